@@ -7,6 +7,8 @@ import click
 
 from molting import __version__
 from molting.commands.registry import apply_refactoring, discover_and_register_commands
+from molting.core.duplicate_finder import DuplicateFinder
+from molting.core.profiling import CpuProfiler, MemoryProfiler
 
 # Dynamically discover and import all command modules
 discover_and_register_commands()
@@ -14,13 +16,39 @@ discover_and_register_commands()
 
 @click.group()
 @click.version_option(version=__version__)
-def main() -> None:
+@click.option(
+    "--memprofile",
+    is_flag=True,
+    help="Trace allocations and report peak memory per phase and the top allocation sites.",
+)
+@click.option(
+    "--cprofile",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="Profile the command with cProfile and save the statistics to this file.",
+)
+@click.option(
+    "--flamegraph",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="Sample call stacks and save them to this file in collapsed-stack format.",
+)
+@click.pass_context
+def main(
+    ctx: click.Context, memprofile: bool, cprofile: Path | None, flamegraph: Path | None
+) -> None:
     """Molting - Python refactoring CLI tool.
 
     Based on Martin Fowler's refactoring catalog, this tool provides
-    automated refactorings for Python code.
+    automated refactorings for Python code. The profiling options apply to
+    any command, refactorings run with apply included.
     """
-    pass
+    if memprofile:
+        memory_profiler = MemoryProfiler()
+        memory_profiler.start()
+        ctx.call_on_close(lambda: click.echo(memory_profiler.stop().format(), err=True))
+    if cprofile is not None or flamegraph is not None:
+        cpu_profiler = CpuProfiler(pstats_path=cprofile, folded_path=flamegraph)
+        cpu_profiler.start()
+        ctx.call_on_close(lambda: click.echo(cpu_profiler.format_top(), err=True))
 
 
 def refactor_file(refactoring_name: str, file_path: Path, **params: Any) -> None:
@@ -35,3 +63,76 @@ def refactor_file(refactoring_name: str, file_path: Path, **params: Any) -> None
         ValueError: If refactoring_name is not recognized
     """
     apply_refactoring(refactoring_name, file_path, **params)
+
+
+@main.command("apply")
+@click.argument("refactoring")
+@click.argument("file_path", type=click.Path(exists=True, dir_okay=False, path_type=Path))
+@click.argument("params", nargs=-1)
+def apply(refactoring: str, file_path: Path, params: tuple[str, ...]) -> None:
+    """Apply REFACTORING to FILE_PATH with key=value PARAMS.
+
+    Parameters are those apply_refactoring() takes, as printed by
+    find-duplicates; True and False are passed as booleans.
+    """
+    try:
+        refactor_file(refactoring, file_path, **_parse_params(params))
+    except ValueError as e:
+        raise click.ClickException(str(e)) from e
+
+
+def _parse_params(params: tuple[str, ...]) -> dict[str, Any]:
+    """Parse key=value arguments into refactoring parameters."""
+    parsed: dict[str, Any] = {}
+    for param in params:
+        key, separator, value = param.partition("=")
+        if not separator or not key:
+            raise click.BadParameter(f"Expected key=value, got '{param}'", param_hint="PARAMS")
+        parsed[key] = {"True": True, "False": False}.get(value, value)
+    return parsed
+
+
+@main.command("find-duplicates")
+@click.argument(
+    "directory", type=click.Path(exists=True, file_okay=False, path_type=Path), default="."
+)
+@click.option(
+    "--threshold",
+    type=click.FloatRange(0.0, 1.0, min_open=True),
+    default=0.8,
+    show_default=True,
+    help="Minimum similarity of two methods.",
+)
+@click.option(
+    "--min-tokens",
+    type=click.IntRange(min=1),
+    default=12,
+    show_default=True,
+    help="Ignore methods with fewer tokens than this.",
+)
+def find_duplicates(directory: Path, threshold: float, min_tokens: int) -> None:
+    """Report classes with near-identical methods under DIRECTORY.
+
+    Each class pair is listed with its similar methods and a suggested
+    form-template-method, pull-up-method or extract-superclass refactoring,
+    with the file and the complete key=value parameters apply_refactoring()
+    takes.
+    """
+    finder = DuplicateFinder(threshold=threshold, min_tokens=min_tokens)
+    finder.add_directory(directory)
+    class_pairs = finder.find_class_pairs()
+    if not class_pairs:
+        click.echo("No near-duplicate methods found.")
+        return
+
+    for class_pair in class_pairs:
+        click.echo(
+            f"{class_pair.class_a} ({class_pair.file_a}) ~ "
+            f"{class_pair.class_b} ({class_pair.file_b})"
+        )
+        for pair in class_pair.methods:
+            click.echo(
+                f"  {pair.first.target}:{pair.first.line} ~ "
+                f"{pair.second.target}:{pair.second.line}  similarity {pair.similarity:.2f}"
+            )
+        click.echo(f"  suggested: {class_pair.suggested_command()}")
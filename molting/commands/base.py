@@ -7,6 +7,11 @@ from typing import Any, Callable
 
 import libcst as cst
 
+from molting.core.call_site_updater import CallSiteUpdater
+from molting.core.changed_files import direct_importers, git_changed_files
+from molting.core.profiling import phase
+from molting.core.reference_searcher import FileSetSearcher
+
 
 class BaseCommand(ABC):
     """Base class for all refactoring commands."""
@@ -22,6 +27,8 @@ class BaseCommand(ABC):
         """
         self.file_path = file_path
         self.params = params
+        # Incremental-mode file sets per directory (see incremental_files())
+        self._incremental_files: dict[Path, set[Path] | None] = {}
 
     @abstractmethod
     def execute(self) -> None:
@@ -54,6 +61,72 @@ class BaseCommand(ABC):
         """
         pass
 
+    def incremental_files(self, directory: Path) -> set[Path] | None:
+        """Return the files an incremental run under a directory is limited to.
+
+        With ``since=<rev>`` or ``changed_only=True`` these are the refactored
+        file plus the Python files git reports as changed (since the revision,
+        or uncommitted). ``with_importers=True`` widens that set to files that
+        directly import a changed file. Git is asked once per directory.
+
+        Args:
+            directory: Root directory of the run
+
+        Returns:
+            Absolute paths of the files, or None if the run covers the whole directory
+
+        Raises:
+            ValueError: If incremental mode is requested outside a git repository
+        """
+        since = self.params.get("since")
+        if since is None and not self.params.get("changed_only", False):
+            return None
+        if directory not in self._incremental_files:
+            files = git_changed_files(directory, since)
+            files.add(self.file_path.resolve())
+            if self.params.get("with_importers", False):
+                files |= direct_importers(files, directory)
+            self._incremental_files[directory] = files
+        return self._incremental_files[directory]
+
+    def project_files(self, directory: Path) -> list[Path]:
+        """Return the Python files project-wide indexes are built from.
+
+        Args:
+            directory: Root directory of the run
+
+        Returns:
+            Absolute paths of every Python file under the directory, or of the
+            incremental-mode files (see incremental_files()), sorted
+
+        Raises:
+            ValueError: If incremental mode is requested outside a git repository
+        """
+        files = self.incremental_files(directory)
+        if files is None:
+            return sorted(path.resolve() for path in directory.rglob("*.py"))
+        return sorted(files)
+
+    def create_call_site_updater(self, directory: Path) -> CallSiteUpdater:
+        """Create a CallSiteUpdater for a directory, honouring incremental-mode parameters.
+
+        In incremental mode the search is limited to the files returned by
+        incremental_files().
+
+        Args:
+            directory: Root directory to search in
+
+        Returns:
+            The configured CallSiteUpdater
+
+        Raises:
+            ValueError: If incremental mode is requested outside a git repository
+        """
+        files = self.incremental_files(directory)
+        if files is None:
+            return CallSiteUpdater(directory)
+        return CallSiteUpdater(directory, searcher=FileSetSearcher(files))
+
     def apply_libcst_transform(
         self, transformer_class: type[cst.CSTTransformer], *args: Any, **kwargs: Any
     ) -> None:
@@ -64,11 +137,13 @@ class BaseCommand(ABC):
             *args: Positional arguments for transformer
             **kwargs: Keyword arguments for transformer
         """
-        source_code = self.file_path.read_text()
-        module = cst.parse_module(source_code)
-        transformer = transformer_class(*args, **kwargs)
-        modified_tree = module.visit(transformer)
-        self.file_path.write_text(modified_tree.code)
+        with phase("parse"):
+            module = cst.parse_module(self.file_path.read_text())
+        with phase("transform"):
+            transformer = transformer_class(*args, **kwargs)
+            modified_tree = module.visit(transformer)
+        with phase("write"):
+            self.file_path.write_text(modified_tree.code)
 
     def apply_ast_transform(self, transform_func: Callable[[ast.Module], ast.Module]) -> None:
         """Apply an AST transformation function to the file.
@@ -7,6 +7,7 @@ from molting.commands.base import BaseCommand
 from molting.commands.registry import register_command
 from molting.core.ast_utils import parse_line_number, parse_target_with_line
 from molting.core.code_generation_utils import create_parameter
+from molting.core.line_index import LineIndex, get_line_index
 
 
 class ExtractFunctionCommand(BaseCommand):
@@ -73,19 +74,15 @@ class ExtractFunctionCommand(BaseCommand):
         class_name, method_name, line_spec = parse_target_with_line(target)
         line_number = parse_line_number(line_spec)
 
-        # Read file
+        # Read file and look up the expression directly from the line index
         source_code = self.file_path.read_text()
-
-        # First pass: collect the expression to extract
-        wrapper = metadata.MetadataWrapper(cst.parse_module(source_code))
-        collector = ExpressionCollector(class_name, method_name, line_number)
-        wrapper.visit(collector)
+        index = get_line_index(source_code)
+        collector = ExpressionCollector(index, class_name, method_name, line_number)
 
         if collector.extracted_expression is None:
             raise ValueError(f"Could not find expression at line {line_number}")
 
-        # Second pass: apply transformation
-        wrapper = metadata.MetadataWrapper(cst.parse_module(source_code))
+        # Apply transformation
         transformer = ExtractFunctionTransformer(
             class_name,
             method_name,
@@ -93,21 +90,22 @@ class ExtractFunctionCommand(BaseCommand):
             line_number,
             collector.extracted_expression,
         )
-        modified_tree = wrapper.visit(transformer)
+        modified_tree = index.wrapper.visit(transformer)
 
         # Write back
         self.file_path.write_text(modified_tree.code)
 
 
-class ExpressionCollector(cst.CSTVisitor):
+class ExpressionCollector:
     """Collector to find the expression to extract."""
 
-    METADATA_DEPENDENCIES = (metadata.PositionProvider,)
-
-    def __init__(self, class_name: str, method_name: str, line_number: int) -> None:
-        """Initialize the collector.
+    def __init__(
+        self, index: LineIndex, class_name: str, method_name: str, line_number: int
+    ) -> None:
+        """Initialize the collector and look up the expression.
 
         Args:
+            index: Line index of the module
             class_name: Name of the class containing the method
             method_name: Name of the method to extract code from
             line_number: Line number of expression to extract (1-indexed)
@@ -115,33 +113,19 @@ class ExpressionCollector(cst.CSTVisitor):
         self.method_name = method_name
         self.line_number = line_number
         self.extracted_expression: cst.BaseExpression | None = None
-        self.in_target_method = False
-
-    def visit_FunctionDef(self, node: cst.FunctionDef) -> None:  # noqa: N802
-        """Visit function definition to find target method."""
-        if node.name.value == self.method_name:
-            self.in_target_method = True
-
-    def leave_FunctionDef(self, node: cst.FunctionDef) -> None:  # noqa: N802
-        """Leave function definition."""
-        if node.name.value == self.method_name:
-            self.in_target_method = False
 
-    def visit_SimpleStatementLine(self, node: cst.SimpleStatementLine) -> None:  # noqa: N802
-        """Visit simple statement to check if it's on the target line."""
-        if not self.in_target_method:
+        method = index.find_function(class_name, method_name)
+        if method is None:
             return
 
-        try:
-            position = self.get_metadata(metadata.PositionProvider, node)
-            if position.start.line == self.line_number:
-                # Extract the right-hand side of an assignment
-                for stmt in node.body:
-                    if isinstance(stmt, cst.Assign):
-                        self.extracted_expression = stmt.value
-                        break
-        except KeyError:
-            pass
+        for stmt in index.statements_starting_on(line_number, within=method):
+            if not isinstance(stmt, cst.SimpleStatementLine):
+                continue
+            # Extract the right-hand side of an assignment
+            for small_stmt in stmt.body:
+                if isinstance(small_stmt, cst.Assign):
+                    self.extracted_expression = small_stmt.value
+                    break
 
 
 class ExtractFunctionTransformer(cst.CSTTransformer):
@@ -1,14 +1,17 @@
 """Extract Method refactoring command."""
 
-from typing import Sequence, Union
+from dataclasses import dataclass
+from pathlib import Path
 
 import libcst as cst
 from libcst import metadata
 
 from molting.commands.base import BaseCommand
 from molting.commands.registry import register_command
-from molting.core.ast_utils import parse_target_with_range
+from molting.core.ast_utils import parse_comma_separated_list, parse_target_with_ranges
 from molting.core.code_generation_utils import create_parameter
+from molting.core.dataflow import RegionFlow, get_function_dataflow
+from molting.core.line_index import LineIndex, get_line_index
 from molting.core.visitors import MethodConflictChecker
 
 
@@ -49,6 +52,10 @@ class ExtractMethodCommand(BaseCommand):
             print(f"name: {invoice.name}")
             print(f"amount: {outstanding}")
             print(f"interest: {interest_charge}")
+
+    Several blocks are extracted in one run with ``Class::method#L6-L8,L10-L12``
+    and one name per range (``name=print_banner,print_details``); all ranges
+    refer to the original line numbers.
     """
 
     name = "extract-method"
@@ -65,78 +72,136 @@ class ExtractMethodCommand(BaseCommand):
         """Apply extract-method refactoring using libCST.
 
         Raises:
-            ValueError: If method not found or target format is invalid
+            ValueError: If method not found, target format is invalid, a range
+                selects no statement, or the ranges overlap or their names conflict
         """
         target = self.params["target"]
-        new_method_name = self.params["name"]
-
-        # Parse target and line range using canonical functions
-        class_name, method_name, start_line, end_line = parse_target_with_range(target)
+        new_method_names = parse_comma_separated_list(self.params["name"])
+
+        # Parse target and line ranges using canonical functions
+        class_name, method_name, line_ranges = parse_target_with_ranges(target)
+        if len(new_method_names) != len(line_ranges):
+            raise ValueError(
+                f"Expected {len(line_ranges)} method name(s) for {len(line_ranges)} line "
+                f"range(s), got {len(new_method_names)}"
+            )
 
-        # Read file
+        # Read file and index its lines (shared with other line-targeted commands)
         source_code = self.file_path.read_text()
+        index = get_line_index(source_code)
+
+        # Check for name conflicts - methods should not already exist
+        for position, new_method_name in enumerate(new_method_names):
+            if new_method_name in new_method_names[:position]:
+                raise ValueError(f"Method name '{new_method_name}' is given more than once")
+            conflict_checker = MethodConflictChecker(class_name, new_method_name)
+            index.module.visit(conflict_checker)
+            if conflict_checker.has_conflict:
+                raise ValueError(
+                    f"Method '{new_method_name}' already exists in class '{class_name}'"
+                )
 
-        # Check for name conflicts - method should not already exist
-        module = cst.parse_module(source_code)
-        conflict_checker = MethodConflictChecker(class_name, new_method_name)
-        module.visit(conflict_checker)
-
-        if conflict_checker.has_conflict:
-            raise ValueError(f"Method '{new_method_name}' already exists in class '{class_name}'")
-
-        # First pass: collect line number information
-        wrapper = metadata.MetadataWrapper(module)
-        line_collector = LineCollector(class_name, method_name, start_line, end_line)
-        wrapper.visit(line_collector)
-
-        # Second pass: apply transformation
-        wrapper = metadata.MetadataWrapper(cst.parse_module(source_code))
-        transformer = ExtractMethodTransformer(
-            class_name,
-            method_name,
-            new_method_name,
-            start_line,
-            end_line,
-            line_collector.extracted_stmt_indices,
-        )
-        modified_tree = wrapper.visit(transformer)
+        # Look up the statements of every range against the original positions
+        extractions: list[Extraction] = []
+        for new_method_name, (start_line, end_line) in zip(new_method_names, line_ranges):
+            line_collector = LineCollector(
+                index, class_name, method_name, start_line, end_line, self.file_path
+            )
+            if line_collector.method is not None and not line_collector.extracted_stmt_indices:
+                raise ValueError(
+                    f"Lines {start_line}-{end_line} select no statement of "
+                    f"'{class_name}::{method_name}'"
+                )
+            for other in extractions:
+                if set(other.stmt_indices) & set(line_collector.extracted_stmt_indices):
+                    raise ValueError(
+                        f"Lines {start_line}-{end_line} overlap the statements "
+                        f"extracted into '{other.new_method_name}'"
+                    )
+            extractions.append(
+                Extraction(
+                    new_method_name,
+                    line_collector.extracted_stmt_indices,
+                    line_collector.region_flow(),
+                )
+            )
+
+        # Apply transformation
+        transformer = ExtractMethodTransformer(class_name, method_name, extractions)
+        modified_tree = index.wrapper.visit(transformer)
 
         # Write back
         self.file_path.write_text(modified_tree.code)
 
 
-class LineCollector(cst.CSTVisitor):
-    """Collector to determine which statements to extract."""
+@dataclass(frozen=True)
+class Extraction:
+    """Statements of a method body to extract into a new method.
+
+    Attributes:
+        new_method_name: Name of the new method
+        stmt_indices: Indices of the statements in the method body, in order
+        region_flow: Dataflow of the statements, from the original method
+    """
+
+    new_method_name: str
+    stmt_indices: list[int]
+    region_flow: RegionFlow
 
-    METADATA_DEPENDENCIES = (metadata.PositionProvider,)
 
-    def __init__(self, class_name: str, method_name: str, start_line: int, end_line: int) -> None:
-        """Initialize the collector.
+class LineCollector:
+    """Collector to determine which statements to extract."""
+
+    def __init__(
+        self,
+        index: LineIndex,
+        class_name: str,
+        method_name: str,
+        start_line: int,
+        end_line: int,
+        file_path: Path | None = None,
+    ) -> None:
+        """Initialize the collector and collect the statement indices.
 
         Args:
+            index: Line index of the module
             class_name: Name of the class containing the method
             method_name: Name of the method to extract code from
             start_line: Start line number of code to extract (1-indexed)
             end_line: End line number of code to extract (1-indexed)
+            file_path: File containing the method, used to key cached analysis
         """
-        self.class_name = class_name
-        self.method_name = method_name
+        self.index = index
+        self.file_path = file_path
+        self.qualified_name = f"{class_name}.{method_name}"
         self.start_line = start_line
         self.end_line = end_line
         self.extracted_stmt_indices: list[int] = []
 
-    def visit_FunctionDef(self, node: cst.FunctionDef) -> None:  # noqa: N802
-        """Visit function definition to collect line information."""
-        if node.name.value != self.method_name:
-            return
+        self.method = index.find_function(class_name, method_name)
+        if self.method is not None:
+            self._collect(self.method)
 
-        for i, stmt in enumerate(node.body.body):
-            stmt_lines = self._get_stmt_lines(stmt)  # type: ignore[arg-type]
+    def region_flow(self) -> RegionFlow:
+        """Solve the method's dataflow for the collected statements.
 
-            if stmt_lines is None:
-                continue
+        Returns:
+            Variables flowing into and out of the statements to extract
+        """
+        if self.method is None or not self.extracted_stmt_indices:
+            return RegionFlow(inputs=[], outputs=[])
+        body = self.method.body.body
+        start = self.index.lines(body[self.extracted_stmt_indices[0]])[0]
+        end = self.index.lines(body[self.extracted_stmt_indices[-1]])[1]
+        dataflow = get_function_dataflow(
+            self.method, self.index.lines, self.qualified_name, self.file_path
+        )
+        return dataflow.region_flow(start, end)
 
-            stmt_start, stmt_end = stmt_lines
+    def _collect(self, method: cst.FunctionDef) -> None:
+        """Collect the indices of the method's body statements in the line range."""
+        for i, stmt in enumerate(method.body.body):
+            stmt_start, stmt_end = self._get_stmt_lines(stmt)  # type: ignore[arg-type]
 
             # Include if fully contained or if end is in range
             if self.start_line <= stmt_start and stmt_end <= self.end_line:
@@ -146,109 +211,145 @@ class LineCollector(cst.CSTVisitor):
                 # End point is in range
                 self.extracted_stmt_indices.append(i)
 
-    def _get_stmt_lines(self, stmt: cst.BaseStatement) -> tuple[int, int] | None:
+    def _get_stmt_lines(self, stmt: cst.BaseStatement) -> tuple[int, int]:
         """Get the range of lines for a statement including leading lines.
 
         Args:
             stmt: The statement to get the line range for
 
         Returns:
-            Tuple of (start_line, end_line) inclusive, or None if not available
+            Tuple of (start_line, end_line) inclusive
         """
-        try:
-            positions = self.get_metadata(metadata.PositionProvider, stmt)
-            start = positions.start.line
-            end = positions.end.line
-
-            # For SimpleStatementLine, check if there are leading lines with comments
-            if isinstance(stmt, cst.SimpleStatementLine):
-                if stmt.leading_lines:
-                    # Count only the meaningful leading lines (those with comments)
-                    leading_count = 0
-                    for lead_line in stmt.leading_lines:
-                        if lead_line.comment is not None:
-                            # This is a line with a comment, count it
-                            leading_count += 1
-                        elif lead_line.indent:
-                            # This is an indented empty line, also count it
-                            leading_count += 1
-                    start = start - leading_count
-
-            return (start, end)
-        except KeyError:
-            return None
-
-
-class VariableUsageAnalyzer(cst.CSTVisitor):
-    """Analyzes variable usage in statements to determine what needs to be returned."""
+        start, end = self.index.lines(stmt)
+
+        # For SimpleStatementLine, check if there are leading lines with comments
+        if isinstance(stmt, cst.SimpleStatementLine):
+            if stmt.leading_lines:
+                # Count only the meaningful leading lines (those with comments)
+                leading_count = 0
+                for lead_line in stmt.leading_lines:
+                    if lead_line.comment is not None:
+                        # This is a line with a comment, count it
+                        leading_count += 1
+                    elif lead_line.indent:
+                        # This is an indented empty line, also count it
+                        leading_count += 1
+                start = start - leading_count
+
+        return (start, end)
+
+
+class AugmentedTargetCollector(cst.CSTVisitor):
+    """Collects the names that are targets of augmented assignments (+=, -=, etc.)."""
 
     def __init__(self) -> None:
-        """Initialize the analyzer."""
-        self.assigned_vars: set[str] = set()
-        self.used_vars: set[str] = set()
-        self.uninitialized_uses: set[str] = set()
-        self.augmented_assigned_vars: set[str] = set()
-
-    def visit_Assign(self, node: cst.Assign) -> None:  # noqa: N802
-        """Visit assignment to track assigned variables."""
-        for target in node.targets:
-            if isinstance(target.target, cst.Name):
-                self.assigned_vars.add(target.target.value)
-
-    def visit_Name(self, node: cst.Name) -> None:  # noqa: N802
-        """Visit name to track variable usage."""
-        # Only track non-builtin names
-        self.used_vars.add(node.value)
+        """Initialize the collector."""
+        self.names: set[str] = set()
 
     def visit_AugAssign(self, node: cst.AugAssign) -> None:  # noqa: N802
         """Visit augmented assignment (e.g., x += 1)."""
         if isinstance(node.target, cst.Name):
-            # For augmented assignment, the variable is both used and assigned
-            self.used_vars.add(node.target.value)
-            self.assigned_vars.add(node.target.value)
-            # Track that this variable needs initialization
-            self.augmented_assigned_vars.add(node.target.value)
-
-    def analyze_uninitialized(self) -> None:
-        """Find variables that are used but not explicitly initialized."""
-        self.uninitialized_uses = self.used_vars - self.assigned_vars
+            self.names.add(node.target.value)
 
 
 class ExtractMethodTransformer(cst.CSTTransformer):
-    """Transforms a class by extracting a method."""
+    """Transforms a class by extracting one or more methods from one of its methods."""
 
     METADATA_DEPENDENCIES = (metadata.ParentNodeProvider,)
 
-    def __init__(
-        self,
-        class_name: str,
-        method_name: str,
-        new_method_name: str,
-        start_line: int,
-        end_line: int,
-        extracted_stmt_indices: list[int],
-    ) -> None:
+    def __init__(self, class_name: str, method_name: str, extractions: list[Extraction]) -> None:
         """Initialize the transformer.
 
         Args:
             class_name: Name of the class containing the method
             method_name: Name of the method to extract code from
-            new_method_name: Name of the new extracted method
-            start_line: Start line number of code to extract (1-indexed)
-            end_line: End line number of code to extract (1-indexed)
-            extracted_stmt_indices: Indices of statements to extract
+            extractions: Non-overlapping statement blocks to extract, each into its own method
         """
         self.class_name = class_name
         self.method_name = method_name
-        self.new_method_name = new_method_name
-        self.start_line = start_line
-        self.end_line = end_line
-        self.extracted_stmt_indices = extracted_stmt_indices
-        self.new_method: cst.FunctionDef | None = None
-        self.return_vars: list[str] = []
-        self.vars_needing_init: set[str] = set()
+        self.extractions = [extraction for extraction in extractions if extraction.stmt_indices]
+        self.new_methods: list[cst.FunctionDef] = []
+
+    def leave_FunctionDef(  # noqa: N802
+        self, original_node: cst.FunctionDef, updated_node: cst.FunctionDef
+    ) -> cst.FunctionDef:
+        """Leave function definition and extract lines if needed."""
+        if original_node.name.value != self.method_name:
+            return updated_node
+
+        if not self.extractions:
+            return updated_node
+
+        body = list(updated_node.body.body)
+        # Index of the first statement of each block -> call replacing the block
+        calls: dict[int, cst.BaseStatement] = {}
+        extracted_indices: set[int] = set()
+        for extraction in self.extractions:
+            extracted_stmts = [body[i] for i in extraction.stmt_indices]
+            extracted_method = ExtractedMethod(extraction, extracted_stmts)  # type: ignore[arg-type]
+            calls[extraction.stmt_indices[0]] = extracted_method.call_statement()
+            extracted_indices.update(extraction.stmt_indices)
+            self.new_methods.append(extracted_method.definition())
+
+        new_body: list[cst.BaseStatement] = []
+        for i, stmt in enumerate(body):
+            if i in calls:
+                new_body.append(calls[i])
+            elif i not in extracted_indices:
+                new_body.append(stmt)  # type: ignore[arg-type]
+
+        return updated_node.with_changes(body=updated_node.body.with_changes(body=tuple(new_body)))
+
+    def leave_ClassDef(  # noqa: N802
+        self, original_node: cst.ClassDef, updated_node: cst.ClassDef
+    ) -> cst.ClassDef:
+        """Leave class definition and add the new methods if needed."""
+        if original_node.name.value != self.class_name:
+            return updated_node
+
+        if self.new_methods:
+            # Add leading blank line before each new method
+            new_methods_with_spacing = [
+                new_method.with_changes(
+                    leading_lines=[cst.EmptyLine(indent=False, whitespace=cst.SimpleWhitespace(""))]
+                )
+                for new_method in self.new_methods
+            ]
+
+            # Add the new methods to the class
+            new_body = (*updated_node.body.body, *new_methods_with_spacing)
+            return updated_node.with_changes(body=updated_node.body.with_changes(body=new_body))
+
+        return updated_node
+
+
+class ExtractedMethod:
+    """The new method for a block of statements and the call that replaces the block."""
+
+    def __init__(self, extraction: Extraction, extracted_stmts: list[cst.BaseStatement]) -> None:
+        """Determine the parameters and return values of the new method.
 
-    def _create_method_call_statement(self) -> cst.SimpleStatementLine:
+        Variables defined in the extracted code and live after it are returned.
+        Inputs that are only accumulated with augmented assignments and also
+        returned are initialized in the new method; other inputs become parameters.
+
+        Args:
+            extraction: The block being extracted
+            extracted_stmts: Statements of the block
+        """
+        self.new_method_name = extraction.new_method_name
+        self.extracted_stmts = extracted_stmts
+
+        augmented = AugmentedTargetCollector()
+        for stmt in extracted_stmts:
+            stmt.visit(augmented)
+
+        inputs = [v for v in extraction.region_flow.inputs if v != "self"]
+        self.return_vars = [v for v in extraction.region_flow.outputs if v != "self"]
+        self.vars_needing_init = set(self.return_vars) & set(inputs) & augmented.names
+        self.param_vars = [v for v in inputs if v not in self.vars_needing_init]
+
+    def call_statement(self) -> cst.SimpleStatementLine:
         """Create a method call statement that invokes the extracted method.
 
         Returns:
@@ -258,7 +359,8 @@ class ExtractMethodTransformer(cst.CSTTransformer):
             func=cst.Attribute(
                 value=cst.Name("self"),
                 attr=cst.Name(self.new_method_name),
-            )
+            ),
+            args=[cst.Arg(value=cst.Name(var)) for var in self.param_vars],
         )
 
         # If there are return variables, assign them
@@ -289,112 +391,24 @@ class ExtractMethodTransformer(cst.CSTTransformer):
             # No return: just call the method
             return cst.SimpleStatementLine(body=[cst.Expr(value=method_call)])
 
-    def leave_FunctionDef(  # noqa: N802
-        self, original_node: cst.FunctionDef, updated_node: cst.FunctionDef
-    ) -> cst.FunctionDef:
-        """Leave function definition and extract lines if needed."""
-        if original_node.name.value != self.method_name:
-            return updated_node
-
-        if not self.extracted_stmt_indices:
-            return updated_node
-
-        body = updated_node.body.body
-        extracted_stmts = self._collect_statements_to_extract(body)  # type: ignore[arg-type]
-        self._analyze_extracted_statements(extracted_stmts, list(body))  # type: ignore[arg-type]
-        new_body = self._build_modified_method_body(body)  # type: ignore[arg-type]
-        self.new_method = self._create_new_extracted_method(extracted_stmts)
-
-        return updated_node.with_changes(body=updated_node.body.with_changes(body=tuple(new_body)))
-
-    def _collect_statements_to_extract(
-        self, body_stmts: Union[Sequence[cst.BaseStatement], Sequence[cst.BaseSmallStatement]]
-    ) -> list[cst.BaseStatement]:
-        """Collect statements that should be extracted by their index.
-
-        Args:
-            body_stmts: All statements in the method body
-
-        Returns:
-            List of statements that are marked for extraction
-        """
-        extracted_stmts: list[cst.BaseStatement] = []
-        for i, stmt in enumerate(body_stmts):
-            if i in self.extracted_stmt_indices:
-                extracted_stmts.append(stmt)  # type: ignore[arg-type]
-        return extracted_stmts
-
-    def _build_modified_method_body(
-        self, original_body: Union[Sequence[cst.BaseStatement], Sequence[cst.BaseSmallStatement]]
-    ) -> list[cst.BaseStatement]:
-        """Build the new method body with extracted statements replaced by a method call.
-
-        Args:
-            original_body: The original method body statements
+    def definition(self) -> cst.FunctionDef:
+        """Create a new method definition from extracted statements.
 
         Returns:
-            New method body with extracted statements replaced by a method call
-        """
-        new_body: list[cst.BaseStatement] = []
-        for i, stmt in enumerate(original_body):
-            if i in self.extracted_stmt_indices:
-                # Insert method call at the first extracted statement position
-                if len([j for j in self.extracted_stmt_indices if j <= i]) == 1:
-                    method_call = self._create_method_call_statement()
-                    new_body.append(method_call)
-            else:
-                new_body.append(stmt)  # type: ignore[arg-type]
-        return new_body
-
-    def _analyze_extracted_statements(
-        self,
-        extracted_stmts: list[cst.BaseStatement],
-        all_stmts: list[cst.BaseStatement | cst.BaseSmallStatement],
-    ) -> None:
-        """Analyze extracted statements to determine what variables need to be returned.
-
-        Args:
-            extracted_stmts: Statements being extracted
-            all_stmts: All statements in the original method
+            A new FunctionDef node for the extracted method
         """
-        # Analyze variable usage in extracted code
-        analyzer = VariableUsageAnalyzer()
-        for stmt in extracted_stmts:
-            stmt.visit(analyzer)
-
-        analyzer.analyze_uninitialized()
-
-        # Track variables that need initialization:
-        # Variables that are only augmented assigned (+=, -=, etc.) need initialization
-        augmented_only = analyzer.augmented_assigned_vars
-
-        # Determine which variables are assigned in extracted code and used afterwards
-        assigned_in_extracted = analyzer.assigned_vars
-        next_stmt_idx = max(self.extracted_stmt_indices) + 1
-
-        # Check if assigned variables are used after extraction
-        used_after = set()
-        if next_stmt_idx < len(all_stmts):
-            post_analyzer = VariableUsageAnalyzer()
-            for stmt in all_stmts[next_stmt_idx:]:  # type: ignore[assignment]
-                stmt.visit(post_analyzer)
-            used_after = post_analyzer.used_vars
-
-        # Variables to return are those assigned in extracted code and used after
-        potential_returns = assigned_in_extracted & used_after
-        self.return_vars = [v for v in potential_returns if v != "self"]
-
-        # Variables needing initialization: returned vars that are augmented-assigned
-        self.vars_needing_init = set(self.return_vars) & augmented_only
+        return cst.FunctionDef(
+            name=cst.Name(self.new_method_name),
+            params=cst.Parameters(
+                params=[create_parameter("self")]
+                + [create_parameter(var) for var in self.param_vars]
+            ),
+            body=self._create_body(),
+        )
 
-    def _create_new_method_body(
-        self, extracted_stmts: list[cst.BaseStatement]
-    ) -> cst.IndentedBlock:
+    def _create_body(self) -> cst.IndentedBlock:
         """Create the body for the new extracted method.
 
-        Args:
-            extracted_stmts: Statements to include in the new method
-
         Returns:
             An IndentedBlock for the new method
         """
@@ -415,7 +429,7 @@ class ExtractMethodTransformer(cst.CSTTransformer):
             body_stmts.append(init_stmt)
 
         # Add the extracted statements
-        body_stmts.extend(extracted_stmts)
+        body_stmts.extend(self.extracted_stmts)
 
         # Add return statement if there are variables to return
         if self.return_vars:
@@ -441,43 +455,6 @@ class ExtractMethodTransformer(cst.CSTTransformer):
 
         return cst.IndentedBlock(body=tuple(body_stmts))
 
-    def _create_new_extracted_method(
-        self, extracted_stmts: list[cst.BaseStatement]
-    ) -> cst.FunctionDef:
-        """Create a new method definition from extracted statements.
-
-        Args:
-            extracted_stmts: Statements that have been extracted
-
-        Returns:
-            A new FunctionDef node for the extracted method
-        """
-        new_method_body = self._create_new_method_body(extracted_stmts)
-        return cst.FunctionDef(
-            name=cst.Name(self.new_method_name),
-            params=cst.Parameters(params=[create_parameter("self")]),
-            body=new_method_body,
-        )
-
-    def leave_ClassDef(  # noqa: N802
-        self, original_node: cst.ClassDef, updated_node: cst.ClassDef
-    ) -> cst.ClassDef:
-        """Leave class definition and add new method if needed."""
-        if original_node.name.value != self.class_name:
-            return updated_node
-
-        if self.new_method is not None:
-            # Add leading blank line before the new method
-            new_method_with_spacing = self.new_method.with_changes(
-                leading_lines=[cst.EmptyLine(indent=False, whitespace=cst.SimpleWhitespace(""))]
-            )
-
-            # Add the new method to the class
-            new_body = tuple(list(updated_node.body.body) + [new_method_with_spacing])
-            return updated_node.with_changes(body=updated_node.body.with_changes(body=new_body))
-
-        return updated_node
-
 
 # Register the command
 register_command(ExtractMethodCommand)
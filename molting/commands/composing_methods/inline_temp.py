@@ -6,6 +6,8 @@ import libcst.metadata as metadata
 from molting.commands.base import BaseCommand
 from molting.commands.registry import register_command
 from molting.core.ast_utils import parse_target
+from molting.core.profiling import phase
+from molting.core.temp_inliner import TempTable, inline_temps
 
 
 @register_command
@@ -32,17 +34,19 @@ class InlineTempCommand(BaseCommand):
     After:
         def get_price(quantity):
             return quantity * item_price * tax_rate
+
+    A target without ``::variable_name`` inlines every single-assignment temp
+    of the function that can be inlined safely, and no target does so for
+    every function of the file, in one pass.
     """
 
     name = "inline-temp"
 
     def validate(self) -> None:
-        """Validate that required parameters are present.
+        """Validate parameters.
 
-        Raises:
-            ValueError: If required parameters are missing
+        The target is optional: without it every function of the file is covered.
         """
-        self.validate_required_params("target")
 
     def execute(self) -> None:
         """Apply inline-temp refactoring using libCST.
@@ -50,7 +54,10 @@ class InlineTempCommand(BaseCommand):
         Raises:
             ValueError: If function or variable not found
         """
-        target = self.params["target"]
+        target = self.params.get("target")
+        if target is None or "::" not in target:
+            self._inline_all(target)
+            return
 
         # Parse target format: "function_name::variable_name"
         function_name, variable_name = parse_target(target, expected_parts=2)
@@ -79,6 +86,50 @@ class InlineTempCommand(BaseCommand):
         # Write back
         self.file_path.write_text(modified_tree.code)
 
+    def _inline_all(self, function_name: str | None) -> None:
+        """Inline every eligible temp of the functions with a name, or of all functions.
+
+        Args:
+            function_name: Name of the functions to cover; every function if None
+
+        Raises:
+            ValueError: If no function has the name
+        """
+        source_code = self.file_path.read_text()
+        with phase("parse"):
+            module = cst.parse_module(source_code)
+
+        collector = FunctionCollector(function_name)
+        module.visit(collector)
+        if function_name is not None and not collector.functions:
+            raise ValueError(f"Function '{function_name}' not found")
+
+        with phase("transform"):
+            table = TempTable(module)
+            temps = [temp for function in collector.functions for temp in table.temps(function)]
+            modified_tree = inline_temps(module, temps)
+
+        if modified_tree.code != source_code:
+            self.file_path.write_text(modified_tree.code)
+
+
+class FunctionCollector(cst.CSTVisitor):
+    """Collector for the functions and methods of a module, nested ones included."""
+
+    def __init__(self, function_name: str | None = None) -> None:
+        """Initialize the collector.
+
+        Args:
+            function_name: Only collect functions with this name, if given
+        """
+        self.function_name = function_name
+        self.functions: list[cst.FunctionDef] = []
+
+    def visit_FunctionDef(self, node: cst.FunctionDef) -> None:  # noqa: N802
+        """Record a function."""
+        if self.function_name is None or node.name.value == self.function_name:
+            self.functions.append(node)
+
 
 class TempVariableCollector(cst.CSTVisitor):
     """Collector to capture the temp variable expression."""
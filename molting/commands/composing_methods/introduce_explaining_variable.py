@@ -8,6 +8,7 @@ from libcst import metadata
 from molting.commands.base import BaseCommand
 from molting.commands.registry import register_command
 from molting.core.ast_utils import parse_target_with_line
+from molting.core.line_index import LineIndex, get_line_index
 from molting.core.visitors import VariableConflictChecker
 
 
@@ -74,7 +75,6 @@ class IntroduceExplainingVariableCommand(BaseCommand):
 
         # Read file
         source_code = self.file_path.read_text()
-        module = cst.parse_module(source_code)
 
         # Determine targeting mode and find the expression
         if "target" in self.params:
@@ -83,9 +83,9 @@ class IntroduceExplainingVariableCommand(BaseCommand):
             function_name, _, line_spec = parse_target_with_line(target)
             target_line = int(line_spec.lstrip("L"))
 
-            wrapper = metadata.MetadataWrapper(module)
-            line_collector = ExpressionCollector(function_name, target_line)
-            wrapper.visit(line_collector)
+            index = get_line_index(source_code)
+            wrapper = index.wrapper
+            line_collector = ExpressionCollector(index, function_name, target_line)
 
             if line_collector.best_expression is None:
                 raise ValueError(
@@ -99,7 +99,7 @@ class IntroduceExplainingVariableCommand(BaseCommand):
             function_name = self.params["in_function"]
             expression_str = self.params["expression"]
 
-            wrapper = metadata.MetadataWrapper(module)
+            wrapper = metadata.MetadataWrapper(cst.parse_module(source_code))
             string_collector = ExpressionByStringCollector(function_name, expression_str)
             wrapper.visit(string_collector)
 
@@ -113,7 +113,7 @@ class IntroduceExplainingVariableCommand(BaseCommand):
 
         # Check for name conflicts before applying transformation
         conflict_checker = VariableConflictChecker(function_name, variable_name)
-        module.visit(conflict_checker)
+        wrapper.module.visit(conflict_checker)
 
         if conflict_checker.has_conflict:
             raise ValueError(
@@ -121,7 +121,6 @@ class IntroduceExplainingVariableCommand(BaseCommand):
             )
 
         # Apply transformation
-        wrapper = metadata.MetadataWrapper(module)
         transformer = IntroduceExplainingVariableTransformer(
             function_name,
             variable_name,
@@ -135,77 +134,37 @@ class IntroduceExplainingVariableCommand(BaseCommand):
         self.file_path.write_text(modified_tree.code)
 
 
-class ExpressionCollector(cst.CSTVisitor):
+class ExpressionCollector:
     """Collector to find the best expression to extract."""
 
-    METADATA_DEPENDENCIES = (metadata.PositionProvider,)
+    def __init__(self, index: LineIndex, function_name: str, target_line: int) -> None:
+        """Initialize the collector and look up the expression.
 
-    def __init__(self, function_name: str, target_line: int) -> None:
-        """Initialize the collector.
+        We want the OUTERMOST candidate expression starting on the target line:
+        multiply chains (not add/subtract) and calls. The index lists expressions
+        inner-first, so the last candidate wins.
 
         Args:
+            index: Line index of the module
             function_name: Name of the function containing the expression
-            target_line: Minimum line number to search from (1-indexed)
+            target_line: Line number the expression starts on (1-indexed)
         """
         self.function_name = function_name
         self.target_line = target_line
         self.best_expression: cst.BaseExpression | None = None
         self.best_line: int = 0
-        self.in_target_function = False
-
-    def visit_FunctionDef(self, node: cst.FunctionDef) -> bool:  # noqa: N802
-        """Visit function definition to track if we're in the target function."""
-        if node.name.value == self.function_name:
-            self.in_target_function = True
-        return True
 
-    def leave_FunctionDef(self, node: cst.FunctionDef) -> None:  # noqa: N802
-        """Leave function definition."""
-        if node.name.value == self.function_name:
-            self.in_target_function = False
-
-    def _check_expression(self, node: cst.BaseExpression) -> None:
-        """Check if this expression should be extracted.
-
-        We want the OUTERMOST expression on the target line. In leave_ order,
-        the outermost is visited LAST (children first). So we keep updating
-        best_expression to get the outermost.
-        """
-        if not self.in_target_function:
+        function = index.find_function(function_name)
+        if function is None:
             return
 
-        try:
-            pos = self.get_metadata(metadata.PositionProvider, node)
-            line = pos.start.line
-
-            # Only consider expressions that start on the target line exactly
-            if line != self.target_line:
-                return
-
-            # Always update - the last one (outermost) wins
-            self.best_expression = node
-            self.best_line = line
-        except KeyError:
-            pass
-
-    def visit_BinaryOperation(self, node: cst.BinaryOperation) -> bool:  # noqa: N802
-        """Visit binary operation - continue to children."""
-        return True
-
-    def leave_BinaryOperation(self, node: cst.BinaryOperation) -> None:  # noqa: N802
-        """After visiting children, check if this whole binop should be extracted.
-
-        Only consider multiply chains (not add/subtract).
-        """
-        if isinstance(node.operator, cst.Multiply):
-            self._check_expression(node)
-
-    def leave_Call(self, node: cst.Call) -> None:  # noqa: N802
-        """After visiting children, check if call should be extracted.
-
-        Calls are checked in leave_ to compete with multiplies for "outermost".
-        """
-        self._check_expression(node)
+        for expression in index.expressions_starting_on(target_line, within=function):
+            is_multiply = isinstance(expression, cst.BinaryOperation) and isinstance(
+                expression.operator, cst.Multiply
+            )
+            if is_multiply or isinstance(expression, cst.Call):
+                self.best_expression = expression
+                self.best_line = target_line
 
 
 class ExpressionByStringCollector(cst.CSTVisitor):
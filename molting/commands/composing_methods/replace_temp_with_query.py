@@ -1,12 +1,17 @@
 """Replace Temp with Query refactoring command."""
 
+from typing import Mapping
+
 import libcst as cst
 import libcst.metadata as metadata
 
 from molting.commands.base import BaseCommand
 from molting.commands.registry import register_command
-from molting.core.ast_utils import parse_target
+from molting.core.ast_utils import extract_all_methods, find_class_in_module, parse_target
 from molting.core.method_inserter import MethodInserter
+from molting.core.profiling import phase
+from molting.core.symbol_table import ModuleSymbolTable
+from molting.core.temp_inliner import NameReplacer, Temp, TempTable, resolve_values
 from molting.core.visitors import MethodConflictChecker
 
 
@@ -48,6 +53,11 @@ class ReplaceTempWithQueryCommand(BaseCommand):
 
             def base_price(self):
                 return self.quantity * self.item_price
+
+    A ``ClassName::method_name`` target replaces every single-assignment temp
+    of the method whose value only reads ``self``, globals and other replaced
+    temps, and a ``ClassName`` target does so for every method of the class.
+    Temps whose name is already a member of the class are left in place.
     """
 
     name = "replace-temp-with-query"
@@ -67,6 +77,9 @@ class ReplaceTempWithQueryCommand(BaseCommand):
             ValueError: If class, method, or variable not found
         """
         target = self.params["target"]
+        if target.count("::") < 2:
+            self._replace_all(*target.split("::"))
+            return
 
         # Parse target format: "ClassName::method_name::variable_name"
         class_name, method_name, variable_name = parse_target(target, expected_parts=3)
@@ -102,6 +115,167 @@ class ReplaceTempWithQueryCommand(BaseCommand):
         # Write back
         self.file_path.write_text(modified_tree.code)
 
+    def _replace_all(self, class_name: str, method_name: str | None = None) -> None:
+        """Replace every eligible temp of a method, or of all methods of a class.
+
+        Args:
+            class_name: Name of the class
+            method_name: Name of the method; every method of the class if None
+
+        Raises:
+            ValueError: If the class or method is not found
+        """
+        source_code = self.file_path.read_text()
+        with phase("parse"):
+            module = cst.parse_module(source_code)
+
+        class_def = find_class_in_module(module, class_name)
+        if class_def is None:
+            raise ValueError(f"Class '{class_name}' not found")
+        methods = [
+            method
+            for method in extract_all_methods(class_def)
+            if method_name is None or method.name.value == method_name
+        ]
+        if not methods:
+            raise ValueError(f"Method '{class_name}::{method_name}' not found")
+
+        with phase("transform"):
+            temps = _query_temps(module, class_def, methods)
+            if not temps:
+                return
+            values = resolve_values(temps, lambda temp, value: _query_call(temp.name))
+            queries: dict[cst.FunctionDef, list[cst.FunctionDef]] = {}
+            for temp in temps:
+                queries.setdefault(temp.function, []).append(_query_method(temp.name, values[temp]))
+            replacements = {use: _query_call(temp.name) for temp in temps for use in temp.uses}
+            transformer = QueryMethodsTransformer(
+                class_def, replacements, [temp.statement for temp in temps], queries
+            )
+            modified_tree = module.visit(transformer)
+
+        self.file_path.write_text(modified_tree.code)
+
+
+def _query_temps(
+    module: cst.Module, class_def: cst.ClassDef, methods: list[cst.FunctionDef]
+) -> list[Temp]:
+    """Return the temps of some methods that can become query methods of their class.
+
+    A temp qualifies when it can be inlined, its value reads nothing local to
+    the method but ``self`` and other qualifying temps, and its name is not
+    already a method, field or class attribute.
+    """
+    class_name = class_def.name.value
+    symbols = ModuleSymbolTable.for_module(module)
+    taken = _class_attributes(class_def)
+    table = TempTable(module)
+    chosen: list[Temp] = []
+    for method in methods:
+        if not _is_instance_method(method):
+            continue
+        scope = table.scopes.function_scope(method)
+        queries: set[str] = set()
+        for temp in table.temps(method):
+            if (
+                temp.name in taken
+                or symbols.has_method(class_name, temp.name)
+                or symbols.has_field(class_name, temp.name)
+            ):
+                continue
+            if any(
+                name != "self" and name not in queries and scope.assignments[name]
+                for name in temp.reads
+            ):
+                continue
+            queries.add(temp.name)
+            taken.add(temp.name)
+            chosen.append(temp)
+    return chosen
+
+
+def _is_instance_method(method: cst.FunctionDef) -> bool:
+    """Return whether a method is a plain instance method whose first parameter is ``self``."""
+    for decorator in method.decorators:
+        if isinstance(decorator.decorator, cst.Name) and decorator.decorator.value in (
+            "staticmethod",
+            "classmethod",
+        ):
+            return False
+    params = method.params.params
+    return bool(params) and params[0].name.value == "self"
+
+
+def _class_attributes(class_def: cst.ClassDef) -> set[str]:
+    """Return the names defined directly in a class body."""
+    names: set[str] = set()
+    if not isinstance(class_def.body, cst.IndentedBlock):
+        return names
+    for statement in class_def.body.body:
+        if isinstance(statement, (cst.FunctionDef, cst.ClassDef)):
+            names.add(statement.name.value)
+        elif isinstance(statement, cst.SimpleStatementLine):
+            for node in statement.body:
+                if isinstance(node, cst.Assign):
+                    targets = [target.target for target in node.targets]
+                elif isinstance(node, cst.AnnAssign):
+                    targets = [node.target]
+                else:
+                    continue
+                names.update(target.value for target in targets if isinstance(target, cst.Name))
+    return names
+
+
+def _query_call(name: str) -> cst.Call:
+    """Create ``self.name()``."""
+    return cst.Call(func=cst.Attribute(value=cst.Name("self"), attr=cst.Name(name)))
+
+
+def _query_method(name: str, expression: cst.BaseExpression) -> cst.FunctionDef:
+    """Create ``def name(self): return expression``."""
+    return cst.FunctionDef(
+        name=cst.Name(name),
+        params=cst.Parameters(params=[cst.Param(name=cst.Name("self"))]),
+        body=cst.IndentedBlock(body=[cst.SimpleStatementLine(body=[cst.Return(value=expression)])]),
+        leading_lines=[cst.EmptyLine(indent=False)],
+    )
+
+
+class QueryMethodsTransformer(NameReplacer):
+    """Replaces temps with calls of query methods inserted after their source methods."""
+
+    def __init__(
+        self,
+        class_def: cst.ClassDef,
+        replacements: Mapping[cst.Name, cst.BaseExpression],
+        removed: list[cst.SimpleStatementLine],
+        queries: dict[cst.FunctionDef, list[cst.FunctionDef]],
+    ) -> None:
+        """Initialize the transformer.
+
+        Args:
+            class_def: The class the methods belong to
+            replacements: Use of a temp -> call of its query method
+            removed: Assignments of the replaced temps
+            queries: Method -> query methods to insert after it
+        """
+        super().__init__(replacements, removed)
+        self.class_def = class_def
+        self.queries = queries
+
+    def leave_ClassDef(  # noqa: N802
+        self, original_node: cst.ClassDef, updated_node: cst.ClassDef
+    ) -> cst.ClassDef:
+        """Insert the query methods after the methods they come from."""
+        if original_node is not self.class_def:
+            return updated_node
+        body: list[cst.CSTNode] = []
+        for original, updated in zip(original_node.body.body, updated_node.body.body):
+            body.append(updated)
+            if isinstance(original, cst.FunctionDef):
+                body.extend(self.queries.get(original, []))
+        return updated_node.with_changes(body=updated_node.body.with_changes(body=body))
+
 
 class TempVariableCollector(cst.CSTVisitor):
     """Collector to capture the temp variable expression."""
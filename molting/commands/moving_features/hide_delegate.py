@@ -6,7 +6,7 @@ import libcst as cst
 
 from molting.commands.base import BaseCommand
 from molting.commands.registry import register_command
-from molting.core.call_site_updater import CallSiteUpdater, Reference
+from molting.core.call_site_updater import Reference
 from molting.core.code_generation_utils import create_parameter
 from molting.core.delegate_member_discovery import DelegateMemberDiscovery
 from molting.core.symbol_context import SymbolContext
@@ -109,7 +109,7 @@ class HideDelegateCommand(BaseCommand):
         # Step 2: Update call sites (only for fallback mode)
         if delegate_class is None:
             directory = self.file_path.parent
-            updater = CallSiteUpdater(directory)
+            updater = self.create_call_site_updater(directory)
 
             def transform_call_site(node: cst.CSTNode, ref: Reference) -> cst.CSTNode:
                 """Transform *.field.manager to *.get_manager()."""
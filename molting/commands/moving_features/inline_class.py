@@ -128,7 +128,7 @@ class InlineClassCommand(BaseCommand):
         # Update call sites for the inlined class
         if delegate_field and (source_methods or source_fields):
             directory = self.file_path.parent
-            updater = CallSiteUpdater(directory)
+            updater = self.create_call_site_updater(directory)
             field_prefix = self._compute_prefix_from_field(delegate_field)
 
             # Update method call sites
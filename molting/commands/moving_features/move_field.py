@@ -1,18 +1,23 @@
 """Move Field refactoring command."""
 
 import re
-from typing import cast
+from typing import Iterable, Sequence, cast
 
 import libcst as cst
 
 from molting.commands.base import BaseCommand
 from molting.commands.registry import register_command
 from molting.core.ast_utils import is_pass_statement
+from molting.core.attribute_index import AttributeAccessIndex
 from molting.core.code_generation_utils import (
     create_field_assignment,
     create_init_method,
     create_parameter,
 )
+from molting.core.file_transaction import FileTransaction
+from molting.core.profiling import phase
+from molting.core.project_index import ProjectIndex
+from molting.core.scope_service import ScopeService
 from molting.core.visitors import FieldConflictChecker
 
 
@@ -71,54 +76,146 @@ class MoveFieldCommand(BaseCommand):
     def execute(self) -> None:
         """Apply move-field refactoring using libCST.
 
+        Several fields of the source class may be moved together
+        (``Account::interest_rate,overdraft_limit``). The target class may be
+        defined in another module of the file's directory. Accesses of the
+        moved fields on source class instances are updated in every module of
+        the directory, each module being parsed and transformed once for all
+        fields.
+
         Raises:
             ValueError: If transformation cannot be applied
         """
-        source = self.params["source"]
+        source_class, field_names = self._parse_source()
         target_class = self.params["to"]
+        directory = self.file_path.parent
+        source_path = self.file_path.resolve()
 
-        parts = source.split("::")
-        if len(parts) != 2:
-            raise ValueError(
-                f"Invalid source format: {source}. Expected format: ClassName::field_name"
-            )
+        with phase("parse"):
+            module = cst.parse_module(self.file_path.read_text())
 
-        source_class = parts[0]
-        field_name = parts[1]
-
-        source_code = self.file_path.read_text()
-        module = cst.parse_module(source_code)
+        files = self.project_files(directory)
+        index = ProjectIndex.from_files(files)
+        defines_target = any(
+            isinstance(stmt, cst.ClassDef) and stmt.name.value == target_class
+            for stmt in module.body
+        )
+        if defines_target:
+            destination_path = source_path
+            destination = module
+        else:
+            destination_path = index.get_class(target_class).file_path.resolve()
+            with phase("parse"):
+                destination = cst.parse_module(destination_path.read_text())
 
         # Check if target class already has a field with the same name
-        conflict_checker = FieldConflictChecker(target_class, field_name)
-        module.visit(conflict_checker)
+        for field_name in field_names:
+            conflict_checker = FieldConflictChecker(target_class, field_name)
+            destination.visit(conflict_checker)
+
+            if conflict_checker.has_conflict:
+                raise ValueError(f"Class '{target_class}' already has a field named '{field_name}'")
+
+        transformer = MoveFieldTransformer(source_class, field_names, target_class)
+        with phase("transform"):
+            modified_tree = module.visit(transformer)
+
+        classes = {source_class} | index.subclasses(source_class)
+        accesses = AttributeAccessIndex.from_files(files)
+        unambiguous = {name for name in field_names if not accesses.classes_storing(name) - classes}
+        candidates = {path.resolve() for path in accesses.candidate_lines(field_names, classes)}
+        candidates.discard(source_path)
+
+        transaction = FileTransaction()
+        for file_path in sorted(candidates | {destination_path} - {source_path}):
+            if file_path == destination_path:
+                other_module = destination
+            else:
+                with phase("parse"):
+                    other_module = cst.parse_module(file_path.read_text())
+            with phase("transform"):
+                updated = other_module
+                if file_path in candidates:
+                    updater = MovedFieldAccessUpdater(
+                        field_names,
+                        transformer.target_class_lower,
+                        classes,
+                        unambiguous,
+                        ScopeService.for_module(other_module),
+                    )
+                    updated = other_module.visit(updater)
+                if file_path == destination_path:
+                    transformer.update_external = False
+                    updated = updated.visit(transformer)
+            if updated.code != other_module.code:
+                transaction.stage(file_path, updated.code)
 
-        if conflict_checker.has_conflict:
-            raise ValueError(f"Class '{target_class}' already has a field named '{field_name}'")
+        transaction.stage(source_path, modified_tree.code)
+        transaction.commit()
 
-        transformer = MoveFieldTransformer(source_class, field_name, target_class)
-        modified_tree = module.visit(transformer)
+    def _parse_source(self) -> tuple[str, list[str]]:
+        """Parse the source parameter into the class and the fields to move.
 
-        self.file_path.write_text(modified_tree.code)
+        Returns:
+            The source class name and the field names, in order
+
+        Raises:
+            ValueError: If the source parameter is malformed
+        """
+        source = self.params["source"]
+        parts = source.split("::")
+        field_names = [name.strip() for name in parts[-1].split(",")] if len(parts) == 2 else []
+        if not field_names or not all(name.isidentifier() for name in field_names):
+            raise ValueError(
+                f"Invalid source format: {source}. Expected format: ClassName::field_name"
+            )
+        return parts[0], list(dict.fromkeys(field_names))
 
 
 class MoveFieldTransformer(cst.CSTTransformer):
     """Transforms classes to move a field from one class to another."""
 
-    def __init__(self, source_class: str, field_name: str, target_class: str) -> None:
+    def __init__(self, source_class: str, field_names: Sequence[str], target_class: str) -> None:
         """Initialize the transformer.
 
         Args:
-            source_class: Name of the class to move the field from
-            field_name: Name of the field to move
-            target_class: Name of the class to move the field to
+            source_class: Name of the class to move the fields from
+            field_names: Names of the fields to move
+            target_class: Name of the class to move the fields to
         """
         self.source_class = source_class
-        self.field_name = field_name
+        self.field_names = list(field_names)
         self.target_class = target_class
         # Convert camelCase/PascalCase to snake_case
         self.target_class_lower = re.sub(r"(?<!^)(?=[A-Z])", "_", target_class).lower()
-        self.field_value: cst.BaseExpression | None = None
+        # Moved field -> the value it was initialized with in the source class
+        self.field_values: dict[str, cst.BaseExpression] = {}
+        # Whether to update accesses in classes other than source and target
+        self.update_external = True
+
+    def visit_Module(self, node: cst.Module) -> None:  # noqa: N802
+        """Record the values the source class's __init__ gives the moved fields.
+
+        They are needed by the target class, which may come first in the module.
+        """
+        for stmt in node.body:
+            if isinstance(stmt, cst.ClassDef) and stmt.name.value == self.source_class:
+                for item in stmt.body.body:
+                    if isinstance(item, cst.FunctionDef) and item.name.value == "__init__":
+                        self._record_field_values(item)
+
+    def _record_field_values(self, init: cst.FunctionDef) -> None:
+        """Record the values assigned to the moved fields in an __init__."""
+        if not isinstance(init.body, cst.IndentedBlock):
+            return
+        for stmt in init.body.body:
+            if not isinstance(stmt, cst.SimpleStatementLine):
+                continue
+            for item in stmt.body:
+                if isinstance(item, cst.Assign) and self._is_field_assignment(item):
+                    for target in item.targets:
+                        if isinstance(target.target, cst.Attribute):
+                            self.field_values[target.target.attr.value] = item.value
 
     def leave_ClassDef(  # noqa: N802
         self, original_node: cst.ClassDef, updated_node: cst.ClassDef
@@ -128,7 +225,7 @@ class MoveFieldTransformer(cst.CSTTransformer):
             return self._transform_source_class(updated_node)
         elif original_node.name.value == self.target_class:
             return self._transform_target_class(updated_node)
-        else:
+        elif self.update_external:
             # Update field references in other classes
             return self._update_external_class_references(updated_node)
         return updated_node
@@ -164,7 +261,7 @@ class MoveFieldTransformer(cst.CSTTransformer):
                 if (
                     isinstance(target.target.value, cst.Name)
                     and target.target.value.value == "self"
-                    and target.target.attr.value == self.field_name
+                    and target.target.attr.value in self.field_names
                 ):
                     return True
         return False
@@ -189,7 +286,6 @@ class MoveFieldTransformer(cst.CSTTransformer):
                     keep_stmt = True
                     for item in stmt.body:
                         if isinstance(item, cst.Assign) and self._is_field_assignment(item):
-                            self.field_value = item.value
                             keep_stmt = False
                             break
                         # Check if this is already an assignment to self.target_class_lower
@@ -233,24 +329,29 @@ class MoveFieldTransformer(cst.CSTTransformer):
 
     def _update_field_references(self, node: cst.FunctionDef) -> cst.FunctionDef:
         """Update references to the moved field in methods."""
-        transformer = FieldReferenceUpdater(self.field_name, self.target_class_lower)
+        transformer = FieldReferenceUpdater(self.field_names, self.target_class_lower)
         return cast(cst.FunctionDef, node.visit(transformer))
 
     def _update_external_class_references(self, node: cst.ClassDef) -> cst.ClassDef:
         """Update field references in classes other than source and target."""
         transformer = ExternalFieldReferenceUpdater(
-            self.source_class, self.field_name, self.target_class_lower
+            self.source_class, self.field_names, self.target_class_lower
         )
         return cast(cst.ClassDef, node.visit(transformer))
 
-    def _create_field_assignment(self) -> cst.SimpleStatementLine:
-        """Create a field assignment statement for the moved field.
+    def _field_value(self, field_name: str) -> cst.BaseExpression:
+        """Return the value a moved field is initialized with in the source class.
 
-        Uses the field's original value if available, otherwise defaults to 0.05
-        (matching the test fixture's interest_rate default).
+        Raises:
+            ValueError: If the source class's __init__ does not assign the field
         """
-        field_value = self.field_value if self.field_value else cst.Float("0.05")
-        return create_field_assignment(self.field_name, field_value)
+        value = self.field_values.get(field_name)
+        if value is None:
+            raise ValueError(
+                f"Field '{field_name}' is not assigned in '{self.source_class}.__init__', "
+                f"so there is no value to initialize it with in '{self.target_class}'"
+            )
+        return value
 
     def _transform_target_class(self, node: cst.ClassDef) -> cst.ClassDef:
         """Transform the target class to add the field."""
@@ -282,30 +383,31 @@ class MoveFieldTransformer(cst.CSTTransformer):
         if isinstance(node.body, cst.IndentedBlock):
             new_stmts = list(node.body.body)
 
-        new_stmts.append(self._create_field_assignment())
+        new_stmts.extend(
+            create_field_assignment(name, self._field_value(name)) for name in self.field_names
+        )
 
         return node.with_changes(body=cst.IndentedBlock(body=tuple(new_stmts)))
 
     def _create_init_with_field(self) -> cst.FunctionDef:
         """Create a new __init__ method with the field."""
-        field_value = self.field_value if self.field_value else cst.Float("0.05")
         return create_init_method(
             params=[],
-            field_assignments={self.field_name: field_value},
+            field_assignments={name: self._field_value(name) for name in self.field_names},
         )
 
 
 class FieldReferenceUpdater(cst.CSTTransformer):
     """Updates references to a field to use a different path."""
 
-    def __init__(self, field_name: str, target_class_lower: str) -> None:
+    def __init__(self, field_names: Sequence[str], target_class_lower: str) -> None:
         """Initialize the updater.
 
         Args:
-            field_name: Name of the field to update
+            field_names: Names of the fields to update
             target_class_lower: Name of the target class reference
         """
-        self.field_name = field_name
+        self.field_names = set(field_names)
         self.target_class_lower = target_class_lower
 
     def leave_Attribute(  # noqa: N802
@@ -315,11 +417,11 @@ class FieldReferenceUpdater(cst.CSTTransformer):
         if (
             isinstance(updated_node.value, cst.Name)
             and updated_node.value.value == "self"
-            and updated_node.attr.value == self.field_name
+            and updated_node.attr.value in self.field_names
         ):
             return cst.Attribute(
                 value=cst.Attribute(value=cst.Name("self"), attr=cst.Name(self.target_class_lower)),
-                attr=cst.Name(self.field_name),
+                attr=updated_node.attr,
             )
         return updated_node
 
@@ -327,16 +429,18 @@ class FieldReferenceUpdater(cst.CSTTransformer):
 class ExternalFieldReferenceUpdater(cst.CSTTransformer):
     """Updates references to a field in external classes (not source or target)."""
 
-    def __init__(self, source_class: str, field_name: str, target_class_lower: str) -> None:
+    def __init__(
+        self, source_class: str, field_names: Sequence[str], target_class_lower: str
+    ) -> None:
         """Initialize the updater.
 
         Args:
             source_class: Name of the source class
-            field_name: Name of the field to update
+            field_names: Names of the fields to update
             target_class_lower: Name of the target class reference
         """
         self.source_class = source_class
-        self.field_name = field_name
+        self.field_names = set(field_names)
         self.target_class_lower = target_class_lower
         # Convert source class to snake_case for instance variable name
         self.source_class_lower = re.sub(r"(?<!^)(?=[A-Z])", "_", source_class).lower()
@@ -350,7 +454,7 @@ class ExternalFieldReferenceUpdater(cst.CSTTransformer):
         Also transforms: param.field -> param.target_instance.field (for parameters)
         """
         # Check if this is an access to the field we're looking for
-        if updated_node.attr.value == self.field_name:
+        if updated_node.attr.value in self.field_names:
             # Pattern 1: self.account.interest_rate -> self.account.account_type.interest_rate
             if isinstance(updated_node.value, cst.Attribute):
                 # We have something like obj.something.field_name
@@ -364,7 +468,7 @@ class ExternalFieldReferenceUpdater(cst.CSTTransformer):
                         value=cst.Attribute(
                             value=updated_node.value, attr=cst.Name(self.target_class_lower)
                         ),
-                        attr=cst.Name(self.field_name),
+                        attr=updated_node.attr,
                     )
             # Pattern 2: other_account.interest_rate -> other_account.account_type.interest_rate
             # This handles function parameters or local variables that are instances of source class
@@ -383,9 +487,58 @@ class ExternalFieldReferenceUpdater(cst.CSTTransformer):
                         value=cst.Attribute(
                             value=updated_node.value, attr=cst.Name(self.target_class_lower)
                         ),
-                        attr=cst.Name(self.field_name),
+                        attr=updated_node.attr,
                     )
         return updated_node
 
 
+class MovedFieldAccessUpdater(cst.CSTTransformer):
+    """Updates accesses of moved fields on source class instances in any module.
+
+    Receivers are resolved through ScopeService: ``obj.field`` becomes
+    ``obj.target.field`` when ``obj`` is an instance of the source class or one
+    of its subclasses. When the receiver's class is unknown, the access is
+    updated only if no other class stores a field of that name.
+    """
+
+    def __init__(
+        self,
+        field_names: Iterable[str],
+        target_class_lower: str,
+        classes: set[str],
+        unambiguous: set[str],
+        scopes: ScopeService,
+    ) -> None:
+        """Initialize the updater.
+
+        Args:
+            field_names: Names of the moved fields
+            target_class_lower: Name of the target class reference
+            classes: The source class and its subclasses
+            unambiguous: Moved fields no other class stores
+            scopes: Scope analysis of the module being transformed
+        """
+        self.field_names = set(field_names)
+        self.target_class_lower = target_class_lower
+        self.classes = classes
+        self.unambiguous = unambiguous
+        self.scopes = scopes
+
+    def leave_Attribute(  # noqa: N802
+        self, original_node: cst.Attribute, updated_node: cst.Attribute
+    ) -> cst.Attribute:
+        """Insert the target class reference between a source instance and a moved field."""
+        field_name = original_node.attr.value
+        if field_name not in self.field_names:
+            return updated_node
+        class_name = self.scopes.attribute_class(original_node)
+        if class_name is None and field_name not in self.unambiguous:
+            return updated_node
+        if class_name is not None and class_name not in self.classes:
+            return updated_node
+        return updated_node.with_changes(
+            value=cst.Attribute(value=updated_node.value, attr=cst.Name(self.target_class_lower))
+        )
+
+
 register_command(MoveFieldCommand)
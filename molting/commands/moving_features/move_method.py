@@ -1,5 +1,6 @@
 """Move Method refactoring command."""
 
+from pathlib import Path
 from typing import Any
 
 import libcst as cst
@@ -8,6 +9,17 @@ from molting.commands.base import BaseCommand
 from molting.commands.registry import register_command
 from molting.core.ast_utils import find_self_field_assignment, is_self_attribute, parse_target
 from molting.core.code_generation_utils import create_parameter
+from molting.core.file_transaction import FileTransaction
+from molting.core.import_graph import ImportGraph
+from molting.core.method_mover import (
+    MovedMethod,
+    carry_imports,
+    rewrite_callers,
+    rewrite_callers_in_files,
+)
+from molting.core.profiling import phase
+from molting.core.project_index import ProjectIndex
+from molting.core.scope_service import ScopeService
 from molting.core.visitors import MethodConflictChecker, SelfFieldCollector
 
 
@@ -71,42 +83,186 @@ class MoveMethodCommand(BaseCommand):
     def execute(self) -> None:
         """Apply move-method refactoring using libCST.
 
+        The target class may be defined in another module of the file's
+        directory; the method is then moved there and the names it uses are
+        imported. With ``update_callers``, calls across the directory are
+        redirected to the target instance and the delegating method is
+        dropped unless some reference could not be rewritten.
+
         Raises:
             ValueError: If method not found or target format is invalid
         """
         source = self.params["source"]
         to_class = self.params["to"]
+        update_callers = self.params.get("update_callers", False)
 
         source_class, method_name = parse_target(source, expected_parts=2)
 
-        # Check if target class already has a method with the same name
-        source_code = self.file_path.read_text()
-        module = cst.parse_module(source_code)
+        with phase("parse"):
+            module = cst.parse_module(self.file_path.read_text())
+        defines_target = any(
+            isinstance(stmt, cst.ClassDef) and stmt.name.value == to_class for stmt in module.body
+        )
+        if defines_target and not update_callers:
+            self._check_conflict(module, to_class, method_name)
+            self.apply_libcst_transform(MoveMethodTransformer, source_class, method_name, to_class)
+            return
+
+        index = ProjectIndex.build(self.file_path.parent)
+        source_path = self.file_path.resolve()
+        if defines_target:
+            destination_path = source_path
+        else:
+            destination_path = index.get_class(to_class).file_path.resolve()
+        self._move(index, module, source_path, destination_path, update_callers)
+
+    def _move(
+        self,
+        index: ProjectIndex,
+        module: cst.Module,
+        source_path: Path,
+        destination_path: Path,
+        update_callers: bool,
+    ) -> None:
+        """Move the method to a class of any module, optionally updating callers.
+
+        Args:
+            index: Index of the project's classes
+            module: The parsed source module
+            source_path: File the method is moved from
+            destination_path: File defining the target class
+            update_callers: Redirect calls of the method to the target instance
+
+        Raises:
+            ValueError: If the method or the field holding the target is not
+                found, the target already has the method, or the method's
+                callers cannot be redirected
+        """
+        source_class, method_name = parse_target(self.params["source"], expected_parts=2)
+        to_class = self.params["to"]
+        directory = self.file_path.parent
+        same_file = destination_path == source_path
+
+        if same_file:
+            destination = module
+        else:
+            with phase("parse"):
+                destination = cst.parse_module(destination_path.read_text())
+        self._check_conflict(destination, to_class, method_name)
+
+        # Analyze the method before any rewriting: the field holding the target,
+        # the fields it takes as parameters and the module-level names it reads
+        probe = MoveMethodTransformer(source_class, method_name, to_class)
+        with phase("transform"):
+            module.visit(probe)
+        assert probe.target_class_field is not None
+        scopes = ScopeService.for_module(module)
+        function = scopes.find_function(source_class, method_name)
+        global_names = scopes.global_reads(function) if function is not None else {}
+
+        transaction = FileTransaction()
+        skipped = 0
+        if update_callers:
+            spec = self._moved_method(index, probe.target_class_field, probe.passed_fields)
+            updater = self.create_call_site_updater(directory)
+            candidates = {path.resolve() for path in updater.find_candidate_lines([method_name])}
+            candidates -= {source_path, destination_path}
+            results = rewrite_callers_in_files(sorted(candidates), spec)
+            for file_path, (new_code, file_skipped) in results.items():
+                skipped += file_skipped
+                if new_code is not None:
+                    transaction.stage(file_path, new_code)
+            with phase("transform"):
+                module, file_skipped = rewrite_callers(module, spec)
+                skipped += file_skipped
+                if not same_file:
+                    destination, file_skipped = rewrite_callers(destination, spec)
+                    skipped += file_skipped
+
+        transformer = MoveMethodTransformer(
+            source_class, method_name, to_class, keep_delegate=not update_callers or skipped > 0
+        )
+        with phase("transform"):
+            module = module.visit(transformer)
+            if not same_file:
+                graph = ImportGraph.for_directory(directory)
+                destination, transformer.local_imports = carry_imports(
+                    global_names, source_path, destination, destination_path, graph
+                )
+                destination = destination.visit(transformer)
+                transaction.stage(destination_path, destination.code)
+        transaction.stage(source_path, module.code)
+        transaction.commit()
+
+    def _moved_method(
+        self, index: ProjectIndex, field: str, passed_fields: list[str]
+    ) -> MovedMethod:
+        """Describe how calls of the method are redirected.
+
+        Args:
+            index: Index of the project's classes
+            field: Field of the source class holding the target instance
+            passed_fields: Source class fields the moved method takes as parameters
+
+        Returns:
+            The caller rewrite specification
+
+        Raises:
+            ValueError: If the method is overridden in the source class's hierarchy,
+                so calls could not be redirected without changing behavior
+        """
+        source_class, method_name = parse_target(self.params["source"], expected_parts=2)
+        classes = {source_class} | index.subclasses(source_class)
+        others = index.classes_defining(method_name) - {source_class}
+        if others & (classes | set(index.ancestors(source_class))):
+            raise ValueError(
+                f"Cannot update callers: '{method_name}' is overridden in the hierarchy "
+                f"of '{source_class}'"
+            )
+        return MovedMethod(method_name, frozenset(classes), field, tuple(passed_fields), not others)
+
+    def _check_conflict(self, module: cst.Module, to_class: str, method_name: str) -> None:
+        """Check that the target class does not already have a method with the same name.
+
+        Raises:
+            ValueError: If the target class already has the method
+        """
         conflict_checker = MethodConflictChecker(to_class, method_name)
         module.visit(conflict_checker)
 
         if conflict_checker.has_conflict:
             raise ValueError(f"Class '{to_class}' already has a method named '{method_name}'")
 
-        self.apply_libcst_transform(MoveMethodTransformer, source_class, method_name, to_class)
-
 
 class MoveMethodTransformer(cst.CSTTransformer):
     """Transforms code by moving a method from one class to another."""
 
-    def __init__(self, source_class: str, method_name: str, target_class: str) -> None:
+    def __init__(
+        self,
+        source_class: str,
+        method_name: str,
+        target_class: str,
+        keep_delegate: bool = True,
+    ) -> None:
         """Initialize the transformer.
 
         Args:
             source_class: Name of the class containing the method to move
             method_name: Name of the method to move
             target_class: Name of the class to move the method to
+            keep_delegate: Leave a method delegating to the moved one in the
+                source class; if False the method is removed from it
         """
         self.source_class = source_class
         self.method_name = method_name
         self.target_class = target_class
+        self.keep_delegate = keep_delegate
         self.method_to_move: cst.FunctionDef | None = None
         self.target_class_field: str | None = None
+        # Source class fields the moved method takes as parameters
+        self.passed_fields: list[str] = []
+        # Statements (imports) to put at the top of the moved method's body
+        self.local_imports: list[cst.SimpleStatementLine] = []
 
     def leave_ClassDef(  # noqa: N802
         self, original_node: cst.ClassDef, updated_node: cst.ClassDef
@@ -139,8 +295,10 @@ class MoveMethodTransformer(cst.CSTTransformer):
                 self.target_class_field = self._find_target_class_field(node)
                 # Pre-compute parameter mapping for use in delegation method
                 self._param_mapping = self._compute_param_mapping(item)
+                self.passed_fields = list(self._param_mapping)
                 delegation_method = self._create_delegation_method(item)
-                updated_class_members.append(delegation_method)
+                if self.keep_delegate:
+                    updated_class_members.append(delegation_method)
             else:
                 updated_class_members.append(item)
 
@@ -149,6 +307,9 @@ class MoveMethodTransformer(cst.CSTTransformer):
                 f"Method '{self.method_name}' not found in class '{self.source_class}'"
             )
 
+        if not updated_class_members:
+            updated_class_members.append(cst.SimpleStatementLine(body=[cst.Pass()]))
+
         return node.with_changes(body=node.body.with_changes(body=tuple(updated_class_members)))
 
     def _process_target_class(self, node: cst.ClassDef) -> cst.ClassDef:
@@ -238,6 +399,7 @@ class MoveMethodTransformer(cst.CSTTransformer):
             cst.Arg(value=cst.Attribute(value=cst.Name("self"), attr=cst.Name(param)))
             for param in params_to_pass
         ]
+        args.extend(_forwarded_args(original_method.params))
 
         if self.target_class_field is None:
             raise ValueError(
@@ -341,6 +503,9 @@ class MoveMethodTransformer(cst.CSTTransformer):
             clean_name = param_name.lstrip("_") if param_name.startswith("_") else param_name
             param_mapping[param_name] = clean_name
             new_params.append(create_parameter(clean_name))
+        # The method's own parameters follow the fields it now receives
+        original_params = self.method_to_move.params
+        new_params.extend([*original_params.posonly_params, *original_params.params][1:])
 
         body_transformer = SelfReferenceReplacer(param_mapping, self.target_class_field)
         transformed_body = self.method_to_move.body.visit(body_transformer)
@@ -350,10 +515,64 @@ class MoveMethodTransformer(cst.CSTTransformer):
         if self.method_to_move.decorators and isinstance(transformed_body, cst.IndentedBlock):
             transformed_body = self._remove_docstring_from_body(transformed_body)
 
+        if self.local_imports and isinstance(transformed_body, cst.IndentedBlock):
+            transformed_body = self._insert_after_docstring(transformed_body, self.local_imports)
+
         return self.method_to_move.with_changes(
-            params=cst.Parameters(params=new_params), body=transformed_body, decorators=()
+            params=cst.Parameters(
+                params=new_params,
+                star_arg=original_params.star_arg,
+                kwonly_params=original_params.kwonly_params,
+                star_kwarg=original_params.star_kwarg,
+            ),
+            body=transformed_body,
+            decorators=(),
         )
 
+    def _insert_after_docstring(
+        self, body: cst.IndentedBlock, statements: list[cst.SimpleStatementLine]
+    ) -> cst.IndentedBlock:
+        """Insert statements at the top of a body, after its docstring.
+
+        Args:
+            body: The method body
+            statements: The statements to insert
+
+        Returns:
+            The body with the statements inserted
+        """
+        stmts = list(body.body)
+        insert_at = 0
+        if stmts and isinstance(stmts[0], cst.SimpleStatementLine) and len(stmts[0].body) == 1:
+            first = stmts[0].body[0]
+            if isinstance(first, cst.Expr) and isinstance(first.value, cst.SimpleString):
+                insert_at = 1
+        return body.with_changes(body=tuple(stmts[:insert_at] + statements + stmts[insert_at:]))
+
+
+def _forwarded_args(params: cst.Parameters) -> list[cst.Arg]:
+    """Build the arguments passing a method's own parameters (all but self) on.
+
+    Args:
+        params: The method's parameters
+
+    Returns:
+        Positional arguments, ``*args``, keyword arguments and ``**kwargs``, in order
+    """
+    args = [
+        cst.Arg(value=cst.Name(param.name.value))
+        for param in [*params.posonly_params, *params.params][1:]
+    ]
+    if isinstance(params.star_arg, cst.Param):
+        args.append(cst.Arg(value=cst.Name(params.star_arg.name.value), star="*"))
+    args.extend(
+        cst.Arg(value=cst.Name(param.name.value), keyword=cst.Name(param.name.value))
+        for param in params.kwonly_params
+    )
+    if params.star_kwarg is not None:
+        args.append(cst.Arg(value=cst.Name(params.star_kwarg.name.value), star="**"))
+    return args
+
 
 class SelfReferenceReplacer(cst.CSTTransformer):
     """Replaces self.field with parameter references and self.target_field.x with self.x."""
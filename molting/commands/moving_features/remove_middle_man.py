@@ -86,7 +86,7 @@ class RemoveMiddleManCommand(BaseCommand):
         # Update call sites for all removed delegation methods
         if transformer.delegate_field and transformer.delegation_methods:
             directory = self.file_path.parent
-            updater = CallSiteUpdater(directory)
+            updater = self.create_call_site_updater(directory)
 
             # Get the public name of the delegate field (without leading underscore)
             public_field_name = transformer.delegate_field.lstrip("_")
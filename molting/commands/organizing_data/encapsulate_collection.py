@@ -101,7 +101,7 @@ class EncapsulateCollectionCommand(BaseCommand):
         # Update call sites for the encapsulated field
         # External references to obj.field_name should become obj.get_field_name()
         directory = self.file_path.parent
-        updater = CallSiteUpdater(directory)
+        updater = self.create_call_site_updater(directory)
         getter_name = f"get_{field_name}"
         self._update_field_access_sites(updater, field_name, getter_name, class_name)
 
@@ -6,8 +6,9 @@ import libcst as cst
 
 from molting.commands.base import BaseCommand
 from molting.commands.registry import register_command
-from molting.core.ast_utils import parse_target
+from molting.core.ast_utils import parse_field_targets, resolve_field_targets
 from molting.core.code_generation_utils import create_parameter
+from molting.core.profiling import phase
 
 INIT_METHOD_NAME = "__init__"
 
@@ -50,6 +51,11 @@ class EncapsulateFieldCommand(BaseCommand):
 
         person = Person("Alice")
         person.name = "Bob"  # Access via property, validation possible
+
+    Several fields are encapsulated in one pass with ``Person::name,email``,
+    ``Person::name,Team::members`` or just ``Person`` for every public field
+    assigned in ``__init__``. Callers keep using ``person.name``, which now goes
+    through the property, so no other file has to change.
     """
 
     name = "encapsulate-field"
@@ -68,37 +74,35 @@ class EncapsulateFieldCommand(BaseCommand):
         Raises:
             ValueError: If transformation cannot be applied
         """
-        target = self.params["target"]
-        class_name, field_name = parse_target(target)
+        targets = parse_field_targets(self.params["target"])
 
-        source_code = self.file_path.read_text()
-        module = cst.parse_module(source_code)
+        with phase("parse"):
+            module = cst.parse_module(self.file_path.read_text())
 
-        transformer = EncapsulateFieldTransformer(class_name, field_name)
-        modified_tree = module.visit(transformer)
+        transformer = EncapsulateFieldTransformer(resolve_field_targets(module, targets))
+        with phase("transform"):
+            modified_tree = module.visit(transformer)
 
         self.file_path.write_text(modified_tree.code)
 
 
 class EncapsulateFieldTransformer(cst.CSTTransformer):
-    """Transforms a public field into a private field with getter and setter."""
+    """Transforms public fields into private fields with getters and setters."""
 
-    def __init__(self, class_name: str, field_name: str) -> None:
+    def __init__(self, fields: dict[str, list[str]]) -> None:
         """Initialize the transformer.
 
         Args:
-            class_name: Name of the class containing the field
-            field_name: Name of the field to encapsulate
+            fields: Class name -> names of the fields to encapsulate
         """
-        self.class_name = class_name
-        self.field_name = field_name
-        self.private_field_name = f"_{field_name}"
+        self.fields = fields
 
     def leave_ClassDef(  # noqa: N802
         self, original_node: cst.ClassDef, updated_node: cst.ClassDef
     ) -> cst.ClassDef:
-        """Modify the target class to encapsulate the field."""
-        if updated_node.name.value != self.class_name:
+        """Modify a target class to encapsulate its fields."""
+        field_names = self.fields.get(updated_node.name.value)
+        if not field_names:
             return updated_node
 
         new_body: list[cst.BaseStatement] = []
@@ -107,39 +111,43 @@ class EncapsulateFieldTransformer(cst.CSTTransformer):
         for stmt in updated_node.body.body:
             if isinstance(stmt, cst.FunctionDef):
                 if stmt.name.value == INIT_METHOD_NAME:
-                    new_body.append(self._transform_init_method(stmt))
+                    new_body.append(self._transform_init_method(stmt, field_names))
                 else:
                     new_body.append(stmt)
             else:
                 new_body.append(cast(cst.BaseStatement, stmt))
 
-        # Add property getter
-        new_body.append(self._create_property_getter())
-
-        # Add property setter
-        new_body.append(self._create_property_setter())
+        # Add a property getter and setter per field
+        for field_name in field_names:
+            new_body.append(self._create_property_getter(field_name))
+            new_body.append(self._create_property_setter(field_name))
 
         return updated_node.with_changes(body=cst.IndentedBlock(body=new_body))
 
-    def _is_field_assignment(self, target: cst.AssignTarget) -> bool:
-        """Check if an assignment target is assigning to the target field.
+    def _assigned_field(self, target: cst.AssignTarget, field_names: list[str]) -> str | None:
+        """Return the target field an assignment target assigns to.
 
         Args:
             target: The assignment target to check
+            field_names: Names of the fields being encapsulated
 
         Returns:
-            True if this is an assignment to self.field_name
+            The field name if this is an assignment to self.<field>, None otherwise
         """
         if not isinstance(target.target, cst.Attribute):
-            return False
-        if not isinstance(target.target.value, cst.Name):
-            return False
-        return target.target.value.value == "self" and target.target.attr.value == self.field_name
-
-    def _create_private_field_assignment(self, value: cst.BaseExpression) -> cst.Assign:
+            return None
+        if not isinstance(target.target.value, cst.Name) or target.target.value.value != "self":
+            return None
+        field_name = target.target.attr.value
+        return field_name if field_name in field_names else None
+
+    def _create_private_field_assignment(
+        self, field_name: str, value: cst.BaseExpression
+    ) -> cst.Assign:
         """Create an assignment to the private field.
 
         Args:
+            field_name: Public name of the field
             value: The value to assign
 
         Returns:
@@ -150,18 +158,21 @@ class EncapsulateFieldTransformer(cst.CSTTransformer):
                 cst.AssignTarget(
                     target=cst.Attribute(
                         value=cst.Name("self"),
-                        attr=cst.Name(self.private_field_name),
+                        attr=cst.Name(f"_{field_name}"),
                     )
                 )
             ],
             value=value,
         )
 
-    def _transform_init_method(self, init_method: cst.FunctionDef) -> cst.FunctionDef:
-        """Transform __init__ to use private field name.
+    def _transform_init_method(
+        self, init_method: cst.FunctionDef, field_names: list[str]
+    ) -> cst.FunctionDef:
+        """Transform __init__ to use private field names.
 
         Args:
             init_method: The __init__ method
+            field_names: Names of the fields being encapsulated
 
         Returns:
             Modified __init__ method
@@ -175,9 +186,12 @@ class EncapsulateFieldTransformer(cst.CSTTransformer):
                     if isinstance(body_item, cst.Assign):
                         modified = False
                         for target in body_item.targets:
-                            if self._is_field_assignment(target):
+                            field_name = self._assigned_field(target, field_names)
+                            if field_name is not None:
                                 # Change self.name to self._name
-                                new_assign = self._create_private_field_assignment(body_item.value)
+                                new_assign = self._create_private_field_assignment(
+                                    field_name, body_item.value
+                                )
                                 new_stmt_body.append(new_assign)
                                 modified = True
                                 break
@@ -191,14 +205,17 @@ class EncapsulateFieldTransformer(cst.CSTTransformer):
 
         return init_method.with_changes(body=cst.IndentedBlock(body=new_body))
 
-    def _create_property_getter(self) -> cst.FunctionDef:
+    def _create_property_getter(self, field_name: str) -> cst.FunctionDef:
         """Create the @property getter method.
 
+        Args:
+            field_name: Public name of the field
+
         Returns:
             Property getter method
         """
         return cst.FunctionDef(
-            name=cst.Name(self.field_name),
+            name=cst.Name(field_name),
             params=cst.Parameters(params=[create_parameter("self")]),
             body=cst.IndentedBlock(
                 body=[
@@ -206,7 +223,7 @@ class EncapsulateFieldTransformer(cst.CSTTransformer):
                         body=[
                             cst.Return(
                                 value=cst.Attribute(
-                                    value=cst.Name("self"), attr=cst.Name(self.private_field_name)
+                                    value=cst.Name("self"), attr=cst.Name(f"_{field_name}")
                                 )
                             )
                         ]
@@ -217,14 +234,17 @@ class EncapsulateFieldTransformer(cst.CSTTransformer):
             leading_lines=[cst.EmptyLine()],
         )
 
-    def _create_property_setter(self) -> cst.FunctionDef:
+    def _create_property_setter(self, field_name: str) -> cst.FunctionDef:
         """Create the @name.setter method.
 
+        Args:
+            field_name: Public name of the field
+
         Returns:
             Property setter method
         """
         return cst.FunctionDef(
-            name=cst.Name(self.field_name),
+            name=cst.Name(field_name),
             params=cst.Parameters(params=[create_parameter("self"), create_parameter("value")]),
             body=cst.IndentedBlock(
                 body=[
@@ -235,7 +255,7 @@ class EncapsulateFieldTransformer(cst.CSTTransformer):
                                     cst.AssignTarget(
                                         target=cst.Attribute(
                                             value=cst.Name("self"),
-                                            attr=cst.Name(self.private_field_name),
+                                            attr=cst.Name(f"_{field_name}"),
                                         )
                                     )
                                 ],
@@ -247,9 +267,7 @@ class EncapsulateFieldTransformer(cst.CSTTransformer):
             ),
             decorators=[
                 cst.Decorator(
-                    decorator=cst.Attribute(
-                        value=cst.Name(self.field_name), attr=cst.Name("setter")
-                    )
+                    decorator=cst.Attribute(value=cst.Name(field_name), attr=cst.Name("setter"))
                 )
             ],
             leading_lines=[cst.EmptyLine()],
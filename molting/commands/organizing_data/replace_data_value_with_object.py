@@ -93,7 +93,7 @@ class ReplaceDataValueWithObjectCommand(BaseCommand):
         # But skip references within the target class (already transformed)
         param_name = transformer.param_name or "name"
         directory = self.file_path.parent
-        updater = CallSiteUpdater(directory)
+        updater = self.create_call_site_updater(directory)
         self._update_field_access_sites(updater, field_name, param_name, class_name)
 
     def _update_field_access_sites(
@@ -8,6 +8,14 @@ from libcst import metadata
 from molting.commands.base import BaseCommand
 from molting.commands.registry import register_command
 from molting.core.ast_utils import parse_line_number, parse_target_with_line
+from molting.core.constant_replacer import (
+    ConstantReplacement,
+    parse_number,
+    rewrite_constant_in_files,
+)
+from molting.core.file_transaction import FileTransaction
+from molting.core.import_graph import ImportGraph
+from molting.core.line_index import LineIndex, get_line_index
 from molting.core.name_conflict_validator import NameConflictValidator
 
 
@@ -44,6 +52,13 @@ class ReplaceMagicNumberWithSymbolicConstantCommand(BaseCommand):
             if subtotal > DISCOUNT_THRESHOLD:
                 return subtotal * DISCOUNT_RATE
             return subtotal
+
+    With ``across_files=True`` every occurrence in the file's directory is
+    replaced, and ``module=<path>`` puts the constant in another module
+    (created if missing, reused if it already holds the same value), importing
+    it where the number was replaced. The number comes from the target line, or
+    from ``value=<number>`` instead of a target. Every file is written in one
+    transaction.
     """
 
     name = "replace-magic-number-with-symbolic-constant"
@@ -54,7 +69,9 @@ class ReplaceMagicNumberWithSymbolicConstantCommand(BaseCommand):
         Raises:
             ValueError: If required parameters are missing or invalid
         """
-        self.validate_required_params("target", "name")
+        self.validate_required_params("name")
+        if "target" not in self.params and "value" not in self.params:
+            raise ValueError(f"Missing required parameters for {self.name}: target or value")
 
         constant_name = self.params["name"]
         if not constant_name.isupper() or not constant_name.replace("_", "").isalnum():
@@ -66,6 +83,14 @@ class ReplaceMagicNumberWithSymbolicConstantCommand(BaseCommand):
         Raises:
             ValueError: If transformation cannot be applied
         """
+        if (
+            "value" in self.params
+            or "module" in self.params
+            or self.params.get("across_files", False)
+        ):
+            self._replace_everywhere()
+            return
+
         target = self.params["target"]
         constant_name = self.params["name"]
 
@@ -79,18 +104,16 @@ class ReplaceMagicNumberWithSymbolicConstantCommand(BaseCommand):
         validator = NameConflictValidator(source_code)
         validator.validate_constant_name(constant_name)
 
-        # First pass: extract the magic number from the target line
-        wrapper = metadata.MetadataWrapper(cst.parse_module(source_code))
-        extractor = MagicNumberExtractor(class_or_function_name, method_name, target_line)
-        wrapper.visit(extractor)
+        # Look up the magic number on the target line directly from the line index
+        index = get_line_index(source_code)
+        extractor = MagicNumberExtractor(index, class_or_function_name, method_name, target_line)
 
         if extractor.magic_number is None:
             raise ValueError(
                 f"Could not find a magic number on line {target_line} in {class_or_function_name}"
             )
 
-        # Second pass: replace magic number and add constant
-        wrapper = metadata.MetadataWrapper(cst.parse_module(source_code))
+        # Replace magic number and add constant
         transformer = ReplaceMagicNumberTransformer(
             class_or_function_name,
             method_name,
@@ -98,20 +121,76 @@ class ReplaceMagicNumberWithSymbolicConstantCommand(BaseCommand):
             constant_name,
             extractor.magic_number,
         )
-        modified_tree = wrapper.visit(transformer)
+        modified_tree = index.wrapper.visit(transformer)
 
         self.file_path.write_text(modified_tree.code)
 
+    def _replace_everywhere(self) -> None:
+        """Replace every occurrence of the number in the file or its directory.
 
-class MagicNumberExtractor(cst.CSTVisitor):
-    """Extracts the magic number from the specified line."""
+        Raises:
+            ValueError: If the number cannot be found on the target line, the
+                constant's module is not in an existing directory, or the
+                constant's name is already used for something else
+        """
+        directory = self.file_path.parent
+        if "value" in self.params:
+            number = parse_number(str(self.params["value"]))
+        else:
+            number = self._number_on_target_line()
+
+        graph = ImportGraph.for_directory(directory)
+        constant_path = (directory / self.params.get("module", self.file_path.name)).resolve()
+        if not constant_path.parent.is_dir():
+            raise ValueError(f"Directory {constant_path.parent} does not exist")
+        spec = ConstantReplacement(number, self.params["name"], graph.module_name(constant_path))
+
+        if self.params.get("across_files", False):
+            files = sorted(path.resolve() for path in directory.rglob("*.py"))
+        else:
+            files = [self.file_path.resolve()]
+        if constant_path not in files:
+            files.append(constant_path)
+
+        transaction = FileTransaction()
+        for file_path, new_code in rewrite_constant_in_files(files, spec, graph).items():
+            if new_code is not None:
+                transaction.stage(file_path, new_code)
+        transaction.commit()
+
+    def _number_on_target_line(self) -> Union[int, float]:
+        """Return the magic number on the target line.
 
-    METADATA_DEPENDENCIES = (metadata.PositionProvider,)
+        Raises:
+            ValueError: If the target line has no number
+        """
+        class_or_function_name, method_name, line_spec = parse_target_with_line(
+            self.params["target"]
+        )
+        target_line = parse_line_number(line_spec)
+        index = get_line_index(self.file_path.read_text())
+        extractor = MagicNumberExtractor(index, class_or_function_name, method_name, target_line)
+        if extractor.magic_number is None:
+            raise ValueError(
+                f"Could not find a magic number on line {target_line} in {class_or_function_name}"
+            )
+        return extractor.magic_number
+
+
+class MagicNumberExtractor:
+    """Extracts the magic number from the specified line."""
 
-    def __init__(self, class_or_function_name: str, method_name: str, target_line: int) -> None:
-        """Initialize the extractor.
+    def __init__(
+        self,
+        index: LineIndex,
+        class_or_function_name: str,
+        method_name: str,
+        target_line: int,
+    ) -> None:
+        """Initialize the extractor and look up the magic number.
 
         Args:
+            index: Line index of the module
             class_or_function_name: Name of the class or function
             method_name: Name of the method (empty string for function-level)
             target_line: Line number where the magic number is located
@@ -120,36 +199,17 @@ class MagicNumberExtractor(cst.CSTVisitor):
         self.method_name = method_name
         self.target_line = target_line
         self.magic_number: Optional[Union[int, float]] = None
-        self.in_target_function = False
 
-    def visit_FunctionDef(self, node: cst.FunctionDef) -> None:  # noqa: N802
-        """Track when we enter the target function."""
-        if self.method_name:
-            # Skip function-level tracking if we're looking for a method
+        function = index.find_function(class_or_function_name, method_name)
+        if function is None:
             return
 
-        if node.name.value == self.class_or_function_name:
-            self.in_target_function = True
-
-    def leave_FunctionDef(self, node: cst.FunctionDef) -> None:  # noqa: N802
-        """Track when we leave the target function."""
-        if node.name.value == self.class_or_function_name:
-            self.in_target_function = False
-
-    def visit_Integer(self, node: cst.Integer) -> None:  # noqa: N802
-        """Extract integer literals."""
-        if self.in_target_function and self._is_on_target_line(node):
-            self.magic_number = int(node.value)
-
-    def visit_Float(self, node: cst.Float) -> None:  # noqa: N802
-        """Extract float literals."""
-        if self.in_target_function and self._is_on_target_line(node):
-            self.magic_number = float(node.value)
-
-    def _is_on_target_line(self, node: cst.CSTNode) -> bool:
-        """Check if a node is on the target line."""
-        pos = self.get_metadata(metadata.PositionProvider, node)
-        return pos.start.line == self.target_line
+        # The last literal on the line wins, as in source order
+        for expression in index.expressions_starting_on(target_line, within=function):
+            if isinstance(expression, cst.Integer):
+                self.magic_number = expression.evaluated_value
+            elif isinstance(expression, cst.Float):
+                self.magic_number = expression.evaluated_value
 
 
 class ReplaceMagicNumberTransformer(cst.CSTTransformer):
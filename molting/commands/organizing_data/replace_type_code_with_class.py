@@ -98,7 +98,7 @@ class ReplaceTypeCodeWithClassCommand(BaseCommand):
         # References to OldClass.CONSTANT should become NewClass.CONSTANT
         if transformer.type_codes:
             directory = self.file_path.parent
-            updater = CallSiteUpdater(directory)
+            updater = self.create_call_site_updater(directory)
             for type_code_name, _ in transformer.type_codes:
                 self._update_type_code_references(
                     updater, class_name, new_class_name, type_code_name
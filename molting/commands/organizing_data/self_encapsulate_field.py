@@ -6,8 +6,9 @@ import libcst as cst
 
 from molting.commands.base import BaseCommand
 from molting.commands.registry import register_command
-from molting.core.ast_utils import parse_target
+from molting.core.ast_utils import parse_field_targets, resolve_field_targets
 from molting.core.code_generation_utils import create_parameter
+from molting.core.profiling import phase
 
 
 class SelfEncapsulateFieldCommand(BaseCommand):
@@ -49,6 +50,10 @@ class SelfEncapsulateFieldCommand(BaseCommand):
 
             def greet(self):
                 return f"Hello, {self.name}"
+
+    Several fields are encapsulated in one pass with ``Range::low,high``,
+    ``Range::low,Span::start`` or just ``Range`` for every public field assigned
+    in ``__init__``.
     """
 
     name = "self-encapsulate-field"
@@ -67,16 +72,14 @@ class SelfEncapsulateFieldCommand(BaseCommand):
         Raises:
             ValueError: If transformation cannot be applied
         """
-        target = self.params["target"]
-
-        # Parse the target to get class and field names
-        class_name, field_name = parse_target(target)
+        targets = parse_field_targets(self.params["target"])
 
-        source_code = self.file_path.read_text()
-        module = cst.parse_module(source_code)
+        with phase("parse"):
+            module = cst.parse_module(self.file_path.read_text())
 
-        transformer = SelfEncapsulateFieldTransformer(class_name, field_name)
-        modified_tree = module.visit(transformer)
+        transformer = SelfEncapsulateFieldTransformer(resolve_field_targets(module, targets))
+        with phase("transform"):
+            modified_tree = module.visit(transformer)
 
         self.file_path.write_text(modified_tree.code)
 
@@ -84,16 +87,13 @@ class SelfEncapsulateFieldCommand(BaseCommand):
 class SelfEncapsulateFieldTransformer(cst.CSTTransformer):
     """Transforms direct field access to use properties."""
 
-    def __init__(self, class_name: str, field_name: str) -> None:
+    def __init__(self, fields: dict[str, list[str]]) -> None:
         """Initialize the transformer.
 
         Args:
-            class_name: Name of the class containing the field
-            field_name: Name of the field to encapsulate
+            fields: Class name -> names of the fields to encapsulate
         """
-        self.class_name = class_name
-        self.field_name = field_name
-        self.private_field_name = f"_{field_name}"
+        self.fields = fields
 
     def leave_ClassDef(  # noqa: N802
         self, original_node: cst.ClassDef, updated_node: cst.ClassDef
@@ -107,41 +107,47 @@ class SelfEncapsulateFieldTransformer(cst.CSTTransformer):
         Returns:
             Transformed class definition with properties
         """
-        if updated_node.name.value != self.class_name:
+        field_names = self.fields.get(updated_node.name.value)
+        if not field_names:
             return updated_node
 
-        new_body, property_exists, last_property_index, init_index = self._process_class_body(
-            updated_node.body.body
+        new_body, existing_properties, last_property_index, init_index = self._process_class_body(
+            updated_node.body.body, field_names
         )
 
-        if property_exists:
+        missing = [name for name in field_names if name not in existing_properties]
+        if not missing:
             return updated_node.with_changes(body=cst.IndentedBlock(body=new_body))
 
         insert_index = last_property_index + 1 if last_property_index >= 0 else init_index + 1
-        final_body = self._insert_properties_at_index(new_body, insert_index)
+        final_body = self._insert_properties_at_index(new_body, insert_index, missing)
         return updated_node.with_changes(body=cst.IndentedBlock(body=final_body))
 
-    def _process_class_body(self, body: Any) -> tuple[list[Any], bool, int, int]:
+    def _process_class_body(
+        self, body: Any, field_names: list[str]
+    ) -> tuple[list[Any], set[str], int, int]:
         """Process class body to transform init and track property locations.
 
         Args:
             body: Class body statements
+            field_names: Names of the fields being encapsulated
 
         Returns:
-            Tuple of (new_body, property_exists, last_property_index, init_index)
+            Tuple of (new_body, fields that already have a property,
+            last_property_index, init_index)
         """
         new_body: list[Any] = []
-        property_exists = False
+        existing_properties: set[str] = set()
         last_property_index = -1
         init_index = -1
 
         for stmt in body:
             if isinstance(stmt, cst.FunctionDef):
                 if stmt.name.value == "__init__":
-                    new_body.append(self._transform_init_method(stmt))
+                    new_body.append(self._transform_init_method(stmt, field_names))
                     init_index = len(new_body) - 1
-                elif stmt.name.value == self.field_name:
-                    property_exists = True
+                elif stmt.name.value in field_names:
+                    existing_properties.add(stmt.name.value)
                     new_body.append(stmt)
                 elif self._is_property_method(stmt):
                     new_body.append(stmt)
@@ -151,14 +157,17 @@ class SelfEncapsulateFieldTransformer(cst.CSTTransformer):
             else:
                 new_body.append(stmt)
 
-        return new_body, property_exists, last_property_index, init_index
+        return new_body, existing_properties, last_property_index, init_index
 
-    def _insert_properties_at_index(self, body: list[Any], insert_index: int) -> list[Any]:
-        """Insert property getter and setter at specified index.
+    def _insert_properties_at_index(
+        self, body: list[Any], insert_index: int, field_names: list[str]
+    ) -> list[Any]:
+        """Insert a property getter and setter per field at specified index.
 
         Args:
             body: Class body statements
             insert_index: Index after which to insert properties
+            field_names: Names of the fields to create properties for
 
         Returns:
             New body with properties inserted
@@ -167,10 +176,11 @@ class SelfEncapsulateFieldTransformer(cst.CSTTransformer):
         for i, stmt in enumerate(body):
             final_body.append(stmt)
             if i == insert_index - 1:
-                final_body.append(cst.EmptyLine(whitespace=cst.SimpleWhitespace("")))
-                final_body.append(self._create_property_getter())
-                final_body.append(cst.EmptyLine(whitespace=cst.SimpleWhitespace("")))
-                final_body.append(self._create_property_setter())
+                for field_name in field_names:
+                    final_body.append(cst.EmptyLine(whitespace=cst.SimpleWhitespace("")))
+                    final_body.append(self._create_property_getter(field_name))
+                    final_body.append(cst.EmptyLine(whitespace=cst.SimpleWhitespace("")))
+                    final_body.append(self._create_property_setter(field_name))
         return final_body
 
     def _is_property_method(self, node: cst.FunctionDef) -> bool:
@@ -191,11 +201,14 @@ class SelfEncapsulateFieldTransformer(cst.CSTTransformer):
                     return True
         return False
 
-    def _transform_init_method(self, init_method: cst.FunctionDef) -> cst.FunctionDef:
-        """Transform __init__ to use private field name.
+    def _transform_init_method(
+        self, init_method: cst.FunctionDef, field_names: list[str]
+    ) -> cst.FunctionDef:
+        """Transform __init__ to use private field names.
 
         Args:
             init_method: The __init__ method
+            field_names: Names of the fields being encapsulated
 
         Returns:
             Modified __init__ method
@@ -204,7 +217,7 @@ class SelfEncapsulateFieldTransformer(cst.CSTTransformer):
 
         for stmt in init_method.body.body:
             if isinstance(stmt, cst.SimpleStatementLine):
-                modified_stmt = self._try_rename_field_assignment(stmt)
+                modified_stmt = self._try_rename_field_assignment(stmt, field_names)
                 new_body.append(modified_stmt if modified_stmt else stmt)
             else:
                 new_body.append(stmt)
@@ -212,61 +225,70 @@ class SelfEncapsulateFieldTransformer(cst.CSTTransformer):
         return init_method.with_changes(body=cst.IndentedBlock(body=new_body))
 
     def _try_rename_field_assignment(
-        self, stmt: cst.SimpleStatementLine
+        self, stmt: cst.SimpleStatementLine, field_names: list[str]
     ) -> cst.SimpleStatementLine | None:
         """Try to rename field assignment to use private name.
 
         Args:
             stmt: Statement line to check
+            field_names: Names of the fields being encapsulated
 
         Returns:
-            Modified statement if it assigns to target field, None otherwise
+            Modified statement if it assigns to a target field, None otherwise
         """
         for body_item in stmt.body:
             if isinstance(body_item, cst.Assign):
                 for target in body_item.targets:
-                    if self._is_assignment_to_field(target.target):
-                        new_target = self._create_private_field_target()
+                    field_name = self._assigned_field(target.target, field_names)
+                    if field_name is not None:
+                        new_target = self._create_private_field_target(field_name)
                         new_assign = body_item.with_changes(targets=[new_target])
                         return stmt.with_changes(body=[new_assign])
         return None
 
-    def _is_assignment_to_field(self, target: cst.BaseExpression) -> bool:
-        """Check if target is assignment to self.field_name.
+    def _assigned_field(self, target: cst.BaseExpression, field_names: list[str]) -> str | None:
+        """Return the target field an assignment target assigns to.
 
         Args:
             target: Assignment target to check
+            field_names: Names of the fields being encapsulated
 
         Returns:
-            True if target is self.field_name
+            The field name if target is self.<field>, None otherwise
         """
         if not isinstance(target, cst.Attribute):
-            return False
-        if not isinstance(target.value, cst.Name):
-            return False
-        return target.value.value == "self" and target.attr.value == self.field_name
+            return None
+        if not isinstance(target.value, cst.Name) or target.value.value != "self":
+            return None
+        return target.attr.value if target.attr.value in field_names else None
 
-    def _create_private_field_target(self) -> cst.AssignTarget:
+    def _create_private_field_target(self, field_name: str) -> cst.AssignTarget:
         """Create assignment target for private field.
 
+        Args:
+            field_name: Public name of the field
+
         Returns:
             Assignment target for self._field_name
         """
         return cst.AssignTarget(
             target=cst.Attribute(
                 value=cst.Name("self"),
-                attr=cst.Name(self.private_field_name),
+                attr=cst.Name(f"_{field_name}"),
             )
         )
 
-    def _create_property_getter(self) -> cst.FunctionDef:
+    def _create_property_getter(self, field_name: str) -> cst.FunctionDef:
         """Create property getter method.
 
+        Args:
+            field_name: Public name of the field
+
         Returns:
             Property getter function definition
         """
         return cst.FunctionDef(
-            name=cst.Name(self.field_name),
+            name=cst.Name(field_name),
             params=cst.Parameters(params=[create_parameter("self")]),
             body=cst.IndentedBlock(
                 body=[
@@ -275,7 +297,7 @@ class SelfEncapsulateFieldTransformer(cst.CSTTransformer):
                             cst.Return(
                                 value=cst.Attribute(
                                     value=cst.Name("self"),
-                                    attr=cst.Name(self.private_field_name),
+                                    attr=cst.Name(f"_{field_name}"),
                                 )
                             )
                         ]
@@ -285,14 +307,17 @@ class SelfEncapsulateFieldTransformer(cst.CSTTransformer):
             decorators=[cst.Decorator(decorator=cst.Name("property"))],
         )
 
-    def _create_property_setter(self) -> cst.FunctionDef:
+    def _create_property_setter(self, field_name: str) -> cst.FunctionDef:
         """Create property setter method.
 
+        Args:
+            field_name: Public name of the field
+
         Returns:
             Property setter function definition
         """
         return cst.FunctionDef(
-            name=cst.Name(self.field_name),
+            name=cst.Name(field_name),
             params=cst.Parameters(
                 params=[
                     create_parameter("self"),
@@ -308,7 +333,7 @@ class SelfEncapsulateFieldTransformer(cst.CSTTransformer):
                                     cst.AssignTarget(
                                         target=cst.Attribute(
                                             value=cst.Name("self"),
-                                            attr=cst.Name(self.private_field_name),
+                                            attr=cst.Name(f"_{field_name}"),
                                         )
                                     )
                                 ],
@@ -320,9 +345,7 @@ class SelfEncapsulateFieldTransformer(cst.CSTTransformer):
             ),
             decorators=[
                 cst.Decorator(
-                    decorator=cst.Attribute(
-                        value=cst.Name(self.field_name), attr=cst.Name("setter")
-                    )
+                    decorator=cst.Attribute(value=cst.Name(field_name), attr=cst.Name("setter"))
                 )
             ],
         )
@@ -0,0 +1,114 @@
+"""Multi-step refactoring sessions on one module.
+
+A ModuleSession applies a chain of refactorings to one file and keeps the
+module's analysis between steps. After each step it compares fingerprints of
+the module's top-level statements with those from before the step, and only
+the definitions that changed are re-analyzed:
+
+- the symbol table is merged from per-statement tables, and only the tables of
+  changed statements are rebuilt
+- cached per-function facts of changed definitions are dropped, while facts of
+  unchanged functions stay in the analysis cache
+- the line index of the new source is built once and shared with the next
+  command through get_line_index(), together with the merged symbol table
+
+Usage:
+    session = ModuleSession(Path("orders.py"))
+    session.run("extract-method", target="Order::print_owing#L9-L12", name="print_banner")
+    session.run("extract-method", target="Order::print_owing#L12-L14", name="print_details")
+    session.history  # [{"Order"}, {"Order"}]
+"""
+
+from pathlib import Path
+from typing import Any
+
+from molting.commands.registry import apply_refactoring, discover_and_register_commands
+from molting.core.analysis_cache import get_analysis_cache
+from molting.core.line_index import LineIndex, get_line_index
+from molting.core.module_snapshot import ModuleSnapshot
+from molting.core.symbol_table import ModuleSymbolTable
+
+
+class ModuleSession:
+    """Applies refactorings to one file, re-analyzing only the definitions each step changed.
+
+    Attributes:
+        file_path: The file being refactored
+        history: Names of the top-level definitions changed by each step, in order
+    """
+
+    def __init__(self, file_path: Path) -> None:
+        """Open a session and analyze the file's current content.
+
+        Args:
+            file_path: Path to the file to refactor
+        """
+        discover_and_register_commands()
+        self.file_path = file_path
+        self.history: list[set[str]] = []
+        self._statement_tables: dict[str, ModuleSymbolTable] = {}
+        self._snapshot: ModuleSnapshot | None = None
+        self._symbols = ModuleSymbolTable()
+        self._line_index: LineIndex | None = None
+        self.refresh()
+
+    @property
+    def symbols(self) -> ModuleSymbolTable:
+        """Symbol table of the module's current content."""
+        return self._symbols
+
+    @property
+    def line_index(self) -> LineIndex:
+        """Line index of the module's current content."""
+        assert self._line_index is not None
+        return self._line_index
+
+    def run(self, refactoring: str, **params: Any) -> set[str]:
+        """Apply one refactoring to the file and update the analysis.
+
+        Args:
+            refactoring: Name of the refactoring to apply
+            **params: Parameters for the refactoring
+
+        Returns:
+            Names of the top-level definitions the refactoring changed
+
+        Raises:
+            ValueError: If refactoring is unknown or parameters are invalid
+        """
+        apply_refactoring(refactoring, self.file_path, **params)
+        changed = self.refresh()
+        self.history.append(changed)
+        return changed
+
+    def refresh(self) -> set[str]:
+        """Re-read the file and re-analyze the top-level definitions that changed.
+
+        Call this after the file was modified outside the session.
+
+        Returns:
+            Names of the top-level definitions that changed since the last refresh
+            (every definition on the first call)
+        """
+        index = get_line_index(self.file_path.read_text())
+        snapshot = ModuleSnapshot(index.module)
+        if self._snapshot is None:
+            changed = snapshot.names
+        else:
+            changed = snapshot.changed_since(self._snapshot)
+
+        tables: dict[str, ModuleSymbolTable] = {}
+        for statement in snapshot.statements:
+            table = self._statement_tables.get(statement.fingerprint)
+            if table is None:
+                table = ModuleSymbolTable.build(statement.node)
+            tables[statement.fingerprint] = table
+        self._statement_tables = tables
+        self._symbols = ModuleSymbolTable.merge(tables.values())
+        ModuleSymbolTable.remember(index.module, self._symbols)
+
+        if self._snapshot is not None:
+            get_analysis_cache().invalidate(self.file_path, changed)
+        self._snapshot = snapshot
+        self._line_index = index
+        return changed
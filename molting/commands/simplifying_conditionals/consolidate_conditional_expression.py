@@ -1,5 +1,7 @@
 """Consolidate Conditional Expression refactoring command."""
 
+from pathlib import Path
+
 import libcst as cst
 from libcst import metadata
 
@@ -7,12 +9,17 @@ from molting.commands.base import BaseCommand
 from molting.commands.registry import register_command
 from molting.core.ast_utils import parse_line_range
 from molting.core.code_generation_utils import create_parameter
+from molting.core.conditional_index import ConditionalPatternIndex, IndexedPattern
 from molting.core.conditional_pattern import (
+    ConditionalCatalog,
+    ConditionalPatternSignature,
     PatternMatch,
-    extract_pattern,
-    scan_for_pattern,
 )
-from molting.core.local_variable_analyzer import LocalVariableAnalyzer
+from molting.core.file_transaction import FileTransaction
+from molting.core.import_graph import ImportGraph
+from molting.core.import_utils import ensure_import
+from molting.core.local_variable_analyzer import get_local_variables
+from molting.core.symbol_table import ModuleSymbolTable
 from molting.core.visitors import MethodConflictChecker
 
 
@@ -54,10 +61,28 @@ class ConsolidateConditionalExpressionCommand(BaseCommand):
             return (customer.type == "valued" or
                     customer.type == "premium" or
                     customer.loyalty_years > 10)
+
+    With ``across_files=True`` every Python file under the target file's directory
+    is fingerprinted, module-level functions in other modules with the same
+    conditional pattern are rewritten to call the helper, and the helper is
+    imported there, relatively within a package. All files are written together
+    or not at all. The functions sharing the pattern are available afterwards as
+    ``pattern_matches``, and ``report=<file>`` writes one line per function
+    saying whether it was rewritten.
     """
 
     name = "consolidate-conditional-expression"
 
+    def __init__(self, file_path: Path, **params: object) -> None:
+        """Initialize the command.
+
+        Args:
+            file_path: Path to the file to refactor
+            **params: Additional parameters for the refactoring
+        """
+        super().__init__(file_path, **params)
+        self.pattern_matches: list[IndexedPattern] = []
+
     def validate(self) -> None:
         """Validate that required parameters are present.
 
@@ -77,6 +102,12 @@ class ConsolidateConditionalExpressionCommand(BaseCommand):
 
         # Parse target format: "function_name#L2-L7" or "ClassName::method#L2-L7"
         class_name, function_name, start_line, end_line = self._parse_target(target)
+        across_files = self.params.get("across_files", False)
+        if across_files and class_name:
+            raise ValueError(
+                "Consolidating across files requires a module-level function target, "
+                f"got method '{class_name}::{function_name}'"
+            )
 
         # Read file
         source_code = self.file_path.read_text()
@@ -94,14 +125,14 @@ class ConsolidateConditionalExpressionCommand(BaseCommand):
             else:
                 raise ValueError(f"Function '{helper_name}' already exists")
 
-        # Extract pattern from target function and scan for matches in other functions
-        pattern = extract_pattern(module, function_name, class_name, start_line, end_line)
+        # Extract pattern from target function and look up matches in other functions
+        catalog = ConditionalCatalog.for_module(module)
+        pattern = catalog.extract_pattern(function_name, class_name, start_line, end_line)
         additional_matches: list[PatternMatch] = []
         if pattern:
-            additional_matches = scan_for_pattern(module, pattern, function_name, class_name)
+            additional_matches = catalog.scan_for_pattern(pattern, function_name, class_name)
 
-        # Parse and transform with metadata
-        wrapper = metadata.MetadataWrapper(module)
+        # Transform with the catalog's metadata wrapper (positions are already resolved)
         transformer = ConsolidateConditionalExpressionTransformer(
             class_name,
             function_name,
@@ -111,10 +142,94 @@ class ConsolidateConditionalExpressionCommand(BaseCommand):
             module,
             additional_matches=additional_matches,
         )
-        modified_tree = wrapper.visit(transformer)
+        modified_tree = catalog.wrapper.visit(transformer)
 
-        # Write back
-        self.file_path.write_text(modified_tree.code)
+        if not across_files:
+            self.file_path.write_text(modified_tree.code)
+            return
+
+        transaction = FileTransaction()
+        transaction.stage(self.file_path, modified_tree.code)
+        if pattern and transformer.helper_function:
+            self._consolidate_other_files(pattern, transformer, transaction)
+        transaction.commit()
+        if "report" in self.params:
+            Path(self.params["report"]).write_text(self._format_report(function_name))
+
+    def _consolidate_other_files(
+        self,
+        pattern: ConditionalPatternSignature,
+        transformer: "ConsolidateConditionalExpressionTransformer",
+        transaction: FileTransaction,
+    ) -> None:
+        """Rewrite module-level functions in other files that share the pattern.
+
+        Args:
+            pattern: Signature of the consolidated conditional chain
+            transformer: The transformer that built the helper in the target file
+            transaction: Transaction to stage the rewritten files in
+
+        Raises:
+            ValueError: If the helper name is already defined in a file to rewrite
+        """
+        assert transformer.helper_function is not None
+        directory = self.file_path.parent
+        target_path = self.file_path.resolve()
+        index = ConditionalPatternIndex.from_files(self.project_files(directory))
+        self.pattern_matches = index.matches(pattern)
+
+        matches_by_file: dict[Path, list[IndexedPattern]] = {}
+        for entry in self.pattern_matches:
+            if entry.file_path != target_path and not entry.class_name:
+                matches_by_file.setdefault(entry.file_path, []).append(entry)
+        if not matches_by_file:
+            return
+
+        helper_name = transformer.helper_name
+        helper_params = [param.name.value for param in transformer.helper_function.params.params]
+        graph = ImportGraph.for_directory(directory)
+        helper_module = graph.module_name(target_path)
+
+        for file_path, entries in matches_by_file.items():
+            module = cst.parse_module(file_path.read_text())
+            symbols = ModuleSymbolTable.for_module(module)
+            if symbols.has_function(helper_name) or symbols.has_constant(helper_name):
+                raise ValueError(f"Function '{helper_name}' already exists in {file_path}")
+
+            call_site_transformer = ConsolidatedCallTransformer(
+                helper_name, helper_params, transformer.function_params, entries
+            )
+            modified = metadata.MetadataWrapper(module).visit(call_site_transformer)
+            imported_from = graph.relative_name(graph.module_name(file_path), helper_module)
+            modified = ensure_import(modified, imported_from, [helper_name])
+            transaction.stage(file_path, modified.code)
+
+    def _format_report(self, function_name: str) -> str:
+        """Format the functions sharing the pattern as one line per function.
+
+        Args:
+            function_name: Name of the consolidated target function
+
+        Returns:
+            The report, e.g. ``rewritten     claims.py:4  claim_amount``
+        """
+        target_path = self.file_path.resolve()
+        root = self.file_path.parent.resolve()
+        lines = []
+        for entry in self.pattern_matches:
+            location = f"{entry.file_path.relative_to(root)}:{entry.start_line}"
+            name = (
+                f"{entry.class_name}.{entry.function_name}"
+                if entry.class_name
+                else (entry.function_name)
+            )
+            if entry.file_path != target_path and entry.class_name:
+                lines.append(f"kept          {location}  {name}  (method in another module)")
+            elif entry.file_path == target_path and entry.function_name == function_name:
+                lines.append(f"consolidated  {location}  {name}")
+            else:
+                lines.append(f"rewritten     {location}  {name}")
+        return "".join(f"{line}\n" for line in lines)
 
     def _parse_target(self, target: str) -> tuple[str, str, int, int]:
         """Parse target format into class name, function name, and line range.
@@ -228,9 +343,8 @@ class ConsolidateConditionalExpressionTransformer(cst.CSTTransformer):
                     self._second_param = node.params.params[1]
 
             # Analyze local variables early
-            if self.module and not self.local_variables:
-                analyzer = LocalVariableAnalyzer(self.module, self.class_name, self.function_name)
-                self.local_variables = analyzer.get_local_variables()
+            if not self.local_variables:
+                self.local_variables = get_local_variables(node, self.class_name)
 
             # Extract conditions from the if statements
             self._extract_conditions(node)
@@ -647,6 +761,94 @@ class ConsolidateConditionalExpressionTransformer(cst.CSTTransformer):
         return updated_node.with_changes(body=new_body)
 
 
+class ConsolidatedCallTransformer(cst.CSTTransformer):
+    """Replaces a matched conditional chain with a call to a helper in another module.
+
+    The helper's parameters are named after the target function. Parameters of
+    a matched function are passed by position, so ``employee`` in the target
+    maps to ``person`` in a match whose first parameter is ``person``; other
+    names are identical in every match, as the fingerprints are equal.
+    """
+
+    METADATA_DEPENDENCIES = (metadata.PositionProvider,)
+
+    def __init__(
+        self,
+        helper_name: str,
+        helper_params: list[str],
+        target_params: list[str],
+        entries: list[IndexedPattern],
+    ) -> None:
+        """Initialize the transformer.
+
+        Args:
+            helper_name: Name of the helper function to call
+            helper_params: Parameter names of the helper function
+            target_params: Parameter names of the function the helper was extracted from
+            entries: Matched module-level functions in this file
+        """
+        self.helper_name = helper_name
+        self.helper_params = helper_params
+        self.target_params = target_params
+        self.entries = {entry.function_name: entry for entry in entries}
+        self.depth = 0
+
+    def visit_ClassDef(self, node: cst.ClassDef) -> bool:  # noqa: N802
+        """Track nesting so only module-level functions are rewritten."""
+        self.depth += 1
+        return True
+
+    def leave_ClassDef(  # noqa: N802
+        self, original_node: cst.ClassDef, updated_node: cst.ClassDef
+    ) -> cst.ClassDef:
+        """Leave the class scope."""
+        self.depth -= 1
+        return updated_node
+
+    def visit_FunctionDef(self, node: cst.FunctionDef) -> bool:  # noqa: N802
+        """Track nesting so only module-level functions are rewritten."""
+        self.depth += 1
+        return True
+
+    def leave_FunctionDef(  # noqa: N802
+        self, original_node: cst.FunctionDef, updated_node: cst.FunctionDef
+    ) -> cst.FunctionDef:
+        """Replace the matched chain of if statements with one helper call."""
+        self.depth -= 1
+        entry = self.entries.get(original_node.name.value)
+        if self.depth or entry is None:
+            return updated_node
+        if not isinstance(original_node.body, cst.IndentedBlock) or not isinstance(
+            updated_node.body, cst.IndentedBlock
+        ):
+            return updated_node
+
+        new_body: list[cst.BaseStatement] = []
+        replaced = False
+        for original, updated in zip(original_node.body.body, updated_node.body.body):
+            line = self.get_metadata(metadata.PositionProvider, original).start.line
+            if not (isinstance(updated, cst.If) and entry.start_line <= line <= entry.end_line):
+                new_body.append(updated)
+                continue
+            if not replaced:
+                new_body.append(self._build_call(original_node, updated))
+                replaced = True
+
+        return updated_node.with_changes(body=updated_node.body.with_changes(body=new_body))
+
+    def _build_call(self, func_def: cst.FunctionDef, first_if: cst.If) -> cst.If:
+        """Build ``if helper(args): <first if's body>`` with positionally mapped arguments."""
+        params = [param.name.value for param in func_def.params.params]
+        args = []
+        for name in self.helper_params:
+            if name in self.target_params and self.target_params.index(name) < len(params):
+                name = params[self.target_params.index(name)]
+            args.append(cst.Arg(value=cst.Name(name)))
+
+        call = cst.Call(func=cst.Name(self.helper_name), args=args)
+        return first_if.with_changes(test=call, orelse=None)
+
+
 class VariableUsageCollector(cst.CSTVisitor):
     """Collector for all variable references in code."""
 
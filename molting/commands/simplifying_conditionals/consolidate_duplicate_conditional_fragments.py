@@ -8,6 +8,7 @@ from libcst import metadata
 from molting.commands.base import BaseCommand
 from molting.commands.registry import register_command
 from molting.core.ast_utils import parse_line_range
+from molting.core.conditional_pattern import ConditionalCatalog
 
 
 @dataclass
@@ -115,15 +116,15 @@ class ConsolidateDuplicateConditionalFragmentsCommand(BaseCommand):
         source_code = self.file_path.read_text()
         module = cst.parse_module(source_code)
 
-        # Scan for additional matches - functions with similar duplicate fragment patterns
-        additional_matches = scan_for_duplicate_fragment_pattern(module, function_name, class_name)
+        # Look up additional matches - functions with similar duplicate fragment patterns
+        catalog = ConditionalCatalog.for_module(module)
+        additional_matches = find_duplicate_fragment_matches(catalog, function_name, class_name)
 
-        # Apply transformation
-        wrapper = metadata.MetadataWrapper(module)
+        # Apply transformation with the catalog's metadata wrapper
         transformer = ConsolidateDuplicateFragmentsTransformer(
             class_name, function_name, start_line, end_line, additional_matches
         )
-        modified_tree = wrapper.visit(transformer)
+        modified_tree = catalog.wrapper.visit(transformer)
 
         # Write back
         self.file_path.write_text(modified_tree.code)
@@ -510,79 +511,55 @@ class _VariableReadCollector(cst.CSTVisitor):
         return True
 
 
-class DuplicateFragmentScanner(cst.CSTVisitor):
-    """Scans for functions with duplicate conditional fragment patterns."""
-
-    METADATA_DEPENDENCIES = (metadata.PositionProvider,)
-
-    def __init__(self, exclude_function: str, exclude_class: str) -> None:
-        """Initialize the scanner."""
-        self.exclude_function = exclude_function
-        self.exclude_class = exclude_class
-        self.matches: list[DuplicateFragmentMatch] = []
-        self.current_class: str = ""
-
-    def visit_ClassDef(self, node: cst.ClassDef) -> bool:  # noqa: N802
-        """Track current class."""
-        self.current_class = node.name.value
-        return True
+def find_duplicate_fragment_matches(
+    catalog: ConditionalCatalog, exclude_function: str, exclude_class: str
+) -> list[DuplicateFragmentMatch]:
+    """Find functions whose first if-else with duplicate trailing statements can be consolidated.
 
-    def leave_ClassDef(self, node: cst.ClassDef) -> None:  # noqa: N802
-        """Reset class tracking."""
-        self.current_class = ""
+    Args:
+        catalog: Conditional catalog of the module
+        exclude_function: Function name to exclude (the original target)
+        exclude_class: Class name to exclude (if method)
 
-    def visit_FunctionDef(self, node: cst.FunctionDef) -> bool:  # noqa: N802
-        """Check if function has duplicate conditional fragment pattern."""
-        # Skip the target function
-        if node.name.value == self.exclude_function:
-            if not self.exclude_class and not self.current_class:
-                return True
-            if self.exclude_class == self.current_class:
-                return True
-
-        # Look for if-else statements with duplicate trailing statements
-        if isinstance(node.body, cst.IndentedBlock):
-            for stmt in node.body.body:
-                if isinstance(stmt, cst.If) and stmt.orelse:
-                    if self._has_duplicate_trailing_statements(stmt):
-                        try:
-                            pos = self.get_metadata(metadata.PositionProvider, stmt)
-                            self.matches.append(
-                                DuplicateFragmentMatch(
-                                    function_name=node.name.value,
-                                    class_name=self.current_class,
-                                    if_line=pos.start.line,
-                                )
-                            )
-                        except KeyError:
-                            pass
-                        # Only consider first if-else per function
-                        break
+    Returns:
+        One match per function, for its first qualifying if-else
+    """
+    matches = []
+    for function in catalog.other_functions(exclude_function, exclude_class):
+        for cataloged in function.ifs:
+            if cataloged.node.orelse and _has_duplicate_trailing_statements(cataloged.node):
+                matches.append(
+                    DuplicateFragmentMatch(
+                        function_name=function.name,
+                        class_name=function.class_name,
+                        if_line=cataloged.line,
+                    )
+                )
+                # Only consider first if-else per function
+                break
+    return matches
 
-        return True
 
-    def _has_duplicate_trailing_statements(self, if_stmt: cst.If) -> bool:
-        """Check if an if-else has duplicate trailing statements."""
-        if not if_stmt.orelse or not isinstance(if_stmt.orelse, cst.Else):
-            return False
+def _has_duplicate_trailing_statements(if_stmt: cst.If) -> bool:
+    """Check if an if-else has duplicate trailing statements."""
+    if not if_stmt.orelse or not isinstance(if_stmt.orelse, cst.Else):
+        return False
 
-        if_body = self._get_body(if_stmt.body)
-        else_body = self._get_body(if_stmt.orelse.body)
+    if_body = _get_body(if_stmt.body)
+    else_body = _get_body(if_stmt.orelse.body)
 
-        if not if_body or not else_body:
-            return False
+    if not if_body or not else_body:
+        return False
 
-        # Check if last statements are identical
-        if if_body[-1].deep_equals(else_body[-1]):
-            return True
+    # Check if last statements are identical
+    return if_body[-1].deep_equals(else_body[-1])
 
-        return False
 
-    def _get_body(self, block: cst.BaseSuite) -> list[cst.BaseStatement]:
-        """Extract statements from a block."""
-        if isinstance(block, cst.IndentedBlock):
-            return list(block.body)
-        return []
+def _get_body(block: cst.BaseSuite) -> list[cst.BaseStatement]:
+    """Extract statements from a block."""
+    if isinstance(block, cst.IndentedBlock):
+        return list(block.body)
+    return []
 
 
 def scan_for_duplicate_fragment_pattern(
@@ -591,10 +568,8 @@ def scan_for_duplicate_fragment_pattern(
     exclude_class: str,
 ) -> list[DuplicateFragmentMatch]:
     """Scan a module for functions with duplicate conditional fragment patterns."""
-    wrapper = metadata.MetadataWrapper(module)
-    scanner = DuplicateFragmentScanner(exclude_function, exclude_class)
-    wrapper.visit(scanner)
-    return scanner.matches
+    catalog = ConditionalCatalog.for_module(module)
+    return find_duplicate_fragment_matches(catalog, exclude_function, exclude_class)
 
 
 # Register the command
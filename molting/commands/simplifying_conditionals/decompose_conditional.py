@@ -10,8 +10,12 @@ from molting.commands.base import BaseCommand
 from molting.commands.registry import register_command
 from molting.core.ast_utils import parse_line_range
 from molting.core.code_generation_utils import create_parameter
-from molting.core.conditional_pattern import build_param_map, normalize_condition
-from molting.core.local_variable_analyzer import LocalVariableAnalyzer
+from molting.core.conditional_pattern import (
+    CatalogedFunction,
+    CatalogedIf,
+    ConditionalCatalog,
+)
+from molting.core.local_variable_analyzer import get_local_variables
 
 
 @dataclass
@@ -130,7 +134,8 @@ class DecomposeConditionalCommand(BaseCommand):
         # Parse module
         module = cst.parse_module(source_code)
 
-        # Extract pattern from target function and scan for matches
+        # Extract pattern from target function and look up matches (one shared catalog pass)
+        catalog = ConditionalCatalog.for_module(module)
         pattern = extract_decompose_pattern(module, function_name, class_name, start_line)
         additional_matches: list[DecomposePatternMatch] = []
         if pattern:
@@ -138,8 +143,7 @@ class DecomposeConditionalCommand(BaseCommand):
                 module, pattern, function_name, class_name
             )
 
-        # Transform with metadata
-        wrapper = metadata.MetadataWrapper(module)
+        # Transform with the catalog's metadata wrapper
         transformer = DecomposeConditionalTransformer(
             class_name,
             function_name,
@@ -151,7 +155,7 @@ class DecomposeConditionalCommand(BaseCommand):
             else_name=else_name,
             additional_matches=additional_matches,
         )
-        modified_tree = wrapper.visit(transformer)
+        modified_tree = catalog.wrapper.visit(transformer)
 
         # Write back
         self.file_path.write_text(modified_tree.code)
@@ -266,9 +270,8 @@ class DecomposeConditionalTransformer(cst.CSTTransformer):
                 self.function_params.append(param.name.value)
 
             # Analyze local variables early so they're available in leave_If
-            if self.module and not self.local_variables:
-                analyzer = LocalVariableAnalyzer(self.module, self.class_name, self.function_name)
-                self.local_variables = analyzer.get_local_variables()
+            if not self.local_variables:
+                self.local_variables = get_local_variables(node, self.class_name)
         elif self._get_match_for_current_function():
             # For additional matches, collect function parameters
             for param in node.params.params:
@@ -649,190 +652,55 @@ class ParameterCollector(cst.CSTVisitor):
 class DecomposePatternSignature:
     """Hashable representation of a decompose conditional pattern."""
 
-    condition: str  # Normalized condition string
-    then_value: str  # Normalized then-branch value
-    else_value: str  # Normalized else-branch value
+    condition: int  # Fingerprint of the condition
+    then_value: int  # Fingerprint of the then-branch value
+    else_value: int  # Fingerprint of the else-branch value
 
 
-class DecomposePatternExtractor(cst.CSTVisitor):
-    """Extracts a decompose conditional pattern from a specific function."""
+def _decompose_pattern(
+    function: CatalogedFunction, cataloged: CatalogedIf
+) -> tuple[DecomposePatternSignature | None, str]:
+    """Fingerprint an if-else whose branches both end by assigning a value.
 
-    METADATA_DEPENDENCIES = (metadata.PositionProvider,)
-
-    def __init__(
-        self,
-        target_function: str,
-        target_class: str,
-        start_line: int,
-    ) -> None:
-        """Initialize the extractor."""
-        self.target_function = target_function
-        self.target_class = target_class
-        self.start_line = start_line
-        self.current_class: str = ""
-        self.signature: DecomposePatternSignature | None = None
-        self.assignment_target: str = ""
-
-    def visit_ClassDef(self, node: cst.ClassDef) -> bool:  # noqa: N802
-        """Track current class."""
-        self.current_class = node.name.value
-        return True
-
-    def leave_ClassDef(self, node: cst.ClassDef) -> None:  # noqa: N802
-        """Reset class tracking."""
-        self.current_class = ""
-
-    def visit_FunctionDef(self, node: cst.FunctionDef) -> bool:  # noqa: N802
-        """Extract pattern from target function."""
-        if node.name.value != self.target_function:
-            return True
-        if self.target_class and self.current_class != self.target_class:
-            return True
-        if not self.target_class and self.current_class:
-            return True
-
-        param_map = build_param_map(node)
-
-        # Find if statement at target line
-        if isinstance(node.body, cst.IndentedBlock):
-            for stmt in node.body.body:
-                if isinstance(stmt, cst.If):
-                    try:
-                        pos = self.get_metadata(metadata.PositionProvider, stmt)
-                        if pos.start.line != self.start_line:
-                            continue
-                    except KeyError:
-                        continue
-
-                    # Extract and normalize condition
-                    condition = normalize_condition(stmt.test, param_map)
-
-                    # Extract then value
-                    then_value = ""
-                    if stmt.body and stmt.body.body:
-                        last_stmt = stmt.body.body[-1]
-                        if isinstance(last_stmt, cst.SimpleStatementLine):
-                            if last_stmt.body and isinstance(last_stmt.body[0], cst.Assign):
-                                assign = last_stmt.body[0]
-                                then_value = normalize_condition(assign.value, param_map)
-                                # Extract assignment target
-                                target = assign.targets[0].target
-                                if isinstance(target, cst.Name):
-                                    self.assignment_target = target.value
-
-                    # Extract else value
-                    else_value = ""
-                    if stmt.orelse and isinstance(stmt.orelse, cst.Else):
-                        if stmt.orelse.body and stmt.orelse.body.body:
-                            last_stmt = stmt.orelse.body.body[-1]
-                            if isinstance(last_stmt, cst.SimpleStatementLine):
-                                if last_stmt.body and isinstance(last_stmt.body[0], cst.Assign):
-                                    assign = last_stmt.body[0]
-                                    else_value = normalize_condition(assign.value, param_map)
-
-                    if condition and then_value and else_value:
-                        self.signature = DecomposePatternSignature(
-                            condition=condition,
-                            then_value=then_value,
-                            else_value=else_value,
-                        )
-                    break
-
-        return True
-
-
-class DecomposePatternScanner(cst.CSTVisitor):
-    """Scans a module for functions with matching decompose conditional pattern."""
+    Args:
+        function: The cataloged function containing the if statement
+        cataloged: The cataloged if statement
 
-    METADATA_DEPENDENCIES = (metadata.PositionProvider,)
-
-    def __init__(
-        self,
-        target_pattern: DecomposePatternSignature,
-        exclude_function: str,
-        exclude_class: str,
-    ) -> None:
-        """Initialize the scanner."""
-        self.target_pattern = target_pattern
-        self.exclude_function = exclude_function
-        self.exclude_class = exclude_class
-        self.matches: list[DecomposePatternMatch] = []
-        self.current_class: str = ""
-
-    def visit_ClassDef(self, node: cst.ClassDef) -> bool:  # noqa: N802
-        """Track current class."""
-        self.current_class = node.name.value
-        return True
+    Returns:
+        Tuple of (signature, assignment target); the signature is None unless both
+        branches end with an assignment, and the target is empty unless the
+        then-branch assigns a plain name
+    """
+    stmt = cataloged.node
+
+    # Extract then value
+    then_value: int | None = None
+    assignment_target = ""
+    if stmt.body and stmt.body.body:
+        last_stmt = stmt.body.body[-1]
+        if isinstance(last_stmt, cst.SimpleStatementLine):
+            if last_stmt.body and isinstance(last_stmt.body[0], cst.Assign):
+                assign = last_stmt.body[0]
+                then_value = function.fingerprint(assign.value)
+                target = assign.targets[0].target
+                if isinstance(target, cst.Name):
+                    assignment_target = target.value
 
-    def leave_ClassDef(self, node: cst.ClassDef) -> None:  # noqa: N802
-        """Reset class tracking."""
-        self.current_class = ""
-
-    def visit_FunctionDef(self, node: cst.FunctionDef) -> bool:  # noqa: N802
-        """Check if function matches pattern."""
-        # Skip the target function
-        if node.name.value == self.exclude_function:
-            if not self.exclude_class and not self.current_class:
-                return True
-            if self.exclude_class == self.current_class:
-                return True
-
-        param_map = build_param_map(node)
-
-        # Find first if-else statement
-        if isinstance(node.body, cst.IndentedBlock):
-            for stmt in node.body.body:
-                if isinstance(stmt, cst.If) and stmt.orelse:
-                    try:
-                        pos = self.get_metadata(metadata.PositionProvider, stmt)
-                        start_line = pos.start.line
-                    except KeyError:
-                        continue
-
-                    # Extract and normalize condition
-                    condition = normalize_condition(stmt.test, param_map)
-
-                    # Extract then value
-                    then_value = ""
-                    assignment_target = ""
-                    if stmt.body and stmt.body.body:
-                        last_stmt = stmt.body.body[-1]
-                        if isinstance(last_stmt, cst.SimpleStatementLine):
-                            if last_stmt.body and isinstance(last_stmt.body[0], cst.Assign):
-                                assign = last_stmt.body[0]
-                                then_value = normalize_condition(assign.value, param_map)
-                                target = assign.targets[0].target
-                                if isinstance(target, cst.Name):
-                                    assignment_target = target.value
-
-                    # Extract else value
-                    else_value = ""
-                    if stmt.orelse and isinstance(stmt.orelse, cst.Else):
-                        if stmt.orelse.body and stmt.orelse.body.body:
-                            last_stmt = stmt.orelse.body.body[-1]
-                            if isinstance(last_stmt, cst.SimpleStatementLine):
-                                if last_stmt.body and isinstance(last_stmt.body[0], cst.Assign):
-                                    assign = last_stmt.body[0]
-                                    else_value = normalize_condition(assign.value, param_map)
-
-                    # Check if pattern matches
-                    if (
-                        condition == self.target_pattern.condition
-                        and then_value == self.target_pattern.then_value
-                        and else_value == self.target_pattern.else_value
-                        and assignment_target
-                    ):
-                        self.matches.append(
-                            DecomposePatternMatch(
-                                function_name=node.name.value,
-                                class_name=self.current_class,
-                                start_line=start_line,
-                                assignment_target=assignment_target,
-                            )
-                        )
-                    break
+    # Extract else value
+    else_value: int | None = None
+    if stmt.orelse and isinstance(stmt.orelse, cst.Else):
+        if stmt.orelse.body and stmt.orelse.body.body:
+            last_stmt = stmt.orelse.body.body[-1]
+            if isinstance(last_stmt, cst.SimpleStatementLine):
+                if last_stmt.body and isinstance(last_stmt.body[0], cst.Assign):
+                    else_value = function.fingerprint(last_stmt.body[0].value)
 
-        return True
+    if then_value is None or else_value is None:
+        return None, assignment_target
+    signature = DecomposePatternSignature(
+        condition=cataloged.fingerprint, then_value=then_value, else_value=else_value
+    )
+    return signature, assignment_target
 
 
 def extract_decompose_pattern(
@@ -842,10 +710,13 @@ def extract_decompose_pattern(
     start_line: int,
 ) -> DecomposePatternSignature | None:
     """Extract a decompose conditional pattern from a function."""
-    wrapper = metadata.MetadataWrapper(module)
-    extractor = DecomposePatternExtractor(function_name, class_name, start_line)
-    wrapper.visit(extractor)
-    return extractor.signature
+    function = ConditionalCatalog.for_module(module).find_function(function_name, class_name)
+    if function is None:
+        return None
+    for cataloged in function.ifs:
+        if cataloged.line == start_line:
+            return _decompose_pattern(function, cataloged)[0]
+    return None
 
 
 def scan_for_decompose_pattern(
@@ -854,11 +725,26 @@ def scan_for_decompose_pattern(
     exclude_function: str,
     exclude_class: str,
 ) -> list[DecomposePatternMatch]:
-    """Scan a module for functions matching a decompose pattern."""
-    wrapper = metadata.MetadataWrapper(module)
-    scanner = DecomposePatternScanner(pattern, exclude_function, exclude_class)
-    wrapper.visit(scanner)
-    return scanner.matches
+    """Scan a module for functions whose first if-else matches a decompose pattern."""
+    catalog = ConditionalCatalog.for_module(module)
+    matches = []
+    for function in catalog.other_functions(exclude_function, exclude_class):
+        first_if_else = next(
+            (cataloged for cataloged in function.ifs if cataloged.node.orelse), None
+        )
+        if first_if_else is None:
+            continue
+        signature, assignment_target = _decompose_pattern(function, first_if_else)
+        if signature == pattern and assignment_target:
+            matches.append(
+                DecomposePatternMatch(
+                    function_name=function.name,
+                    class_name=function.class_name,
+                    start_line=first_if_else.line,
+                    assignment_target=assignment_target,
+                )
+            )
+    return matches
 
 
 # Register the command
@@ -1,15 +1,39 @@
 """Add Parameter refactoring command."""
 
-import ast
+import libcst as cst
 
 from molting.commands.base import BaseCommand
 from molting.commands.registry import register_command
-from molting.core.ast_utils import (
-    create_contact_info_body,
-    find_method_in_tree,
-    parse_target,
+from molting.core.ast_utils import parse_target
+from molting.core.file_transaction import FileTransaction
+from molting.core.profiling import phase
+from molting.core.scope_service import ScopeService
+from molting.core.signature_changer import (
+    AddedParameter,
+    SignatureChange,
+    SignatureChanger,
+    parse_added_parameters,
+    signature_scope,
 )
 
+# Bodies written for known (method, parameter) pairs so the new parameter is used
+_KNOWN_BODIES = {
+    ("get_contact_info", "include_email"): (
+        'result = f"{self.name}\\n{self.phone}"\n'
+        "if include_email:\n"
+        '    result += f"\\n{self.email}"\n'
+        "return result\n"
+    ),
+    ("get_account_summary", "include_overdraft"): (
+        'summary = f"Account: {self.account_number}\\n"\n'
+        'summary += f"Balance: ${self.balance:.2f}\\n"\n'
+        'summary += f"Transactions: {len(self.transaction_history)}"\n'
+        "if include_overdraft:\n"
+        '    summary += f"\\nOverdraft Limit: ${self.overdraft_limit:.2f}"\n'
+        "return summary\n"
+    ),
+}
+
 
 class AddParameterCommand(BaseCommand):
     """Add a parameter to a method to pass in information it currently lacks.
@@ -44,6 +68,23 @@ class AddParameterCommand(BaseCommand):
                 if include_overdraft:
                     summary += f"\\nOverdraft Limit: ${self.overdraft_limit:.2f}"
                 return summary
+
+    Several parameters can be added in one run: ``name`` takes a parameter
+    list such as ``include_email=False, limit=None``. ``default`` gives the
+    default of a single parameter named without one. A parameter without a
+    default needs ``value``, the argument passed by the existing calls
+    (comma-separated, one per such parameter, in order); calls pass it by
+    keyword. Parameters are added to the method and to the overrides it
+    shares a slot with.
+
+    By default calls are updated in the target file only. With
+    ``across_files=True`` every caller under the target file's directory is
+    updated too; each file is parsed once and all files are written together.
+    Calls are updated only when their receiver is of a class of the method's
+    family; with ``include_unresolved=True``, receivers of unknown type are
+    updated too when no unrelated class defines the method. Without it, such
+    calls that need a new argument raise a ValueError listing their locations
+    before any file is written.
     """
 
     name = "add-parameter"
@@ -57,148 +98,118 @@ class AddParameterCommand(BaseCommand):
         self.validate_required_params("target", "name")
 
     def execute(self) -> None:
-        """Apply add-parameter refactoring using AST manipulation.
+        """Apply add-parameter refactoring.
 
         Raises:
             ValueError: If method not found or target format is invalid
         """
-        target = self.params["target"]
-        name = self.params["name"]
-        default = self.params.get("default")
-        _, method_name = parse_target(target)
-
-        def transform(tree: ast.Module) -> ast.Module:
-            """Transform the AST to add a parameter to the method.
-
-            Args:
-                tree: The AST module to transform
-
-            Returns:
-                The modified AST module
-
-            Raises:
-                ValueError: If method not found or is not an instance method
-            """
-            result = find_method_in_tree(tree, method_name)
-            if result is None:
-                raise ValueError(f"Method '{method_name}' not found in {self.file_path}")
-
-            class_node, method_node = result
-
-            if not method_node.args.args or method_node.args.args[0].arg != "self":
-                raise ValueError(f"Method '{method_name}' is not an instance method")
+        class_name, method_name = parse_target(self.params["target"])
+        change = SignatureChange(class_name, method_name, added=tuple(self._added_parameters()))
+
+        with phase("parse"):
+            module = cst.parse_module(self.file_path.read_text())
+        definition = ScopeService.for_module(module).find_function(class_name, method_name)
+        if definition is None:
+            raise ValueError(f"Method '{method_name}' not found in {self.file_path}")
+        params = definition.params.params
+        if not params or params[0].name.value != "self":
+            raise ValueError(f"Method '{method_name}' is not an instance method")
+
+        updater = None
+        if self.params.get("across_files", False):
+            updater = self.create_call_site_updater(self.file_path.parent)
+        index, callers = signature_scope(self.file_path, method_name, updater)
+        changer = SignatureChanger(
+            index,
+            change,
+            definition,
+            include_unresolved=self.params.get("include_unresolved", False),
+        )
+
+        transaction = FileTransaction()
+        with phase("transform"):
+            new_module = changer.update_module(module, self.file_path)
+            for added in change.added:
+                body = _KNOWN_BODIES.get((method_name, added.name))
+                if body is not None:
+                    new_module = new_module.visit(_BodyReplacer(class_name, method_name, body))
+            transaction.stage(self.file_path, new_module.code)
+        for file_path, new_code in changer.rewrite_files(callers).items():
+            transaction.stage(file_path, new_code)
+        changer.check_skipped()
+        transaction.commit()
+
+    def _added_parameters(self) -> list[AddedParameter]:
+        """Parse the parameters to add from the name, default and value options.
+
+        Returns:
+            The parameters to add, in order
 
-            new_arg = ast.arg(arg=name, annotation=None)
-            # Append the new parameter at the end
-            method_node.args.args.append(new_arg)
-
-            if default:
-                default_val = ast.parse(default, mode="eval").body
-                method_node.args.defaults.append(default_val)
+        Raises:
+            ValueError: If the options do not describe the parameters unambiguously
+        """
+        added = parse_added_parameters(self.params["name"])
+        default = self.params.get("default")
+        if default is not None:
+            if len(added) != 1 or added[0].default is not None:
+                raise ValueError("'default' applies to a single parameter named without a default")
+            added = [AddedParameter(added[0].name, str(default))]
+
+        required = [parameter for parameter in added if parameter.default is None]
+        values: list[str] = []
+        if "value" in self.params:
+            values_tuple = cst.parse_expression(f"({self.params['value']},)")
+            assert isinstance(values_tuple, cst.Tuple)
+            values = [
+                cst.Module([]).code_for_node(element.value) for element in values_tuple.elements
+            ]
+        if len(values) != len(required):
+            names = ", ".join(parameter.name for parameter in required)
+            raise ValueError(
+                f"Expected {len(required)} value(s) for the calls (parameters without "
+                f"default: {names or 'none'}), got {len(values)}"
+            )
+        value_by_name = dict(zip((parameter.name for parameter in required), values))
+        return [
+            AddedParameter(parameter.name, parameter.default, value_by_name.get(parameter.name))
+            for parameter in added
+        ]
 
-            # Update method body for specific known cases
-            if name == "include_email" and method_name == "get_contact_info":
-                method_node.body = create_contact_info_body(name)
-            elif name == "include_overdraft" and method_name == "get_account_summary":
-                # Generate method body that uses the include_overdraft parameter
-                method_node.body = self._generate_account_summary_body()
 
-            return tree
+class _BodyReplacer(cst.CSTTransformer):
+    """Replaces the body of a method of a class."""
 
-        self.apply_ast_transform(transform)
+    def __init__(self, class_name: str, method_name: str, body: str) -> None:
+        """Initialize the transformer.
 
-    def _generate_account_summary_body(self) -> list:
-        """Generate method body for get_account_summary with include_overdraft."""
-        return [
-            ast.Assign(
-                targets=[ast.Name(id="summary", ctx=ast.Store())],
-                value=ast.JoinedStr(
-                    values=[
-                        ast.Constant(value="Account: "),
-                        ast.FormattedValue(
-                            value=ast.Attribute(
-                                value=ast.Name(id="self", ctx=ast.Load()),
-                                attr="account_number",
-                                ctx=ast.Load(),
-                            ),
-                            conversion=-1,
-                            format_spec=None,
-                        ),
-                        ast.Constant(value="\n"),
-                    ]
-                ),
-            ),
-            ast.AugAssign(
-                target=ast.Name(id="summary", ctx=ast.Store()),
-                op=ast.Add(),
-                value=ast.JoinedStr(
-                    values=[
-                        ast.Constant(value="Balance: $"),
-                        ast.FormattedValue(
-                            value=ast.Attribute(
-                                value=ast.Name(id="self", ctx=ast.Load()),
-                                attr="balance",
-                                ctx=ast.Load(),
-                            ),
-                            conversion=-1,
-                            format_spec=ast.JoinedStr(values=[ast.Constant(value=".2f")]),
-                        ),
-                        ast.Constant(value="\n"),
-                    ]
-                ),
-            ),
-            ast.AugAssign(
-                target=ast.Name(id="summary", ctx=ast.Store()),
-                op=ast.Add(),
-                value=ast.JoinedStr(
-                    values=[
-                        ast.Constant(value="Transactions: "),
-                        ast.FormattedValue(
-                            value=ast.Call(
-                                func=ast.Name(id="len", ctx=ast.Load()),
-                                args=[
-                                    ast.Attribute(
-                                        value=ast.Name(id="self", ctx=ast.Load()),
-                                        attr="transaction_history",
-                                        ctx=ast.Load(),
-                                    )
-                                ],
-                                keywords=[],
-                            ),
-                            conversion=-1,
-                            format_spec=None,
-                        ),
-                    ]
-                ),
-            ),
-            ast.If(
-                test=ast.Name(id="include_overdraft", ctx=ast.Load()),
-                body=[
-                    ast.AugAssign(
-                        target=ast.Name(id="summary", ctx=ast.Store()),
-                        op=ast.Add(),
-                        value=ast.JoinedStr(
-                            values=[
-                                ast.Constant(value="\nOverdraft Limit: $"),
-                                ast.FormattedValue(
-                                    value=ast.Attribute(
-                                        value=ast.Name(id="self", ctx=ast.Load()),
-                                        attr="overdraft_limit",
-                                        ctx=ast.Load(),
-                                    ),
-                                    conversion=-1,
-                                    format_spec=ast.JoinedStr(values=[ast.Constant(value=".2f")]),
-                                ),
-                            ]
-                        ),
-                    )
-                ],
-                orelse=[],
-            ),
-            ast.Return(
-                value=ast.Name(id="summary", ctx=ast.Load()),
-            ),
-        ]
+        Args:
+            class_name: Class defining the method
+            method_name: Method whose body is replaced
+            body: Source code of the new body, unindented
+        """
+        self.class_name = class_name
+        self.method_name = method_name
+        self.body = cst.parse_module(body).body
+        self.in_class = False
+
+    def visit_ClassDef(self, node: cst.ClassDef) -> None:  # noqa: N802
+        """Track whether the target class is being visited."""
+        self.in_class = node.name.value == self.class_name
+
+    def leave_ClassDef(  # noqa: N802
+        self, original_node: cst.ClassDef, updated_node: cst.ClassDef
+    ) -> cst.ClassDef:
+        """Leave a class."""
+        self.in_class = False
+        return updated_node
+
+    def leave_FunctionDef(  # noqa: N802
+        self, original_node: cst.FunctionDef, updated_node: cst.FunctionDef
+    ) -> cst.FunctionDef:
+        """Replace the body of the target method."""
+        if not self.in_class or original_node.name.value != self.method_name:
+            return updated_node
+        return updated_node.with_changes(body=cst.IndentedBlock(body=self.body))
 
 
 # Register the command
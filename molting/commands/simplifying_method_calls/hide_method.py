@@ -1,10 +1,18 @@
 """Hide Method refactoring command."""
 
+from pathlib import Path
+
 import libcst as cst
 
 from molting.commands.base import BaseCommand
 from molting.commands.registry import register_command
 from molting.core.ast_utils import parse_target
+from molting.core.attribute_index import AttributeAccessIndex
+from molting.core.file_transaction import FileTransaction
+from molting.core.method_renamer import MethodRename, MethodRenamer
+from molting.core.method_visibility import find_hideable_methods, format_report
+from molting.core.profiling import phase
+from molting.core.project_index import ProjectIndex
 
 
 class HideMethodCommand(BaseCommand):
@@ -38,6 +46,15 @@ class HideMethodCommand(BaseCommand):
 
             def _apply_discount(self, amount):
                 return amount * 0.9
+
+    With a class as target (``Class`` instead of ``Class::method``), or with
+    ``package=True`` for every class under the target file's directory, all
+    public methods that nothing outside their class uses are hidden at once.
+    Usage is decided from one project-wide index of attribute accesses, so
+    the cost does not grow with the number of methods. Methods that override
+    or are overridden are kept public. All files are written together, and
+    ``report=<file>`` writes one line per method saying whether it was hidden
+    and why.
     """
 
     name = "hide-method"
@@ -48,7 +65,8 @@ class HideMethodCommand(BaseCommand):
         Raises:
             ValueError: If required parameters are missing
         """
-        self.validate_required_params("target")
+        if not self.params.get("package", False):
+            self.validate_required_params("target")
 
     def execute(self) -> None:
         """Apply hide-method refactoring using libCST.
@@ -56,7 +74,10 @@ class HideMethodCommand(BaseCommand):
         Raises:
             ValueError: If method not found or target format is invalid
         """
-        target = self.params["target"]
+        target = self.params.get("target")
+        if target is None or "::" not in target:
+            self._hide_unused_methods(target)
+            return
         class_name, method_name = parse_target(target, expected_parts=2)
 
         # Validate that the method name doesn't already start with underscore
@@ -69,6 +90,47 @@ class HideMethodCommand(BaseCommand):
         # Apply the transformation
         self.apply_libcst_transform(HideMethodTransformer, class_name, method_name, new_method_name)
 
+    def _hide_unused_methods(self, class_name: str | None) -> None:
+        """Hide every public method used only inside its class.
+
+        Args:
+            class_name: Class whose methods are examined, or None for every
+                class under the target file's directory
+
+        Raises:
+            ValueError: If the class is not found or defined more than once
+        """
+        directory = self.file_path.parent
+        with phase("search"):
+            files = self.project_files(directory)
+            project = ProjectIndex.from_files(files)
+            accesses = AttributeAccessIndex.from_files(files)
+        if class_name is not None:
+            project.get_class(class_name)
+        decisions = find_hideable_methods(
+            project, accesses, [class_name] if class_name is not None else None
+        )
+
+        hidden = [decision for decision in decisions if decision.hidden]
+        if hidden:
+            renamer = MethodRenamer(
+                project,
+                [MethodRename(d.class_name, d.method_name, d.new_name) for d in hidden],
+            )
+            transaction = FileTransaction()
+            for file_path in sorted({decision.file_path for decision in hidden}):
+                with phase("parse"):
+                    source = file_path.read_text()
+                    module = cst.parse_module(source)
+                with phase("transform"):
+                    new_code = renamer.rename_module(module).code
+                if new_code != source:
+                    transaction.stage(file_path, new_code)
+            transaction.commit()
+
+        if "report" in self.params:
+            Path(self.params["report"]).write_text(format_report(decisions, directory.resolve()))
+
 
 class HideMethodTransformer(cst.CSTTransformer):
     """Transforms a class to hide a method by making it private."""
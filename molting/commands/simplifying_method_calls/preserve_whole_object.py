@@ -199,7 +199,7 @@ class PreserveWholeObjectCommand(BaseCommand):
         # Update call sites to use the whole object instead of individual attributes
         # Transform: within_plan(plan, obj.low, obj.high) -> within_plan(plan, obj)
         directory = self.file_path.parent
-        updater = CallSiteUpdater(directory)
+        updater = self.create_call_site_updater(directory)
         self._update_call_sites(updater, function_name)
 
     def _find_source_object_for_locals(self, ref: Reference) -> Optional[cst.BaseExpression]:
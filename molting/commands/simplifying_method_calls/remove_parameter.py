@@ -1,14 +1,14 @@
 """Remove Parameter refactoring command."""
 
-import ast
+import libcst as cst
 
 from molting.commands.base import BaseCommand
 from molting.commands.registry import register_command
-from molting.core.ast_utils import (
-    find_method_in_tree,
-    parameter_has_default,
-    parse_target,
-)
+from molting.core.ast_utils import parse_target
+from molting.core.file_transaction import FileTransaction
+from molting.core.profiling import phase
+from molting.core.scope_service import ScopeService
+from molting.core.signature_changer import SignatureChange, SignatureChanger, signature_scope
 
 
 class RemoveParameterCommand(BaseCommand):
@@ -37,6 +37,21 @@ class RemoveParameterCommand(BaseCommand):
             return sum(item.price for item in items) - discount
 
         result = obj.calculate_total([item1, item2], 5.0)
+
+    Several parameters can be removed in one run by listing them separated by
+    commas (``Class::method::a,b``). The parameters are removed from the
+    method and the overrides it shares a slot with, and their arguments are
+    dropped from the calls, whether passed by position or by keyword.
+
+    By default calls are updated in the target file only. With
+    ``across_files=True`` every caller under the target file's directory is
+    updated too; each file is parsed once and all files are written together.
+    Calls are updated only when their receiver is of a class of the method's
+    family; with ``include_unresolved=True``, receivers of unknown type are
+    updated too when no unrelated class defines the method. Without it, such
+    calls raise a ValueError listing their locations before any file is
+    written, as do calls whose arguments cannot be matched to the parameters
+    (``*args``).
     """
 
     name = "remove-parameter"
@@ -50,101 +65,39 @@ class RemoveParameterCommand(BaseCommand):
         self.validate_required_params("target")
 
     def execute(self) -> None:
-        """Apply remove-parameter refactoring using AST manipulation.
+        """Apply remove-parameter refactoring.
 
         Raises:
-            ValueError: If method or parameter not found
-        """
-        target = self.params["target"]
-        _, method_name, param_name = parse_target(target, expected_parts=3)
-
-        def transform(tree: ast.Module) -> ast.Module:
-            """Transform the AST to remove a parameter from the method.
-
-            Args:
-                tree: The AST module to transform
-
-            Returns:
-                The modified AST module
-
-            Raises:
-                ValueError: If method or parameter not found
-            """
-            result = find_method_in_tree(tree, method_name)
-            if result is None:
-                raise ValueError(f"Method '{method_name}' not found in {self.file_path}")
-
-            _, method_node = result
-
-            # Find and remove the parameter from the method's argument list
-            param_index = None
-            for i, arg in enumerate(method_node.args.args):
-                if arg.arg == param_name:
-                    param_index = i
-                    break
-
-            if param_index is None:
-                raise ValueError(f"Parameter '{param_name}' not found in method '{method_name}'")
-
-            # Check if the parameter has a default value before removing
-            total_args = len(method_node.args.args)
-            num_defaults = len(method_node.args.defaults)
-            has_default = parameter_has_default(param_index, total_args, num_defaults)
-
-            # Remove the parameter from the argument list
-            method_node.args.args.pop(param_index)
-
-            # If the parameter had a default value, remove it from the defaults list
-            if has_default:
-                num_args_without_defaults = total_args - num_defaults
-                default_index = param_index - num_args_without_defaults
-                method_node.args.defaults.pop(default_index)
-
-            # Remove arguments from all call sites
-            # Note: param_index in method calls excludes the implicit 'self' parameter
-            call_arg_index = param_index - 1 if param_index > 0 else 0
-            tree = RemoveArgumentTransformer(method_name, call_arg_index).visit(tree)
-
-            return tree
-
-        self.apply_ast_transform(transform)
-
-
-class RemoveArgumentTransformer(ast.NodeTransformer):
-    """Transformer to remove arguments from method calls."""
-
-    def __init__(self, method_name: str, param_index: int) -> None:
-        """Initialize the transformer.
-
-        Args:
-            method_name: Name of the method being modified
-            param_index: Index of the parameter to remove
+            ValueError: If method or parameter not found, or a call cannot be updated
         """
-        self.method_name = method_name
-        self.param_index = param_index
-
-    def visit_Call(self, node: ast.Call) -> ast.Call:  # noqa: N802
-        """Visit a Call node and remove argument at param_index.
-
-        This removes the argument at param_index if the call is to the
-        method_name being modified.
-
-        Args:
-            node: The Call node to visit
-
-        Returns:
-            The modified Call node
-        """
-        # First, recursively visit child nodes
-        self.generic_visit(node)
-
-        # Check if this is a call to the method we're modifying
-        if isinstance(node.func, ast.Attribute) and node.func.attr == self.method_name:
-            # Remove the argument at param_index if it exists
-            if self.param_index < len(node.args):
-                node.args.pop(self.param_index)
-
-        return node
+        class_name, method_name, param_spec = parse_target(self.params["target"], expected_parts=3)
+        removed = tuple(name.strip() for name in param_spec.split(",") if name.strip())
+        change = SignatureChange(class_name, method_name, removed=removed)
+
+        with phase("parse"):
+            module = cst.parse_module(self.file_path.read_text())
+        definition = ScopeService.for_module(module).find_function(class_name, method_name)
+        if definition is None:
+            raise ValueError(f"Method '{method_name}' not found in {self.file_path}")
+
+        updater = None
+        if self.params.get("across_files", False):
+            updater = self.create_call_site_updater(self.file_path.parent)
+        index, callers = signature_scope(self.file_path, method_name, updater)
+        changer = SignatureChanger(
+            index,
+            change,
+            definition,
+            include_unresolved=self.params.get("include_unresolved", False),
+        )
+
+        transaction = FileTransaction()
+        with phase("transform"):
+            transaction.stage(self.file_path, changer.update_module(module, self.file_path).code)
+        for file_path, new_code in changer.rewrite_files(callers).items():
+            transaction.stage(file_path, new_code)
+        changer.check_skipped()
+        transaction.commit()
 
 
 # Register the command
@@ -1,10 +1,16 @@
 """Rename Method refactoring command."""
 
-import re
+from pathlib import Path
+
+import libcst as cst
 
 from molting.commands.base import BaseCommand
 from molting.commands.registry import register_command
 from molting.core.ast_utils import parse_target
+from molting.core.file_transaction import FileTransaction
+from molting.core.method_renamer import MethodRename, MethodRenamer, load_rename_map
+from molting.core.profiling import phase
+from molting.core.project_index import ProjectIndex
 
 
 class RenameMethodCommand(BaseCommand):
@@ -32,6 +38,19 @@ class RenameMethodCommand(BaseCommand):
             return sum(item.price for item in items)
 
         total = order.calculate_total_price(products)
+
+    The method is renamed together with the overrides it shares a slot with in
+    base classes and subclasses, and accesses are updated in every Python file
+    under the target file's directory. Accesses are renamed when their
+    receiver's type is known to be a class of the method's family; receivers
+    of other types (unrelated classes, ``dict``, imported library classes) are
+    left alone. With ``include_unresolved=True``, receivers of unknown type are
+    renamed too when no unrelated class defines a method of the same name.
+
+    With ``mapping=<file>`` every rename listed in the file (one
+    ``Class::method new_name`` per line) is applied in the same pass, so each
+    file is parsed and written once however many methods are renamed. All
+    files are written together or not at all.
     """
 
     name = "rename-method"
@@ -42,7 +61,8 @@ class RenameMethodCommand(BaseCommand):
         Raises:
             ValueError: If required parameters are missing
         """
-        self.validate_required_params("target", "new_name")
+        if "mapping" not in self.params:
+            self.validate_required_params("target", "new_name")
 
     def execute(self) -> None:
         """Apply rename-method refactoring.
@@ -50,35 +70,45 @@ class RenameMethodCommand(BaseCommand):
         Raises:
             ValueError: If method not found or target format is invalid
         """
-        target = self.params["target"]
-        new_name = self.params["new_name"]
-
-        _, method_name = parse_target(target)
-
-        # Read the source file
-        source = self.file_path.read_text()
-
-        # Verify method exists
-        if f"def {method_name}" not in source:
-            raise ValueError(f"Method '{method_name}' not found in {self.file_path}")
+        renames = self._renames()
+        directory = self.file_path.parent
+        renamer = MethodRenamer(
+            ProjectIndex.from_files(self.project_files(directory)),
+            renames,
+            include_unresolved=self.params.get("include_unresolved", False),
+        )
+
+        updater = self.create_call_site_updater(directory)
+        files = {path.resolve() for path in updater.find_candidate_lines(renamer.old_names)}
+        files.add(self.file_path.resolve())
+
+        transaction = FileTransaction()
+        for file_path in sorted(files):
+            with phase("parse"):
+                source = file_path.read_text()
+                module = cst.parse_module(source)
+            with phase("transform"):
+                new_code = renamer.rename_module(module).code
+            if new_code != source:
+                transaction.stage(file_path, new_code)
+        transaction.commit()
+
+    def _renames(self) -> list[MethodRename]:
+        """Collect the renames from the target and the mapping file.
+
+        Returns:
+            The renames to apply
 
-        # Use regex to replace all method calls and definitions
-        # This handles:
-        # 1. Method definitions: def method_name(
-        # 2. Method calls with self: self.method_name(
-        # 3. Method calls with variables: var.method_name(
-        # 4. Method calls with attributes: obj.attr.method_name(
-
-        # Replace method definition
-        pattern = rf"\bdef {re.escape(method_name)}\("
-        result = re.sub(pattern, f"def {new_name}(", source)
-
-        # Replace all method calls with dot notation
-        pattern = rf"\.{re.escape(method_name)}\("
-        result = re.sub(pattern, f".{new_name}(", result)
-
-        # Write the updated source back
-        self.file_path.write_text(result)
+        Raises:
+            ValueError: If the target or the mapping file is invalid
+        """
+        renames = []
+        if "target" in self.params:
+            class_name, method_name = parse_target(self.params["target"])
+            renames.append(MethodRename(class_name, method_name, self.params["new_name"]))
+        if "mapping" in self.params:
+            renames.extend(load_rename_map(Path(self.params["mapping"])))
+        return renames
 
 
 # Register the command
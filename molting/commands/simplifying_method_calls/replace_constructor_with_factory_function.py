@@ -5,10 +5,26 @@ import libcst as cst
 from molting.commands.base import BaseCommand
 from molting.commands.registry import register_command
 from molting.core.ast_utils import parse_target
+from molting.core.file_transaction import FileTransaction
+from molting.core.import_graph import ImportGraph
+from molting.core.instantiation_rewriter import (
+    FactoryReplacement,
+    rewrite_instantiations_in_files,
+)
+from molting.core.profiling import phase
 
 
 class ReplaceConstructorWithFactoryFunctionCommand(BaseCommand):
-    """Command to replace constructor with a factory function."""
+    """Command to replace constructor with a factory function.
+
+    The factory is added after the class, and instantiations are replaced in
+    the class's module and in every module under its directory that imports
+    the class (``from models import Employee [as Emp]``) or its module
+    (``import models``). The factory is imported where needed, taking the
+    class's place in the import when nothing else uses the class. Modules are
+    rewritten in parallel when there are many, and all files are written
+    together.
+    """
 
     name = "replace-constructor-with-factory-function"
 
@@ -32,16 +48,30 @@ class ReplaceConstructorWithFactoryFunctionCommand(BaseCommand):
         if method_name != "__init__":
             raise ValueError(f"Target must be a constructor (__init__), got: {method_name}")
 
-        # Read file
-        source_code = self.file_path.read_text()
-
-        # Parse and transform
-        module = cst.parse_module(source_code)
+        with phase("parse"):
+            module = cst.parse_module(self.file_path.read_text())
         transformer = ReplaceConstructorWithFactoryFunctionTransformer(class_name)
-        modified_tree = module.visit(transformer)
-
-        # Write back
-        self.file_path.write_text(modified_tree.code)
+        with phase("transform"):
+            modified_tree = module.visit(transformer)
+
+        transaction = FileTransaction()
+        transaction.stage(self.file_path, modified_tree.code)
+
+        directory = self.file_path.parent
+        updater = self.create_call_site_updater(directory)
+        files = {path.resolve() for path in updater.find_candidate_lines([class_name])}
+        files.discard(self.file_path.resolve())
+        if files:
+            graph = ImportGraph.for_directory(directory)
+            spec = FactoryReplacement(
+                class_name, graph.module_name(self.file_path), transformer.factory_name
+            )
+            for file_path, new_code in rewrite_instantiations_in_files(
+                sorted(files), spec, graph
+            ).items():
+                if new_code is not None:
+                    transaction.stage(file_path, new_code)
+        transaction.commit()
 
 
 class ReplaceConstructorWithFactoryFunctionTransformer(cst.CSTTransformer):
@@ -119,7 +119,7 @@ class ReplaceParameterWithExplicitMethodsCommand(BaseCommand):
 
         # Update call sites to use the new explicit methods
         directory = self.file_path.parent
-        updater = CallSiteUpdater(directory)
+        updater = self.create_call_site_updater(directory)
         self._update_call_sites(updater, method_name, param_name, parameter_values)
 
     def _update_call_sites(
@@ -0,0 +1,139 @@
+"""Memoized per-function analysis facts.
+
+Batch runs often target the same function several times (an extract-method
+followed by another extract-method on the same long function, for example).
+AnalysisCache keeps the facts computed for a function, keyed by the file, the
+function's qualified name and a hash of the function's source, so an unchanged
+function is never re-analyzed and an edited one can never be served stale facts.
+
+Facts that contain line numbers also depend on where the function starts, so
+callers pass the start line for those and a function that merely moved is
+re-analyzed.
+
+Usage:
+    cache = get_analysis_cache()
+    facts = cache.get_or_compute(
+        "dataflow", file_path, "Order.print_owing", function, lambda: analyze(function)
+    )
+"""
+
+import hashlib
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Iterable, TypeVar
+
+import libcst as cst
+
+T = TypeVar("T")
+
+# Number of (function, analysis) results kept by the shared cache
+_CACHE_SIZE = 256
+
+_EMPTY_MODULE = cst.Module(body=[])
+
+
+def function_fingerprint(function: cst.FunctionDef) -> str:
+    """Hash the source of a function, including its signature and decorators.
+
+    Args:
+        function: The function to fingerprint
+
+    Returns:
+        Hex digest that changes whenever the function's text changes
+    """
+    code = _EMPTY_MODULE.code_for_node(function)
+    return hashlib.blake2b(code.encode(), digest_size=16).hexdigest()
+
+
+class AnalysisCache:
+    """LRU cache of analysis results keyed by function identity and source hash."""
+
+    def __init__(self, max_entries: int = _CACHE_SIZE) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            max_entries: Number of results kept before the least recently used is evicted
+        """
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[tuple[Any, ...], Any] = OrderedDict()
+
+    def __len__(self) -> int:
+        """Return the number of cached results."""
+        return len(self._entries)
+
+    def get_or_compute(
+        self,
+        kind: str,
+        file_path: Path | None,
+        qualified_name: str,
+        function: cst.FunctionDef,
+        compute: Callable[[], T],
+        start_line: int | None = None,
+    ) -> T:
+        """Return a cached analysis result, computing and storing it on a miss.
+
+        Args:
+            kind: Name of the analysis (results of different analyses never collide)
+            file_path: File containing the function, or None if unknown
+            qualified_name: ``Class.method`` or ``function`` name of the function
+            function: The function node, hashed to detect edits
+            compute: Computes the result on a miss
+            start_line: Start line of the function, for results that contain line numbers
+
+        Returns:
+            The cached or freshly computed result
+        """
+        file_key = str(file_path.resolve()) if file_path is not None else ""
+        key = (kind, file_key, qualified_name, function_fingerprint(function), start_line)
+        if key in self._entries:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return self._entries[key]  # type: ignore[no-any-return]
+
+        self.misses += 1
+        result = compute()
+        self._entries[key] = result
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return result
+
+    def invalidate(self, file_path: Path | None, names: Iterable[str]) -> int:
+        """Drop the results of a file's functions that belong to changed definitions.
+
+        Results keyed by source hash can never be served stale, but once a
+        definition has changed its old results are dead weight in the cache.
+
+        Args:
+            file_path: File the definitions live in, or None for results cached without one
+            names: Top-level definition names (a class name covers all of its methods)
+
+        Returns:
+            Number of results dropped
+        """
+        file_key = str(file_path.resolve()) if file_path is not None else ""
+        exact = set(names)
+        prefixes = tuple(f"{name}." for name in exact)
+        stale = [
+            key
+            for key in self._entries
+            if key[1] == file_key and (key[2] in exact or key[2].startswith(prefixes))
+        ]
+        for key in stale:
+            del self._entries[key]
+        return len(stale)
+
+    def clear(self) -> None:
+        """Drop every cached result and reset the statistics."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+_cache = AnalysisCache()
+
+
+def get_analysis_cache() -> AnalysisCache:
+    """Return the process-wide analysis cache shared by all commands."""
+    return _cache
@@ -2,7 +2,7 @@
 
 import ast
 import re
-from typing import Any, List, Optional, Sequence, Tuple
+from typing import Any, Optional, Sequence, Tuple
 
 import libcst as cst
 
@@ -33,6 +33,80 @@ def parse_target(target: str, expected_parts: int = 2) -> Tuple[str, ...]:
     return tuple(parts)  # type: ignore[return-value]
 
 
+def parse_field_targets(target: str) -> dict[str, list[str]]:
+    """Parse a batch of fields in 'Class', 'Class::a,b' or 'A::x,B::y' format.
+
+    A name after a 'Class::field' item is another field of that class; a bare
+    class name stands for every public field of the class.
+
+    Args:
+        target: Target specification string
+
+    Returns:
+        Class name -> field names, in order; an empty list means every public field
+
+    Raises:
+        ValueError: If format is invalid
+    """
+    fields: dict[str, list[str]] = {}
+    current_class = None
+    for item in (part.strip() for part in target.split(",")):
+        parts = item.split("::")
+        if len(parts) > 2 or not all(part.isidentifier() for part in parts):
+            raise ValueError(
+                f"Invalid target format '{target}'. "
+                "Expected 'ClassName', 'ClassName::field,...' or 'A::field,B::field'"
+            )
+        if len(parts) == 2:
+            current_class, field_name = parts
+        elif current_class is not None:
+            field_name = item
+        else:
+            fields.setdefault(item, [])
+            continue
+        class_fields = fields.setdefault(current_class, [])
+        if field_name not in class_fields:
+            class_fields.append(field_name)
+    return fields
+
+
+def resolve_field_targets(
+    module: cst.Module, targets: dict[str, list[str]]
+) -> dict[str, list[str]]:
+    """Expand whole-class targets into the public fields assigned in ``__init__``.
+
+    Fields that the class already defines as a method or property are skipped.
+
+    Args:
+        module: Module defining the classes
+        targets: Class name -> field names, as returned by parse_field_targets
+
+    Returns:
+        Class name -> field names to encapsulate
+
+    Raises:
+        ValueError: If a class is not found or has no public field to encapsulate
+    """
+    resolved: dict[str, list[str]] = {}
+    for class_name, field_names in targets.items():
+        class_def = find_class_in_module(module, class_name)
+        if class_def is None:
+            raise ValueError(f"Class '{class_name}' not found")
+        if field_names:
+            resolved[class_name] = field_names
+            continue
+        init_method = find_method_in_class(class_def, "__init__")
+        assigned = extract_init_field_assignments(init_method) if init_method else {}
+        members = {
+            stmt.name.value for stmt in class_def.body.body if isinstance(stmt, cst.FunctionDef)
+        }
+        public = [name for name in assigned if not name.startswith("_") and name not in members]
+        if not public:
+            raise ValueError(f"Class '{class_name}' has no public fields to encapsulate")
+        resolved[class_name] = public
+    return resolved
+
+
 def parse_line_number(line_spec: str) -> int:
     """Parse line number from 'L4' format.
 
@@ -176,6 +250,31 @@ def parse_target_with_range(target: str) -> Tuple[str, str, int, int]:
     return (class_name, method_name, start_line, end_line)
 
 
+def parse_target_with_ranges(target: str) -> Tuple[str, str, list[Tuple[int, int]]]:
+    """Parse target with line ranges from 'ClassName::method#L9-L11,L14-L20' format.
+
+    Args:
+        target: Target string with one or more comma-separated line ranges
+
+    Returns:
+        Tuple of (class_or_function_name, method_name, [(start_line, end_line), ...])
+        For function-level targets, method_name will be empty string
+
+    Raises:
+        ValueError: If target format is invalid
+    """
+    parts = target.split(TARGET_SEPARATOR)
+    if len(parts) != 2:
+        raise ValueError(
+            f"Invalid target format '{target}'. "
+            f"Expected 'ClassName::method#L<start>-L<end>[,L<start>-L<end>...]'"
+        )
+
+    line_ranges = [parse_line_range(spec.strip()) for spec in parts[1].split(",")]
+    class_name, method_name = _parse_class_method_part(parts[0])
+    return (class_name, method_name, line_ranges)
+
+
 def find_method_in_tree(tree: Any, method_name: str) -> Optional[Tuple[Any, Any]]:
     """Find a method in a class within the AST tree.
 
@@ -213,71 +312,6 @@ def parameter_has_default(param_index: int, total_args: int, num_defaults: int)
     return param_index >= num_args_without_defaults
 
 
-def create_formatted_attribute(attr_name: str) -> ast.FormattedValue:
-    """Create a formatted value node for an attribute reference in an f-string.
-
-    Args:
-        attr_name: Name of the attribute to reference
-
-    Returns:
-        FormattedValue AST node
-    """
-    return ast.FormattedValue(
-        value=ast.Attribute(
-            value=ast.Name(id="self", ctx=ast.Load()),
-            attr=attr_name,
-            ctx=ast.Load(),
-        ),
-        conversion=-1,
-        format_spec=None,
-    )
-
-
-def create_contact_info_body(param_name: str) -> List[Any]:
-    """Create method body for get_contact_info with conditional email inclusion.
-
-    Args:
-        param_name: Name of the boolean parameter controlling email inclusion
-
-    Returns:
-        List of AST statement nodes for the method body
-    """
-    # Create: result = f"{self.name}\n{self.phone}"
-    result_assign = ast.Assign(
-        targets=[ast.Name(id="result", ctx=ast.Store())],
-        value=ast.JoinedStr(
-            values=[
-                create_formatted_attribute("name"),
-                ast.Constant(value="\n"),
-                create_formatted_attribute("phone"),
-            ]
-        ),
-    )
-
-    # Create: if <param_name>: result += f"\n{self.email}"
-    if_stmt = ast.If(
-        test=ast.Name(id=param_name, ctx=ast.Load()),
-        body=[
-            ast.AugAssign(
-                target=ast.Name(id="result", ctx=ast.Store()),
-                op=ast.Add(),
-                value=ast.JoinedStr(
-                    values=[
-                        ast.Constant(value="\n"),
-                        create_formatted_attribute("email"),
-                    ]
-                ),
-            )
-        ],
-        orelse=[],
-    )
-
-    # Create: return result
-    return_stmt = ast.Return(value=ast.Name(id="result", ctx=ast.Load()))
-
-    return [result_assign, if_stmt, return_stmt]
-
-
 def extract_init_field_assignments(
     init_method: cst.FunctionDef,
 ) -> dict[str, cst.BaseExpression]:
@@ -0,0 +1,203 @@
+"""Project-wide index of attribute accesses.
+
+Refactorings that move or rename a field must find every ``obj.field`` in the
+project. Searching for the bare name matches every unrelated attribute with
+the same name; AttributeAccessIndex parses each Python file once, with the fast
+``ast`` parser, and records every attribute access with the class of its
+receiver when that is evident: ``self.x`` (or whatever a method's first
+parameter is called) inside a method belongs to the method's class.
+
+Accesses whose receiver class is known and unrelated can then be dropped
+before any file is parsed with libcst, and the classes that store an
+attribute tell whether an access on an unknown receiver is ambiguous.
+
+Usage:
+    index = AttributeAccessIndex.build(Path("src"))
+    index.classes_storing("interest_rate")                          # {"Account"}
+    index.candidate_lines(["interest_rate"], {"Account", "Savings"})  # {path: {12, 30}}
+"""
+
+import ast
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable
+
+
+@dataclass(frozen=True)
+class AttributeAccess:
+    """An ``obj.attr`` expression found in the project.
+
+    Attributes:
+        file_path: File containing the access
+        line: Line of the access
+        attr: Attribute name
+        receiver_class: Class of the receiver when it is a method's first
+            parameter, None when unknown
+        is_store: Whether the access is an assignment target
+    """
+
+    file_path: Path
+    line: int
+    attr: str
+    receiver_class: str | None
+    is_store: bool
+
+
+class AttributeAccessIndex:
+    """Attribute accesses of a project, by attribute name."""
+
+    def __init__(self) -> None:
+        """Initialize an empty index; use build() or add_file() to populate it."""
+        self._accesses: dict[str, list[AttributeAccess]] = {}
+
+    @classmethod
+    def build(cls, directory: Path) -> "AttributeAccessIndex":
+        """Index every Python file under a directory.
+
+        Args:
+            directory: Root directory of the project
+
+        Returns:
+            The populated index
+        """
+        return cls.from_files(sorted(path.resolve() for path in directory.rglob("*.py")))
+
+    @classmethod
+    def from_files(cls, files: Iterable[Path]) -> "AttributeAccessIndex":
+        """Index the given Python files.
+
+        Files that cannot be read or parsed contribute no accesses.
+
+        Args:
+            files: Files to index
+
+        Returns:
+            The populated index
+        """
+        index = cls()
+        for file_path in files:
+            try:
+                source = file_path.read_text()
+            except (OSError, UnicodeDecodeError):
+                continue
+            index.add_file(file_path, source)
+        return index
+
+    def add_file(self, file_path: Path, source: str) -> None:
+        """Add the attribute accesses of a file's source.
+
+        Args:
+            file_path: Path of the file
+            source: Source code of the file
+        """
+        try:
+            tree = ast.parse(source)
+        except SyntaxError:
+            return
+        collector = _AccessCollector(file_path)
+        collector.visit(tree)
+        for access in collector.accesses:
+            self._accesses.setdefault(access.attr, []).append(access)
+
+    def accesses(self, attr: str) -> list[AttributeAccess]:
+        """Return the accesses of an attribute, in file and line order."""
+        return list(self._accesses.get(attr, []))
+
+    def classes_storing(self, attr: str) -> set[str]:
+        """Return the classes whose methods assign an attribute on their instance."""
+        return {
+            access.receiver_class
+            for access in self._accesses.get(attr, [])
+            if access.is_store and access.receiver_class is not None
+        }
+
+    def candidate_lines(self, attrs: Iterable[str], classes: set[str]) -> dict[Path, set[int]]:
+        """Return the lines that may access attributes of instances of some classes.
+
+        Accesses whose receiver belongs to another class are excluded;
+        accesses on receivers of unknown class are kept.
+
+        Args:
+            attrs: Attribute names
+            classes: Classes whose instances' attributes are looked for
+
+        Returns:
+            File -> line numbers (1-indexed) with a candidate access
+        """
+        lines_by_file: dict[Path, set[int]] = {}
+        for attr in dict.fromkeys(attrs):
+            for access in self._accesses.get(attr, []):
+                if access.receiver_class is None or access.receiver_class in classes:
+                    lines_by_file.setdefault(access.file_path, set()).add(access.line)
+        return lines_by_file
+
+
+class _AccessCollector(ast.NodeVisitor):
+    """Collects the attribute accesses of a module with their receiver class."""
+
+    def __init__(self, file_path: Path) -> None:
+        """Initialize the collector.
+
+        Args:
+            file_path: File being collected
+        """
+        self.file_path = file_path
+        self.accesses: list[AttributeAccess] = []
+        # Enclosing class name, or None inside a function, innermost last
+        self._classes: list[str | None] = []
+        # (receiver parameter name, its class) of the enclosing method, innermost last
+        self._receivers: list[tuple[str, str] | None] = []
+
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:  # noqa: N802
+        """Enter a class."""
+        self._classes.append(node.name)
+        self.generic_visit(node)
+        self._classes.pop()
+
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:  # noqa: N802
+        """Enter a function; a method's first parameter is an instance of its class."""
+        self._visit_function(node)
+
+    def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> None:  # noqa: N802
+        """Enter an async function."""
+        self._visit_function(node)
+
+    def visit_Attribute(self, node: ast.Attribute) -> None:  # noqa: N802
+        """Record an attribute access."""
+        receiver = self._receivers[-1] if self._receivers else None
+        receiver_class = None
+        if receiver is not None and isinstance(node.value, ast.Name):
+            if node.value.id == receiver[0]:
+                receiver_class = receiver[1]
+        self.accesses.append(
+            AttributeAccess(
+                self.file_path,
+                node.lineno,
+                node.attr,
+                receiver_class,
+                isinstance(node.ctx, ast.Store),
+            )
+        )
+        self.generic_visit(node)
+
+    def _visit_function(self, node: ast.FunctionDef | ast.AsyncFunctionDef) -> None:
+        """Track the receiver of a method while visiting its body."""
+        class_name = self._classes[-1] if self._classes else None
+        params = [*node.args.posonlyargs, *node.args.args]
+        is_static = any(
+            isinstance(decorator, ast.Name) and decorator.id == "staticmethod"
+            for decorator in node.decorator_list
+        )
+        if class_name is not None and params and not is_static:
+            receiver: tuple[str, str] | None = (params[0].arg, class_name)
+        elif self._receivers:
+            # Nested functions see the enclosing method's receiver
+            receiver = self._receivers[-1]
+        else:
+            receiver = None
+
+        self._classes.append(None)
+        self._receivers.append(receiver)
+        self.generic_visit(node)
+        self._receivers.pop()
+        self._classes.pop()
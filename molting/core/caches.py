@@ -0,0 +1,124 @@
+"""Small LRU caches shared by the analyses that are reused across commands.
+
+Several analyses are expensive enough to reuse when a command, or the next
+command of a batch, asks again about the same module: scope analysis, symbol
+tables, conditional catalogs, line indexes and import graphs. Each keeps its
+results in one of the caches below. They all hold at most ``CACHE_SIZE``
+entries, evicting the least recently used one, and clear_caches() empties all
+of them at once (to release memory after a batch, or to isolate tests).
+
+LRUCache is keyed by value (a source text, a directory). IdentityCache is
+keyed by the identity of an object such as a parsed module; it stores the
+object with its value, so the object's id cannot be reused by another object
+while the entry is cached.
+
+Usage:
+    _services: IdentityCache[cst.Module, ScopeService] = IdentityCache()
+
+    service = _services.get(module)
+    if service is None:
+        service = ScopeService(module)
+        _services.put(module, service)
+"""
+
+from collections import OrderedDict
+from typing import Any, Generic, Hashable, TypeVar
+from weakref import WeakSet
+
+_K = TypeVar("_K", bound=Hashable)
+_O = TypeVar("_O")
+_V = TypeVar("_V")
+
+# Number of entries each cache keeps
+CACHE_SIZE = 8
+
+# Every live cache, emptied by clear_caches()
+_caches: "WeakSet[LRUCache[Any, Any]]" = WeakSet()
+
+
+class LRUCache(Generic[_K, _V]):
+    """Least recently used cache of at most CACHE_SIZE values."""
+
+    def __init__(self) -> None:
+        """Initialize an empty cache, emptied by clear_caches()."""
+        self._entries: OrderedDict[_K, _V] = OrderedDict()
+        _caches.add(self)
+
+    def __len__(self) -> int:
+        """Return the number of cached values."""
+        return len(self._entries)
+
+    def get(self, key: _K) -> _V | None:
+        """Return the value cached for a key, marking it as recently used.
+
+        Args:
+            key: The key
+
+        Returns:
+            The value, or None if it is not cached
+        """
+        value = self._entries.get(key)
+        if value is not None:
+            self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: _K, value: _V) -> None:
+        """Cache a value, evicting the least recently used one if the cache is full.
+
+        Args:
+            key: The key
+            value: The value
+        """
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > CACHE_SIZE:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached value."""
+        self._entries.clear()
+
+
+class IdentityCache(Generic[_O, _V]):
+    """LRU cache of values computed for objects, keyed by the objects' identity."""
+
+    def __init__(self) -> None:
+        """Initialize an empty cache, emptied by clear_caches()."""
+        self._entries: LRUCache[int, tuple[_O, _V]] = LRUCache()
+
+    def __len__(self) -> int:
+        """Return the number of cached values."""
+        return len(self._entries)
+
+    def get(self, obj: _O) -> _V | None:
+        """Return the value cached for this very object.
+
+        Args:
+            obj: The object
+
+        Returns:
+            The value, or None if it is not cached
+        """
+        cached = self._entries.get(id(obj))
+        if cached is None or cached[0] is not obj:
+            return None
+        return cached[1]
+
+    def put(self, obj: _O, value: _V) -> None:
+        """Cache a value for an object, keeping the object alive with it.
+
+        Args:
+            obj: The object
+            value: The value
+        """
+        self._entries.put(id(obj), (obj, value))
+
+    def clear(self) -> None:
+        """Drop every cached value."""
+        self._entries.clear()
+
+
+def clear_caches() -> None:
+    """Empty every LRUCache and IdentityCache."""
+    for cache in _caches:
+        cache.clear()
@@ -0,0 +1,321 @@
+"""Asyncio pipeline for streaming call-site updates.
+
+This module provides CallSitePipeline, which CallSiteUpdater.update_all runs.
+Instead of collecting every reference before transforming anything, files flow
+through four stages connected by bounded queues:
+
+    search -> validate -> transform -> write
+
+The search subprocess streams matches file by file, and parsing and
+transforming run on an executor. Parsed modules are held only while a file is
+in the queues; each new source is staged in a FileTransaction as soon as it is
+ready, and the files are written together once every stage has finished, so a
+failed run changes nothing.
+
+While a profiler is active (see molting.core.profiling), the stages run on the
+calling thread instead of worker threads, so their phases and call stacks are
+recorded.
+"""
+
+import asyncio
+from concurrent.futures import Executor, Future
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, AsyncIterator, Callable, TypeVar
+
+import libcst as cst
+
+from molting.core.call_site_updater import CallSiteUpdater, Reference, UpdateResult
+from molting.core.file_transaction import FileTransaction
+from molting.core.profiling import is_profiling, phase
+from molting.core.reference_searcher import StreamingReferenceSearcher, TextMatch
+from molting.core.symbol_context import SymbolContext
+
+_T = TypeVar("_T")
+
+# Marks the end of a stage's output on its queue
+_DONE = None
+
+
+@dataclass
+class PipelineProgress:
+    """Snapshot of pipeline progress, passed to the progress callback.
+
+    Attributes:
+        stage: Stage that just finished a file ("search", "validate", "transform", "write")
+        file_path: The file that stage just finished
+        files_searched: Files reported by the search stage so far
+        files_validated: Files parsed and validated so far
+        files_transformed: Files transformed so far
+        files_written: Files staged for writing so far
+        references_updated: References updated in written files so far
+    """
+
+    stage: str
+    file_path: Path
+    files_searched: int = 0
+    files_validated: int = 0
+    files_transformed: int = 0
+    files_written: int = 0
+    references_updated: int = 0
+
+
+ProgressCallback = Callable[[PipelineProgress], None]
+
+
+class _CallingThreadExecutor(Executor):
+    """Executor that runs each call right away on the submitting thread."""
+
+    def submit(self, fn: Callable[..., _T], /, *args: Any, **kwargs: Any) -> "Future[_T]":
+        """Run a call and return its already completed future."""
+        future: Future[_T] = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except BaseException as e:
+            future.set_exception(e)
+        return future
+
+
+class CallSitePipeline:
+    """Run search, validation, transformation and writing as overlapping stages.
+
+    Example:
+        pipeline = CallSitePipeline(CallSiteUpdater(Path("/path/to/code")), queue_size=8)
+        result = asyncio.run(
+            pipeline.run("manager", SymbolContext.ATTRIBUTE_ACCESS, transformer)
+        )
+    """
+
+    def __init__(
+        self,
+        updater: CallSiteUpdater,
+        queue_size: int = 16,
+        executor: Executor | None = None,
+        progress: ProgressCallback | None = None,
+    ) -> None:
+        """Initialize the pipeline.
+
+        Args:
+            updater: Updater providing the directory, search backend and per-file steps
+            queue_size: Maximum number of files buffered between two stages
+            executor: Executor for CPU-bound parsing and transforms (the loop's
+                default if None, or the calling thread while profiling)
+            progress: Optional callback invoked each time a stage finishes a file
+        """
+        if queue_size < 1:
+            raise ValueError(f"queue_size must be at least 1, got {queue_size}")
+        self.updater = updater
+        self.queue_size = queue_size
+        self.executor = executor
+        self.progress = progress
+        self._state = PipelineProgress(stage="", file_path=updater.directory)
+        self._executor = executor
+
+    async def run(
+        self,
+        symbol: str,
+        context: SymbolContext,
+        transformer: Callable[[cst.CSTNode, Reference], cst.CSTNode],
+        on_object: str | None = None,
+        transaction: FileTransaction | None = None,
+    ) -> UpdateResult:
+        """Find and transform all matching references, streaming between stages.
+
+        Args:
+            symbol: The symbol name to update
+            context: The context type to match
+            transformer: Function to transform each matching node
+            on_object: Optional object name to filter on
+            transaction: Transaction to stage the new sources in, committed by
+                the caller; if None, the run stages into its own and commits it
+
+        Returns:
+            UpdateResult with files modified and count of references updated
+
+        Raises:
+            RuntimeError: If search, parsing, transformation or writing fails
+                (no file is written)
+        """
+        self._state = PipelineProgress(stage="", file_path=self.updater.directory)
+        self._executor = self.executor
+        if self._executor is None and is_profiling():
+            self._executor = _CallingThreadExecutor()
+        staging = transaction if transaction is not None else FileTransaction()
+        candidates: asyncio.Queue[tuple[Path, set[int]] | None] = asyncio.Queue(self.queue_size)
+        validated: asyncio.Queue[list[Reference] | None] = asyncio.Queue(self.queue_size)
+        transformed: asyncio.Queue[tuple[Path, str, int] | None] = asyncio.Queue(self.queue_size)
+        result = UpdateResult(files_modified=[], references_updated=0)
+
+        tasks = [
+            asyncio.ensure_future(self._search_stage(symbol, candidates)),
+            asyncio.ensure_future(
+                self._validate_stage(symbol, context, on_object, candidates, validated)
+            ),
+            asyncio.ensure_future(self._transform_stage(transformer, validated, transformed)),
+            asyncio.ensure_future(self._write_stage(transformed, staging, result)),
+        ]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            # Fail-fast: if any stage raised, stop the others
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        if transaction is None:
+            staging.commit()
+        return result
+
+    async def _search_stage(
+        self, symbol: str, candidates: "asyncio.Queue[tuple[Path, set[int]] | None]"
+    ) -> None:
+        """Stream candidate files and their matching lines from the search backend."""
+        async for file_path, lines in self._stream_candidates(symbol):
+            self._report("search", file_path, files_searched=1)
+            await candidates.put((file_path, lines))
+        await candidates.put(_DONE)
+
+    async def _validate_stage(
+        self,
+        symbol: str,
+        context: SymbolContext,
+        on_object: str | None,
+        candidates: "asyncio.Queue[tuple[Path, set[int]] | None]",
+        validated: "asyncio.Queue[list[Reference] | None]",
+    ) -> None:
+        """Parse each candidate file and keep the references that match the context."""
+        loop = asyncio.get_running_loop()
+        while (item := await candidates.get()) is not _DONE:
+            file_path, lines = item
+            refs = await loop.run_in_executor(
+                self._executor,
+                self.updater.find_references_in_file,
+                file_path,
+                lines,
+                symbol,
+                context,
+                on_object,
+            )
+            self._report("validate", file_path, files_validated=1)
+            if refs:
+                await validated.put(refs)
+        await validated.put(_DONE)
+
+    async def _transform_stage(
+        self,
+        transformer: Callable[[cst.CSTNode, Reference], cst.CSTNode],
+        validated: "asyncio.Queue[list[Reference] | None]",
+        transformed: "asyncio.Queue[tuple[Path, str, int] | None]",
+    ) -> None:
+        """Transform each file's references on the executor."""
+        loop = asyncio.get_running_loop()
+        while (refs := await validated.get()) is not _DONE:
+            new_code = await loop.run_in_executor(
+                self._executor, self._transform, refs, transformer
+            )
+            file_path = refs[0].file_path
+            self._report("transform", file_path, files_transformed=1)
+            if new_code is not None:
+                await transformed.put((file_path, new_code, len(refs)))
+        await transformed.put(_DONE)
+
+    async def _write_stage(
+        self,
+        transformed: "asyncio.Queue[tuple[Path, str, int] | None]",
+        transaction: FileTransaction,
+        result: UpdateResult,
+    ) -> None:
+        """Stage transformed files for writing as soon as they are ready."""
+        while (item := await transformed.get()) is not _DONE:
+            file_path, new_code, ref_count = item
+            transaction.stage(file_path, new_code)
+            result.files_modified.append(file_path)
+            result.references_updated += ref_count
+            self._report("write", file_path, files_written=1, references_updated=ref_count)
+
+    async def _stream_candidates(self, symbol: str) -> AsyncIterator[tuple[Path, set[int]]]:
+        """Yield (file, matching lines) pairs as the search backend produces them.
+
+        Command-line backends are read line by line from the subprocess; they
+        report all matches of a file together, so a file is emitted as soon as
+        output moves on to the next one. Other backends run on a worker thread
+        and are grouped once they finish.
+        """
+        searcher = self.updater.searcher
+        directory = self.updater.directory
+
+        if not isinstance(searcher, StreamingReferenceSearcher):
+            matches = await asyncio.get_running_loop().run_in_executor(
+                self._executor, self._search, symbol
+            )
+            lines_by_file: dict[Path, set[int]] = {}
+            for text_match in matches:
+                lines_by_file.setdefault(text_match.file_path, set()).add(text_match.line_number)
+            for file_path, lines in lines_by_file.items():
+                yield file_path, lines
+            return
+
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *searcher.build_command(symbol, directory),
+                cwd=directory,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+            )
+        except OSError as e:
+            raise RuntimeError(f"search failed: {e}") from e
+
+        assert process.stdout is not None
+        current_file: Path | None = None
+        current_lines: set[int] = set()
+        try:
+            async for raw_line in process.stdout:
+                with phase("search"):
+                    match = searcher.parse_line(raw_line.decode().rstrip("\n"), symbol, directory)
+                if match is None:
+                    continue
+                if match.file_path != current_file:
+                    if current_file is not None:
+                        yield current_file, current_lines
+                    current_file, current_lines = match.file_path, set()
+                current_lines.add(match.line_number)
+            if current_file is not None:
+                yield current_file, current_lines
+        finally:
+            if process.returncode is None:
+                process.kill()
+            await process.wait()
+
+    def _search(self, symbol: str) -> list[TextMatch]:
+        """Run a non-streaming search backend."""
+        with phase("search"):
+            return self.updater.searcher.search(symbol, self.updater.directory)
+
+    def _transform(
+        self,
+        refs: list[Reference],
+        transformer: Callable[[cst.CSTNode, Reference], cst.CSTNode],
+    ) -> str | None:
+        """Transform the references of one file."""
+        with phase("transform"):
+            return self.updater.transform_file(refs, transformer)
+
+    def _report(self, stage: str, file_path: Path, **increments: int) -> None:
+        """Advance the progress counters and notify the callback."""
+        state = self._state
+        state.stage = stage
+        state.file_path = file_path
+        for counter, amount in increments.items():
+            setattr(state, counter, getattr(state, counter) + amount)
+        if self.progress is not None:
+            self.progress(
+                PipelineProgress(
+                    stage=stage,
+                    file_path=file_path,
+                    files_searched=state.files_searched,
+                    files_validated=state.files_validated,
+                    files_transformed=state.files_transformed,
+                    files_written=state.files_written,
+                    references_updated=state.references_updated,
+                )
+            )
@@ -5,52 +5,157 @@ and AST validators to find and transform all references to a symbol across
 a codebase.
 """
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Callable
+from typing import TYPE_CHECKING, Any, Callable, Collection, Iterable
 
 import libcst as cst
 from libcst.metadata import MetadataWrapper, PositionProvider
 
 from molting.core.ast_validators import get_validator
+from molting.core.file_transaction import FileTransaction
+from molting.core.profiling import phase
 from molting.core.reference_searcher import ReferenceSearcher, get_best_searcher
 from molting.core.symbol_context import SymbolContext
 
+if TYPE_CHECKING:
+    from molting.core.call_site_pipeline import ProgressCallback
 
-@dataclass
+
+class SourceFileTable:
+    """Shared per-file storage for parsed modules referenced by Reference records.
+
+    Each file is parsed once and stored under an integer file id. References
+    only keep that id plus a node path, so memory scales with the number of
+    files rather than the number of hits.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty table."""
+        self._paths: list[Path] = []
+        self._modules: list[cst.Module] = []
+        self._lines: list[list[str]] = []
+        self._ids: dict[Path, int] = {}
+
+    def add(self, file_path: Path, module: cst.Module, source_code: str) -> int:
+        """Register a parsed file and return its file id.
+
+        Args:
+            file_path: Path to the file
+            module: The parsed module that node paths are resolved against
+            source_code: The source text the module was parsed from
+
+        Returns:
+            The integer id assigned to the file
+        """
+        if file_path in self._ids:
+            file_id = self._ids[file_path]
+            self._modules[file_id] = module
+            self._lines[file_id] = source_code.splitlines()
+            return file_id
+
+        file_id = len(self._paths)
+        self._ids[file_path] = file_id
+        self._paths.append(file_path)
+        self._modules.append(module)
+        self._lines.append(source_code.splitlines())
+        return file_id
+
+    def path(self, file_id: int) -> Path:
+        """Return the path of a registered file."""
+        return self._paths[file_id]
+
+    def module(self, file_id: int) -> cst.Module:
+        """Return the shared module of a registered file."""
+        return self._modules[file_id]
+
+    def line(self, file_id: int, line_number: int) -> str:
+        """Return a source line (1-indexed) of a registered file."""
+        lines = self._lines[file_id]
+        if 1 <= line_number <= len(lines):
+            return lines[line_number - 1]
+        return ""
+
+    def resolve(self, file_id: int, node_path: tuple[int, ...]) -> cst.CSTNode:
+        """Rehydrate the node at a child-index path from the module root.
+
+        Args:
+            file_id: Id of the file containing the node
+            node_path: Child indices leading from the module to the node
+
+        Returns:
+            The CST node at that path
+        """
+        node: cst.CSTNode = self._modules[file_id]
+        for index in node_path:
+            node = node.children[index]
+        return node
+
+    def file_ids(self) -> list[int]:
+        """Return all registered file ids in registration order."""
+        return list(range(len(self._paths)))
+
+
+@dataclass(slots=True)
 class Reference:
     """Represents a single reference to a symbol in code.
 
+    References are compact: they store a file id and a node path into a module
+    shared through a SourceFileTable, and rehydrate nodes on demand.
+
     Attributes:
-        file_path: Path to the file containing the reference
+        files: Table holding the shared module for each file
+        file_id: Id of the file containing the reference in ``files``
         line_number: Line number where the reference appears (1-indexed)
         column: Column number where the reference starts (0-indexed)
-        node: The CST node representing the reference
-        parent: The parent CST node
-        module: The full module CST
+        node_path: Child indices leading from the module to the reference node
         context: The SymbolContext type of this reference
         symbol: The symbol name being referenced
         containing_class: Name of the class containing this reference (if any)
         containing_function: Name of the function containing this reference (if any)
         attribute_chain: List of attributes in the chain (e.g., ["obj", "field"])
-        source_line: The full source line containing the reference
         metadata: Additional metadata about the reference
     """
 
-    file_path: Path
+    files: SourceFileTable
+    file_id: int
     line_number: int
     column: int
-    node: cst.CSTNode
-    parent: cst.CSTNode
-    module: cst.Module
+    node_path: tuple[int, ...]
     context: SymbolContext
     symbol: str
-    containing_class: str | None
-    containing_function: str | None
-    attribute_chain: list[str] | None
-    source_line: str
+    containing_class: str | None = None
+    containing_function: str | None = None
+    attribute_chain: list[str] | None = None
     metadata: dict[str, Any] = field(default_factory=dict)
 
+    @property
+    def file_path(self) -> Path:
+        """Path to the file containing the reference."""
+        return self.files.path(self.file_id)
+
+    @property
+    def module(self) -> cst.Module:
+        """The full module CST, shared by all references in the same file."""
+        return self.files.module(self.file_id)
+
+    @property
+    def node(self) -> cst.CSTNode:
+        """The CST node representing the reference."""
+        return self.files.resolve(self.file_id, self.node_path)
+
+    @property
+    def parent(self) -> cst.CSTNode:
+        """The parent CST node (the module for top-level nodes)."""
+        return self.files.resolve(self.file_id, self.node_path[:-1])
+
+    @property
+    def source_line(self) -> str:
+        """The full source line containing the reference."""
+        return self.files.line(self.file_id, self.line_number)
+
 
 @dataclass
 class UpdateResult:
@@ -107,63 +212,98 @@ class CallSiteUpdater:
         Raises:
             RuntimeError: If search or parsing fails
         """
-        # Use the search backend to find potential matches
-        text_matches = self.searcher.search(symbol, self.directory)
-
-        # Get the validator for this context
-        validator = get_validator(context)
+        # Group candidate lines by file so each file is parsed exactly once
+        lines_by_file = self.find_candidate_lines([symbol])
 
+        files = SourceFileTable()
         references = []
+        for file_path, target_lines in lines_by_file.items():
+            references.extend(
+                self.find_references_in_file(
+                    file_path, target_lines, symbol, context, on_object, files
+                )
+            )
 
-        # Process each text match to see if it's a true match
-        for match in text_matches:
-            try:
-                # Parse the file
-                source_code = match.file_path.read_text()
-                module = cst.parse_module(source_code)
+        return references
 
-                # Find the node at this line and validate it
-                node_finder = NodeFinder(match.line_number, symbol, validator, on_object)
-                # Use metadata wrapper to provide position information
-                wrapper = MetadataWrapper(module)
-                wrapper.visit(node_finder)
+    def find_candidate_lines(self, symbols: Iterable[str]) -> dict[Path, set[int]]:
+        """Search for several symbols and group the matching lines by file.
 
-                # If we found a matching node, create a Reference
-                for found_node in node_finder.found_nodes:
-                    # Get accurate position from metadata using the same wrapper
-                    try:
-                        pos = wrapper.resolve(PositionProvider)[found_node]
-                        line_num = pos.start.line
-                        col_num = pos.start.column
-                    except (KeyError, AttributeError):
-                        # Fall back to text match position
-                        line_num = match.line_number
-                        col_num = match.column
-
-                    ref = Reference(
-                        file_path=match.file_path,
-                        line_number=line_num,
-                        column=col_num,
-                        node=found_node,
-                        parent=module,  # Simplified - could track actual parent
-                        module=module,
-                        context=context,
-                        symbol=symbol,
-                        containing_class=None,  # Could be enhanced to track this
-                        containing_function=None,  # Could be enhanced to track this
-                        attribute_chain=None,  # Could be enhanced to extract chain
-                        source_line=match.line,
-                        metadata={},
-                    )
-                    references.append(ref)
-
-            except Exception as e:
-                # Fail-fast: raise on any error
-                raise RuntimeError(
-                    f"Error processing {match.file_path}:{match.line_number}: {e}"
-                ) from e
+        Refactorings that update many symbols at once use this to parse each
+        candidate file a single time for all of them.
 
-        return references
+        Args:
+            symbols: The symbol names to search for
+
+        Returns:
+            File -> line numbers (1-indexed) containing any of the symbols
+
+        Raises:
+            RuntimeError: If the search fails
+        """
+        lines_by_file: dict[Path, set[int]] = {}
+        with phase("search"):
+            for symbol in dict.fromkeys(symbols):
+                for match in self.searcher.search(symbol, self.directory):
+                    lines_by_file.setdefault(match.file_path, set()).add(match.line_number)
+        return lines_by_file
+
+    def find_references_in_file(
+        self,
+        file_path: Path,
+        target_lines: Collection[int],
+        symbol: str,
+        context: SymbolContext,
+        on_object: str | None = None,
+        files: SourceFileTable | None = None,
+    ) -> list[Reference]:
+        """Validate the candidate lines of one file and return its references.
+
+        Args:
+            file_path: The file containing the text matches
+            target_lines: Line numbers reported by the search backend (1-indexed)
+            symbol: The symbol name to find
+            context: The context type to match
+            on_object: Optional object name to filter on
+            files: Table to register the parsed module in (a new one if omitted)
+
+        Returns:
+            List of Reference objects found in the file
+
+        Raises:
+            RuntimeError: If reading or parsing the file fails
+        """
+        try:
+            with phase("parse"):
+                source_code = file_path.read_text()
+                module = cst.parse_module(source_code)
+            with phase("metadata"):
+                wrapper = MetadataWrapper(module)
+                node_finder = NodeFinder(target_lines, symbol, get_validator(context), on_object)
+                wrapper.visit(node_finder)
+        except Exception as e:
+            # Fail-fast: raise on any error
+            raise RuntimeError(f"Error processing {file_path}: {e}") from e
+
+        if not node_finder.found:
+            return []
+
+        # Node paths are resolved against the wrapper's module, so share that one
+        if files is None:
+            files = SourceFileTable()
+        file_id = files.add(file_path, wrapper.module, source_code)
+        return [
+            Reference(
+                files=files,
+                file_id=file_id,
+                line_number=line_num,
+                column=col_num,
+                node_path=node_path,
+                context=context,
+                symbol=symbol,
+            )
+            for node_path, line_num, col_num in node_finder.found
+        ]
 
     def update_all(
         self,
@@ -171,99 +311,132 @@ class CallSiteUpdater:
         context: SymbolContext,
         transformer: Callable[[cst.CSTNode, Reference], cst.CSTNode],
         on_object: str | None = None,
+        progress: "ProgressCallback | None" = None,
+        transaction: FileTransaction | None = None,
     ) -> UpdateResult:
         """Find and transform all matching references.
 
+        Files stream through a CallSitePipeline: each one is validated and
+        transformed while the search is still reporting others, and its new
+        source is staged for writing. When called from a running event loop,
+        the pipeline runs on its own loop in a worker thread.
+
         Args:
             symbol: The symbol name to update
             context: The context type to match
             transformer: Function to transform each matching node
             on_object: Optional object name to filter on
+            progress: Optional callback invoked each time a stage finishes a file
+            transaction: Transaction to stage the new sources in, committed by
+                the caller; if None, the files are written before returning
 
         Returns:
             UpdateResult with files modified and count of references updated
 
         Raises:
-            RuntimeError: If search, parsing, or transformation fails
+            RuntimeError: If search, parsing, transformation or writing fails
+                (no file is written)
         """
-        # Find all references
-        references = self.find_references(symbol, context, on_object)
-
-        if not references:
-            return UpdateResult(files_modified=[], references_updated=0)
-
-        # Group references by file
-        refs_by_file: dict[Path, list[Reference]] = {}
-        for ref in references:
-            if ref.file_path not in refs_by_file:
-                refs_by_file[ref.file_path] = []
-            refs_by_file[ref.file_path].append(ref)
-
-        # Transform each file
-        modified_files = []
-        total_updated = 0
-
-        for file_path, file_refs in refs_by_file.items():
-            try:
-                # Parse the file
-                source_code = file_path.read_text()
-                module = cst.parse_module(source_code)
+        # Imported here because the pipeline module builds on this one
+        from molting.core.call_site_pipeline import CallSitePipeline
 
-                # Apply transformations using metadata wrapper
-                wrapper = MetadataWrapper(module)
-                updater_visitor = UpdaterTransformer(file_refs, transformer)
-                modified_module = wrapper.visit(updater_visitor)
+        pipeline = CallSitePipeline(self, progress=progress)
+        run = pipeline.run(symbol, context, transformer, on_object, transaction)
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(run)
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            return pool.submit(asyncio.run, run).result()
+
+    def transform_file(
+        self,
+        file_refs: list[Reference],
+        transformer: Callable[[cst.CSTNode, Reference], cst.CSTNode],
+    ) -> str | None:
+        """Apply the transformer to all references of a single file.
+
+        Args:
+            file_refs: References that all belong to the same file
+            transformer: Function to transform each matching node
+
+        Returns:
+            The new source code, or None if the module was left unchanged
 
-                # Write back if changed
-                if modified_module != module:
-                    file_path.write_text(modified_module.code)
-                    modified_files.append(file_path)
-                    total_updated += len(file_refs)
+        Raises:
+            RuntimeError: If the transformation fails
+        """
+        file_path = file_refs[0].file_path
+        try:
+            # Reuse the module parsed during the search
+            module = file_refs[0].module
 
-            except Exception as e:
-                raise RuntimeError(f"Error updating {file_path}: {e}") from e
+            # Apply transformations using metadata wrapper (the module is a
+            # fresh parse owned by this updater, so the defensive copy is skipped)
+            wrapper = MetadataWrapper(module, unsafe_skip_copy=True)
+            updater_visitor = UpdaterTransformer(file_refs, transformer)
+            modified_module = wrapper.visit(updater_visitor)
+        except Exception as e:
+            raise RuntimeError(f"Error updating {file_path}: {e}") from e
 
-        return UpdateResult(files_modified=modified_files, references_updated=total_updated)
+        if modified_module == module:
+            return None
+        return modified_module.code
 
 
 class NodeFinder(cst.CSTVisitor):
-    """Visitor to find nodes at a specific line matching a pattern."""
+    """Visitor to find nodes on specific lines matching a pattern.
+
+    Matches are recorded as (node_path, line, column) tuples, where node_path is
+    the sequence of child indices leading from the module to the matching node.
+    """
 
     METADATA_DEPENDENCIES = (PositionProvider,)
 
     def __init__(
-        self, target_line: int, symbol: str, validator: Any, on_object: str | None = None
+        self,
+        target_lines: Collection[int],
+        symbol: str,
+        validator: Any,
+        on_object: str | None = None,
     ) -> None:
         """Initialize the finder.
 
         Args:
-            target_line: Line number to search on (1-indexed)
+            target_lines: Line numbers to search on (1-indexed)
             symbol: Symbol name to find
             validator: Validator to check if nodes match
             on_object: Optional object name to filter on
         """
         super().__init__()
-        self.target_line = target_line
+        self.target_lines = set(target_lines)
         self.symbol = symbol
         self.validator = validator
         self.on_object = on_object
-        self.found_nodes: list[cst.CSTNode] = []
+        self.found: list[tuple[tuple[int, ...], int, int]] = []
+        # Stack of [path, next_child_index] for the nodes currently being visited
+        self._path_stack: list[list[Any]] = []
 
     def on_visit(self, node: cst.CSTNode) -> bool:
-        """Visit a node and check if it's on the target line."""
-        # Check if node matches the pattern
+        """Visit a node and check if it's on one of the target lines."""
+        if self._path_stack:
+            parent_entry = self._path_stack[-1]
+            node_path = parent_entry[0] + (parent_entry[1],)
+            parent_entry[1] += 1
+        else:
+            node_path = ()
+        self._path_stack.append([node_path, 0])
+
         if self.validator.matches(node, self.symbol, self.on_object):
-            # Try to get position metadata
-            try:
-                pos = self.get_metadata(PositionProvider, node)
-                if pos.start.line == self.target_line:
-                    self.found_nodes.append(node)
-            except KeyError:
-                # Metadata not available, fall back to adding all matches
-                # (this is less precise but works for simple cases)
-                self.found_nodes.append(node)
+            pos = self.get_metadata(PositionProvider, node)
+            if pos.start.line in self.target_lines:
+                self.found.append((node_path, pos.start.line, pos.start.column))
         return True
 
+    def on_leave(self, original_node: cst.CSTNode) -> None:
+        """Pop the node's path entry."""
+        self._path_stack.pop()
+
 
 class UpdaterTransformer(cst.CSTTransformer):
     """Transformer to update specific nodes in a module."""
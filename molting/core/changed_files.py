@@ -0,0 +1,121 @@
+"""Git-aware candidate file sets for incremental refactoring runs.
+
+Refactoring campaigns in CI usually only need to touch files changed on a
+branch. This module computes that file set from git (committed changes since a
+revision plus the working tree status) and can widen it to the modules that
+directly import a changed file, so searches cost proportional to the diff
+rather than to the whole tree.
+
+Usage:
+    files = git_changed_files(Path("src"), since="origin/main")
+    files |= direct_importers(files, Path("src"))
+    updater = CallSiteUpdater(Path("src"), searcher=FileSetSearcher(files))
+"""
+
+import ast
+import subprocess
+from pathlib import Path
+from typing import Iterable
+
+from molting.core.reference_searcher import ReferenceSearcher, get_best_searcher
+
+
+def _run_git(args: list[str], cwd: Path) -> str:
+    """Run a git command and return its stdout.
+
+    Raises:
+        ValueError: If git is unavailable or the command fails
+    """
+    try:
+        result = subprocess.run(
+            ["git", *args], cwd=cwd, capture_output=True, text=True, check=False
+        )
+    except OSError as e:
+        raise ValueError(f"Cannot run git: {e}") from e
+    if result.returncode != 0:
+        raise ValueError(f"git {' '.join(args)} failed: {result.stderr.strip()}")
+    return result.stdout
+
+
+def git_changed_files(directory: Path, since: str | None = None) -> set[Path]:
+    """Return the Python files under a directory that changed according to git.
+
+    Args:
+        directory: Directory to restrict the result to (must be inside a git work tree)
+        since: Revision to diff against; defaults to HEAD (uncommitted changes only)
+
+    Returns:
+        Absolute paths of existing .py files that differ from the revision, are
+        staged, modified in the working tree, or untracked
+
+    Raises:
+        ValueError: If the directory is not in a git repository or the revision is unknown
+    """
+    directory = directory.resolve()
+    root = Path(_run_git(["rev-parse", "--show-toplevel"], directory).strip())
+
+    names = _run_git(["diff", "--name-only", since or "HEAD", "--"], root).splitlines()
+    names += _run_git(["ls-files", "--others", "--exclude-standard"], root).splitlines()
+
+    changed = set()
+    for name in names:
+        path = root / name
+        if path.suffix == ".py" and path.is_file() and path.is_relative_to(directory):
+            changed.add(path)
+    return changed
+
+
+def direct_importers(
+    files: Iterable[Path], directory: Path, searcher: ReferenceSearcher | None = None
+) -> set[Path]:
+    """Return the Python files under a directory that directly import any of the given files.
+
+    Candidates are found with a text search for each module's name and then
+    confirmed by parsing their import statements, so unrelated files are never
+    parsed. Matching is by module name, which may over-approximate but never
+    misses an importer.
+
+    Args:
+        files: Changed files whose importers should be found
+        directory: Directory to search for importers
+        searcher: Optional search backend (auto-detects if not provided)
+
+    Returns:
+        Absolute paths of importing files (excluding the given files themselves)
+    """
+    files = {path.resolve() for path in files}
+    module_names = {path.stem for path in files if path.stem != "__init__"}
+    module_names |= {path.parent.name for path in files if path.stem == "__init__"}
+    if not module_names:
+        return set()
+
+    searcher = searcher if searcher is not None else get_best_searcher()
+    candidates: set[Path] = set()
+    for module_name in module_names:
+        candidates.update(
+            match.file_path.resolve() for match in searcher.search(module_name, directory)
+        )
+
+    importers = set()
+    for candidate in candidates - files:
+        try:
+            imported = _imported_names(candidate.read_text())
+        except (SyntaxError, UnicodeDecodeError, OSError):
+            continue
+        if imported & module_names:
+            importers.add(candidate)
+    return importers
+
+
+def _imported_names(source_code: str) -> set[str]:
+    """Collect every module and name component referenced by a file's imports."""
+    names: set[str] = set()
+    for node in ast.walk(ast.parse(source_code)):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                names.update(alias.name.split("."))
+        elif isinstance(node, ast.ImportFrom):
+            if node.module:
+                names.update(node.module.split("."))
+            names.update(alias.name for alias in node.names)
+    return names
@@ -0,0 +1,166 @@
+"""Project-wide index of conditional pattern fingerprints.
+
+ConditionalPatternIndex fingerprints the leading conditional chain of every
+function in every Python file under a directory and buckets the results by
+fingerprint, so all functions sharing a ConditionalPatternSignature - in any
+module - are found with one dictionary lookup.
+
+Files are fingerprinted in parallel worker processes. Workers return only
+plain data (paths, names, lines and integer fingerprints), which is cheap to
+send back and, because fingerprints do not depend on the interpreter's hash
+seed, comparable across processes.
+
+Usage:
+    index = ConditionalPatternIndex.build(Path("src"))
+    for entry in index.matches(signature):
+        print(entry.file_path, entry.function_name)
+"""
+
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable
+
+import libcst as cst
+
+from molting.core.conditional_pattern import ConditionalPatternSignature, collect_patterns
+from molting.core.parallel import map_files
+
+
+@dataclass(frozen=True)
+class IndexedPattern:
+    """A function whose leading conditional chain was fingerprinted.
+
+    Attributes:
+        file_path: File containing the function
+        function_name: Name of the function
+        class_name: Name of the containing class (empty string for module-level)
+        start_line: Line of the first if statement of the chain
+        end_line: Line of the last if statement of the chain
+    """
+
+    file_path: Path
+    function_name: str
+    class_name: str
+    start_line: int
+    end_line: int
+
+
+class ConditionalPatternIndex:
+    """Fingerprint-bucketed index of conditional patterns across files."""
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self._buckets: dict[int, list[tuple[ConditionalPatternSignature, IndexedPattern]]] = {}
+
+    @classmethod
+    def build(
+        cls,
+        directory: Path,
+        executor: Executor | None = None,
+        max_workers: int | None = None,
+    ) -> "ConditionalPatternIndex":
+        """Fingerprint every Python file under a directory.
+
+        Args:
+            directory: Root directory to index
+            executor: Executor to fingerprint files on; a process pool is created
+                for large trees and small trees are indexed in-process if None
+            max_workers: Worker count for the process pool created when executor is None
+
+        Returns:
+            The populated index
+        """
+        files = sorted(path.resolve() for path in directory.rglob("*.py"))
+        return cls.from_files(files, executor=executor, max_workers=max_workers)
+
+    @classmethod
+    def from_files(
+        cls,
+        files: Iterable[Path],
+        executor: Executor | None = None,
+        max_workers: int | None = None,
+    ) -> "ConditionalPatternIndex":
+        """Fingerprint the given Python files.
+
+        Args:
+            files: Files to index
+            executor: Executor to fingerprint files on; a process pool is created
+                for many files and few files are indexed in-process if None
+            max_workers: Worker count for the process pool created when executor is None
+
+        Returns:
+            The populated index
+        """
+        files = list(files)
+        index = cls()
+
+        results = map_files(_fingerprint_file, files, executor=executor, max_workers=max_workers)
+        index._add_results(files, results)
+        return index
+
+    def add(self, signature: ConditionalPatternSignature, entry: IndexedPattern) -> None:
+        """Add a fingerprinted pattern to its bucket."""
+        self._buckets.setdefault(signature.fingerprint, []).append((signature, entry))
+
+    def matches(self, signature: ConditionalPatternSignature) -> list[IndexedPattern]:
+        """Return every indexed function whose pattern equals the signature.
+
+        Args:
+            signature: The pattern to look up
+
+        Returns:
+            Matching functions, ordered by file and line
+        """
+        bucket = self._buckets.get(signature.fingerprint, [])
+        return [entry for candidate, entry in bucket if candidate == signature]
+
+    def duplicates(self) -> list[list[IndexedPattern]]:
+        """Return groups of two or more functions sharing a pattern.
+
+        Returns:
+            One list per shared signature, each ordered by file and line
+        """
+        groups: list[list[IndexedPattern]] = []
+        for bucket in self._buckets.values():
+            by_signature: dict[ConditionalPatternSignature, list[IndexedPattern]] = {}
+            for signature, entry in bucket:
+                by_signature.setdefault(signature, []).append(entry)
+            groups.extend(entries for entries in by_signature.values() if len(entries) > 1)
+        return groups
+
+    def _add_results(
+        self,
+        files: list[Path],
+        results: Iterable[list[tuple[tuple[int, ...], int, str, str, int, int]]],
+    ) -> None:
+        """Add worker results, which arrive in the same order as the files."""
+        for file_path, rows in zip(files, results):
+            for conditions, num_statements, function_name, class_name, start, end in rows:
+                signature = ConditionalPatternSignature(conditions, num_statements)
+                self.add(
+                    signature,
+                    IndexedPattern(file_path, function_name, class_name, start, end),
+                )
+
+
+def _fingerprint_file(file_path: Path) -> list[tuple[tuple[int, ...], int, str, str, int, int]]:
+    """Fingerprint one file's functions as plain tuples (runs in worker processes).
+
+    Files that cannot be read or parsed contribute no patterns.
+    """
+    try:
+        module = cst.parse_module(file_path.read_text())
+    except (OSError, UnicodeDecodeError, cst.ParserSyntaxError):
+        return []
+    return [
+        (
+            signature.conditions,
+            signature.num_statements,
+            match.function_name,
+            match.class_name,
+            match.start_line,
+            match.end_line,
+        )
+        for signature, match in collect_patterns(module)
+    ]
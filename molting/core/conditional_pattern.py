@@ -3,13 +3,44 @@
 This module provides tools for finding and matching identical conditional patterns
 across multiple functions in a codebase. It enables refactorings that need to
 identify duplicate logic (like repeated eligibility checks) and consolidate them.
+
+Conditions are compared by structural fingerprint: an integer hash computed
+bottom-up over the expression's CST, with function parameters mapped to
+positional slots. Matching therefore compares integers rather than rendered code.
+
+ConditionalCatalog records every function's top-level if statements with
+their fingerprints and lines in one traversal, so extracting the target's
+pattern and scanning for matches are lookups.
 """
 
-from dataclasses import dataclass
+import hashlib
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
 
 import libcst as cst
 from libcst import metadata
 
+from molting.core.caches import IdentityCache
+
+# Syntax-only nodes that do not affect an expression's meaning
+_TRIVIA_TYPES = (
+    cst.BaseParenthesizableWhitespace,
+    cst.LeftParen,
+    cst.RightParen,
+    cst.LeftSquareBracket,
+    cst.RightSquareBracket,
+    cst.LeftCurlyBrace,
+    cst.RightCurlyBrace,
+    cst.Comma,
+    cst.Dot,
+    cst.Colon,
+    cst.AssignEqual,
+)
+
+# Recently built catalogs, reused by ConditionalCatalog.for_module()
+_catalog_cache: "IdentityCache[cst.Module, ConditionalCatalog]" = IdentityCache()
+
 
 @dataclass(frozen=True)
 class ConditionalPatternSignature:
@@ -20,22 +51,32 @@ class ConditionalPatternSignature:
     parameter names differ.
 
     Attributes:
-        conditions: Tuple of normalized condition strings, sorted alphabetically
+        conditions: Tuple of condition fingerprints, sorted
         num_statements: Number of if statements in the pattern
+        fingerprint: Combined fingerprint of the whole pattern, derived from the above
     """
 
-    conditions: tuple[str, ...]
+    conditions: tuple[int, ...]
     num_statements: int
+    fingerprint: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Combine the condition fingerprints into the pattern fingerprint."""
+        object.__setattr__(self, "fingerprint", hash((self.conditions, self.num_statements)))
 
     def __hash__(self) -> int:
-        """Hash based on conditions and statement count."""
-        return hash((self.conditions, self.num_statements))
+        """Hash based on the pattern fingerprint."""
+        return self.fingerprint
 
     def __eq__(self, other: object) -> bool:
-        """Compare patterns for equality."""
+        """Compare patterns for equality, checking the fingerprint first."""
         if not isinstance(other, ConditionalPatternSignature):
             return NotImplemented
-        return self.conditions == other.conditions and self.num_statements == other.num_statements
+        return (
+            self.fingerprint == other.fingerprint
+            and self.num_statements == other.num_statements
+            and self.conditions == other.conditions
+        )
 
 
 @dataclass
@@ -59,11 +100,74 @@ class PatternMatch:
     return_value: cst.BaseExpression | None
 
 
+def fingerprint_condition(condition: cst.BaseExpression, param_map: dict[str, str]) -> int:
+    """Compute a structural fingerprint of a condition expression.
+
+    The fingerprint is a hash computed bottom-up from each node's type, its
+    literal value and its children's fingerprints. Whitespace, comments and
+    parentheses are ignored, and names found in ``param_map`` hash as their
+    positional placeholder, so ``employee.seniority < 2`` in one function and
+    ``person.seniority < 2`` in another have the same fingerprint when both
+    names are the first parameter.
+
+    Args:
+        condition: The CST expression to fingerprint
+        param_map: Mapping from parameter names to placeholders
+
+    Returns:
+        Integer fingerprint, stable across processes
+    """
+    return _fingerprint(condition, param_map)
+
+
+def _fingerprint(node: cst.CSTNode, param_map: dict[str, str]) -> int:
+    """Fingerprint a node from its type, literal value and children."""
+    if isinstance(node, cst.Name):
+        placeholder = param_map.get(node.value)
+        if placeholder is not None:
+            return hash((_stable_hash("$param"), _stable_hash(placeholder)))
+        return hash((_stable_hash("Name"), _stable_hash(node.value)))
+    if isinstance(node, cst.Attribute):
+        # The attribute name is a plain identifier, never a parameter reference
+        return hash(
+            (
+                _stable_hash("Attribute"),
+                _fingerprint(node.value, param_map),
+                _stable_hash(node.attr.value),
+            )
+        )
+    if isinstance(node, cst.Arg) and node.keyword is not None:
+        return hash(
+            (
+                _stable_hash("Arg"),
+                _stable_hash(node.keyword.value),
+                _stable_hash(node.star),
+                _fingerprint(node.value, param_map),
+            )
+        )
+
+    parts = [_stable_hash(type(node).__name__)]
+    value = getattr(node, "value", None)
+    if isinstance(value, str):
+        parts.append(_stable_hash(value))
+    for child in node.children:
+        if not isinstance(child, _TRIVIA_TYPES):
+            parts.append(_fingerprint(child, param_map))
+    return hash(tuple(parts))
+
+
+@lru_cache(maxsize=4096)
+def _stable_hash(text: str) -> int:
+    """Hash a string independently of PYTHONHASHSEED, so fingerprints agree across processes."""
+    return int.from_bytes(hashlib.blake2b(text.encode(), digest_size=8).digest(), "little")
+
+
 def normalize_condition(condition: cst.BaseExpression, param_map: dict[str, str]) -> str:
     """Normalize a condition expression to a canonical string form.
 
-    Replaces function parameter names with positional placeholders ($0, $1, etc.)
-    so that patterns can match across functions with different parameter names.
+    Replaces function parameter names with positional placeholders ($0, $1, etc.).
+    This is a human-readable rendering; pattern matching uses
+    fingerprint_condition() instead.
 
     Example:
         Input:  employee.seniority < 2, param_map={"employee": "$0"}
@@ -76,22 +180,12 @@ def normalize_condition(condition: cst.BaseExpression, param_map: dict[str, str]
     Returns:
         Normalized string representation of the condition
     """
-    # Convert to string first
     dummy_module = cst.Module(body=[cst.SimpleStatementLine(body=[cst.Expr(condition)])])
     code = dummy_module.code.strip()
 
-    # Replace parameter names with placeholders using word boundaries
     # Sort by length (longest first) to avoid partial replacements
-    sorted_params = sorted(param_map.keys(), key=len, reverse=True)
-
-    for param_name in sorted_params:
-        placeholder = param_map[param_name]
-        # Use simple word boundary replacement
-        # Handle: param.attr, param[x], (param), param,
-        import re
-
-        pattern = rf"\b{re.escape(param_name)}\b"
-        code = re.sub(pattern, placeholder, code)
+    for param_name in sorted(param_map.keys(), key=len, reverse=True):
+        code = re.sub(rf"\b{re.escape(param_name)}\b", param_map[param_name], code)
 
     return code
 
@@ -111,165 +205,233 @@ def build_param_map(func: cst.FunctionDef) -> dict[str, str]:
     return param_map
 
 
-class PatternExtractor(cst.CSTVisitor):
-    """Extracts a conditional pattern from a specific function and line range.
+@dataclass
+class CatalogedIf:
+    """An ``if`` statement directly in a function body.
 
-    This visitor analyzes a function to find consecutive if statements within
-    a line range that all return the same value, and creates a signature
-    representing that pattern.
+    Attributes:
+        node: The if statement
+        line: Line the statement starts on
+        fingerprint: Structural fingerprint of the test expression
     """
 
-    METADATA_DEPENDENCIES = (metadata.PositionProvider,)
+    node: cst.If
+    line: int
+    fingerprint: int
 
-    def __init__(
-        self,
-        target_function: str,
-        target_class: str,
-        start_line: int,
-        end_line: int,
-    ) -> None:
-        """Initialize the extractor.
+
+@dataclass
+class CatalogedFunction:
+    """A function and the ``if`` statements directly in its body.
+
+    Attributes:
+        node: The function definition
+        class_name: Name of the innermost enclosing class (empty string for none)
+        param_map: Parameter name -> positional placeholder, as from build_param_map()
+        ifs: Top-level if statements of the body, in source order
+    """
+
+    node: cst.FunctionDef
+    class_name: str
+    param_map: dict[str, str]
+    ifs: list[CatalogedIf]
+
+    @property
+    def name(self) -> str:
+        """Name of the function."""
+        return self.node.name.value
+
+    def fingerprint(self, expression: cst.BaseExpression) -> int:
+        """Fingerprint an expression of this function with its parameter slots."""
+        return fingerprint_condition(expression, self.param_map)
+
+
+class ConditionalCatalog:
+    """Every function's top-level ``if`` statements, fingerprinted in one pass.
+
+    The simplifying-conditionals commands look up the pattern they extract
+    from the target function and the matching functions elsewhere in the
+    module here, instead of running a traversal per question. The catalog owns
+    the MetadataWrapper it resolved positions with; run the command's
+    transformer with ``catalog.wrapper.visit(...)`` so the module is traversed
+    once more, for the transform itself.
+
+    Usage:
+        catalog = ConditionalCatalog.for_module(cst.parse_module(source_code))
+        pattern = catalog.extract_pattern("disability_amount", "", 2, 7)
+        matches = catalog.scan_for_pattern(pattern, "disability_amount", "")
+        modified = catalog.wrapper.visit(transformer)
+    """
+
+    def __init__(self, wrapper: metadata.MetadataWrapper) -> None:
+        """Build the catalog with a single traversal of the wrapper's module.
 
         Args:
-            target_function: Name of the function to analyze
-            target_class: Name of the class (empty string for module-level)
-            start_line: Start line of the pattern range
-            end_line: End line of the pattern range
+            wrapper: Metadata wrapper for the module to catalog
         """
-        self.target_function = target_function
-        self.target_class = target_class
-        self.start_line = start_line
-        self.end_line = end_line
-
-        self.conditions: list[cst.BaseExpression] = []
-        self.return_value: cst.BaseExpression | None = None
-        self.param_map: dict[str, str] = {}
-        self.current_class: str = ""
-        self.signature: ConditionalPatternSignature | None = None
+        self.wrapper = wrapper
+        self.module = wrapper.module
+        self.functions: list[CatalogedFunction] = []
+        builder = _CatalogBuilder(self.functions)
+        wrapper.visit(builder)
 
-    def visit_ClassDef(self, node: cst.ClassDef) -> bool:  # noqa: N802
-        """Track current class."""
-        self.current_class = node.name.value
-        return True
+    @classmethod
+    def for_module(cls, module: cst.Module) -> "ConditionalCatalog":
+        """Return the catalog for a module, reusing it if the module was seen recently.
 
-    def leave_ClassDef(self, node: cst.ClassDef) -> None:  # noqa: N802
-        """Reset class tracking."""
-        self.current_class = ""
+        The module is wrapped without a defensive copy, so it should be a fresh
+        parse that is not shared with another MetadataWrapper.
 
-    def visit_FunctionDef(self, node: cst.FunctionDef) -> bool:  # noqa: N802
-        """Extract pattern from target function."""
-        # Check if this is the target function
-        if node.name.value != self.target_function:
-            return True
-        if self.target_class and self.current_class != self.target_class:
-            return True
-        if not self.target_class and self.current_class:
-            return True
-
-        # Build parameter map for normalization
-        self.param_map = build_param_map(node)
-
-        # Extract conditions from if statements in the line range
-        if isinstance(node.body, cst.IndentedBlock):
-            for stmt in node.body.body:
-                if isinstance(stmt, cst.If):
-                    try:
-                        pos = self.get_metadata(metadata.PositionProvider, stmt)
-                        if pos.start.line < self.start_line or pos.start.line > self.end_line:
-                            continue
-                    except KeyError:
-                        continue
-
-                    # Check if this has a simple return
-                    return_val = self._get_return_value(stmt)
-                    if return_val is None:
-                        continue
-
-                    # First condition or matching return value
-                    if self.return_value is None:
-                        self.return_value = return_val
-                        self.conditions.append(stmt.test)
-                    elif self._values_match(return_val, self.return_value):
-                        self.conditions.append(stmt.test)
-                    else:
-                        # Different return value, stop
-                        break
-
-        # Create signature if we found conditions
-        if self.conditions:
-            normalized = []
-            for cond in self.conditions:
-                norm = normalize_condition(cond, self.param_map)
-                normalized.append(norm)
-
-            # Sort for order-independent matching
-            normalized.sort()
-            self.signature = ConditionalPatternSignature(
-                conditions=tuple(normalized),
-                num_statements=len(self.conditions),
-            )
+        Args:
+            module: The module to catalog
 
-        return True
+        Returns:
+            The catalog, whose ``module`` is the given module
+        """
+        cached = _catalog_cache.get(module)
+        if cached is not None:
+            return cached
 
-    def _get_return_value(self, if_stmt: cst.If) -> cst.BaseExpression | None:
-        """Get return value from an if statement with a simple return body."""
-        if not isinstance(if_stmt.body, cst.IndentedBlock):
-            return None
-        if len(if_stmt.body.body) != 1:
-            return None
+        catalog = cls(metadata.MetadataWrapper(module, unsafe_skip_copy=True))
+        _catalog_cache.put(module, catalog)
+        return catalog
 
-        body_stmt = if_stmt.body.body[0]
-        if not isinstance(body_stmt, cst.SimpleStatementLine):
-            return None
-        if len(body_stmt.body) != 1:
-            return None
+    def find_function(self, function_name: str, class_name: str) -> CatalogedFunction | None:
+        """Find a function by name, in a class or at any non-class position.
 
-        item = body_stmt.body[0]
-        if isinstance(item, cst.Return) and item.value:
-            return item.value
+        Args:
+            function_name: Name of the function
+            class_name: Name of the enclosing class (empty string for functions outside classes)
+        """
+        for function in self.functions:
+            if function.name == function_name and function.class_name == class_name:
+                return function
         return None
 
-    def _values_match(self, val1: cst.BaseExpression, val2: cst.BaseExpression) -> bool:
-        """Check if two return values match (same type, ignoring exact value)."""
-        # For pattern matching, we just need same type of return (e.g., both return numbers)
-        # The actual values can differ (0 vs 0.5)
-        if isinstance(val1, cst.Integer) and isinstance(val2, cst.Integer):
-            return True
-        if isinstance(val1, cst.Float) and isinstance(val2, cst.Float):
-            return True
-        if isinstance(val1, cst.Integer) and isinstance(val2, cst.Float):
-            return True
-        if isinstance(val1, cst.Float) and isinstance(val2, cst.Integer):
-            return True
-        return False
-
-
-class PatternScanner(cst.CSTVisitor):
-    """Scans a module for functions containing a matching conditional pattern.
-
-    This visitor walks through all functions in a module and identifies those
-    that have the same pattern of conditional statements as the target.
-    """
+    def other_functions(self, exclude_function: str, exclude_class: str) -> list[CatalogedFunction]:
+        """Return every function except the excluded target.
 
-    METADATA_DEPENDENCIES = (metadata.PositionProvider,)
+        Args:
+            exclude_function: Function name to exclude (usually the original target)
+            exclude_class: Class name to exclude (if method)
+        """
+        return [
+            function
+            for function in self.functions
+            if function.name != exclude_function or function.class_name != exclude_class
+        ]
+
+    def extract_pattern(
+        self, function_name: str, class_name: str, start_line: int, end_line: int
+    ) -> ConditionalPatternSignature | None:
+        """Extract the pattern of the if statements in a line range of a function.
+
+        Consecutive if statements in the range that all return a numeric value
+        form the pattern; if statements without a simple return are skipped, and
+        the pattern ends at the first statement returning a different kind of value.
+
+        Args:
+            function_name: Name of the function to analyze
+            class_name: Name of the class (empty string for module-level)
+            start_line: Start line of the pattern range
+            end_line: End line of the pattern range
 
-    def __init__(
+        Returns:
+            The pattern signature, or None if no pattern found
+        """
+        function = self.find_function(function_name, class_name)
+        if function is None:
+            return None
+
+        chain: list[CatalogedIf] = []
+        return_value: cst.BaseExpression | None = None
+        for cataloged in function.ifs:
+            if cataloged.line < start_line or cataloged.line > end_line:
+                continue
+            value = _get_return_value(cataloged.node)
+            if value is None:
+                continue
+            if return_value is None:
+                return_value = value
+            elif not _values_match(value, return_value):
+                break
+            chain.append(cataloged)
+
+        return _signature(chain) if chain else None
+
+    def scan_for_pattern(
         self,
-        target_pattern: ConditionalPatternSignature,
+        pattern: ConditionalPatternSignature,
         exclude_function: str = "",
         exclude_class: str = "",
-    ) -> None:
-        """Initialize the scanner.
+    ) -> list[PatternMatch]:
+        """Find the functions whose leading conditional pattern equals a signature.
 
         Args:
-            target_pattern: The pattern signature to search for
-            exclude_function: Function name to exclude (usually the original target)
-            exclude_class: Class name to exclude (if method)
+            pattern: The pattern signature to match
+            exclude_function: Function to exclude from matching
+            exclude_class: Class to exclude (if method)
+
+        Returns:
+            List of PatternMatch objects for matching functions
+        """
+        return [
+            match
+            for signature, match in self._leading_patterns(
+                self.other_functions(exclude_function, exclude_class)
+            )
+            if signature == pattern
+        ]
+
+    def collect_patterns(self) -> list[tuple[ConditionalPatternSignature, PatternMatch]]:
+        """Return the leading conditional pattern of every function that has one."""
+        return self._leading_patterns(self.functions)
+
+    def _leading_patterns(
+        self, functions: list[CatalogedFunction]
+    ) -> list[tuple[ConditionalPatternSignature, PatternMatch]]:
+        """Build the signature of each function's first run of returning if statements."""
+        patterns = []
+        for function in functions:
+            chain: list[CatalogedIf] = []
+            return_value: cst.BaseExpression | None = None
+            for cataloged in function.ifs:
+                value = _get_return_value(cataloged.node)
+                if value is None:
+                    if chain:
+                        break  # Pattern ended
+                    continue
+                if return_value is None:
+                    return_value = value
+                elif not _values_match(value, return_value):
+                    break
+                chain.append(cataloged)
+
+            if chain:
+                match = PatternMatch(
+                    function_name=function.name,
+                    class_name=function.class_name,
+                    start_line=chain[0].line,
+                    end_line=chain[-1].line,
+                    conditions=[cataloged.node.test for cataloged in chain],
+                    return_value=return_value,
+                )
+                patterns.append((_signature(chain), match))
+        return patterns
+
+
+class _CatalogBuilder(cst.CSTVisitor):
+    """Records functions and their top-level if statements with fingerprints."""
+
+    METADATA_DEPENDENCIES = (metadata.PositionProvider,)
+
+    def __init__(self, functions: list[CatalogedFunction]) -> None:
+        """Initialize the builder.
+
+        Args:
+            functions: List to append cataloged functions to
         """
-        self.target_pattern = target_pattern
-        self.exclude_function = exclude_function
-        self.exclude_class = exclude_class
-        self.matches: list[PatternMatch] = []
+        self.functions = functions
         self.current_class: str = ""
 
     def visit_ClassDef(self, node: cst.ClassDef) -> bool:  # noqa: N802
@@ -282,105 +444,50 @@ class PatternScanner(cst.CSTVisitor):
         self.current_class = ""
 
     def visit_FunctionDef(self, node: cst.FunctionDef) -> bool:  # noqa: N802
-        """Check if this function matches the pattern."""
-        # Skip the original target function
-        if node.name.value == self.exclude_function:
-            if not self.exclude_class and not self.current_class:
-                return True
-            if self.exclude_class == self.current_class:
-                return True
-
-        # Build parameter map for this function
+        """Catalog the function's top-level if statements."""
         param_map = build_param_map(node)
-
-        # Find consecutive if statements with matching returns
-        conditions: list[cst.BaseExpression] = []
-        return_value: cst.BaseExpression | None = None
-        start_line = 0
-        end_line = 0
-
+        ifs = []
         if isinstance(node.body, cst.IndentedBlock):
             for stmt in node.body.body:
                 if isinstance(stmt, cst.If):
-                    try:
-                        pos = self.get_metadata(metadata.PositionProvider, stmt)
-                        line = pos.start.line
-                    except KeyError:
-                        continue
-
-                    ret_val = self._get_return_value(stmt)
-                    if ret_val is None:
-                        if conditions:
-                            break  # Pattern ended
-                        continue
-
-                    if return_value is None:
-                        return_value = ret_val
-                        conditions.append(stmt.test)
-                        start_line = line
-                        end_line = line
-                    elif self._values_match(ret_val, return_value):
-                        conditions.append(stmt.test)
-                        end_line = line
-                    else:
-                        break
-
-        # Check if conditions match the target pattern
-        if conditions:
-            normalized = []
-            for cond in conditions:
-                norm = normalize_condition(cond, param_map)
-                normalized.append(norm)
-            normalized.sort()
-
-            candidate = ConditionalPatternSignature(
-                conditions=tuple(normalized),
-                num_statements=len(conditions),
-            )
+                    line = self.get_metadata(metadata.PositionProvider, stmt).start.line
+                    ifs.append(CatalogedIf(stmt, line, fingerprint_condition(stmt.test, param_map)))
+        self.functions.append(CatalogedFunction(node, self.current_class, param_map, ifs))
+        return True
 
-            if candidate == self.target_pattern:
-                self.matches.append(
-                    PatternMatch(
-                        function_name=node.name.value,
-                        class_name=self.current_class,
-                        start_line=start_line,
-                        end_line=end_line,
-                        conditions=conditions,
-                        return_value=return_value,
-                    )
-                )
 
-        return True
+def _signature(chain: list[CatalogedIf]) -> ConditionalPatternSignature:
+    """Build an order-independent signature from a chain of if statements."""
+    return ConditionalPatternSignature(
+        conditions=tuple(sorted(cataloged.fingerprint for cataloged in chain)),
+        num_statements=len(chain),
+    )
 
-    def _get_return_value(self, if_stmt: cst.If) -> cst.BaseExpression | None:
-        """Get return value from an if statement with a simple return body."""
-        if not isinstance(if_stmt.body, cst.IndentedBlock):
-            return None
-        if len(if_stmt.body.body) != 1:
-            return None
 
-        body_stmt = if_stmt.body.body[0]
-        if not isinstance(body_stmt, cst.SimpleStatementLine):
-            return None
-        if len(body_stmt.body) != 1:
-            return None
+def _get_return_value(if_stmt: cst.If) -> cst.BaseExpression | None:
+    """Get return value from an if statement with a simple return body."""
+    if not isinstance(if_stmt.body, cst.IndentedBlock):
+        return None
+    if len(if_stmt.body.body) != 1:
+        return None
 
-        item = body_stmt.body[0]
-        if isinstance(item, cst.Return) and item.value:
-            return item.value
+    body_stmt = if_stmt.body.body[0]
+    if not isinstance(body_stmt, cst.SimpleStatementLine):
         return None
+    if len(body_stmt.body) != 1:
+        return None
+
+    item = body_stmt.body[0]
+    if isinstance(item, cst.Return) and item.value:
+        return item.value
+    return None
 
-    def _values_match(self, val1: cst.BaseExpression, val2: cst.BaseExpression) -> bool:
-        """Check if two return values match (same type)."""
-        if isinstance(val1, cst.Integer) and isinstance(val2, cst.Integer):
-            return True
-        if isinstance(val1, cst.Float) and isinstance(val2, cst.Float):
-            return True
-        if isinstance(val1, cst.Integer) and isinstance(val2, cst.Float):
-            return True
-        if isinstance(val1, cst.Float) and isinstance(val2, cst.Integer):
-            return True
-        return False
+
+def _values_match(val1: cst.BaseExpression, val2: cst.BaseExpression) -> bool:
+    """Check if two return values match (both numbers, ignoring the exact value)."""
+    # For pattern matching, we just need same type of return (e.g., both return numbers)
+    # The actual values can differ (0 vs 0.5)
+    return isinstance(val1, (cst.Integer, cst.Float)) and isinstance(val2, (cst.Integer, cst.Float))
 
 
 def extract_pattern(
@@ -393,7 +500,7 @@ def extract_pattern(
     """Extract a conditional pattern from a function.
 
     Args:
-        module: The CST module
+        module: The CST module (a fresh parse; see ConditionalCatalog.for_module)
         function_name: Name of the function to analyze
         class_name: Name of the class (empty string for module-level)
         start_line: Start line of the pattern range
@@ -402,10 +509,8 @@ def extract_pattern(
     Returns:
         The pattern signature, or None if no pattern found
     """
-    wrapper = metadata.MetadataWrapper(module)
-    extractor = PatternExtractor(function_name, class_name, start_line, end_line)
-    wrapper.visit(extractor)
-    return extractor.signature
+    catalog = ConditionalCatalog.for_module(module)
+    return catalog.extract_pattern(function_name, class_name, start_line, end_line)
 
 
 def scan_for_pattern(
@@ -417,7 +522,7 @@ def scan_for_pattern(
     """Scan a module for functions matching a pattern.
 
     Args:
-        module: The CST module to scan
+        module: The CST module to scan (a fresh parse; see ConditionalCatalog.for_module)
         pattern: The pattern signature to match
         exclude_function: Function to exclude from matching
         exclude_class: Class to exclude (if method)
@@ -425,7 +530,19 @@ def scan_for_pattern(
     Returns:
         List of PatternMatch objects for matching functions
     """
-    wrapper = metadata.MetadataWrapper(module)
-    scanner = PatternScanner(pattern, exclude_function, exclude_class)
-    wrapper.visit(scanner)
-    return scanner.matches
+    catalog = ConditionalCatalog.for_module(module)
+    return catalog.scan_for_pattern(pattern, exclude_function, exclude_class)
+
+
+def collect_patterns(module: cst.Module) -> list[tuple[ConditionalPatternSignature, PatternMatch]]:
+    """Fingerprint the leading conditional pattern of every function in a module.
+
+    Args:
+        module: The CST module to scan
+
+    Returns:
+        (signature, match) pairs, one per function that has a pattern
+    """
+    return ConditionalCatalog(
+        metadata.MetadataWrapper(module, unsafe_skip_copy=True)
+    ).collect_patterns()
@@ -0,0 +1,389 @@
+"""Replacing every occurrence of a numeric literal with a named constant.
+
+A magic number such as ``9.81`` or ``86400`` is usually scattered across a
+package. ConstantReplacement names the value, the constant and the module that
+defines it; each module is then rewritten on its own:
+
+- in the defining module the constant is reused when it is already assigned
+  the same value, and added after the docstring and imports otherwise
+- in other modules every matching literal becomes the constant's name and
+  ``from <module> import NAME`` is added, unless it is already there; the
+  import is relative (``from .constants import NAME``) within a package, and
+  goes after the other imports, in a group of its own unless they import
+  from the project too
+
+Literals inside ``Literal[...]`` annotations are types, not values, and are
+kept.
+
+Literals match when they have the same type and value, so ``86_400`` and
+``0x15180`` match ``86400`` but ``86400.0`` does not. A file is tokenized
+before it is parsed, so modules without the number cost no libcst parse, and
+rewrite_constant_in_files transforms many files in a process pool.
+
+Usage:
+    spec = ConstantReplacement(9.81, "GRAVITY", "physics.constants")
+    results = rewrite_constant_in_files(files, spec, graph)  # {path: new code or None}
+"""
+
+import ast
+import io
+import tokenize
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Iterable, Union, cast
+
+import libcst as cst
+from libcst.metadata import ClassScope, GlobalScope
+
+from molting.core.import_graph import ImportGraph
+from molting.core.parallel import map_files
+from molting.core.profiling import phase
+from molting.core.scope_service import ScopeService
+
+
+@dataclass(frozen=True)
+class ConstantReplacement:
+    """A number replaced by a module-level constant.
+
+    Attributes:
+        value: The number to replace
+        constant_name: Name of the constant
+        module_name: Dotted name of the module defining the constant
+    """
+
+    value: Union[int, float]
+    constant_name: str
+    module_name: str
+
+
+def parse_number(text: str) -> Union[int, float]:
+    """Parse an integer or float literal as written in Python source.
+
+    Args:
+        text: The literal, e.g. ``86_400`` or ``9.81``
+
+    Returns:
+        The number
+
+    Raises:
+        ValueError: If text is not an integer or float literal
+    """
+    try:
+        value = ast.literal_eval(text.strip())
+    except (ValueError, SyntaxError) as e:
+        raise ValueError(f"Invalid number '{text}'") from e
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise ValueError(f"Invalid number '{text}'")
+    return value
+
+
+def rewrite_constant(
+    module: cst.Module, spec: ConstantReplacement, module_name: str, graph: ImportGraph
+) -> cst.Module:
+    """Replace the matching literals of a module with the constant.
+
+    Args:
+        module: The module to rewrite
+        spec: The number and its constant
+        module_name: Dotted name of the module being rewritten
+        graph: Import graph of the project, to resolve relative imports
+
+    Returns:
+        The rewritten module
+
+    Raises:
+        ValueError: If the constant's name is already bound to something else
+            in the module, or a local name shadows it where a literal is replaced
+    """
+    defines = module_name == spec.module_name
+    scopes = ScopeService.for_module(module)
+    bindings = scopes.module_bindings(spec.constant_name)
+
+    definition = None
+    if defines:
+        definition = _find_definition(module, spec)
+        if bindings and (definition is None or len(bindings) > 1):
+            raise ValueError(f"Constant '{spec.constant_name}' already exists in {module_name}")
+    else:
+        for binding in bindings:
+            if not _imports_constant(binding.node, spec, module_name, graph):
+                raise ValueError(
+                    f"Cannot import '{spec.constant_name}' into {module_name}: "
+                    "the name is already used"
+                )
+
+    finder = _LiteralFinder(spec.value, definition.value if definition else None)
+    module.visit(finder)
+    for literal in finder.literals:
+        if _is_shadowed(scopes, literal, spec.constant_name):
+            raise ValueError(
+                f"Cannot use '{spec.constant_name}' at {module_name}:{scopes.line(literal)}: "
+                "a local name shadows it"
+            )
+    if not finder.literals and (not defines or definition is not None):
+        return module
+
+    module = module.visit(_LiteralTransformer(spec.constant_name, finder.literals))
+    if defines and definition is None:
+        return _insert_statement(module, _constant_definition(spec))
+    if not defines and not bindings:
+        imported_from = graph.relative_name(module_name, spec.module_name)
+        return _insert_statement(
+            module,
+            _constant_import(imported_from, spec.constant_name),
+            lambda statement: _is_project_import(statement, graph),
+        )
+    return module
+
+
+def rewrite_constant_in_files(
+    files: Iterable[Path],
+    spec: ConstantReplacement,
+    graph: ImportGraph,
+    executor: Executor | None = None,
+    max_workers: int | None = None,
+) -> dict[Path, str | None]:
+    """Replace the matching literals of several files with the constant.
+
+    Files are read but not written. A defining module that does not exist yet
+    is treated as empty, so its new content defines the constant.
+
+    Args:
+        files: Files to rewrite
+        spec: The number and its constant
+        graph: Import graph of the project the files belong to
+        executor: Executor to transform files on; a process pool is created
+            for many files and few files are transformed in-process if None
+        max_workers: Worker count for the process pool created when executor is None
+
+    Returns:
+        File -> new code, or None if unchanged
+    """
+    files = list(files)
+    results = map_files(
+        _rewrite_file, files, spec, graph, executor=executor, max_workers=max_workers
+    )
+    return dict(zip(files, results))
+
+
+def _rewrite_file(file_path: Path, spec: ConstantReplacement, graph: ImportGraph) -> str | None:
+    """Replace the matching literals of one file (runs in worker processes)."""
+    module_name = graph.module_name(file_path)
+    source = file_path.read_text() if file_path.exists() else ""
+    if module_name != spec.module_name and not _contains_number(source, spec.value):
+        return None
+    with phase("parse"):
+        module = cst.parse_module(source)
+    with phase("transform"):
+        new_code = rewrite_constant(module, spec, module_name, graph).code
+    return new_code if new_code != source else None
+
+
+def _same_number(value: object, number: Union[int, float]) -> bool:
+    """Return whether a literal's value is the number, with the same type."""
+    return type(value) is type(number) and value == number
+
+
+def _contains_number(source: str, number: Union[int, float]) -> bool:
+    """Return whether a source contains a literal of the number, without parsing it."""
+    try:
+        for token in tokenize.generate_tokens(io.StringIO(source).readline):
+            if token.type == tokenize.NUMBER and _same_number(
+                ast.literal_eval(token.string), number
+            ):
+                return True
+    except (tokenize.TokenError, SyntaxError):
+        # Let the parse report the error
+        return True
+    return False
+
+
+def _find_definition(module: cst.Module, spec: ConstantReplacement) -> cst.Assign | None:
+    """Return the module-level ``NAME = <number>`` assignment of the constant, if any."""
+    for statement in module.body:
+        if not isinstance(statement, cst.SimpleStatementLine):
+            continue
+        for node in statement.body:
+            if (
+                isinstance(node, cst.Assign)
+                and len(node.targets) == 1
+                and isinstance(node.targets[0].target, cst.Name)
+                and node.targets[0].target.value == spec.constant_name
+                and isinstance(node.value, (cst.Integer, cst.Float))
+                and _same_number(node.value.evaluated_value, spec.value)
+            ):
+                return node
+    return None
+
+
+def _imports_constant(
+    node: cst.CSTNode, spec: ConstantReplacement, module_name: str, graph: ImportGraph
+) -> bool:
+    """Return whether a binding node is an import of the constant from its module."""
+    if not isinstance(node, cst.ImportFrom) or isinstance(node.names, cst.ImportStar):
+        return False
+    target = cst.Module([]).code_for_node(node.module) if node.module is not None else None
+    if graph.resolve_relative(module_name, len(node.relative), target) != spec.module_name:
+        return False
+    return any(
+        alias.evaluated_name == spec.constant_name and alias.asname is None for alias in node.names
+    )
+
+
+def _is_shadowed(scopes: ScopeService, node: cst.CSTNode, name: str) -> bool:
+    """Return whether a name read at a node would resolve to something other than a global."""
+    own_scope = scope = scopes.scope_of(node)
+    while scope is not None and not isinstance(scope, GlobalScope):
+        # A class body's names are not visible from its methods
+        if (scope is own_scope or not isinstance(scope, ClassScope)) and scope.assignments[name]:
+            return True
+        scope = scope.parent
+    return False
+
+
+def _constant_definition(spec: ConstantReplacement) -> cst.SimpleStatementLine:
+    """Create ``NAME = <number>``."""
+    return cast(
+        cst.SimpleStatementLine, cst.parse_statement(f"{spec.constant_name} = {spec.value!r}\n")
+    )
+
+
+def _constant_import(module_name: str, constant_name: str) -> cst.SimpleStatementLine:
+    """Create ``from <module> import NAME``; the module may be relative (``.constants``)."""
+    return cast(
+        cst.SimpleStatementLine,
+        cst.parse_statement(f"from {module_name} import {constant_name}\n"),
+    )
+
+
+def _is_import(statement: cst.BaseStatement) -> bool:
+    """Return whether a statement line imports something."""
+    return isinstance(statement, cst.SimpleStatementLine) and any(
+        isinstance(node, (cst.Import, cst.ImportFrom)) for node in statement.body
+    )
+
+
+def _is_project_import(statement: cst.BaseStatement, graph: ImportGraph) -> bool:
+    """Return whether a statement line imports from the project (relative imports included)."""
+    packages = {name.split(".")[0] for name in graph.modules}
+    for node in cast(cst.SimpleStatementLine, statement).body:
+        if isinstance(node, cst.ImportFrom):
+            if node.relative:
+                return True
+            if node.module is not None:
+                imported = cst.Module([]).code_for_node(node.module)
+                if imported.split(".")[0] in packages:
+                    return True
+        elif isinstance(node, cst.Import):
+            if any(alias.evaluated_name.split(".")[0] in packages for alias in node.names):
+                return True
+    return False
+
+
+def _insert_statement(
+    module: cst.Module,
+    statement: cst.SimpleStatementLine,
+    same_group: Callable[[cst.BaseStatement], bool] = _is_import,
+) -> cst.Module:
+    """Insert a statement after the module's docstring and leading imports.
+
+    Args:
+        module: The module to insert into
+        statement: The statement to insert
+        same_group: Whether a preceding import is in the statement's group;
+            a blank line separates the statement from an import that is not
+    """
+    index = 0
+    for position, existing in enumerate(module.body):
+        if (position == 0 and _is_docstring(existing)) or _is_import(existing):
+            index = position + 1
+        else:
+            break
+    if index > 0 and not (
+        _is_import(module.body[index - 1]) and same_group(module.body[index - 1])
+    ):
+        statement = statement.with_changes(leading_lines=[cst.EmptyLine()])
+    body = list(module.body)
+    body.insert(index, statement)
+    if index < len(body) - 1 and _is_import(statement) != _is_import(body[index + 1]):
+        following = body[index + 1]
+        if not following.leading_lines:
+            blank_lines = 2 if isinstance(following, (cst.FunctionDef, cst.ClassDef)) else 1
+            body[index + 1] = following.with_changes(leading_lines=[cst.EmptyLine()] * blank_lines)
+    # A module created for the constant gets a final newline
+    return module.with_changes(
+        body=body, has_trailing_newline=module.has_trailing_newline or not module.body
+    )
+
+
+def _is_docstring(statement: cst.BaseStatement) -> bool:
+    """Return whether a statement is a bare string expression."""
+    return (
+        isinstance(statement, cst.SimpleStatementLine)
+        and len(statement.body) == 1
+        and isinstance(statement.body[0], cst.Expr)
+        and isinstance(statement.body[0].value, (cst.SimpleString, cst.ConcatenatedString))
+    )
+
+
+class _LiteralFinder(cst.CSTVisitor):
+    """Finds the literals of a number."""
+
+    def __init__(self, number: Union[int, float], excluded: cst.BaseExpression | None) -> None:
+        """Initialize the finder.
+
+        Args:
+            number: The number to find
+            excluded: Value of the constant's own definition, which is kept
+        """
+        self.number = number
+        self.excluded = excluded
+        self.literals: set[cst.CSTNode] = set()
+
+    def visit_Subscript(self, node: cst.Subscript) -> bool:  # noqa: N802
+        """Skip ``Literal[...]`` (or ``typing.Literal[...]``) annotations."""
+        callee = node.value
+        if isinstance(callee, cst.Attribute):
+            callee = callee.attr
+        return not (isinstance(callee, cst.Name) and callee.value == "Literal")
+
+    def visit_Integer(self, node: cst.Integer) -> None:  # noqa: N802
+        """Record a matching integer literal."""
+        if node is not self.excluded and _same_number(node.evaluated_value, self.number):
+            self.literals.add(node)
+
+    def visit_Float(self, node: cst.Float) -> None:  # noqa: N802
+        """Record a matching float literal."""
+        if node is not self.excluded and _same_number(node.evaluated_value, self.number):
+            self.literals.add(node)
+
+
+class _LiteralTransformer(cst.CSTTransformer):
+    """Replaces the found literals with the constant's name."""
+
+    def __init__(self, constant_name: str, literals: set[cst.CSTNode]) -> None:
+        """Initialize the transformer.
+
+        Args:
+            constant_name: Name of the constant
+            literals: Literals to replace
+        """
+        self.constant_name = constant_name
+        self.literals = literals
+
+    def leave_Integer(  # noqa: N802
+        self, original_node: cst.Integer, updated_node: cst.Integer
+    ) -> cst.BaseExpression:
+        """Replace a found integer literal."""
+        if original_node in self.literals:
+            return cst.Name(self.constant_name, lpar=updated_node.lpar, rpar=updated_node.rpar)
+        return updated_node
+
+    def leave_Float(  # noqa: N802
+        self, original_node: cst.Float, updated_node: cst.Float
+    ) -> cst.BaseExpression:
+        """Replace a found float literal."""
+        if original_node in self.literals:
+            return cst.Name(self.constant_name, lpar=updated_node.lpar, rpar=updated_node.rpar)
+        return updated_node
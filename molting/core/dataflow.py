@@ -0,0 +1,677 @@
+"""Intra-procedural dataflow analysis over a statement-level control-flow graph.
+
+FunctionDataflow builds a control-flow graph (CFG) for one function, with a
+node per simple statement and per compound-statement header (``if`` test,
+loop header, ``with`` items, ``except`` clause, ...), and solves two classic
+problems over it with Python integers as bitsets:
+
+- liveness (backward): which variables may still be read after each node
+- reaching definitions (forward): which assignments may reach each node
+
+Region queries then follow from the solution. A variable is an input of a
+line range if a definition from outside the range reaches a read inside it,
+and an output if the range defines it and it is live on an edge leaving the
+range. An output that a definition from before the range can still reach on
+leaving it (the range assigns it on some paths only) is an input as well, so
+the extracted code can return the unchanged value on the other paths. Loop
+back edges, branches and early returns are ordinary CFG edges, so they are
+accounted for without line-number heuristics.
+
+Usage:
+    index = get_line_index(source_code)
+    function = index.find_function("Order", "print_owing")
+    dataflow = FunctionDataflow(function, index.lines)
+    region = dataflow.region_flow(9, 12)
+    region.inputs, region.outputs
+"""
+
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Sequence
+
+import libcst as cst
+
+from molting.core.analysis_cache import get_analysis_cache
+
+
+@dataclass
+class FlowNode:
+    """A node of the control-flow graph.
+
+    Attributes:
+        statement: The statement this node stands for (None for entry and exit)
+        line: First line of the statement (or of the function for entry/exit)
+        uses: Bitset of variables read by the node
+        defs: Bitset of variables written by the node
+        successors: Indices of the nodes control may flow to next
+    """
+
+    statement: cst.CSTNode | None
+    line: int
+    uses: int = 0
+    defs: int = 0
+    successors: list[int] = field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class RegionFlow:
+    """Variables flowing into and out of a region of a function.
+
+    Attributes:
+        inputs: Variables read in the region with a definition from outside it
+            reaching the read, and outputs the region does not assign on every path
+        outputs: Variables defined in the region that are live when control leaves it
+    """
+
+    inputs: list[str]
+    outputs: list[str]
+
+
+class FunctionDataflow:
+    """Liveness and reaching definitions for one function.
+
+    Variables are local names only: a name never assigned in the function (a
+    global or builtin) has no definitions, so it is never an input. Parameters
+    are defined by the entry node.
+    """
+
+    ENTRY = 0
+    EXIT = 1
+
+    def __init__(
+        self, function: cst.FunctionDef, lines: Callable[[cst.CSTNode], tuple[int, int]]
+    ) -> None:
+        """Build the CFG and solve both dataflow problems.
+
+        Args:
+            function: The function to analyze
+            lines: Returns the (start_line, end_line) of a node of the function,
+                e.g. ``LineIndex.lines``
+        """
+        self.function = function
+        self.variables: list[str] = []
+        self._variable_index: dict[str, int] = {}
+        function_line = lines(function)[0]
+        self.nodes: list[FlowNode] = [FlowNode(None, function_line), FlowNode(None, function_line)]
+
+        _CFGBuilder(self, lines).build(function)
+
+        self.live_in, self.live_out = self._solve_liveness()
+        (
+            self.reach_in,
+            self.reach_out,
+            self._def_nodes,
+            self._variable_defs,
+        ) = self._solve_reaching_definitions()
+
+    def variable_bit(self, name: str) -> int:
+        """Return the bit of a variable, registering the variable on first use."""
+        index = self._variable_index.get(name)
+        if index is None:
+            index = len(self.variables)
+            self._variable_index[name] = index
+            self.variables.append(name)
+        return 1 << index
+
+    def names(self, bits: int) -> list[str]:
+        """Return the variables in a bitset, in order of first appearance."""
+        result = []
+        index = 0
+        while bits:
+            if bits & 1:
+                result.append(self.variables[index])
+            bits >>= 1
+            index += 1
+        return result
+
+    def region_flow(self, start_line: int, end_line: int) -> RegionFlow:
+        """Compute the inputs and outputs of the statements starting in a line range.
+
+        Args:
+            start_line: First line of the region (1-indexed)
+            end_line: Last line of the region (1-indexed, inclusive)
+
+        Returns:
+            The region's inputs and outputs, in order of first appearance
+        """
+        region = {
+            index
+            for index, node in enumerate(self.nodes)
+            if node.statement is not None and start_line <= node.line <= end_line
+        }
+
+        outside_defs = 0
+        for def_index, node_index in enumerate(self._def_nodes):
+            if node_index not in region:
+                outside_defs |= 1 << def_index
+
+        inputs = 0
+        defined = 0
+        live_on_exit = 0
+        # Outside definitions still reaching an edge that leaves the region
+        passing_outside = 0
+        for index in region:
+            node = self.nodes[index]
+            reaching_outside = self.reach_in[index] & outside_defs
+            uses = node.uses
+            variable = 0
+            while uses:
+                if uses & 1 and reaching_outside & self._variable_defs[variable]:
+                    inputs |= 1 << variable
+                uses >>= 1
+                variable += 1
+            defined |= node.defs
+            for successor in node.successors:
+                if successor not in region:
+                    live_on_exit |= self.live_in[successor]
+                    passing_outside |= self.reach_out[index] & outside_defs
+
+        outputs = defined & live_on_exit
+        variable = 0
+        remaining = outputs
+        while remaining:
+            if remaining & 1 and passing_outside & self._variable_defs[variable]:
+                inputs |= 1 << variable
+            remaining >>= 1
+            variable += 1
+
+        return RegionFlow(inputs=self.names(inputs), outputs=self.names(outputs))
+
+    def _solve_liveness(self) -> tuple[list[int], list[int]]:
+        """Solve live variables backward with a worklist."""
+        count = len(self.nodes)
+        predecessors: list[list[int]] = [[] for _ in range(count)]
+        for index, node in enumerate(self.nodes):
+            for successor in node.successors:
+                predecessors[successor].append(index)
+
+        live_in = [0] * count
+        live_out = [0] * count
+        worklist = deque(reversed(range(count)))
+        queued = [True] * count
+        while worklist:
+            index = worklist.popleft()
+            queued[index] = False
+            node = self.nodes[index]
+            out = 0
+            for successor in node.successors:
+                out |= live_in[successor]
+            live_out[index] = out
+            new_in = node.uses | (out & ~node.defs)
+            if new_in != live_in[index]:
+                live_in[index] = new_in
+                for predecessor in predecessors[index]:
+                    if not queued[predecessor]:
+                        queued[predecessor] = True
+                        worklist.append(predecessor)
+        return live_in, live_out
+
+    def _solve_reaching_definitions(
+        self,
+    ) -> tuple[list[int], list[int], list[int], list[int]]:
+        """Solve reaching definitions forward with a worklist.
+
+        Returns:
+            Tuple of (reach_in per node, reach_out per node, node index per
+            definition, definition bitset per variable)
+        """
+        count = len(self.nodes)
+        def_nodes: list[int] = []
+        variable_defs = [0] * len(self.variables)
+        gen = [0] * count
+        for index, node in enumerate(self.nodes):
+            defs = node.defs
+            variable = 0
+            while defs:
+                if defs & 1:
+                    bit = 1 << len(def_nodes)
+                    def_nodes.append(index)
+                    gen[index] |= bit
+                    variable_defs[variable] |= bit
+                defs >>= 1
+                variable += 1
+
+        kill = [0] * count
+        for index, node in enumerate(self.nodes):
+            for variable in range(len(self.variables)):
+                if node.defs >> variable & 1:
+                    kill[index] |= variable_defs[variable]
+
+        predecessors: list[list[int]] = [[] for _ in range(count)]
+        for index, node in enumerate(self.nodes):
+            for successor in node.successors:
+                predecessors[successor].append(index)
+
+        reach_in = [0] * count
+        reach_out = [0] * count
+        worklist = deque(range(count))
+        queued = [True] * count
+        while worklist:
+            index = worklist.popleft()
+            queued[index] = False
+            incoming = 0
+            for predecessor in predecessors[index]:
+                incoming |= reach_out[predecessor]
+            reach_in[index] = incoming
+            new_out = gen[index] | (incoming & ~kill[index])
+            if new_out != reach_out[index]:
+                reach_out[index] = new_out
+                for successor in self.nodes[index].successors:
+                    if not queued[successor]:
+                        queued[successor] = True
+                        worklist.append(successor)
+        return reach_in, reach_out, def_nodes, variable_defs
+
+
+def get_function_dataflow(
+    function: cst.FunctionDef,
+    lines: Callable[[cst.CSTNode], tuple[int, int]],
+    qualified_name: str,
+    file_path: Path | None = None,
+) -> FunctionDataflow:
+    """Return the dataflow of a function, reusing it while the function is unchanged.
+
+    Args:
+        function: The function to analyze
+        lines: Line lookup for nodes of the function
+        qualified_name: ``Class.method`` or ``function`` name of the function
+        file_path: File containing the function, if known
+
+    Returns:
+        The solved dataflow, shared through the analysis cache
+    """
+    return get_analysis_cache().get_or_compute(
+        "dataflow",
+        file_path,
+        qualified_name,
+        function,
+        lambda: FunctionDataflow(function, lines),
+        start_line=lines(function)[0],
+    )
+
+
+@dataclass
+class _Loop:
+    """Jump targets of the innermost enclosing loop."""
+
+    header: int
+    breaks: list[int] = field(default_factory=list)
+
+
+class _CFGBuilder:
+    """Builds the nodes and edges of a FunctionDataflow."""
+
+    def __init__(
+        self, dataflow: FunctionDataflow, lines: Callable[[cst.CSTNode], tuple[int, int]]
+    ) -> None:
+        """Initialize the builder.
+
+        Args:
+            dataflow: The dataflow whose nodes to populate
+            lines: Line lookup for nodes of the function
+        """
+        self.dataflow = dataflow
+        self.lines = lines
+        self.loops: list[_Loop] = []
+        # Except-clause nodes of enclosing try bodies; any statement may jump there
+        self.handlers: list[list[int]] = []
+
+    def build(self, function: cst.FunctionDef) -> None:
+        """Build the CFG of a function body."""
+        entry = self.dataflow.nodes[FunctionDataflow.ENTRY]
+        for param in _all_params(function.params):
+            entry.defs |= self.dataflow.variable_bit(param.name.value)
+
+        body = function.body.body if isinstance(function.body, cst.IndentedBlock) else ()
+        exits = self._block(body, [FunctionDataflow.ENTRY])  # type: ignore[arg-type]
+        self._link(exits, FunctionDataflow.EXIT)
+
+    def _new_node(self, statement: cst.CSTNode, uses: set[str], defs: set[str]) -> int:
+        """Create a node, with edges to the handlers of enclosing try statements."""
+        node = FlowNode(statement, self.lines(statement)[0])
+        for name in uses:
+            node.uses |= self.dataflow.variable_bit(name)
+        for name in defs:
+            node.defs |= self.dataflow.variable_bit(name)
+        index = len(self.dataflow.nodes)
+        self.dataflow.nodes.append(node)
+        for handlers in self.handlers:
+            node.successors.extend(handlers)
+        return index
+
+    def _link(self, predecessors: list[int], successor: int) -> None:
+        """Add an edge from each predecessor to a successor."""
+        for predecessor in predecessors:
+            self.dataflow.nodes[predecessor].successors.append(successor)
+
+    def _block(self, statements: Sequence[cst.BaseStatement], preds: list[int]) -> list[int]:
+        """Add a sequence of statements; returns the nodes that fall through."""
+        for statement in statements:
+            preds = self._statement(statement, preds)
+        return preds
+
+    def _suite(self, suite: cst.BaseSuite, preds: list[int]) -> list[int]:
+        """Add the statements of an indented block or a same-line suite."""
+        if isinstance(suite, cst.IndentedBlock):
+            return self._block(suite.body, preds)
+        return self._simple(suite, suite.body, preds)  # type: ignore[arg-type]
+
+    def _statement(self, statement: cst.BaseStatement, preds: list[int]) -> list[int]:
+        """Add one statement; returns the nodes that fall through to the next one."""
+        if isinstance(statement, cst.SimpleStatementLine):
+            return self._simple(statement, statement.body, preds)
+        if isinstance(statement, cst.If):
+            return self._if(statement, preds)
+        if isinstance(statement, cst.While):
+            return self._loop(statement, statement.test, None, preds)
+        if isinstance(statement, cst.For):
+            return self._loop(statement, statement.iter, statement.target, preds)
+        if isinstance(statement, (cst.Try, cst.TryStar)):
+            return self._try(statement, preds)
+        if isinstance(statement, cst.With):
+            uses, defs = _accesses(*(item.item for item in statement.items))
+            for item in statement.items:
+                if item.asname is not None:
+                    target_uses, target_defs = _target_accesses(item.asname.name)
+                    uses |= target_uses
+                    defs |= target_defs
+            header = self._new_node(statement, uses, defs)
+            self._link(preds, header)
+            return self._suite(statement.body, [header])
+        if isinstance(statement, cst.Match):
+            return self._match(statement, preds)
+        if isinstance(statement, (cst.FunctionDef, cst.ClassDef)):
+            # Nested scopes: the name is defined here, and every name the
+            # nested body reads is conservatively treated as read here too
+            uses, _ = _accesses(statement)
+            node = self._new_node(statement, uses, {statement.name.value})
+            self._link(preds, node)
+            return [node]
+        # Unknown compound statement: one opaque node
+        uses, defs = _accesses(statement)
+        node = self._new_node(statement, uses, defs)
+        self._link(preds, node)
+        return [node]
+
+    def _simple(
+        self,
+        statement: cst.CSTNode,
+        small_statements: Sequence[cst.BaseSmallStatement],
+        preds: list[int],
+    ) -> list[int]:
+        """Add a line of small statements, following return/raise/break/continue."""
+        uses, defs = _accesses(*small_statements)
+        node = self._new_node(statement, uses, defs)
+        self._link(preds, node)
+        for small in small_statements:
+            if isinstance(small, (cst.Return, cst.Raise)):
+                self._link([node], FunctionDataflow.EXIT)
+                return []
+            if isinstance(small, cst.Break) and self.loops:
+                self.loops[-1].breaks.append(node)
+                return []
+            if isinstance(small, cst.Continue) and self.loops:
+                self._link([node], self.loops[-1].header)
+                return []
+        return [node]
+
+    def _if(self, statement: cst.If, preds: list[int]) -> list[int]:
+        """Add an if statement with its elif/else chain."""
+        uses, defs = _accesses(statement.test)
+        test = self._new_node(statement, uses, defs)
+        self._link(preds, test)
+        exits = self._suite(statement.body, [test])
+        if isinstance(statement.orelse, cst.If):
+            exits += self._if(statement.orelse, [test])
+        elif isinstance(statement.orelse, cst.Else):
+            exits += self._suite(statement.orelse.body, [test])
+        else:
+            exits.append(test)
+        return exits
+
+    def _loop(
+        self,
+        statement: cst.While | cst.For,
+        header_expression: cst.BaseExpression,
+        target: cst.BaseExpression | None,
+        preds: list[int],
+    ) -> list[int]:
+        """Add a while or for loop with its back edge and optional else clause."""
+        uses, defs = _accesses(header_expression)
+        if target is not None:
+            target_uses, target_defs = _target_accesses(target)
+            uses |= target_uses
+            defs |= target_defs
+        header = self._new_node(statement, uses, defs)
+        self._link(preds, header)
+
+        loop = _Loop(header)
+        self.loops.append(loop)
+        body_exits = self._suite(statement.body, [header])
+        self.loops.pop()
+        self._link(body_exits, header)
+
+        exits = [header]
+        if statement.orelse is not None:
+            exits = self._suite(statement.orelse.body, [header])
+        return exits + loop.breaks
+
+    def _try(self, statement: cst.Try | cst.TryStar, preds: list[int]) -> list[int]:
+        """Add a try statement; every statement of the body may jump to each handler."""
+        handler_nodes = []
+        handler_bodies = []
+        for handler in statement.handlers:
+            uses, defs = _accesses(handler.type) if handler.type is not None else (set(), set())
+            if handler.name is not None:
+                defs |= _target_accesses(handler.name.name)[1]
+            handler_nodes.append(self._new_node(handler, uses, defs))
+            handler_bodies.append(handler.body)
+        # An exception may also be raised before the first statement completes
+        for handler_node in handler_nodes:
+            self._link(preds, handler_node)
+
+        self.handlers.append(handler_nodes)
+        exits = self._suite(statement.body, preds)
+        self.handlers.pop()
+
+        if statement.orelse is not None:
+            exits = self._suite(statement.orelse.body, exits)
+        for body, handler_node in zip(handler_bodies, handler_nodes):
+            exits += self._suite(body, [handler_node])
+        if statement.finalbody is not None:
+            exits = self._suite(statement.finalbody.body, exits)
+        return exits
+
+    def _match(self, statement: cst.Match, preds: list[int]) -> list[int]:
+        """Add a match statement; each case is a branch from the subject."""
+        uses, defs = _accesses(statement.subject)
+        subject = self._new_node(statement, uses, defs)
+        self._link(preds, subject)
+        exits = [subject]
+        for case in statement.cases:
+            case_uses, case_defs = _accesses(case.pattern)
+            if case.guard is not None:
+                guard_uses, guard_defs = _accesses(case.guard)
+                case_uses |= guard_uses
+                case_defs |= guard_defs
+            case_node = self._new_node(case, case_uses, case_defs)
+            self._link([subject], case_node)
+            exits += self._suite(case.body, [case_node])
+        return exits
+
+
+def _all_params(params: cst.Parameters) -> list[cst.Param]:
+    """Return every parameter of a signature, including *args and **kwargs."""
+    result = [*params.posonly_params, *params.params, *params.kwonly_params]
+    if isinstance(params.star_arg, cst.Param):
+        result.append(params.star_arg)
+    if params.star_kwarg is not None:
+        result.append(params.star_kwarg)
+    return result
+
+
+def _accesses(*nodes: cst.CSTNode) -> tuple[set[str], set[str]]:
+    """Collect the names read and written by some nodes."""
+    collector = _AccessCollector()
+    for node in nodes:
+        node.visit(collector)
+    return collector.uses, collector.defs
+
+
+def _target_accesses(target: cst.BaseExpression) -> tuple[set[str], set[str]]:
+    """Collect the names read and written by an assignment target."""
+    collector = _AccessCollector()
+    collector.store(target)
+    return collector.uses, collector.defs
+
+
+class _AccessCollector(cst.CSTVisitor):
+    """Collects local names read (uses) and bound (defs) by statements or expressions."""
+
+    def __init__(self) -> None:
+        """Initialize the collector."""
+        self.uses: set[str] = set()
+        self.defs: set[str] = set()
+
+    def store(self, target: cst.BaseExpression) -> None:
+        """Record an assignment target: names are bound, sub-expressions are read."""
+        if isinstance(target, cst.Name):
+            self.defs.add(target.value)
+        elif isinstance(target, (cst.Tuple, cst.List)):
+            for element in target.elements:
+                self.store(element.value)
+        elif isinstance(target, cst.StarredElement):
+            self.store(target.value)
+        else:
+            # Attribute or subscript targets read their base and index
+            target.visit(self)
+
+    def visit_Name(self, node: cst.Name) -> bool:  # noqa: N802
+        """Record a read of a name."""
+        self.uses.add(node.value)
+        return False
+
+    def visit_Attribute(self, node: cst.Attribute) -> bool:  # noqa: N802
+        """Read only the base of an attribute access, not the attribute name."""
+        node.value.visit(self)
+        return False
+
+    def visit_Arg(self, node: cst.Arg) -> bool:  # noqa: N802
+        """Read the argument value but not a keyword name."""
+        node.value.visit(self)
+        return False
+
+    def visit_Assign(self, node: cst.Assign) -> bool:  # noqa: N802
+        """Read the value, then bind the targets."""
+        node.value.visit(self)
+        for target in node.targets:
+            self.store(target.target)
+        return False
+
+    def visit_AugAssign(self, node: cst.AugAssign) -> bool:  # noqa: N802
+        """An augmented assignment reads and then binds its target."""
+        node.value.visit(self)
+        node.target.visit(self)
+        self.store(node.target)
+        return False
+
+    def visit_AnnAssign(self, node: cst.AnnAssign) -> bool:  # noqa: N802
+        """Bind the target only if a value is assigned; local annotations are not evaluated."""
+        if node.value is not None:
+            node.value.visit(self)
+            self.store(node.target)
+        elif not isinstance(node.target, cst.Name):
+            node.target.visit(self)
+        return False
+
+    def visit_NamedExpr(self, node: cst.NamedExpr) -> bool:  # noqa: N802
+        """A walrus expression reads its value and binds its target."""
+        node.value.visit(self)
+        self.store(node.target)
+        return False
+
+    def visit_Del(self, node: cst.Del) -> bool:  # noqa: N802
+        """Deleting a name ends its current value, like a definition."""
+        self.store(node.target)
+        return False
+
+    def visit_Import(self, node: cst.Import) -> bool:  # noqa: N802
+        """Imports bind the alias or the top-level package name."""
+        for alias in node.names:
+            if alias.asname is not None:
+                self.store(alias.asname.name)  # type: ignore[arg-type]
+            else:
+                self.defs.add(cst.Module([]).code_for_node(alias.name).split(".")[0])
+        return False
+
+    def visit_ImportFrom(self, node: cst.ImportFrom) -> bool:  # noqa: N802
+        """From-imports bind each imported name or its alias."""
+        if isinstance(node.names, cst.ImportStar):
+            return False
+        for alias in node.names:
+            if alias.asname is not None:
+                self.store(alias.asname.name)  # type: ignore[arg-type]
+            elif isinstance(alias.name, cst.Name):
+                self.defs.add(alias.name.value)
+        return False
+
+    def visit_Global(self, node: cst.Global) -> bool:  # noqa: N802
+        """Global declarations neither read nor bind."""
+        return False
+
+    def visit_Nonlocal(self, node: cst.Nonlocal) -> bool:  # noqa: N802
+        """Nonlocal declarations neither read nor bind."""
+        return False
+
+    def visit_Annotation(self, node: cst.Annotation) -> bool:  # noqa: N802
+        """Skip annotations."""
+        return False
+
+    def visit_Lambda(self, node: cst.Lambda) -> bool:  # noqa: N802
+        """Read the free names of a lambda body, excluding its parameters."""
+        inner = _AccessCollector()
+        node.body.visit(inner)
+        bound = {param.name.value for param in _all_params(node.params)}
+        self.uses |= inner.uses - bound
+        return False
+
+    def visit_ListComp(self, node: cst.ListComp) -> bool:  # noqa: N802
+        """Read the free names of a comprehension."""
+        self._comprehension(node.for_in, node.elt)
+        return False
+
+    def visit_SetComp(self, node: cst.SetComp) -> bool:  # noqa: N802
+        """Read the free names of a comprehension."""
+        self._comprehension(node.for_in, node.elt)
+        return False
+
+    def visit_GeneratorExp(self, node: cst.GeneratorExp) -> bool:  # noqa: N802
+        """Read the free names of a comprehension."""
+        self._comprehension(node.for_in, node.elt)
+        return False
+
+    def visit_DictComp(self, node: cst.DictComp) -> bool:  # noqa: N802
+        """Read the free names of a comprehension."""
+        self._comprehension(node.for_in, node.key, node.value)
+        return False
+
+    def _comprehension(self, for_in: cst.CompFor, *elements: cst.BaseExpression) -> None:
+        """Read a comprehension's free names; its loop targets are local to it."""
+        inner = _AccessCollector()
+        bound: set[str] = set()
+        comp_for: cst.CompFor | None = for_in
+        while comp_for is not None:
+            comp_for.iter.visit(inner)
+            target = _AccessCollector()
+            target.store(comp_for.target)
+            bound |= target.defs
+            inner.uses |= target.uses
+            for condition in comp_for.ifs:
+                condition.test.visit(inner)
+            comp_for = comp_for.inner_for_in
+        for element in elements:
+            element.visit(inner)
+        self.uses |= inner.uses - bound
+        # Walrus targets inside a comprehension bind in the enclosing scope
+        self.defs |= inner.defs - bound
@@ -0,0 +1,447 @@
+"""Near-duplicate method detection across a codebase.
+
+Form-template-method, extract-superclass and pull-up-method all need the user
+to name classes whose methods share structure. DuplicateFinder finds those
+candidates: each method becomes a set of token shingles, the set is reduced
+to a fixed-size MinHash signature, and locality-sensitive hashing (LSH) over
+bands of the signature puts similar methods in the same bucket. Only methods
+that share a bucket are compared, so the cost grows with the number of
+methods rather than the number of method pairs. Candidates are scored with the
+exact Jaccard similarity of their shingle sets, since a 64-bin estimate of the
+short sets typical of methods can be off by more than 0.1.
+
+Signatures use one-permutation hashing: every shingle is hashed once and
+routed to one of ``num_bins`` bins that keep their minimum, with empty bins
+filled from their neighbours (densification). This gives the same Jaccard
+estimate as classic MinHash with ``num_bins`` permutations, at the cost of one
+hash per shingle instead of ``num_bins``, which keeps pure Python fast enough
+for large trees.
+
+Usage:
+    finder = DuplicateFinder(threshold=0.8)
+    finder.add_directory(Path("src"))
+    for pair in finder.find_class_pairs():
+        refactoring, file_path, params = pair.suggestion()
+        apply_refactoring(refactoring, file_path, **params)
+"""
+
+import ast
+import io
+import re
+import shlex
+import tokenize
+import zlib
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from pathlib import Path
+
+# Token types that carry structure; comments, whitespace and newlines are ignored
+_SIGNIFICANT_TOKENS = {tokenize.NAME, tokenize.OP, tokenize.NUMBER, tokenize.STRING}
+_MASK64 = (1 << 64) - 1
+
+
+@dataclass(frozen=True)
+class MethodInfo:
+    """A method that was fingerprinted.
+
+    Attributes:
+        file_path: File containing the method
+        class_name: Name of the class defining the method
+        method_name: Name of the method
+        line: Line of the ``def`` statement
+        bases: Base class names of the defining class, as written
+        assignments: (name, value dump) of each ``name = value`` statement at
+            the top level of the method's body, in order
+    """
+
+    file_path: Path
+    class_name: str
+    method_name: str
+    line: int
+    bases: tuple[str, ...]
+    assignments: tuple[tuple[str, str], ...] = ()
+
+    @property
+    def target(self) -> str:
+        """The method in ``Class::method`` target format."""
+        return f"{self.class_name}::{self.method_name}"
+
+
+@dataclass(frozen=True)
+class DuplicateMethodPair:
+    """Two methods in different classes with near-identical token shingles.
+
+    Attributes:
+        first: One of the methods
+        second: The other method
+        similarity: Jaccard similarity of their shingle sets (0.0-1.0)
+    """
+
+    first: MethodInfo
+    second: MethodInfo
+    similarity: float
+
+
+@dataclass
+class DuplicateClassPair:
+    """Two classes that share one or more near-identical methods.
+
+    Attributes:
+        class_a: Name of the first class
+        class_b: Name of the second class
+        file_a: File defining the first class
+        file_b: File defining the second class
+        shared_bases: Base classes both classes inherit from directly
+        methods: The near-identical method pairs, most similar first
+    """
+
+    class_a: str
+    class_b: str
+    file_a: Path
+    file_b: Path
+    shared_bases: tuple[str, ...]
+    methods: list[DuplicateMethodPair] = field(default_factory=list)
+
+    def suggestion(self) -> tuple[str, Path, dict[str, str]]:
+        """Suggest the refactoring these duplicates are ready to feed.
+
+        Returns:
+            The refactoring, the file to apply it to and its parameters, as
+            apply_refactoring() takes them: ``form-template-method`` if the
+            classes share a base and have same-named methods whose locals are
+            computed differently (each such local becomes a step),
+            ``pull-up-method`` if they share a base otherwise, and
+            ``extract-superclass`` if they share no base
+        """
+        if self.shared_bases:
+            for pair in self.methods:
+                steps = _template_steps(pair.first, pair.second)
+                if pair.first.method_name == pair.second.method_name and steps:
+                    return (
+                        "form-template-method",
+                        self.file_a,
+                        {
+                            "targets": f"{pair.first.target},{pair.second.target}",
+                            "name": pair.first.method_name,
+                            "steps": ",".join(f"{step}:get_{step}" for step in steps),
+                        },
+                    )
+            first = self.methods[0].first
+            return (
+                "pull-up-method",
+                first.file_path,
+                {"target": first.target, "to": self.shared_bases[0]},
+            )
+        return (
+            "extract-superclass",
+            self.file_a,
+            {
+                "targets": f"{self.class_a},{self.class_b}",
+                "name": _superclass_name(self.class_a, self.class_b),
+            },
+        )
+
+    def suggested_command(self) -> str:
+        """Format suggestion() as ``<refactoring> <file> key=value ...``."""
+        refactoring, file_path, params = self.suggestion()
+        arguments = [f"{key}={shlex.quote(value)}" for key, value in params.items()]
+        return " ".join([refactoring, shlex.quote(str(file_path)), *arguments])
+
+
+class DuplicateFinder:
+    """Finds near-duplicate methods across classes with MinHash and LSH.
+
+    Methods shorter than ``min_tokens`` are ignored, as trivial getters and
+    one-line delegations are near-identical everywhere.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.8,
+        num_bins: int = 64,
+        bands: int = 16,
+        shingle_size: int = 3,
+        min_tokens: int = 12,
+    ) -> None:
+        """Initialize the finder.
+
+        Args:
+            threshold: Minimum Jaccard similarity to report (0.0-1.0)
+            num_bins: MinHash signature length
+            bands: Number of LSH bands; must divide num_bins. More bands find
+                less similar pairs at the cost of more candidate comparisons
+            shingle_size: Number of consecutive tokens per shingle
+            min_tokens: Minimum number of tokens for a method to be considered
+
+        Raises:
+            ValueError: If the parameters are inconsistent
+        """
+        if not 0.0 < threshold <= 1.0:
+            raise ValueError(f"threshold must be in (0, 1], got {threshold}")
+        if num_bins % bands != 0:
+            raise ValueError(f"bands ({bands}) must divide num_bins ({num_bins})")
+        self.threshold = threshold
+        self.num_bins = num_bins
+        self.bands = bands
+        self.rows = num_bins // bands
+        self.shingle_size = shingle_size
+        self.min_tokens = min_tokens
+        self.methods: list[MethodInfo] = []
+        self.signatures: list[tuple[int, ...]] = []
+        self.shingle_sets: list[frozenset[int]] = []
+
+    def add_directory(self, directory: Path) -> None:
+        """Fingerprint the methods of every Python file under a directory.
+
+        Args:
+            directory: Root directory to scan
+        """
+        for file_path in sorted(directory.rglob("*.py")):
+            self.add_file(file_path)
+
+    def add_file(self, file_path: Path) -> None:
+        """Fingerprint the methods of one file; unreadable or invalid files are skipped.
+
+        Args:
+            file_path: The Python file to scan
+        """
+        try:
+            source_code = file_path.read_text()
+            tree = ast.parse(source_code)
+            tokens = _significant_tokens(source_code)
+        except (OSError, UnicodeDecodeError, SyntaxError, tokenize.TokenError):
+            return
+        self.add_source(file_path, tree, tokens)
+
+    def add_source(self, file_path: Path, tree: ast.Module, tokens: list[tuple[int, str]]) -> None:
+        """Fingerprint the methods of a parsed module.
+
+        Args:
+            file_path: File the module was read from
+            tree: The parsed module
+            tokens: (line, normalized token) pairs of the module, in order
+        """
+        token_lines = [line for line, _ in tokens]
+        for node in tree.body:
+            if not isinstance(node, ast.ClassDef):
+                continue
+            bases = tuple(ast.unparse(base) for base in node.bases)
+            for item in node.body:
+                if not isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                    continue
+                start = bisect_left(token_lines, item.lineno)
+                end = bisect_left(token_lines, (item.end_lineno or item.lineno) + 1)
+                method_tokens = [token for _, token in tokens[start:end]]
+                if len(method_tokens) < self.min_tokens:
+                    continue
+                assignments = tuple(
+                    (statement.targets[0].id, ast.dump(statement.value))
+                    for statement in item.body
+                    if isinstance(statement, ast.Assign)
+                    and len(statement.targets) == 1
+                    and isinstance(statement.targets[0], ast.Name)
+                )
+                self.methods.append(
+                    MethodInfo(file_path, node.name, item.name, item.lineno, bases, assignments)
+                )
+                shingles = self.shingles(method_tokens)
+                self.shingle_sets.append(frozenset(shingles))
+                self.signatures.append(self.signature(shingles))
+
+    def shingles(self, tokens: list[str]) -> set[int]:
+        """Hash every run of ``shingle_size`` consecutive tokens.
+
+        Args:
+            tokens: Normalized tokens of a method
+
+        Returns:
+            Set of shingle hashes (CRC-32, so results do not depend on the
+            interpreter's per-process string hash seed)
+        """
+        size = self.shingle_size
+        return {
+            zlib.crc32("\x00".join(tokens[i : i + size]).encode())
+            for i in range(len(tokens) - size + 1)
+        }
+
+    def signature(self, shingles: set[int]) -> tuple[int, ...]:
+        """Compute the one-permutation MinHash signature of a shingle set.
+
+        Args:
+            shingles: Shingle hashes of a method
+
+        Returns:
+            Tuple of ``num_bins`` minimum values
+        """
+        num_bins = self.num_bins
+        empty = _MASK64
+        bins = [empty] * num_bins
+        for shingle in shingles:
+            mixed = _mix(shingle)
+            index = mixed % num_bins
+            value = mixed // num_bins
+            if value < bins[index]:
+                bins[index] = value
+
+        # Densify: an empty bin borrows the value of the next non-empty bin,
+        # re-mixed with the distance so borrowed values differ per bin
+        if empty in bins and len(set(bins)) > 1:
+            filled = list(bins)
+            for index in range(num_bins):
+                if bins[index] != empty:
+                    continue
+                distance = 1
+                while bins[(index + distance) % num_bins] == empty:
+                    distance += 1
+                filled[index] = _mix(bins[(index + distance) % num_bins] + distance)
+            bins = filled
+        return tuple(bins)
+
+    def similarity(self, first: int, second: int) -> float:
+        """Return the Jaccard similarity of two fingerprinted methods.
+
+        Args:
+            first: Index of the first method in ``methods``
+            second: Index of the second method in ``methods``
+        """
+        set_a = self.shingle_sets[first]
+        set_b = self.shingle_sets[second]
+        if not set_a and not set_b:
+            return 1.0
+        return len(set_a & set_b) / len(set_a | set_b)
+
+    def candidate_pairs(self) -> set[tuple[int, int]]:
+        """Return index pairs of methods that share at least one LSH bucket."""
+        rows = self.rows
+        buckets: dict[tuple[int, tuple[int, ...]], list[int]] = {}
+        for method_index, signature in enumerate(self.signatures):
+            for band in range(self.bands):
+                key = (band, signature[band * rows : (band + 1) * rows])
+                buckets.setdefault(key, []).append(method_index)
+
+        pairs: set[tuple[int, int]] = set()
+        for members in buckets.values():
+            if len(members) < 2:
+                continue
+            for i, first in enumerate(members):
+                for second in members[i + 1 :]:
+                    pairs.add((first, second))
+        return pairs
+
+    def find_method_pairs(self) -> list[DuplicateMethodPair]:
+        """Return near-identical method pairs defined in different classes.
+
+        Returns:
+            Pairs with estimated similarity at or above the threshold, most similar first
+        """
+        results = []
+        for first, second in self.candidate_pairs():
+            method_a = self.methods[first]
+            method_b = self.methods[second]
+            if (method_a.file_path, method_a.class_name) == (
+                method_b.file_path,
+                method_b.class_name,
+            ):
+                continue
+            similarity = self.similarity(first, second)
+            if similarity >= self.threshold:
+                results.append(DuplicateMethodPair(method_a, method_b, similarity))
+        results.sort(
+            key=lambda pair: (
+                -pair.similarity,
+                str(pair.first.file_path),
+                pair.first.line,
+                str(pair.second.file_path),
+                pair.second.line,
+            )
+        )
+        return results
+
+    def find_class_pairs(self) -> list[DuplicateClassPair]:
+        """Group near-identical method pairs by the pair of classes defining them.
+
+        Returns:
+            Class pairs ordered by number of shared methods, then best similarity
+        """
+        groups: dict[tuple[Path, str, Path, str], DuplicateClassPair] = {}
+        for pair in self.find_method_pairs():
+            first, second = pair.first, pair.second
+            if (str(second.file_path), second.line) < (str(first.file_path), first.line):
+                first, second = second, first
+                pair = DuplicateMethodPair(first, second, pair.similarity)
+            key = (first.file_path, first.class_name, second.file_path, second.class_name)
+            group = groups.get(key)
+            if group is None:
+                shared = tuple(base for base in first.bases if base in second.bases)
+                group = DuplicateClassPair(
+                    first.class_name,
+                    second.class_name,
+                    first.file_path,
+                    second.file_path,
+                    shared,
+                )
+                groups[key] = group
+            group.methods.append(pair)
+        return sorted(
+            groups.values(),
+            key=lambda group: (-len(group.methods), -group.methods[0].similarity),
+        )
+
+
+def _template_steps(first: MethodInfo, second: MethodInfo) -> list[str]:
+    """Return the locals both methods assign once, with different values, in order."""
+    values = dict(second.assignments)
+    names = [name for name, _ in first.assignments]
+    return [
+        name
+        for name, value in first.assignments
+        if names.count(name) == 1 and name in values and values[name] != value
+    ]
+
+
+def _superclass_name(class_a: str, class_b: str) -> str:
+    """Name a superclass after the trailing words two class names share.
+
+    ``ResidentialSite`` and ``LifelineSite`` give ``Site``; names without a
+    common ending give ``<class_a>Base``.
+    """
+    words_a = re.findall(r"[A-Z]?[a-z0-9]+|[A-Z]+(?![a-z])", class_a)
+    words_b = re.findall(r"[A-Z]?[a-z0-9]+|[A-Z]+(?![a-z])", class_b)
+    common: list[str] = []
+    while (
+        len(common) < min(len(words_a), len(words_b))
+        and words_a[-1 - len(common)] == words_b[-1 - len(common)]
+    ):
+        common.insert(0, words_a[-1 - len(common)])
+    name = "".join(common)
+    if name and name not in (class_a, class_b):
+        return name
+    return f"{class_a}Base"
+
+
+def _significant_tokens(source_code: str) -> list[tuple[int, str]]:
+    """Tokenize source into (line, token) pairs, normalizing literals.
+
+    Numbers and strings become placeholders, so methods that differ only in
+    constants (the variant steps of a template method) still look alike.
+    """
+    tokens = []
+    for token in tokenize.generate_tokens(io.StringIO(source_code).readline):
+        if token.type not in _SIGNIFICANT_TOKENS:
+            continue
+        if token.type == tokenize.NUMBER:
+            text = "<num>"
+        elif token.type == tokenize.STRING:
+            text = "<str>"
+        else:
+            text = token.string
+        tokens.append((token.start[0], text))
+    return tokens
+
+
+def _mix(value: int) -> int:
+    """Scramble a hash into a well-distributed 64-bit value (splitmix64 finalizer)."""
+    value = (value + 0x9E3779B97F4A7C15) & _MASK64
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return value ^ (value >> 31)
@@ -0,0 +1,78 @@
+"""All-or-nothing writes for refactorings that modify several files.
+
+Multi-file refactorings compute every new source in memory first and stage it
+in a FileTransaction. Nothing touches the disk until commit(), and if any
+write fails the files already written are restored, so a failed run never
+leaves a half-refactored project behind.
+
+Usage:
+    transaction = FileTransaction()
+    transaction.stage(Path("a.py"), new_code_a)
+    transaction.stage(Path("b.py"), new_code_b)
+    transaction.commit()
+"""
+
+from pathlib import Path
+
+from molting.core.profiling import phase
+
+
+class FileTransaction:
+    """Stages new file contents and writes them together."""
+
+    def __init__(self) -> None:
+        """Initialize an empty transaction."""
+        self._staged: dict[Path, str] = {}
+
+    def stage(self, file_path: Path, new_code: str) -> None:
+        """Stage new content for a file, replacing anything staged for it before.
+
+        Args:
+            file_path: File to write on commit
+            new_code: Full new content of the file
+        """
+        self._staged[file_path.resolve()] = new_code
+
+    def staged(self, file_path: Path) -> str | None:
+        """Return the content staged for a file, or None if nothing is staged."""
+        return self._staged.get(file_path.resolve())
+
+    @property
+    def files(self) -> list[Path]:
+        """Files staged in this transaction, in staging order."""
+        return list(self._staged)
+
+    def commit(self) -> list[Path]:
+        """Write every staged file, restoring the originals if any write fails.
+
+        Returns:
+            The files written, in staging order
+
+        Raises:
+            RuntimeError: If a file cannot be written (all files are rolled back)
+        """
+        originals: dict[Path, str | None] = {}
+        with phase("write"):
+            try:
+                for file_path, new_code in self._staged.items():
+                    originals[file_path] = file_path.read_text() if file_path.exists() else None
+                    file_path.write_text(new_code)
+            except OSError as e:
+                self._rollback(originals)
+                raise RuntimeError(f"Error writing {file_path}: {e}; no files were changed") from e
+
+        written = list(self._staged)
+        self._staged.clear()
+        return written
+
+    @staticmethod
+    def _rollback(originals: dict[Path, str | None]) -> None:
+        """Restore files to their content from before the commit."""
+        for file_path, original in originals.items():
+            try:
+                if original is None:
+                    file_path.unlink(missing_ok=True)
+                else:
+                    file_path.write_text(original)
+            except OSError:
+                continue
@@ -0,0 +1,261 @@
+"""Module import graph of a project.
+
+Refactorings that move code between modules must name modules the way the
+project imports them, and must not add an import that closes a cycle.
+ImportGraph maps every Python file under a root directory to its dotted
+module name and records which project modules each module imports.
+
+Module names are relative to the import root: the directory containing the
+outermost package of the root, found by walking up through the directories
+that have an ``__init__.py`` (find_import_root). A graph of ``src/app`` names
+``src/app/helpers.py`` ``app.helpers``, as ``from app.helpers import ...``
+must.
+
+Graphs are cached per root directory. A cached graph is reused as long as no
+Python file under the root was added, removed or modified, so refactorings in
+one run share the import parse.
+
+Usage:
+    graph = ImportGraph.for_directory(Path("src/billing"))  # src/billing/__init__.py exists
+    graph.module_name(Path("src/billing/account.py"))  # "billing.account"
+    graph.reaches("billing.account", "billing.types")  # True if a chain of imports exists
+    graph.relative_name("billing.account", "billing.types")  # ".types"
+"""
+
+import ast
+from pathlib import Path
+
+from molting.core.caches import LRUCache
+
+# (root directory, import root) -> (fingerprint of the root's Python files, graph)
+_cache: "LRUCache[tuple[Path, Path], tuple[tuple[tuple[str, int, int], ...], ImportGraph]]" = (
+    LRUCache()
+)
+
+
+class ImportGraph:
+    """Project modules and the project modules each of them imports."""
+
+    def __init__(self, root: Path, import_root: Path | None = None) -> None:
+        """Initialize an empty graph; use build() or for_directory() to populate it.
+
+        Args:
+            root: Directory whose Python files are the graph's modules
+            import_root: Directory module names are relative to; defaults to
+                find_import_root(root)
+        """
+        self.root = root.resolve()
+        self.import_root = (import_root or find_import_root(self.root)).resolve()
+        self.modules: dict[str, Path] = {}
+        self._names: dict[Path, str] = {}
+        self._imports: dict[str, set[str]] = {}
+
+    @classmethod
+    def build(cls, root: Path, import_root: Path | None = None) -> "ImportGraph":
+        """Parse the imports of every Python file under a directory.
+
+        Files that cannot be read or parsed are modules without imports.
+
+        Args:
+            root: Root directory of the project
+            import_root: Directory module names are relative to; defaults to
+                find_import_root(root)
+
+        Returns:
+            The populated graph
+        """
+        graph = cls(root, import_root)
+        files = sorted(path.resolve() for path in graph.root.rglob("*.py"))
+        for file_path in files:
+            name = _module_name(graph.import_root, file_path)
+            graph.modules[name] = file_path
+            graph._names[file_path] = name
+
+        for name, file_path in graph.modules.items():
+            try:
+                tree = ast.parse(file_path.read_text())
+            except (OSError, UnicodeDecodeError, SyntaxError):
+                graph._imports[name] = set()
+                continue
+            is_package = file_path.name == "__init__.py"
+            graph._imports[name] = {
+                imported
+                for imported in _imported_modules(tree, name, is_package)
+                if imported in graph.modules and imported != name
+            }
+        return graph
+
+    @classmethod
+    def for_directory(cls, root: Path, import_root: Path | None = None) -> "ImportGraph":
+        """Return the graph of a directory, reusing a cached one if no file changed.
+
+        Args:
+            root: Root directory of the project
+            import_root: Directory module names are relative to; defaults to
+                find_import_root(root)
+
+        Returns:
+            The graph for the directory's current content
+        """
+        root = root.resolve()
+        key = (root, (import_root or find_import_root(root)).resolve())
+        fingerprint = tuple(
+            (str(path), stat.st_mtime_ns, stat.st_size)
+            for path in sorted(root.rglob("*.py"))
+            for stat in [path.stat()]
+        )
+        cached = _cache.get(key)
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1]
+
+        graph = cls.build(root, key[1])
+        _cache.put(key, (fingerprint, graph))
+        return graph
+
+    def module_name(self, file_path: Path) -> str:
+        """Return the dotted module name of a file under the import root.
+
+        Args:
+            file_path: A Python file under the import root
+
+        Returns:
+            The module name, e.g. ``billing.account``
+
+        Raises:
+            ValueError: If the file is not under the import root
+        """
+        file_path = file_path.resolve()
+        name = self._names.get(file_path)
+        if name is not None:
+            return name
+        try:
+            return _module_name(self.import_root, file_path)
+        except ValueError as e:
+            raise ValueError(f"{file_path} is not under {self.import_root}") from e
+
+    def imports(self, module: str) -> set[str]:
+        """Return the project modules a module imports directly."""
+        return set(self._imports.get(module, set()))
+
+    def importers(self, module: str) -> set[str]:
+        """Return the project modules that import a module directly."""
+        return {name for name, imported in self._imports.items() if module in imported}
+
+    def reaches(self, start: str, goal: str) -> bool:
+        """Return whether a chain of imports leads from one module to another.
+
+        Args:
+            start: Module the chain starts at
+            goal: Module the chain should reach
+
+        Returns:
+            True if start imports goal directly or through other project modules
+        """
+        seen = {start}
+        pending = [start]
+        while pending:
+            for imported in self._imports.get(pending.pop(), set()):
+                if imported == goal:
+                    return True
+                if imported not in seen:
+                    seen.add(imported)
+                    pending.append(imported)
+        return False
+
+    def resolve_relative(self, module: str, level: int, target: str | None) -> str:
+        """Return the absolute name of a relative import made by a module.
+
+        Args:
+            module: Module containing the import
+            level: Number of leading dots
+            target: Module written after the dots, if any
+
+        Returns:
+            The absolute module name
+        """
+        is_package = self.modules.get(module, Path()).name == "__init__.py"
+        return _absolute_module(module, is_package, level, target)
+
+    def relative_name(self, module: str, target: str) -> str:
+        """Return how a module names another one in a relative import.
+
+        Args:
+            module: Module containing the import
+            target: Absolute name of the imported module
+
+        Returns:
+            The name with leading dots (``.types``, ``..core.types``), or target
+            itself if the modules are not in the same top-level package
+        """
+        is_package = self.modules.get(module, Path()).name == "__init__.py"
+        package = module.split(".") if is_package else module.split(".")[:-1]
+        target_parts = target.split(".")
+        if not package or target_parts[0] != package[0]:
+            return target
+        common = 0
+        while (
+            common < min(len(package), len(target_parts))
+            and package[common] == target_parts[common]
+        ):
+            common += 1
+        dots = "." * (len(package) - common + 1)
+        return dots + ".".join(target_parts[common:])
+
+
+def find_import_root(path: Path) -> Path:
+    """Return the directory a file or directory is imported from.
+
+    That is the parent of the outermost package containing it: directories
+    are walked up as long as they have an ``__init__.py``.
+
+    Args:
+        path: A Python file or a directory
+
+    Returns:
+        The import root (the directory itself if it is not a package)
+    """
+    directory = path.resolve()
+    if not directory.is_dir():
+        directory = directory.parent
+    while (directory / "__init__.py").is_file() and directory.parent != directory:
+        directory = directory.parent
+    return directory
+
+
+def _module_name(root: Path, file_path: Path) -> str:
+    """Return the dotted name of a file relative to a root (``pkg/__init__.py`` is ``pkg``)."""
+    parts = list(file_path.relative_to(root).with_suffix("").parts)
+    if parts and parts[-1] == "__init__":
+        parts.pop()
+    return ".".join(parts)
+
+
+def _absolute_module(module: str, is_package: bool, level: int, target: str | None) -> str:
+    """Resolve ``from <dots><target> import ...`` made by a module to an absolute name."""
+    if level == 0:
+        return target or ""
+    package = module.split(".") if is_package else module.split(".")[:-1]
+    if level > 1:
+        package = package[: len(package) - (level - 1)]
+    return ".".join([*package, *([target] if target else [])])
+
+
+def _imported_modules(tree: ast.Module, module: str, is_package: bool) -> set[str]:
+    """Return every module an import statement of a module may load.
+
+    ``import a.b`` loads ``a`` and ``a.b``; ``from a import b`` loads ``a`` and,
+    if ``a.b`` is a module, ``a.b`` as well.
+    """
+    result: set[str] = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                parts = alias.name.split(".")
+                result.update(".".join(parts[: i + 1]) for i in range(len(parts)))
+        elif isinstance(node, ast.ImportFrom):
+            base = _absolute_module(module, is_package, node.level, node.module)
+            if base:
+                parts = base.split(".")
+                result.update(".".join(parts[: i + 1]) for i in range(len(parts)))
+            result.update(f"{base}.{alias.name}" if base else alias.name for alias in node.names)
+    return result
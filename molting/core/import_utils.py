@@ -8,7 +8,8 @@ def has_import(module: cst.Module, module_name: str, import_name: str) -> bool:
 
     Args:
         module: The module to check
-        module_name: The module being imported from (e.g., "typing")
+        module_name: The module being imported from (e.g., "typing", or ".helpers"
+            for a relative import)
         import_name: The name being imported (e.g., "Protocol")
 
     Returns:
@@ -18,8 +19,8 @@ def has_import(module: cst.Module, module_name: str, import_name: str) -> bool:
         if isinstance(stmt, cst.SimpleStatementLine):
             for item in stmt.body:
                 if isinstance(item, cst.ImportFrom):
-                    if isinstance(item.module, cst.Name):
-                        if item.module.value == module_name:
+                    if item.module is not None or item.relative:
+                        if _from_module(module, item) == module_name:
                             # Check for star import
                             if isinstance(item.names, cst.ImportStar):
                                 return True
@@ -38,7 +39,8 @@ def ensure_import(module: cst.Module, module_name: str, names: list[str]) -> cst
 
     Args:
         module: The module to modify
-        module_name: The module to import from
+        module_name: The module to import from (may be dotted, e.g. "pkg.helpers",
+            or relative, e.g. ".helpers")
         names: List of names to import
 
     Returns:
@@ -51,16 +53,126 @@ def ensure_import(module: cst.Module, module_name: str, names: list[str]) -> cst
 
     # Create the import statement
     import_aliases = [cst.ImportAlias(name=cst.Name(name)) for name in names]
-    import_stmt = cst.SimpleStatementLine(
-        body=[
-            cst.ImportFrom(
-                module=cst.Name(module_name),
-                names=import_aliases,
-            )
-        ]
+    import_stmt = cst.SimpleStatementLine(body=[import_from(module_name, import_aliases)])
+
+    return insert_import(module, import_stmt)
+
+
+def import_from(module_name: str, names: list[cst.ImportAlias]) -> cst.ImportFrom:
+    """Build ``from module_name import names``.
+
+    Args:
+        module_name: The module to import from; leading dots make the import relative
+        names: The imported names
+
+    Returns:
+        The import node
+    """
+    target = module_name.lstrip(".")
+    dots = len(module_name) - len(target)
+    return cst.ImportFrom(
+        module=cst.parse_expression(target) if target else None,  # type: ignore[arg-type]
+        names=names,
+        relative=[cst.Dot()] * dots,
     )
 
-    # Insert at the beginning (after any existing imports)
-    new_body = [import_stmt] + list(module.body)
+
+def has_module_import(module: cst.Module, module_name: str, alias: str | None = None) -> bool:
+    """Check if ``import module_name [as alias]`` exists.
+
+    Args:
+        module: The module to check
+        module_name: The dotted module name (e.g., "os.path")
+        alias: The name the module is bound to, if imported with ``as``
+
+    Returns:
+        True if the import exists
+    """
+    for stmt in module.body:
+        if isinstance(stmt, cst.SimpleStatementLine):
+            for item in stmt.body:
+                if isinstance(item, cst.Import):
+                    for name in item.names:
+                        if name.evaluated_name == module_name and (
+                            (name.asname is None and alias is None)
+                            or (name.asname is not None and name.evaluated_alias == alias)
+                        ):
+                            return True
+    return False
+
+
+def ensure_module_import(
+    module: cst.Module, module_name: str, alias: str | None = None
+) -> cst.Module:
+    """Add ``import module_name [as alias]`` if not already present.
+
+    Args:
+        module: The module to modify
+        module_name: The dotted module name to import
+        alias: Name to bind the module to, if different from its own name
+
+    Returns:
+        Modified module with import added
+    """
+    if has_module_import(module, module_name, alias):
+        return module
+
+    dotted = cst.parse_expression(module_name)
+    import_alias = cst.ImportAlias(
+        name=dotted,  # type: ignore[arg-type]
+        asname=cst.AsName(name=cst.Name(alias)) if alias else None,
+    )
+    return insert_import(module, cst.SimpleStatementLine(body=[cst.Import(names=[import_alias])]))
+
+
+def insert_import(module: cst.Module, import_stmt: cst.SimpleStatementLine) -> cst.Module:
+    """Insert an import statement at the top of a module.
+
+    A module docstring and ``__future__`` imports stay ahead of it. If the
+    statement it is inserted before is not an import, a blank line separates
+    them.
+
+    Args:
+        module: The module to modify
+        import_stmt: The import statement to insert
+
+    Returns:
+        Modified module with the statement inserted
+    """
+    body = list(module.body)
+    insert_at = 0
+    while insert_at < len(body) and _is_docstring_or_future_import(body[insert_at], insert_at):
+        insert_at += 1
+    following = body[insert_at:]
+    if following and not _is_import(following[0]) and not following[0].leading_lines:
+        following[0] = following[0].with_changes(leading_lines=[cst.EmptyLine()])
+    new_body = body[:insert_at] + [import_stmt] + following
 
     return module.with_changes(body=new_body)
+
+
+def _from_module(module: cst.Module, node: cst.ImportFrom) -> str:
+    """Return the module a from-import names, with its leading dots."""
+    target = module.code_for_node(node.module) if node.module is not None else ""
+    return "." * len(node.relative) + target
+
+
+def _is_import(stmt: cst.BaseStatement) -> bool:
+    """Check if a module-level statement is an import."""
+    return isinstance(stmt, cst.SimpleStatementLine) and all(
+        isinstance(item, (cst.Import, cst.ImportFrom)) for item in stmt.body
+    )
+
+
+def _is_docstring_or_future_import(stmt: cst.BaseStatement, position: int) -> bool:
+    """Check if a module-level statement must stay ahead of inserted imports."""
+    if not isinstance(stmt, cst.SimpleStatementLine) or len(stmt.body) != 1:
+        return False
+    item = stmt.body[0]
+    if position == 0 and isinstance(item, cst.Expr) and isinstance(item.value, cst.SimpleString):
+        return True
+    return (
+        isinstance(item, cst.ImportFrom)
+        and isinstance(item.module, cst.Name)
+        and item.module.value == "__future__"
+    )
@@ -0,0 +1,296 @@
+"""Rewriting instantiations of a class into calls of a factory function.
+
+Once a class has a factory function next to it, every ``Class(...)`` in other
+modules should call the factory instead. A module can refer to the class in
+several ways, all resolved against the module's imports with ScopeService:
+
+- ``from billing.models import Employee`` (or a relative import of the same
+  module), possibly with ``as Emp``: ``Emp(...)`` becomes ``create_employee(...)``
+  and the factory is imported from the same module, replacing the class in the
+  import when nothing else uses it
+- ``import billing.models`` or ``import billing.models as models``:
+  ``models.Employee(...)`` becomes ``models.create_employee(...)``
+- ``from billing import models`` (or ``from . import models``):
+  ``models.Employee(...)`` becomes ``models.create_employee(...)`` too
+
+Names that shadow the import (a parameter called ``Employee``) are left alone,
+as are references that are not calls (``isinstance(x, Employee)``, subclassing).
+
+Candidate files are independent, so rewrite_instantiations_in_files
+transforms them in a process pool when there are many of them. Each file is
+parsed once.
+
+Usage:
+    spec = FactoryReplacement("Employee", "billing.models", "create_employee")
+    results = rewrite_instantiations_in_files(files, spec, graph)  # {path: new code or None}
+"""
+
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable
+
+import libcst as cst
+
+from molting.core.import_graph import ImportGraph
+from molting.core.parallel import map_files
+from molting.core.profiling import phase
+from molting.core.scope_service import ScopeService
+
+
+@dataclass(frozen=True)
+class FactoryReplacement:
+    """A class whose instantiations are replaced by a factory function.
+
+    Attributes:
+        class_name: Name of the class
+        module_name: Dotted name of the module defining the class and the factory
+        factory_name: Name of the factory function
+    """
+
+    class_name: str
+    module_name: str
+    factory_name: str
+
+
+def rewrite_instantiations(
+    module: cst.Module, spec: FactoryReplacement, module_name: str, graph: ImportGraph
+) -> cst.Module:
+    """Rewrite the instantiations of a class in a module that imports it.
+
+    Args:
+        module: The module to rewrite
+        spec: The class and its factory
+        module_name: Dotted name of the module being rewritten
+        graph: Import graph of the project, to resolve relative imports
+
+    Returns:
+        The rewritten module
+
+    Raises:
+        ValueError: If the module binds the factory's name to something else
+    """
+    if spec.class_name not in module.code:
+        return module
+    class_imports, module_references = _import_bindings(module, spec, module_name, graph)
+    if not class_imports and not module_references:
+        return module
+
+    scopes = ScopeService.for_module(module)
+    finder = _InstantiationFinder(spec, scopes, class_imports, module_references)
+    module.visit(finder)
+    if not finder.calls:
+        return module
+
+    add_to = None
+    if finder.used_imports:
+        factory_bindings = scopes.module_bindings(spec.factory_name)
+        for binding in factory_bindings:
+            if not _imports_factory(binding.node, spec, module_name, graph):
+                raise ValueError(
+                    f"Cannot import '{spec.factory_name}' into {module_name}: "
+                    "the name is already used"
+                )
+        if not factory_bindings:
+            add_to = next(node for node in class_imports.values() if node in finder.used_imports)
+    unused = {
+        node
+        for local, node in class_imports.items()
+        if node in finder.used_imports
+        and all(
+            access.node in finder.callee_names
+            for binding in scopes.module_bindings(local)
+            if binding.node is node
+            for access in binding.references
+        )
+    }
+    return module.visit(_FactoryTransformer(spec, finder.calls, add_to, unused))
+
+
+def rewrite_instantiations_in_files(
+    files: Iterable[Path],
+    spec: FactoryReplacement,
+    graph: ImportGraph,
+    executor: Executor | None = None,
+    max_workers: int | None = None,
+) -> dict[Path, str | None]:
+    """Rewrite the instantiations of a class in several files.
+
+    Files are read but not written.
+
+    Args:
+        files: Files to rewrite
+        spec: The class and its factory
+        graph: Import graph of the project the files belong to
+        executor: Executor to transform files on; a process pool is created
+            for many files and few files are transformed in-process if None
+        max_workers: Worker count for the process pool created when executor is None
+
+    Returns:
+        File -> new code, or None if unchanged
+    """
+    files = list(files)
+    results = map_files(
+        _rewrite_file, files, spec, graph, executor=executor, max_workers=max_workers
+    )
+    return dict(zip(files, results))
+
+
+def _rewrite_file(file_path: Path, spec: FactoryReplacement, graph: ImportGraph) -> str | None:
+    """Rewrite the instantiations of a class in one file (runs in worker processes)."""
+    with phase("parse"):
+        source = file_path.read_text()
+        module = cst.parse_module(source)
+    with phase("transform"):
+        new_code = rewrite_instantiations(module, spec, graph.module_name(file_path), graph).code
+    return new_code if new_code != source else None
+
+
+def _imports_factory(
+    node: cst.CSTNode, spec: FactoryReplacement, module_name: str, graph: ImportGraph
+) -> bool:
+    """Return whether a binding node is an import of the factory from its module."""
+    if not isinstance(node, cst.ImportFrom) or isinstance(node.names, cst.ImportStar):
+        return False
+    target = cst.Module([]).code_for_node(node.module) if node.module is not None else None
+    if graph.resolve_relative(module_name, len(node.relative), target) != spec.module_name:
+        return False
+    return any(
+        alias.evaluated_name == spec.factory_name and alias.asname is None for alias in node.names
+    )
+
+
+def _import_bindings(
+    module: cst.Module, spec: FactoryReplacement, module_name: str, graph: ImportGraph
+) -> tuple[dict[str, cst.ImportFrom], dict[str, cst.Import | cst.ImportFrom]]:
+    """Find the module-level imports of the class and of its module.
+
+    Returns:
+        Local name of the class -> its ``from`` import, and dotted reference
+        to the class's module (``models`` or ``billing.models``) -> its
+        ``import`` or ``from`` import
+    """
+    class_imports: dict[str, cst.ImportFrom] = {}
+    module_references: dict[str, cst.Import | cst.ImportFrom] = {}
+    for statement in module.body:
+        if not isinstance(statement, cst.SimpleStatementLine):
+            continue
+        for node in statement.body:
+            if isinstance(node, cst.ImportFrom) and not isinstance(node.names, cst.ImportStar):
+                target = (
+                    cst.Module([]).code_for_node(node.module) if node.module is not None else None
+                )
+                imported = graph.resolve_relative(module_name, len(node.relative), target)
+                for alias in node.names:
+                    local = alias.evaluated_alias or alias.evaluated_name
+                    if imported == spec.module_name and alias.evaluated_name == spec.class_name:
+                        class_imports[local] = node
+                    elif f"{imported}.{alias.evaluated_name}" == spec.module_name:
+                        module_references[local] = node
+            elif isinstance(node, cst.Import):
+                for alias in node.names:
+                    if alias.evaluated_name == spec.module_name:
+                        module_references[alias.evaluated_alias or spec.module_name] = node
+    return class_imports, module_references
+
+
+class _InstantiationFinder(cst.CSTVisitor):
+    """Finds the calls of a class that resolve to its imports."""
+
+    def __init__(
+        self,
+        spec: FactoryReplacement,
+        scopes: ScopeService,
+        class_imports: dict[str, cst.ImportFrom],
+        module_references: dict[str, cst.Import | cst.ImportFrom],
+    ) -> None:
+        """Initialize the finder.
+
+        Args:
+            spec: The class and its factory
+            scopes: Scope analysis of the module being rewritten
+            class_imports: Local name of the class -> its import
+            module_references: Dotted reference to the class's module -> its import
+        """
+        self.spec = spec
+        self.scopes = scopes
+        self.class_imports = class_imports
+        self.module_references = module_references
+        # Calls to rewrite
+        self.calls: set[cst.Call] = set()
+        # Imports of the class whose binding is called
+        self.used_imports: set[cst.ImportFrom] = set()
+        # Callee names of the calls that use those bindings
+        self.callee_names: set[cst.CSTNode] = set()
+
+    def visit_Call(self, node: cst.Call) -> None:  # noqa: N802
+        """Record ``Class(...)`` and ``module.Class(...)`` calls."""
+        callee = node.func
+        if isinstance(callee, cst.Name):
+            import_node = self.class_imports.get(callee.value)
+            if import_node is not None and import_node in self.scopes.binding_nodes(callee):
+                self.calls.add(node)
+                self.used_imports.add(import_node)
+                self.callee_names.add(callee)
+        elif isinstance(callee, cst.Attribute) and callee.attr.value == self.spec.class_name:
+            module_import = self.module_references.get(cst.Module([]).code_for_node(callee.value))
+            reference = callee.value
+            if (
+                module_import is not None
+                and isinstance(reference, (cst.Name, cst.Attribute))
+                and module_import in self.scopes.binding_nodes(reference)
+            ):
+                self.calls.add(node)
+
+
+class _FactoryTransformer(cst.CSTTransformer):
+    """Calls the factory instead of the class and imports it."""
+
+    def __init__(
+        self,
+        spec: FactoryReplacement,
+        calls: set[cst.Call],
+        add_to: cst.ImportFrom | None,
+        unused: set[cst.ImportFrom],
+    ) -> None:
+        """Initialize the transformer.
+
+        Args:
+            spec: The class and its factory
+            calls: Calls of the class to rewrite
+            add_to: Import of the class the factory is added to, if it must be imported
+            unused: Imports of the class whose binding is no longer used
+        """
+        self.spec = spec
+        self.calls = calls
+        self.add_to = add_to
+        self.unused = unused
+
+    def leave_Call(self, original_node: cst.Call, updated_node: cst.Call) -> cst.Call:  # noqa: N802
+        """Replace ``Class(...)`` with ``factory(...)`` and ``module.Class(...)`` likewise."""
+        if original_node not in self.calls:
+            return updated_node
+        callee = updated_node.func
+        if isinstance(callee, cst.Attribute):
+            return updated_node.with_changes(
+                func=callee.with_changes(attr=cst.Name(self.spec.factory_name))
+            )
+        return updated_node.with_changes(func=cst.Name(self.spec.factory_name))
+
+    def leave_ImportFrom(  # noqa: N802
+        self, original_node: cst.ImportFrom, updated_node: cst.ImportFrom
+    ) -> cst.ImportFrom | cst.RemovalSentinel:
+        """Import the factory; drop class aliases that are no longer used."""
+        if isinstance(updated_node.names, cst.ImportStar):
+            return updated_node
+        if original_node is not self.add_to and original_node not in self.unused:
+            return updated_node
+        names = list(updated_node.names)
+        if original_node in self.unused:
+            names = [alias for alias in names if alias.evaluated_name != self.spec.class_name]
+        if original_node is self.add_to:
+            names.append(cst.ImportAlias(name=cst.Name(self.spec.factory_name)))
+        if not names:
+            return cst.RemoveFromParent()
+        names[-1] = names[-1].with_changes(comma=cst.MaybeSentinel.DEFAULT)
+        return updated_node.with_changes(names=names)
@@ -0,0 +1,243 @@
+"""Line-interval index for line-targeted refactorings.
+
+Many commands take targets such as ``Class::method#L3-L7`` and then need the
+statements or expressions on those lines. Instead of a dedicated metadata
+traversal per command, LineIndex resolves positions once per module and maps
+line ranges to nodes, so lookups are direct and repeated line-targeted
+operations on the same source reuse the index.
+
+Usage:
+    index = get_line_index(source_code)
+    function = index.find_function("Order", "print_owing")
+    statement = index.enclosing_statement(9, 12)
+    modified = index.wrapper.visit(transformer)
+"""
+
+from dataclasses import dataclass
+
+import libcst as cst
+from libcst import metadata
+
+from molting.core.caches import LRUCache
+
+# Recently indexed sources, reused by get_line_index()
+_cache: "LRUCache[str, LineIndex]" = LRUCache()
+
+
+@dataclass(frozen=True)
+class IndexedStatement:
+    """A statement together with its line interval and enclosing statement.
+
+    Attributes:
+        node: The statement node
+        start_line: First line of the statement (1-indexed)
+        end_line: Last line of the statement (1-indexed, inclusive)
+        parent: Index of the smallest enclosing statement in LineIndex.statements,
+            or None for module-level statements
+    """
+
+    node: cst.BaseStatement
+    start_line: int
+    end_line: int
+    parent: int | None
+
+
+class LineIndex:
+    """Maps line ranges of a module to its statements, expressions and functions.
+
+    The index owns a MetadataWrapper whose module is the tree all returned nodes
+    belong to. Transformers that must see those exact nodes should be run with
+    ``index.wrapper.visit(...)``.
+    """
+
+    def __init__(self, wrapper: metadata.MetadataWrapper) -> None:
+        """Build the index with a single traversal of the wrapper's module.
+
+        Args:
+            wrapper: Metadata wrapper for the module to index
+        """
+        self.wrapper = wrapper
+        self.module = wrapper.module
+        self.statements: list[IndexedStatement] = []
+        self._positions = wrapper.resolve(metadata.PositionProvider)
+        # Innermost statement covering each line, as an index into self.statements
+        self._innermost: dict[int, int] = {}
+        # Expressions keyed by start line, in post-order (inner expressions first)
+        self._expressions: dict[int, list[cst.BaseExpression]] = {}
+        # Functions keyed by (class_or_function_name, method_name), as in target specs
+        self._functions: dict[tuple[str, str], cst.FunctionDef] = {}
+        self._functions_by_name: dict[str, list[cst.FunctionDef]] = {}
+
+        self.module.visit(_LineIndexBuilder(self))
+
+    def lines(self, node: cst.CSTNode) -> tuple[int, int]:
+        """Return the (start_line, end_line) interval of an indexed node."""
+        position = self._positions[node]
+        return (position.start.line, position.end.line)
+
+    def position(self, node: cst.CSTNode) -> metadata.CodeRange:
+        """Return the code range of a node of the indexed module."""
+        return self._positions[node]
+
+    def find_function(
+        self, class_or_function_name: str, method_name: str = ""
+    ) -> cst.FunctionDef | None:
+        """Find a function or method using the target-spec naming convention.
+
+        Args:
+            class_or_function_name: Class name, or function name for function targets
+            method_name: Method name (empty string for function-level targets)
+
+        Returns:
+            The method of that class, the module-level function of that name, or
+            the first function with that name anywhere in the module; None if absent
+        """
+        key = (class_or_function_name, method_name)
+        if key in self._functions:
+            return self._functions[key]
+        if method_name:
+            return None
+        candidates = self._functions_by_name.get(class_or_function_name)
+        return candidates[0] if candidates else None
+
+    def statement_at(self, line: int) -> cst.BaseStatement | None:
+        """Return the innermost statement covering a line."""
+        entry = self._innermost.get(line)
+        return self.statements[entry].node if entry is not None else None
+
+    def enclosing_statement(self, start_line: int, end_line: int) -> cst.BaseStatement | None:
+        """Return the smallest statement whose interval covers the whole line range."""
+        entry = self._innermost.get(start_line)
+        while entry is not None:
+            indexed = self.statements[entry]
+            if indexed.start_line <= start_line and end_line <= indexed.end_line:
+                return indexed.node
+            entry = indexed.parent
+        return None
+
+    def statements_starting_on(
+        self, line: int, within: cst.CSTNode | None = None
+    ) -> list[cst.BaseStatement]:
+        """Return statements whose first line is ``line``, outermost first.
+
+        Args:
+            line: Line number (1-indexed)
+            within: Optional node whose interval the statements must lie in
+        """
+        chain = []
+        entry = self._innermost.get(line)
+        while entry is not None:
+            indexed = self.statements[entry]
+            if indexed.start_line == line and self._is_within(indexed.node, within):
+                chain.append(indexed.node)
+            entry = indexed.parent
+        chain.reverse()
+        return chain
+
+    def expressions_starting_on(
+        self, line: int, within: cst.CSTNode | None = None
+    ) -> list[cst.BaseExpression]:
+        """Return expressions whose first line is ``line``, inner expressions first.
+
+        The order matches the order in which a visitor leaves the nodes, so the
+        last matching entry is the outermost one.
+
+        Args:
+            line: Line number (1-indexed)
+            within: Optional node whose interval the expressions must lie in
+        """
+        expressions = self._expressions.get(line, [])
+        if within is None:
+            return list(expressions)
+        return [expr for expr in expressions if self._is_within(expr, within)]
+
+    def _is_within(self, node: cst.CSTNode, container: cst.CSTNode | None) -> bool:
+        """Check whether a node's code range lies inside another node's range."""
+        if container is None:
+            return True
+        inner = self._positions[node]
+        outer = self._positions[container]
+        return (outer.start.line, outer.start.column) <= (
+            inner.start.line,
+            inner.start.column,
+        ) and (inner.end.line, inner.end.column) <= (outer.end.line, outer.end.column)
+
+
+class _LineIndexBuilder(cst.CSTVisitor):
+    """Populates a LineIndex in one traversal using already-resolved positions."""
+
+    def __init__(self, index: LineIndex) -> None:
+        """Initialize the builder.
+
+        Args:
+            index: The index to populate
+        """
+        self.index = index
+        self.statement_stack: list[int] = []
+        self.class_stack: list[str] = []
+        self.function_depth = 0
+
+    def visit_ClassDef(self, node: cst.ClassDef) -> None:  # noqa: N802
+        """Track the enclosing class for method keys."""
+        self.class_stack.append(node.name.value)
+
+    def leave_ClassDef(self, original_node: cst.ClassDef) -> None:  # noqa: N802
+        """Leave the class scope."""
+        self.class_stack.pop()
+
+    def visit_FunctionDef(self, node: cst.FunctionDef) -> None:  # noqa: N802
+        """Register functions under their target-spec key."""
+        name = node.name.value
+        self.index._functions_by_name.setdefault(name, []).append(node)
+        if self.function_depth == 0:
+            if self.class_stack:
+                self.index._functions.setdefault((self.class_stack[-1], name), node)
+            else:
+                self.index._functions.setdefault((name, ""), node)
+        self.function_depth += 1
+
+    def leave_FunctionDef(self, original_node: cst.FunctionDef) -> None:  # noqa: N802
+        """Leave the function scope."""
+        self.function_depth -= 1
+
+    def on_visit(self, node: cst.CSTNode) -> bool:
+        """Record statement intervals, innermost statement winning per line."""
+        if isinstance(node, cst.BaseStatement):
+            start_line, end_line = self.index.lines(node)
+            parent = self.statement_stack[-1] if self.statement_stack else None
+            entry = len(self.index.statements)
+            self.index.statements.append(IndexedStatement(node, start_line, end_line, parent))
+            for line in range(start_line, end_line + 1):
+                self.index._innermost[line] = entry
+            self.statement_stack.append(entry)
+        return super().on_visit(node)
+
+    def on_leave(self, original_node: cst.CSTNode) -> None:
+        """Record expressions in post-order and pop statements."""
+        super().on_leave(original_node)
+        if isinstance(original_node, cst.BaseStatement):
+            self.statement_stack.pop()
+        elif isinstance(original_node, cst.BaseExpression):
+            start_line = self.index.position(original_node).start.line
+            self.index._expressions.setdefault(start_line, []).append(original_node)
+
+
+def get_line_index(source_code: str) -> LineIndex:
+    """Return a line index for a source text, reusing it for identical sources.
+
+    Commands that target lines of the same unchanged file (for example several
+    operations in one batch) share one parse and one position traversal.
+
+    Args:
+        source_code: Python source code to index
+
+    Returns:
+        The LineIndex for the parsed source
+    """
+    index = _cache.get(source_code)
+    if index is not None:
+        return index
+
+    index = LineIndex(metadata.MetadataWrapper(cst.parse_module(source_code)))
+    _cache.put(source_code, index)
+    return index
@@ -5,8 +5,39 @@ vs passed as parameters, enabling proper parameter passing when extracting code
 that uses local variables.
 """
 
+from pathlib import Path
+
 import libcst as cst
 
+from molting.core.analysis_cache import get_analysis_cache
+from molting.core.scope_service import ScopeService
+
+
+def get_local_variables(
+    function: cst.FunctionDef, class_name: str = "", file_path: Path | None = None
+) -> list[str]:
+    """Get the local variables of a function node, reusing results for unchanged functions.
+
+    Args:
+        function: The function definition to analyze
+        class_name: Name of the containing class (empty string for module-level functions)
+        file_path: File containing the function, used to key cached analysis
+
+    Returns:
+        List of unique local variable names (not including parameters)
+    """
+    function_name = function.name.value
+    qualified_name = f"{class_name}.{function_name}" if class_name else function_name
+
+    def analyze() -> tuple[str, ...]:
+        module = cst.Module(body=[function])
+        return tuple(LocalVariableAnalyzer(module, "", function_name).get_local_variables())
+
+    local_variables = get_analysis_cache().get_or_compute(
+        "local_variables", file_path, qualified_name, function, analyze
+    )
+    return list(local_variables)
+
 
 class LocalVariableAnalyzer(cst.CSTVisitor):
     """Analyzes local variables and their usage within a function.
@@ -80,22 +111,20 @@ class LocalVariableAnalyzer(cst.CSTVisitor):
             end_line: End line number (1-indexed)
 
         Returns:
-            List of unique variable names used in that range
+            List of unique variable names read or assigned in that range
         """
-        # Collect variables from the code within the range
-        visitor = VariableUsageCollector()
-
-        # Parse the function to understand line positions
         if not self._target_function_node:
             self.module.visit(self)
+        if self._target_function_node is None:
+            return []
 
-        # Visit statements in the target function and collect those in range
-        if self._target_function_node and self._target_function_node.body.body:
-            for stmt in self._target_function_node.body.body:
-                # This is a simplified approach - collect all used variables
-                stmt.visit(visitor)
-
-        return visitor.used_variables
+        scopes = ScopeService.for_module(self.module)
+        scope = scopes.function_scope(self._target_function_node)
+        used = scopes.reads_in_region(scope, start_line, end_line)
+        for name in scopes.assignments_in_region(scope, start_line, end_line):
+            if name not in used:
+                used.append(name)
+        return [name for name in used if name not in ("self", "cls")]
 
     def visit_ClassDef(self, node: cst.ClassDef) -> bool:  # noqa: N802
         """Track entry into target class."""
@@ -218,47 +247,3 @@ class LocalVariableAnalyzer(cst.CSTVisitor):
         elif isinstance(target, cst.Subscript):
             # Skip subscript assignments like x[0] = ...
             pass
-
-
-class VariableUsageCollector(cst.CSTVisitor):
-    """Collector for all variable references in code."""
-
-    def __init__(self) -> None:
-        """Initialize the collector."""
-        self.used_variables: list[str] = []
-
-    def visit_Name(self, node: cst.Name) -> bool:  # noqa: N802
-        """Collect variable names used in expressions."""
-        var_name = node.value
-        # Skip Python keywords and builtins
-        if var_name not in self.used_variables and not self._is_builtin(var_name):
-            self.used_variables.append(var_name)
-        return True
-
-    def visit_Attribute(self, node: cst.Attribute) -> bool:  # noqa: N802
-        """Skip processing of attribute accesses to focus on base variables."""
-        # We don't want to collect attribute names, just the base object
-        return True
-
-    @staticmethod
-    def _is_builtin(name: str) -> bool:
-        """Check if a name is a Python builtin or keyword.
-
-        Args:
-            name: Variable name to check
-
-        Returns:
-            True if it's a builtin/keyword, False otherwise
-        """
-        builtins = {
-            "True",
-            "False",
-            "None",
-            "self",
-            "cls",
-            "Exception",
-            "ValueError",
-            "TypeError",
-            "AttributeError",
-        }
-        return name in builtins
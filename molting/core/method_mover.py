@@ -0,0 +1,318 @@
+"""Support for moving a method to a class in another module.
+
+Moving a method across modules needs two things besides the move itself:
+
+- the names the method reads from its module (imports, classes, constants)
+  must be imported by the destination module, without introducing an import
+  cycle (carry_imports)
+- calls of the method may be rewritten to call it on the destination
+  instance, ``obj.method(x)`` becoming ``obj.field.method(obj.a, x)``, so the
+  delegating stub left in the source class can be dropped (rewrite_callers)
+
+A call is rewritten when its receiver resolves (through ScopeService) to the
+source class or one of its subclasses. When the receiver cannot be resolved,
+it is rewritten only if no other class defines a method of that name.
+Accesses that cannot be rewritten (``super()`` receivers, receivers that are
+not plain references when fields must be passed, method references that are
+not called) are counted as skipped.
+
+Candidate files are independent, so rewrite_callers_in_files transforms them
+in a process pool when there are many of them. Each file is parsed once.
+
+Usage:
+    spec = MovedMethod("overdraft_charge", frozenset({"Account"}), "account_type", ("days",))
+    results = rewrite_callers_in_files(files, spec)  # {path: (new code or None, skipped)}
+"""
+
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable
+
+import libcst as cst
+from libcst.metadata import Assignment
+
+from molting.core.import_graph import ImportGraph
+from molting.core.import_utils import (
+    ensure_import,
+    ensure_module_import,
+    import_from,
+    insert_import,
+)
+from molting.core.parallel import map_files
+from molting.core.profiling import phase
+from molting.core.scope_service import ScopeService
+
+# Where an imported name comes from: ("import", dotted module, alias) or
+# ("from", absolute module, original name, alias); the module of an origin to
+# write may be relative (".helpers")
+_Origin = tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class MovedMethod:
+    """How calls of a moved method are rewritten.
+
+    Attributes:
+        method_name: Name of the moved method
+        classes: The source class and its subclasses
+        field: Field of the source class holding the destination instance
+        fields: Source class fields passed as leading arguments to the moved method
+        rewrite_unresolved: Whether calls on receivers of unknown class are
+            rewritten (true when no other class defines a method of that name)
+    """
+
+    method_name: str
+    classes: frozenset[str]
+    field: str
+    fields: tuple[str, ...] = ()
+    rewrite_unresolved: bool = True
+
+
+def rewrite_callers(module: cst.Module, spec: MovedMethod) -> tuple[cst.Module, int]:
+    """Rewrite the calls of a moved method in a module.
+
+    Args:
+        module: The module to rewrite
+        spec: The moved method
+
+    Returns:
+        The rewritten module and the number of accesses that were not rewritten
+    """
+    if spec.method_name not in module.code:
+        return module, 0
+    rewriter = _CallerRewriter(spec, ScopeService.for_module(module))
+    return module.visit(rewriter), rewriter.skipped
+
+
+def rewrite_callers_in_files(
+    files: Iterable[Path],
+    spec: MovedMethod,
+    executor: Executor | None = None,
+    max_workers: int | None = None,
+) -> dict[Path, tuple[str | None, int]]:
+    """Rewrite the calls of a moved method in several files.
+
+    Files are read but not written.
+
+    Args:
+        files: Files to rewrite
+        spec: The moved method
+        executor: Executor to transform files on; a process pool is created
+            for many files and few files are transformed in-process if None
+        max_workers: Worker count for the process pool created when executor is None
+
+    Returns:
+        File -> (new code, or None if unchanged; number of skipped accesses)
+    """
+    files = list(files)
+    results = map_files(_rewrite_file, files, spec, executor=executor, max_workers=max_workers)
+    return dict(zip(files, results))
+
+
+def _rewrite_file(file_path: Path, spec: MovedMethod) -> tuple[str | None, int]:
+    """Rewrite the calls of a moved method in one file (runs in worker processes)."""
+    with phase("parse"):
+        source = file_path.read_text()
+        module = cst.parse_module(source)
+    with phase("transform"):
+        new_module, skipped = rewrite_callers(module, spec)
+    new_code = new_module.code
+    return (new_code if new_code != source else None, skipped)
+
+
+class _CallerRewriter(cst.CSTTransformer):
+    """Redirects calls of a moved method to the field holding its new class."""
+
+    def __init__(self, spec: MovedMethod, scopes: ScopeService) -> None:
+        """Initialize the rewriter.
+
+        Args:
+            spec: The moved method
+            scopes: Scope analysis of the module being transformed
+        """
+        self.spec = spec
+        self.scopes = scopes
+        self.skipped = 0
+        # Attribute nodes that are the callee of a call
+        self._callees: set[cst.CSTNode] = set()
+
+    def visit_Call(self, node: cst.Call) -> None:  # noqa: N802
+        """Remember the callee so leave_Attribute does not count it as a bare reference."""
+        self._callees.add(node.func)
+
+    def leave_Call(self, original_node: cst.Call, updated_node: cst.Call) -> cst.Call:  # noqa: N802
+        """Rewrite ``obj.method(args)`` to ``obj.field.method(obj.a, ..., args)``."""
+        callee = original_node.func
+        if not isinstance(callee, cst.Attribute) or not self._is_moved(callee):
+            return updated_node
+        assert isinstance(updated_node.func, cst.Attribute)
+        receiver = updated_node.func.value
+        if _is_super_call(receiver) or (self.spec.fields and not _is_reference(receiver)):
+            self.skipped += 1
+            return updated_node
+
+        field_args = [
+            cst.Arg(value=cst.Attribute(value=receiver, attr=cst.Name(name)))
+            for name in self.spec.fields
+        ]
+        new_callee = cst.Attribute(
+            value=cst.Attribute(value=receiver, attr=cst.Name(self.spec.field)),
+            attr=cst.Name(self.spec.method_name),
+        )
+        return updated_node.with_changes(func=new_callee, args=[*field_args, *updated_node.args])
+
+    def leave_Attribute(  # noqa: N802
+        self, original_node: cst.Attribute, updated_node: cst.Attribute
+    ) -> cst.Attribute:
+        """Count references to the moved method that are not calls."""
+        if original_node not in self._callees and self._is_moved(original_node):
+            self.skipped += 1
+        return updated_node
+
+    def _is_moved(self, attribute: cst.Attribute) -> bool:
+        """Return whether an access refers to the moved method."""
+        if attribute.attr.value != self.spec.method_name:
+            return False
+        class_name = self.scopes.attribute_class(attribute)
+        if class_name is None:
+            return self.spec.rewrite_unresolved
+        return class_name in self.spec.classes
+
+
+def _is_super_call(node: cst.BaseExpression) -> bool:
+    """Return whether an expression is a ``super()`` call."""
+    return (
+        isinstance(node, cst.Call)
+        and isinstance(node.func, cst.Name)
+        and node.func.value == "super"
+    )
+
+
+def _is_reference(node: cst.BaseExpression) -> bool:
+    """Return whether an expression is a name or a chain of attributes on a name."""
+    while isinstance(node, cst.Attribute):
+        node = node.value
+    return isinstance(node, cst.Name)
+
+
+def carry_imports(
+    names: dict[str, list[Assignment]],
+    source_path: Path,
+    destination: cst.Module,
+    destination_path: Path,
+    graph: ImportGraph,
+) -> tuple[cst.Module, list[cst.SimpleStatementLine]]:
+    """Import into a destination module the module-level names a moved method reads.
+
+    Imported names are imported the same way. A relative import stays
+    relative, re-expressed from the destination (``from .helpers import x``),
+    when both modules are in the same top-level package, and is made absolute
+    otherwise. Names defined in the source module are imported from it, the
+    same way (``from .account import RATE``). An
+    import that would close an import cycle is returned as a function-local
+    import instead of being added to the destination.
+
+    Args:
+        names: Module-level names the method reads and their bindings in the
+            source module (see ScopeService.global_reads)
+        source_path: File the method is moved from
+        destination: Module the method is moved to
+        destination_path: File of the destination module
+        graph: Import graph of the project
+
+    Returns:
+        The destination with the new imports, and the statements to put at the
+        top of the moved method's body
+
+    Raises:
+        ValueError: If a name cannot be imported (star import) or the
+            destination binds it to something else
+    """
+    source_name = graph.module_name(source_path)
+    destination_name = graph.module_name(destination_path)
+    destination_scopes = ScopeService.for_module(destination)
+
+    module_level: list[_Origin] = []
+    local: list[_Origin] = []
+    for name, bindings in names.items():
+        origin = _origin(bindings[0], source_name, graph)
+        existing = destination_scopes.module_bindings(name)
+        if existing:
+            if any(_origin(binding, destination_name, graph) == origin for binding in existing):
+                continue
+            raise ValueError(
+                f"'{name}' is used by the moved method but means something else "
+                f"in {destination_path.name}"
+            )
+        imported_module = origin[1]
+        written = origin
+        if _is_relative(bindings[0]) or imported_module == source_name:
+            written = (origin[0], graph.relative_name(destination_name, origin[1]), *origin[2:])
+        if imported_module == destination_name or graph.reaches(imported_module, destination_name):
+            local.append(written)
+        else:
+            module_level.append(written)
+
+    for origin in reversed(module_level):
+        destination = _ensure_origin_import(destination, origin)
+    return destination, [_import_statement(origin) for origin in local]
+
+
+def _origin(assignment: Assignment, module_name: str, graph: ImportGraph) -> _Origin:
+    """Return where a module-level binding of a module comes from."""
+    node = assignment.node
+    name = assignment.name
+    if isinstance(node, cst.Import):
+        for alias in node.names:
+            if alias.evaluated_alias == name:
+                return ("import", alias.evaluated_name, name)
+            if alias.asname is None and name in (
+                alias.evaluated_name,
+                alias.evaluated_name.split(".")[0],
+            ):
+                return ("import", alias.evaluated_name, "")
+    if isinstance(node, cst.ImportFrom):
+        if isinstance(node.names, cst.ImportStar):
+            raise ValueError(f"Cannot import '{name}': it comes from a star import")
+        target = cst.Module([]).code_for_node(node.module) if node.module is not None else None
+        absolute = graph.resolve_relative(module_name, len(node.relative), target)
+        for alias in node.names:
+            if alias.evaluated_alias == name:
+                return ("from", absolute, alias.evaluated_name, name)
+            if alias.asname is None and alias.evaluated_name == name:
+                return ("from", absolute, name, "")
+    return ("from", module_name, name, "")
+
+
+def _is_relative(assignment: Assignment) -> bool:
+    """Return whether a binding comes from a relative ``from`` import."""
+    return isinstance(assignment.node, cst.ImportFrom) and bool(assignment.node.relative)
+
+
+def _import_statement(origin: _Origin) -> cst.SimpleStatementLine:
+    """Build the import statement for a binding origin."""
+    if origin[0] == "import":
+        _, module_name, alias = origin
+        dotted = cst.parse_expression(module_name)
+        assert isinstance(dotted, (cst.Name, cst.Attribute))
+        return cst.SimpleStatementLine(body=[cst.Import(names=[_alias(dotted, alias)])])
+    _, module_name, name, alias = origin
+    return cst.SimpleStatementLine(body=[import_from(module_name, [_alias(cst.Name(name), alias)])])
+
+
+def _alias(name: cst.Name | cst.Attribute, alias: str) -> cst.ImportAlias:
+    """Build an import alias, with ``as alias`` if alias is not empty."""
+    if not alias:
+        return cst.ImportAlias(name=name)
+    return cst.ImportAlias(name=name, asname=cst.AsName(name=cst.Name(alias)))
+
+
+def _ensure_origin_import(module: cst.Module, origin: _Origin) -> cst.Module:
+    """Add the module-level import of a binding origin to a module."""
+    if origin[0] == "import":
+        return ensure_module_import(module, origin[1], origin[2] or None)
+    _, module_name, name, alias = origin
+    if not alias:
+        return ensure_import(module, module_name, [name])
+    return insert_import(module, _import_statement(origin))
@@ -0,0 +1,251 @@
+"""Hierarchy-aware renaming of methods across a project.
+
+MethodRenamer renames methods together with the overrides they share a slot
+with, and updates the accesses that refer to them. An access ``obj.name`` is
+renamed when its receiver's type (ScopeService.receiver_type) is a class of
+the renamed method's family. Receivers of any other type, including builtins
+(``settings: dict``, ``{}``) and imported third-party classes, are left alone.
+
+Receivers whose type cannot be inferred are left alone too, unless
+include_unresolved is set: then they are renamed when no class outside the
+family defines a method of that name.
+
+Any number of renames are applied together: each candidate file is searched
+for all old names, parsed once and transformed once.
+
+A rename map lists one rename per line, ``Class::method new_name``; blank
+lines and ``#`` comments are ignored:
+
+    # API cleanup
+    Customer::get_inv_cdtlmt get_invoice_credit_limit
+    Order::calc calculate_total
+
+Usage:
+    renamer = MethodRenamer(ProjectIndex.build(root), load_rename_map(Path("renames.txt")))
+    new_module = renamer.rename_module(module)
+"""
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable
+
+import libcst as cst
+
+from molting.core.project_index import ProjectIndex
+from molting.core.scope_service import ScopeService
+
+
+@dataclass(frozen=True)
+class MethodRename:
+    """One method rename.
+
+    Attributes:
+        class_name: Class defining (or inheriting) the method
+        method_name: Current method name
+        new_name: New method name
+    """
+
+    class_name: str
+    method_name: str
+    new_name: str
+
+
+def parse_rename_map(text: str) -> list[MethodRename]:
+    """Parse a rename map.
+
+    Args:
+        text: Lines of the form ``Class::method new_name``
+
+    Returns:
+        The renames, in order
+
+    Raises:
+        ValueError: If a line is malformed
+    """
+    renames = []
+    for number, raw_line in enumerate(text.splitlines(), start=1):
+        line = raw_line.split("#", 1)[0].strip()
+        if not line:
+            continue
+        parts = line.split()
+        target_parts = parts[0].split("::")
+        if len(parts) != 2 or len(target_parts) != 2 or not all(target_parts):
+            raise ValueError(
+                f"Invalid rename on line {number}: '{raw_line.strip()}' "
+                "(expected 'Class::method new_name')"
+            )
+        if not parts[1].isidentifier():
+            raise ValueError(f"Invalid method name on line {number}: '{parts[1]}'")
+        renames.append(MethodRename(target_parts[0], target_parts[1], parts[1]))
+    return renames
+
+
+def load_rename_map(path: Path) -> list[MethodRename]:
+    """Read and parse a rename map file.
+
+    Args:
+        path: Path to the rename map
+
+    Returns:
+        The renames, in order
+
+    Raises:
+        ValueError: If the file cannot be read or a line is malformed
+    """
+    try:
+        text = path.read_text()
+    except OSError as e:
+        raise ValueError(f"Cannot read rename map {path}: {e}") from e
+    return parse_rename_map(text)
+
+
+class MethodRenamer:
+    """Applies a set of method renames, resolved against a project index."""
+
+    def __init__(
+        self,
+        index: ProjectIndex,
+        renames: Iterable[MethodRename],
+        include_unresolved: bool = False,
+    ) -> None:
+        """Resolve each rename's method family.
+
+        Args:
+            index: Index of the project's classes
+            renames: The renames to apply
+            include_unresolved: Also rename accesses on receivers of unknown
+                type when the method name is unambiguous in the project
+
+        Raises:
+            ValueError: If a method is not found, or two renames give the same
+                method different new names
+        """
+        # Old name -> (family, new name) for each rename of a method with that name
+        self._families: dict[str, list[tuple[set[str], str]]] = {}
+        # Old names also defined by classes outside every renamed family
+        self._ambiguous: set[str] = set()
+        self.include_unresolved = include_unresolved
+
+        for rename in renames:
+            family = index.method_family(rename.class_name, rename.method_name)
+            entries = self._families.setdefault(rename.method_name, [])
+            for other_family, other_name in entries:
+                if other_family & family and other_name != rename.new_name:
+                    raise ValueError(
+                        f"Conflicting renames for '{rename.class_name}::{rename.method_name}': "
+                        f"'{other_name}' and '{rename.new_name}'"
+                    )
+            if not any(other_family == family for other_family, _ in entries):
+                entries.append((family, rename.new_name))
+
+        for method_name, entries in self._families.items():
+            covered = set().union(*(family for family, _ in entries))
+            if index.classes_defining(method_name) - covered:
+                self._ambiguous.add(method_name)
+
+    @property
+    def old_names(self) -> list[str]:
+        """Names of the methods being renamed."""
+        return list(self._families)
+
+    def new_name_for(self, class_name: str | None, method_name: str) -> str | None:
+        """Return the new name of a method accessed on a class.
+
+        Args:
+            class_name: Type of the access's receiver, or None if unknown
+            method_name: Name being accessed
+
+        Returns:
+            The new name, or None if the access is not renamed
+        """
+        entries = self._families.get(method_name, [])
+        if class_name is None:
+            if self.include_unresolved and len(entries) == 1 and method_name not in self._ambiguous:
+                return entries[0][1]
+            return None
+        for family, new_name in entries:
+            if class_name in family:
+                return new_name
+        return None
+
+    def rename_module(self, module: cst.Module) -> cst.Module:
+        """Rename the methods defined and accessed in a module.
+
+        Args:
+            module: The module to rename in
+
+        Returns:
+            The module with definitions and accesses renamed
+        """
+        if not any(name in module.code for name in self._families):
+            return module
+        return module.visit(_MethodRenameTransformer(self, ScopeService.for_module(module)))
+
+
+class _MethodRenameTransformer(cst.CSTTransformer):
+    """Renames method definitions and the attribute accesses that refer to them."""
+
+    def __init__(self, renamer: MethodRenamer, scopes: ScopeService) -> None:
+        """Initialize the transformer.
+
+        Args:
+            renamer: Decides the new name of each definition and access
+            scopes: Scope analysis of the module being transformed
+        """
+        self.renamer = renamer
+        self.scopes = scopes
+        self.old_names = set(renamer.old_names)
+        # Enclosing class name, or None for a function, innermost last
+        self.enclosing: list[str | None] = []
+
+    def visit_ClassDef(self, node: cst.ClassDef) -> None:  # noqa: N802
+        """Enter a class."""
+        self.enclosing.append(node.name.value)
+
+    def leave_ClassDef(  # noqa: N802
+        self, original_node: cst.ClassDef, updated_node: cst.ClassDef
+    ) -> cst.ClassDef:
+        """Leave a class."""
+        self.enclosing.pop()
+        return updated_node
+
+    def visit_FunctionDef(self, node: cst.FunctionDef) -> None:  # noqa: N802
+        """Enter a function."""
+        self.enclosing.append(None)
+
+    def leave_FunctionDef(  # noqa: N802
+        self, original_node: cst.FunctionDef, updated_node: cst.FunctionDef
+    ) -> cst.FunctionDef:
+        """Rename a method of a renamed family."""
+        self.enclosing.pop()
+        class_name = self.enclosing[-1] if self.enclosing else None
+        if class_name is None:
+            return updated_node
+        new_name = self.renamer.new_name_for(class_name, original_node.name.value)
+        if new_name is None:
+            return updated_node
+        return updated_node.with_changes(name=cst.Name(new_name))
+
+    def leave_Attribute(  # noqa: N802
+        self, original_node: cst.Attribute, updated_node: cst.Attribute
+    ) -> cst.Attribute:
+        """Rename an access whose receiver belongs to a renamed family."""
+        method_name = original_node.attr.value
+        if method_name not in self.old_names:
+            return updated_node
+        new_name = self.renamer.new_name_for(self._receiver_class(original_node), method_name)
+        if new_name is None:
+            return updated_node
+        return updated_node.with_changes(attr=cst.Name(new_name))
+
+    def _receiver_class(self, attribute: cst.Attribute) -> str | None:
+        """Return the type of an access's receiver; ``super()`` counts as the enclosing class."""
+        receiver = attribute.value
+        if (
+            isinstance(receiver, cst.Call)
+            and isinstance(receiver.func, cst.Name)
+            and receiver.func.value == "super"
+        ):
+            classes = [name for name in self.enclosing if name is not None]
+            return classes[-1] if classes else None
+        return self.scopes.receiver_type(attribute)
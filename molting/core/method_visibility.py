@@ -0,0 +1,159 @@
+"""Finding public methods that only their own class uses.
+
+A public method can be hidden (renamed to ``_name``) when nothing outside its
+class refers to it. The decision for every method of a package comes from two
+indexes built once: ProjectIndex for the class hierarchy and
+AttributeAccessIndex for every ``obj.name`` access in the project, so checking
+thousands of methods costs one parse of each file rather than one search per
+method.
+
+A method is hidden only when:
+
+- every access to it is made on the instance of its own class inside one of
+  the class's methods (accesses of unrelated classes' own methods of the same
+  name are ignored)
+- no base class or subclass defines a method of the same name, since
+  renaming one side of an override would change behavior
+- no class of its hierarchy already defines the private name
+- its class is defined only once in the project
+
+Accesses the index cannot see, such as ``getattr(obj, "name")`` or callers
+outside the indexed directory, are not taken into account.
+
+Usage:
+    decisions = find_hideable_methods(project, accesses, ["Account"])
+    hidden = [decision for decision in decisions if decision.hidden]
+"""
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable
+
+from molting.core.attribute_index import AttributeAccessIndex
+from molting.core.project_index import ProjectIndex
+
+
+@dataclass(frozen=True)
+class VisibilityDecision:
+    """Whether a public method is hidden, and why.
+
+    Attributes:
+        class_name: Class defining the method
+        method_name: Public name of the method
+        file_path: File the class is defined in
+        line: Line of the class definition
+        hidden: Whether the method can be renamed to its private name
+        reason: Why the method is hidden or kept public
+    """
+
+    class_name: str
+    method_name: str
+    file_path: Path
+    line: int
+    hidden: bool
+    reason: str
+
+    @property
+    def new_name(self) -> str:
+        """Private name of the method."""
+        return f"_{self.method_name}"
+
+
+def find_hideable_methods(
+    project: ProjectIndex,
+    accesses: AttributeAccessIndex,
+    class_names: Iterable[str] | None = None,
+) -> list[VisibilityDecision]:
+    """Decide, for each public method of some classes, whether it can be hidden.
+
+    Args:
+        project: Index of the project's classes
+        accesses: Index of the project's attribute accesses
+        class_names: Classes to examine; every class of the project if None
+
+    Returns:
+        One decision per public method, by class and method name
+    """
+    if class_names is None:
+        class_names = project.classes
+    decisions = []
+    for class_name in sorted(set(class_names)):
+        definitions = project.classes.get(class_name, [])
+        if len(definitions) != 1:
+            continue
+        indexed = definitions[0]
+        for method_name in sorted(indexed.methods):
+            if method_name.startswith("_"):
+                continue
+            hidden, reason = _decide(project, accesses, class_name, method_name)
+            decisions.append(
+                VisibilityDecision(
+                    class_name, method_name, indexed.file_path, indexed.line, hidden, reason
+                )
+            )
+    return decisions
+
+
+def format_report(decisions: Iterable[VisibilityDecision], root: Path) -> str:
+    """Format decisions as one line per method.
+
+    Args:
+        decisions: Decisions to report
+        root: Directory file paths are shown relative to
+
+    Returns:
+        The report, e.g. ``hidden  account.py:3  Account.describe -> _describe``
+    """
+    lines = []
+    for decision in decisions:
+        location = f"{_relative(decision.file_path, root)}:{decision.line}"
+        method = f"{decision.class_name}.{decision.method_name}"
+        if decision.hidden:
+            lines.append(
+                f"hidden  {location}  {method} -> {decision.new_name}  ({decision.reason})"
+            )
+        else:
+            lines.append(f"kept    {location}  {method}  ({decision.reason})")
+    return "".join(f"{line}\n" for line in lines)
+
+
+def _decide(
+    project: ProjectIndex, accesses: AttributeAccessIndex, class_name: str, method_name: str
+) -> tuple[bool, str]:
+    """Return whether a method can be hidden and the reason."""
+    family = project.method_family(class_name, method_name)
+    overrides = sorted(name for name in family - {class_name} if project.defines(name, method_name))
+    if overrides:
+        return False, f"shares its slot with {', '.join(overrides)}"
+
+    private_name = f"_{method_name}"
+    hierarchy = {class_name, *project.ancestors(class_name), *project.subclasses(class_name)}
+    clashes = sorted(name for name in hierarchy if project.defines(name, private_name))
+    if clashes:
+        return False, f"'{private_name}' is already defined in {', '.join(clashes)}"
+
+    external = [
+        access
+        for access in accesses.accesses(method_name)
+        if access.receiver_class != class_name
+        and not (
+            access.receiver_class is not None
+            and access.receiver_class not in hierarchy
+            and project.defines(access.receiver_class, method_name)
+        )
+    ]
+    if external:
+        first = external[0]
+        more = f" and {len(external) - 1} more" if len(external) > 1 else ""
+        return False, f"used at {first.file_path.name}:{first.line}{more}"
+    if accesses.accesses(method_name):
+        return True, "only used inside the class"
+    return True, "never referenced"
+
+
+def _relative(file_path: Path, root: Path) -> Path:
+    """Return a path relative to a root when it is under it."""
+    try:
+        return file_path.relative_to(root)
+    except ValueError:
+        return file_path
@@ -0,0 +1,95 @@
+"""Fingerprints of a module's top-level statements, for change detection.
+
+A ModuleSnapshot hashes the source of every top-level statement. Comparing the
+snapshots taken before and after a refactoring tells which top-level
+definitions the refactoring changed, so analysis derived from the unchanged
+ones can be kept.
+
+Usage:
+    before = ModuleSnapshot(module)
+    after = ModuleSnapshot(transformed_module)
+    after.changed_since(before)  # {"Order"}
+"""
+
+import hashlib
+from collections import Counter
+from dataclasses import dataclass
+
+import libcst as cst
+
+# Name reported for top-level statements that define nothing (imports, calls, ...)
+MODULE_CODE = "<module>"
+
+
+@dataclass(frozen=True)
+class TopLevelStatement:
+    """A top-level statement with the name it defines and a hash of its source.
+
+    Attributes:
+        name: Class or function name, assigned name(s), or MODULE_CODE
+        fingerprint: Hash of the statement's source, including leading comments
+        node: The statement node
+    """
+
+    name: str
+    fingerprint: str
+    node: cst.BaseStatement
+
+
+class ModuleSnapshot:
+    """The top-level statements of a module, fingerprinted."""
+
+    def __init__(self, module: cst.Module) -> None:
+        """Fingerprint every top-level statement of a module.
+
+        Args:
+            module: The module to snapshot
+        """
+        self.statements = [
+            TopLevelStatement(
+                _statement_name(statement),
+                hashlib.blake2b(
+                    module.code_for_node(statement).encode(), digest_size=16
+                ).hexdigest(),
+                statement,
+            )
+            for statement in module.body
+        ]
+
+    @property
+    def names(self) -> set[str]:
+        """Names of all top-level statements."""
+        return {statement.name for statement in self.statements}
+
+    def changed_since(self, previous: "ModuleSnapshot") -> set[str]:
+        """Return the names of top-level definitions that differ from a previous snapshot.
+
+        Args:
+            previous: Snapshot of the module before the change
+
+        Returns:
+            Names that were added, removed or whose source changed
+        """
+        before = Counter((s.name, s.fingerprint) for s in previous.statements)
+        after = Counter((s.name, s.fingerprint) for s in self.statements)
+        return {name for name, _ in (before - after) + (after - before)}
+
+
+def _statement_name(statement: cst.BaseStatement) -> str:
+    """Return the name a top-level statement defines."""
+    if isinstance(statement, (cst.ClassDef, cst.FunctionDef)):
+        return statement.name.value
+    if isinstance(statement, cst.SimpleStatementLine):
+        names: list[str] = []
+        for small in statement.body:
+            targets: list[cst.BaseExpression]
+            if isinstance(small, cst.Assign):
+                targets = [target.target for target in small.targets]
+            elif isinstance(small, (cst.AnnAssign, cst.AugAssign)):
+                targets = [small.target]
+            else:
+                continue
+            names.extend(target.value for target in targets if isinstance(target, cst.Name))
+        if names:
+            return ",".join(names)
+    return MODULE_CODE
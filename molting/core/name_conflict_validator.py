@@ -1,19 +1,19 @@
-"""Validator for detecting name conflicts when creating classes or constants.
+"""Validator for detecting name conflicts when creating new names.
 
-This module provides a utility to check if a class name or constant name
-already exists at module level before refactoring operations create them.
+This module provides a utility to check if a class, constant, method or field
+name already exists before refactoring operations create them.
 """
 
 import libcst as cst
 
-from molting.core.visitors import ClassConflictChecker, ConstantConflictChecker
+from molting.core.symbol_table import ModuleSymbolTable
 
 
 class NameConflictValidator:
-    """Validates that class and constant names don't conflict at module level.
+    """Validates that new names don't conflict with existing definitions.
 
-    This validator uses visitor patterns to detect existing classes and constants
-    in the module, preventing accidental overwriting of existing code.
+    The module's symbol table is built once, so validating several names costs a
+    single traversal, preventing accidental overwriting of existing code.
 
     Example:
         source = "class Customer: pass"
@@ -30,6 +30,7 @@ class NameConflictValidator:
         """
         self.source_code = source_code
         self.module = cst.parse_module(source_code)
+        self.symbols = ModuleSymbolTable.build(self.module)
 
     def validate_class_name(self, class_name: str) -> None:
         """Validate that a class name doesn't already exist at module level.
@@ -40,10 +41,7 @@ class NameConflictValidator:
         Raises:
             ValueError: If the class name already exists at module level
         """
-        checker = ClassConflictChecker(class_name)
-        self.module.visit(checker)
-
-        if checker.has_conflict:
+        if self.symbols.has_class(class_name):
             raise ValueError(f"Class '{class_name}' already exists in the module")
 
     def validate_constant_name(self, constant_name: str) -> None:
@@ -55,8 +53,33 @@ class NameConflictValidator:
         Raises:
             ValueError: If the constant name already exists at module level
         """
-        checker = ConstantConflictChecker(constant_name)
-        self.module.visit(checker)
-
-        if checker.has_conflict:
+        if self.symbols.has_constant(constant_name):
             raise ValueError(f"Constant '{constant_name}' already exists in the module")
+
+    def validate_method_name(self, class_name: str, method_name: str) -> None:
+        """Validate that a method doesn't already exist in a class.
+
+        Args:
+            class_name: The class to check, or empty string for module-level functions
+            method_name: The method name to validate
+
+        Raises:
+            ValueError: If the method already exists
+        """
+        if self.symbols.has_method(class_name, method_name):
+            if class_name:
+                raise ValueError(f"Method '{method_name}' already exists in class '{class_name}'")
+            raise ValueError(f"Function '{method_name}' already exists in the module")
+
+    def validate_field_name(self, class_name: str, field_name: str) -> None:
+        """Validate that a field isn't already assigned in a class's __init__.
+
+        Args:
+            class_name: The class to check
+            field_name: The field name to validate
+
+        Raises:
+            ValueError: If the field already exists
+        """
+        if self.symbols.has_field(class_name, field_name):
+            raise ValueError(f"Field '{field_name}' already exists in class '{class_name}'")
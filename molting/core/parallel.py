@@ -0,0 +1,57 @@
+"""Running a function over many files, in worker processes when it pays off.
+
+Commands that rewrite a whole package transform each candidate file on its
+own, so the files can be processed in parallel. map_files calls a per-file
+function with the same extra arguments for every file and returns the results
+in file order. Forking worker processes costs more than it saves on small
+trees, so below a threshold the files are processed in-process. Callers (and
+tests) can pass their own executor instead.
+
+The function and its arguments are sent to worker processes, so they must be
+picklable: a module-level function and plain data.
+
+Usage:
+    results = map_files(_rewrite_file, files, spec, graph)  # one result per file
+"""
+
+from concurrent.futures import Executor, ProcessPoolExecutor
+from itertools import repeat
+from pathlib import Path
+from typing import Any, Callable, Sequence, TypeVar
+
+_T = TypeVar("_T")
+
+# Minimum number of files before map_files uses a process pool
+_PARALLEL_THRESHOLD = 16
+
+# Number of files sent to a worker process at a time
+_CHUNK_SIZE = 8
+
+
+def map_files(
+    func: Callable[..., _T],
+    files: Sequence[Path],
+    *args: Any,
+    executor: Executor | None = None,
+    max_workers: int | None = None,
+) -> list[_T]:
+    """Call ``func(file, *args)`` for every file.
+
+    Args:
+        func: Function of a file and the extra arguments
+        files: Files to process
+        *args: Extra arguments, the same for every file
+        executor: Executor to run the calls on; a process pool is created for
+            many files and few files are processed in-process if None
+        max_workers: Worker count for the process pool created when executor is None
+
+    Returns:
+        The results, in the order of files
+    """
+    arguments = [files, *(repeat(arg) for arg in args)]
+    if executor is not None:
+        return list(executor.map(func, *arguments))
+    if len(files) >= _PARALLEL_THRESHOLD:
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(func, *arguments, chunksize=_CHUNK_SIZE))
+    return list(map(func, *arguments))
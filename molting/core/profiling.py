@@ -0,0 +1,428 @@
+"""Memory and CPU profiling of refactoring runs.
+
+A refactoring goes through the same phases whatever the command: searching for
+candidate files, parsing them, resolving metadata, transforming the trees and
+writing the results back. The shared helpers that run those steps (BaseCommand,
+CallSiteUpdater, ScopeService, FileTransaction) mark them with phase(), which
+costs nothing unless a MemoryProfiler is active.
+
+While a profiler is active, tracemalloc traces every allocation. Each phase
+records the peak traced memory reached above the memory in use when the phase
+started, and the memory it still holds when it ends. Phases may nest (a
+transform that resolves scope metadata, for example); the peak of the inner
+phase counts towards the outer one as well. When the profiler stops, the
+allocation sites still holding the most memory are reported.
+
+Only phases of the thread that started the profiler are attributed, since
+phases run on worker threads would interleave their allocations. Code that
+normally uses worker threads, such as CallSitePipeline behind
+CallSiteUpdater.update_all(), checks is_profiling() and stays on the calling
+thread while a profiler is active.
+
+CpuProfiler runs cProfile over a command and can save the raw statistics for
+pstats or snakeviz. cProfile only records caller/callee pairs, so for
+flamegraphs a background thread also samples the profiled thread's call stack
+at a fixed interval and writes the samples in the collapsed-stack format read
+by flamegraph.pl, speedscope and inferno.
+
+Usage:
+    with MemoryProfiler() as profiler:
+        apply_refactoring("rename-method", path, target="Order::total", new_name="sum")
+    print(profiler.report.format())
+
+    with CpuProfiler(folded_path=Path("out.folded")) as profiler:
+        apply_refactoring("rename-method", path, target="Order::total", new_name="sum")
+    print(profiler.format_top())
+"""
+
+import cProfile
+import io
+import pstats
+import sys
+import threading
+import tracemalloc
+from collections import Counter
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import FrameType
+from typing import ContextManager, Iterator
+
+# Phases reported in this order, followed by any other phase names
+PHASES = ("search", "parse", "metadata", "transform", "write")
+
+# Frames stored per traced allocation
+_TRACEBACK_DEPTH = 1
+
+# Seconds between two call-stack samples taken for flamegraphs
+_SAMPLE_INTERVAL = 0.001
+
+# Functions defined under this directory are reported by CpuProfiler.top_functions()
+_PACKAGE_DIR = str(Path(__file__).resolve().parent.parent)
+
+_active_profiler: "MemoryProfiler | None" = None
+_active_cpu_profiler: "CpuProfiler | None" = None
+
+
+@dataclass
+class PhaseMemory:
+    """Memory used by one phase, over all the times it ran.
+
+    Attributes:
+        name: Phase name
+        calls: Number of times the phase ran
+        peak: Highest traced memory reached above the phase's starting memory, in bytes
+        retained: Memory still held when the phase ended, summed over all runs, in bytes
+    """
+
+    name: str
+    calls: int = 0
+    peak: int = 0
+    retained: int = 0
+
+
+@dataclass(frozen=True)
+class AllocationSite:
+    """A source line holding traced memory when profiling stopped.
+
+    Attributes:
+        file_name: File containing the allocating line
+        line: Line number of the allocation
+        size: Bytes allocated at the line and still alive
+        count: Number of memory blocks allocated at the line and still alive
+    """
+
+    file_name: str
+    line: int
+    size: int
+    count: int
+
+
+@dataclass
+class MemoryReport:
+    """Result of a profiling run.
+
+    Attributes:
+        peak: Highest traced memory reached during the run, in bytes
+        phases: Memory used by each phase, in PHASES order
+        top_sites: Allocation sites holding the most memory at the end of the run
+    """
+
+    peak: int = 0
+    phases: list[PhaseMemory] = field(default_factory=list)
+    top_sites: list[AllocationSite] = field(default_factory=list)
+
+    def phase(self, name: str) -> PhaseMemory | None:
+        """Return the memory used by a phase, or None if it never ran."""
+        return next((phase for phase in self.phases if phase.name == name), None)
+
+    def format(self) -> str:
+        """Render the report as a plain-text table."""
+        lines = [f"Peak traced memory: {format_bytes(self.peak)}"]
+        if self.phases:
+            lines.append(f"{'phase':<12}{'calls':>7}{'peak':>12}{'retained':>12}")
+            lines.extend(
+                f"{phase.name:<12}{phase.calls:>7}"
+                f"{format_bytes(phase.peak):>12}{format_bytes(phase.retained):>12}"
+                for phase in self.phases
+            )
+        if self.top_sites:
+            lines.append("Top allocation sites:")
+            lines.extend(
+                f"  {site.file_name}:{site.line}  {format_bytes(site.size)} "
+                f"in {site.count} blocks"
+                for site in self.top_sites
+            )
+        return "\n".join(lines)
+
+
+class MemoryProfiler:
+    """Traces allocations with tracemalloc and attributes peaks to refactoring phases."""
+
+    def __init__(self, top: int = 10) -> None:
+        """Initialize the profiler.
+
+        Args:
+            top: Number of allocation sites to report
+        """
+        self.top = top
+        self.report = MemoryReport()
+        self._phases: dict[str, PhaseMemory] = {}
+        # Highest traced memory seen by each open phase, innermost last
+        self._open_peaks: list[int] = []
+        self._started_tracing = False
+        # Thread whose phases are attributed
+        self._thread_id: int | None = None
+
+    def __enter__(self) -> "MemoryProfiler":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        """Start tracing allocations and make this the active profiler.
+
+        Raises:
+            RuntimeError: If another profiler is already active
+        """
+        global _active_profiler
+        if _active_profiler is not None:
+            raise RuntimeError("A memory profiler is already active")
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(_TRACEBACK_DEPTH)
+            self._started_tracing = True
+        tracemalloc.reset_peak()
+        self._thread_id = threading.get_ident()
+        _active_profiler = self
+
+    def stop(self) -> MemoryReport:
+        """Stop tracing and build the report.
+
+        Returns:
+            The report, also available as the report attribute
+        """
+        global _active_profiler
+        if _active_profiler is not self:
+            return self.report
+        _active_profiler = None
+
+        self._fold_peak()
+        snapshot = tracemalloc.take_snapshot().filter_traces(
+            [tracemalloc.Filter(False, tracemalloc.__file__)]
+        )
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+        self.report.phases = sorted(self._phases.values(), key=_phase_order)
+        self.report.top_sites = [
+            AllocationSite(
+                _short_path(stat.traceback[0].filename),
+                stat.traceback[0].lineno,
+                stat.size,
+                stat.count,
+            )
+            for stat in snapshot.statistics("lineno")[: self.top]
+        ]
+        return self.report
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Attribute the memory used inside the block to a phase.
+
+        Args:
+            name: Phase name, normally one of PHASES
+        """
+        self._fold_peak()
+        start = tracemalloc.get_traced_memory()[0]
+        self._open_peaks.append(start)
+        try:
+            yield
+        finally:
+            self._fold_peak()
+            peak = self._open_peaks.pop()
+            stats = self._phases.setdefault(name, PhaseMemory(name))
+            stats.calls += 1
+            stats.peak = max(stats.peak, peak - start)
+            stats.retained += tracemalloc.get_traced_memory()[0] - start
+
+    def _fold_peak(self) -> None:
+        """Credit the peak since the last reset to the run and every open phase, then reset it."""
+        peak = tracemalloc.get_traced_memory()[1]
+        self.report.peak = max(self.report.peak, peak)
+        self._open_peaks = [max(open_peak, peak) for open_peak in self._open_peaks]
+        tracemalloc.reset_peak()
+
+
+@dataclass(frozen=True)
+class FunctionTiming:
+    """Time spent in one function during a CPU profiling run.
+
+    Attributes:
+        name: ``path:line(function)`` of the function
+        calls: Number of calls
+        total_time: Seconds spent in the function itself
+        cumulative_time: Seconds spent in the function and everything it called
+    """
+
+    name: str
+    calls: int
+    total_time: float
+    cumulative_time: float
+
+
+class CpuProfiler:
+    """Profiles a run with cProfile and optionally samples call stacks for flamegraphs."""
+
+    def __init__(
+        self,
+        pstats_path: Path | None = None,
+        folded_path: Path | None = None,
+        interval: float = _SAMPLE_INTERVAL,
+    ) -> None:
+        """Initialize the profiler.
+
+        Args:
+            pstats_path: File the cProfile statistics are dumped to on stop, if any
+            folded_path: File the collapsed call stacks are written to on stop, if any
+            interval: Seconds between two call-stack samples
+        """
+        self.pstats_path = pstats_path
+        self.folded_path = folded_path
+        self.interval = interval
+        self.samples: Counter[str] = Counter()
+        self._profile = cProfile.Profile()
+        self._stats: pstats.Stats | None = None
+        self._sampler: threading.Thread | None = None
+        self._stop_sampling = threading.Event()
+
+    def __enter__(self) -> "CpuProfiler":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        """Start profiling the calling thread."""
+        global _active_cpu_profiler
+        _active_cpu_profiler = self
+        if self.folded_path is not None:
+            self._stop_sampling.clear()
+            self._sampler = threading.Thread(
+                target=self._sample,
+                args=(threading.get_ident(),),
+                name="molting-stack-sampler",
+                daemon=True,
+            )
+            self._sampler.start()
+        self._profile.enable()
+
+    def stop(self) -> pstats.Stats:
+        """Stop profiling and write the requested output files.
+
+        Returns:
+            The collected statistics
+        """
+        global _active_cpu_profiler
+        if self._stats is not None:
+            return self._stats
+        self._profile.disable()
+        if _active_cpu_profiler is self:
+            _active_cpu_profiler = None
+        if self._sampler is not None:
+            self._stop_sampling.set()
+            self._sampler.join()
+            self._sampler = None
+
+        self._stats = pstats.Stats(self._profile, stream=io.StringIO())
+        if self.pstats_path is not None:
+            self._stats.dump_stats(self.pstats_path)
+        if self.folded_path is not None:
+            self.folded_path.write_text(
+                "".join(f"{stack} {count}\n" for stack, count in sorted(self.samples.items()))
+            )
+        return self._stats
+
+    def top_functions(self, limit: int = 20) -> list[FunctionTiming]:
+        """Return the molting functions with the highest cumulative time.
+
+        Args:
+            limit: Maximum number of functions returned
+
+        Returns:
+            Functions defined in the molting package, slowest first
+        """
+        stats = self.stop()
+        timings = [
+            FunctionTiming(
+                f"{_short_path(file_name)}:{line}({function})", calls, total_time, cumulative
+            )
+            for (file_name, line, function), (_, calls, total_time, cumulative, _) in (
+                stats.stats.items()  # type: ignore[attr-defined]
+            )
+            if file_name.startswith(_PACKAGE_DIR)
+        ]
+        timings.sort(key=lambda timing: timing.cumulative_time, reverse=True)
+        return timings[:limit]
+
+    def format_top(self, limit: int = 20) -> str:
+        """Render the molting functions with the highest cumulative time as a table."""
+        lines = [f"{'cumtime':>9}{'tottime':>9}{'calls':>9}  function"]
+        lines.extend(
+            f"{timing.cumulative_time:>9.3f}{timing.total_time:>9.3f}{timing.calls:>9}"
+            f"  {timing.name}"
+            for timing in self.top_functions(limit)
+        )
+        return "\n".join(lines)
+
+    def _sample(self, thread_id: int) -> None:
+        """Record the profiled thread's call stack every interval until stopped."""
+        while not self._stop_sampling.wait(self.interval):
+            frame = sys._current_frames().get(thread_id)
+            if frame is not None:
+                self.samples[_fold_stack(frame)] += 1
+
+
+def phase(name: str) -> ContextManager[None]:
+    """Mark a refactoring phase for the active memory profiler, if any.
+
+    Args:
+        name: Phase name, normally one of PHASES
+
+    Returns:
+        A context manager covering the phase (a no-op when not profiling, or
+        on a thread other than the profiled one)
+    """
+    if _active_profiler is None or _active_profiler._thread_id != threading.get_ident():
+        return nullcontext()
+    return _active_profiler.phase(name)
+
+
+def is_profiling() -> bool:
+    """Return whether a memory or CPU profiler is active.
+
+    Both only see work done on the thread that started them, so code that would
+    hand work to other threads runs it on the calling thread instead while this
+    is true.
+    """
+    return _active_profiler is not None or _active_cpu_profiler is not None
+
+
+def format_bytes(size: int) -> str:
+    """Format a byte count with a binary unit (``"1.5 MiB"``)."""
+    value = float(size)
+    for unit in ("B", "KiB", "MiB"):
+        if abs(value) < 1024:
+            return f"{value:.0f} {unit}" if unit == "B" else f"{value:.1f} {unit}"
+        value /= 1024
+    return f"{value:.1f} GiB"
+
+
+def _fold_stack(frame: FrameType | None) -> str:
+    """Render a call stack as semicolon-separated frames, outermost first."""
+    frames = []
+    while frame is not None:
+        code = frame.f_code
+        frames.append(f"{code.co_name} ({_short_path(code.co_filename)}:{code.co_firstlineno})")
+        frame = frame.f_back
+    return ";".join(reversed(frames))
+
+
+def _phase_order(phase: PhaseMemory) -> tuple[int, str]:
+    """Sort key putting the standard phases first, in pipeline order."""
+    if phase.name in PHASES:
+        return (PHASES.index(phase.name), phase.name)
+    return (len(PHASES), phase.name)
+
+
+def _short_path(file_name: str) -> str:
+    """Shorten a path to start at the molting package or site-packages directory."""
+    parts = Path(file_name).parts
+    for anchor in ("molting", "site-packages"):
+        if anchor in parts:
+            index = len(parts) - 1 - parts[::-1].index(anchor)
+            return str(Path(*parts[index:]))
+    return file_name
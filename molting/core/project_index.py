@@ -0,0 +1,244 @@
+"""Project-wide index of classes, their bases and their methods.
+
+Refactorings that change a method's signature or name must treat the method
+together with the overrides it shares a slot with. ProjectIndex parses every
+Python file under a directory once, with the fast ``ast`` parser, and records
+each class's bases and methods so hierarchy questions become lookups.
+
+Classes are identified by name. Base classes are matched by the last component
+of the name they are written with (``models.Customer`` matches ``Customer``);
+bases defined outside the indexed tree are kept but have no entry of their own.
+
+Module-level functions are recorded with the type their return annotation
+names, so a receiver built by a factory (``make().charge()`` with
+``def make() -> Billing``) can be resolved to its class.
+
+Usage:
+    index = ProjectIndex.build(Path("src"))
+    index.subclasses("Employee")                  # {"Manager", "Engineer"}
+    index.method_family("Manager", "pay_amount")  # {"Employee", "Manager", "Engineer"}
+    index.functions["make_billing"]               # "Billing", or None if unannotated
+"""
+
+import ast
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable
+
+
+@dataclass(frozen=True)
+class IndexedClass:
+    """A class definition found in the project.
+
+    Attributes:
+        name: Class name
+        file_path: File the class is defined in
+        line: Line of the ``class`` statement
+        bases: Names of the direct base classes, last dotted component only
+        methods: Names of the functions defined directly in the class body
+    """
+
+    name: str
+    file_path: Path
+    line: int
+    bases: tuple[str, ...]
+    methods: frozenset[str]
+
+
+class ProjectIndex:
+    """Classes of a project with their inheritance relations."""
+
+    def __init__(self) -> None:
+        """Initialize an empty index; use build() or add_file() to populate it."""
+        self.classes: dict[str, list[IndexedClass]] = {}
+        # Module-level function -> type named by its return annotation; None if
+        # unannotated, or if definitions in several files disagree
+        self.functions: dict[str, str | None] = {}
+        self.files: list[Path] = []
+        self._direct_subclasses: dict[str, set[str]] = {}
+
+    @classmethod
+    def build(cls, directory: Path) -> "ProjectIndex":
+        """Index every Python file under a directory.
+
+        Args:
+            directory: Root directory of the project
+
+        Returns:
+            The populated index
+        """
+        return cls.from_files(sorted(path.resolve() for path in directory.rglob("*.py")))
+
+    @classmethod
+    def from_files(cls, files: Iterable[Path]) -> "ProjectIndex":
+        """Index the given Python files.
+
+        Files that cannot be read or parsed contribute no classes.
+
+        Args:
+            files: Files to index
+
+        Returns:
+            The populated index
+        """
+        index = cls()
+        for file_path in files:
+            try:
+                source = file_path.read_text()
+            except (OSError, UnicodeDecodeError):
+                continue
+            index.add_file(file_path, source)
+        return index
+
+    def add_file(self, file_path: Path, source: str) -> None:
+        """Add the classes and module-level functions defined in a file's source.
+
+        Args:
+            file_path: Path of the file
+            source: Source code of the file
+        """
+        try:
+            tree = ast.parse(source)
+        except SyntaxError:
+            return
+        self.files.append(file_path)
+        for statement in tree.body:
+            if isinstance(statement, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                returns = _annotation_name(statement.returns) if statement.returns else None
+                if self.functions.get(statement.name, returns) != returns:
+                    returns = None
+                self.functions[statement.name] = returns
+        for node in ast.walk(tree):
+            if not isinstance(node, ast.ClassDef):
+                continue
+            bases = tuple(name for name in map(_base_name, node.bases) if name is not None)
+            methods = frozenset(
+                item.name
+                for item in node.body
+                if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef))
+            )
+            self.classes.setdefault(node.name, []).append(
+                IndexedClass(node.name, file_path, node.lineno, bases, methods)
+            )
+            for base in bases:
+                self._direct_subclasses.setdefault(base, set()).add(node.name)
+
+    def get_class(self, name: str) -> IndexedClass:
+        """Return the single definition of a class.
+
+        Args:
+            name: Class name
+
+        Returns:
+            The class definition
+
+        Raises:
+            ValueError: If the class is not defined, or defined in several places
+        """
+        definitions = self.classes.get(name, [])
+        if not definitions:
+            raise ValueError(f"Class '{name}' not found")
+        if len(definitions) > 1:
+            places = ", ".join(f"{c.file_path}:{c.line}" for c in definitions)
+            raise ValueError(f"Class '{name}' is defined more than once: {places}")
+        return definitions[0]
+
+    def defines(self, class_name: str, method_name: str) -> bool:
+        """Return whether a class defines a method in its own body."""
+        return any(method_name in c.methods for c in self.classes.get(class_name, []))
+
+    def classes_defining(self, method_name: str) -> set[str]:
+        """Return the names of all classes defining a method in their own body."""
+        return {
+            name
+            for name, definitions in self.classes.items()
+            if any(method_name in c.methods for c in definitions)
+        }
+
+    def bases(self, class_name: str) -> list[str]:
+        """Return the direct bases of a class (of all its definitions), in order."""
+        result: list[str] = []
+        for definition in self.classes.get(class_name, []):
+            result.extend(base for base in definition.bases if base not in result)
+        return result
+
+    def ancestors(self, class_name: str) -> list[str]:
+        """Return all base classes of a class, nearest first.
+
+        Args:
+            class_name: Class name
+
+        Returns:
+            Transitive base class names, breadth first and without repeats
+        """
+        result: list[str] = []
+        pending = self.bases(class_name)
+        while pending:
+            base = pending.pop(0)
+            if base in result or base == class_name:
+                continue
+            result.append(base)
+            pending.extend(self.bases(base))
+        return result
+
+    def subclasses(self, class_name: str) -> set[str]:
+        """Return all classes inheriting from a class, directly or indirectly."""
+        result: set[str] = set()
+        pending = [class_name]
+        while pending:
+            for subclass in self._direct_subclasses.get(pending.pop(), set()):
+                if subclass not in result and subclass != class_name:
+                    result.add(subclass)
+                    pending.append(subclass)
+        return result
+
+    def method_family(self, class_name: str, method_name: str) -> set[str]:
+        """Return the classes sharing a method slot with a class's method.
+
+        The family starts at the topmost ancestors that define the method and
+        includes every class below them, since an override or an inherited
+        call on any of them refers to the same method.
+
+        Args:
+            class_name: Class defining or inheriting the method
+            method_name: Method name
+
+        Returns:
+            Names of the classes in the family
+
+        Raises:
+            ValueError: If neither the class nor any of its bases defines the method
+        """
+        lineage = [class_name, *self.ancestors(class_name)]
+        defining = [name for name in lineage if self.defines(name, method_name)]
+        if not defining:
+            raise ValueError(f"Method '{method_name}' not found in class '{class_name}'")
+        roots = [
+            name
+            for name in defining
+            if not any(self.defines(ancestor, method_name) for ancestor in self.ancestors(name))
+        ]
+        family: set[str] = set()
+        for root in roots:
+            family.add(root)
+            family |= self.subclasses(root)
+        return family
+
+
+def _annotation_name(node: ast.expr) -> str | None:
+    """Return the class name an annotation refers to, including string annotations."""
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        try:
+            return _base_name(ast.parse(node.value, mode="eval").body)
+        except SyntaxError:
+            return None
+    return _base_name(node)
+
+
+def _base_name(node: ast.expr) -> str | None:
+    """Return the class name a base expression refers to, if it is a plain or dotted name."""
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        return node.attr
+    return None
@@ -9,7 +9,7 @@ import shutil
 import subprocess
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Protocol, runtime_checkable
+from typing import Iterable, Protocol, runtime_checkable
 
 
 @dataclass
@@ -56,6 +56,54 @@ class ReferenceSearcher(Protocol):
         ...
 
 
+@runtime_checkable
+class StreamingReferenceSearcher(ReferenceSearcher, Protocol):
+    """Protocol for search backends driven by an external command.
+
+    These backends expose their command line and output parser separately so
+    callers can stream matches from the subprocess as they are produced.
+    """
+
+    def build_command(self, pattern: str, directory: Path) -> list[str]:
+        """Build the command line that searches for a pattern.
+
+        Args:
+            pattern: The text pattern to search for
+            directory: The directory to search in (also the working directory)
+
+        Returns:
+            The command and its arguments
+        """
+        ...
+
+    def parse_line(self, line: str, pattern: str, directory: Path) -> TextMatch | None:
+        """Parse one line of command output into a TextMatch.
+
+        Args:
+            line: A single line of output (without trailing newline)
+            pattern: The text pattern that was searched for
+            directory: The directory the search ran in
+
+        Returns:
+            The parsed TextMatch, or None if the line is not a match
+        """
+        ...
+
+
+def _parse_column_output(line: str, pattern: str, directory: Path) -> TextMatch | None:
+    """Parse ``filename:line:column:text`` output with 1-indexed columns."""
+    parts = line.split(":", 3)
+    if len(parts) < 4:
+        return None
+    return TextMatch(
+        file_path=directory / parts[0],
+        line_number=int(parts[1]),
+        column=int(parts[2]) - 1,
+        text=pattern,
+        line=parts[3],
+    )
+
+
 class RipgrepSearcher:
     """Search backend using ripgrep (rg) for fast text searching."""
 
@@ -69,18 +117,8 @@ class RipgrepSearcher:
             raise RuntimeError("ripgrep (rg) is not available")
 
         try:
-            # Use ripgrep with line numbers and column numbers
             result = subprocess.run(
-                [
-                    "rg",
-                    "--line-number",
-                    "--column",
-                    "--no-heading",
-                    "--type",
-                    "py",
-                    "--fixed-strings",
-                    pattern,
-                ],
+                self.build_command(pattern, directory),
                 cwd=directory,
                 capture_output=True,
                 text=True,
@@ -89,28 +127,31 @@ class RipgrepSearcher:
 
             matches = []
             for line in result.stdout.splitlines():
-                # Format: filename:line:column:text
-                parts = line.split(":", 3)
-                if len(parts) >= 4:
-                    file_path = directory / parts[0]
-                    line_number = int(parts[1])
-                    column = int(parts[2]) - 1  # rg uses 1-indexed columns
-                    full_line = parts[3]
-
-                    matches.append(
-                        TextMatch(
-                            file_path=file_path,
-                            line_number=line_number,
-                            column=column,
-                            text=pattern,
-                            line=full_line,
-                        )
-                    )
+                match = self.parse_line(line, pattern, directory)
+                if match is not None:
+                    matches.append(match)
 
             return matches
         except Exception as e:
             raise RuntimeError(f"ripgrep search failed: {e}") from e
 
+    def build_command(self, pattern: str, directory: Path) -> list[str]:
+        """Build the ripgrep command line with line and column numbers."""
+        return [
+            "rg",
+            "--line-number",
+            "--column",
+            "--no-heading",
+            "--type",
+            "py",
+            "--fixed-strings",
+            pattern,
+        ]
+
+    def parse_line(self, line: str, pattern: str, directory: Path) -> TextMatch | None:
+        """Parse ripgrep output (``filename:line:column:text``)."""
+        return _parse_column_output(line, pattern, directory)
+
 
 class AgSearcher:
     """Search backend using The Silver Searcher (ag)."""
@@ -125,9 +166,8 @@ class AgSearcher:
             raise RuntimeError("ag (The Silver Searcher) is not available")
 
         try:
-            # Use ag with line numbers and column numbers
             result = subprocess.run(
-                ["ag", "--line-numbers", "--column", "--nogroup", "--python", "--literal", pattern],
+                self.build_command(pattern, directory),
                 cwd=directory,
                 capture_output=True,
                 text=True,
@@ -136,28 +176,22 @@ class AgSearcher:
 
             matches = []
             for line in result.stdout.splitlines():
-                # Format: filename:line:column:text
-                parts = line.split(":", 3)
-                if len(parts) >= 4:
-                    file_path = directory / parts[0]
-                    line_number = int(parts[1])
-                    column = int(parts[2]) - 1  # ag uses 1-indexed columns
-                    full_line = parts[3]
-
-                    matches.append(
-                        TextMatch(
-                            file_path=file_path,
-                            line_number=line_number,
-                            column=column,
-                            text=pattern,
-                            line=full_line,
-                        )
-                    )
+                match = self.parse_line(line, pattern, directory)
+                if match is not None:
+                    matches.append(match)
 
             return matches
         except Exception as e:
             raise RuntimeError(f"ag search failed: {e}") from e
 
+    def build_command(self, pattern: str, directory: Path) -> list[str]:
+        """Build the ag command line with line and column numbers."""
+        return ["ag", "--line-numbers", "--column", "--nogroup", "--python", "--literal", pattern]
+
+    def parse_line(self, line: str, pattern: str, directory: Path) -> TextMatch | None:
+        """Parse ag output (``filename:line:column:text``)."""
+        return _parse_column_output(line, pattern, directory)
+
 
 class GrepSearcher:
     """Search backend using standard grep."""
@@ -172,17 +206,8 @@ class GrepSearcher:
             raise RuntimeError("grep is not available")
 
         try:
-            # Use grep with line numbers, recursive, only Python files
             result = subprocess.run(
-                [
-                    "grep",
-                    "-n",
-                    "-r",
-                    "--include=*.py",
-                    "-F",  # Fixed string (literal)
-                    pattern,
-                    str(directory),
-                ],
+                self.build_command(pattern, directory),
                 capture_output=True,
                 text=True,
                 check=False,
@@ -190,32 +215,46 @@ class GrepSearcher:
 
             matches = []
             for line in result.stdout.splitlines():
-                # Format: filename:line:text
-                parts = line.split(":", 2)
-                if len(parts) >= 3:
-                    file_path = Path(parts[0])
-                    line_number = int(parts[1])
-                    full_line = parts[2]
-
-                    # Find column by searching for pattern in line
-                    column = full_line.find(pattern)
-                    if column == -1:
-                        column = 0
-
-                    matches.append(
-                        TextMatch(
-                            file_path=file_path,
-                            line_number=line_number,
-                            column=column,
-                            text=pattern,
-                            line=full_line,
-                        )
-                    )
+                match = self.parse_line(line, pattern, directory)
+                if match is not None:
+                    matches.append(match)
 
             return matches
         except Exception as e:
             raise RuntimeError(f"grep search failed: {e}") from e
 
+    def build_command(self, pattern: str, directory: Path) -> list[str]:
+        """Build a recursive, fixed-string grep command over Python files."""
+        return [
+            "grep",
+            "-n",
+            "-r",
+            "--include=*.py",
+            "-F",  # Fixed string (literal)
+            pattern,
+            str(directory),
+        ]
+
+    def parse_line(self, line: str, pattern: str, directory: Path) -> TextMatch | None:
+        """Parse grep output (``filename:line:text``), locating the column in the line."""
+        parts = line.split(":", 2)
+        if len(parts) < 3:
+            return None
+
+        full_line = parts[2]
+        # Find column by searching for pattern in line
+        column = full_line.find(pattern)
+        if column == -1:
+            column = 0
+
+        return TextMatch(
+            file_path=Path(parts[0]),
+            line_number=int(parts[1]),
+            column=column,
+            text=pattern,
+            line=full_line,
+        )
+
 
 class PythonSearcher:
     """Fallback search backend using pure Python."""
@@ -232,38 +271,71 @@ class PythonSearcher:
         for py_file in directory.rglob("*.py"):
             if not py_file.is_file():
                 continue
+            matches.extend(_search_file(py_file, pattern))
 
-            try:
-                content = py_file.read_text()
-                lines = content.splitlines()
-
-                for line_num, line in enumerate(lines, start=1):
-                    # Find all occurrences of pattern in this line
-                    column = 0
-                    while True:
-                        index = line.find(pattern, column)
-                        if index == -1:
-                            break
-
-                        matches.append(
-                            TextMatch(
-                                file_path=py_file,
-                                line_number=line_num,
-                                column=index,
-                                text=pattern,
-                                line=line,
-                            )
-                        )
-
-                        # Move past this match to find additional matches on same line
-                        column = index + 1
-
-            except (UnicodeDecodeError, PermissionError):
-                # Skip files that can't be read
-                continue
+        return matches
+
+
+class FileSetSearcher:
+    """Search backend restricted to a fixed set of candidate files.
+
+    Used for incremental runs (e.g. only files changed since a git revision),
+    where the cost should scale with the candidate set rather than the tree.
+    """
+
+    def __init__(self, files: Iterable[Path]) -> None:
+        """Initialize the searcher.
+
+        Args:
+            files: The only files that will be searched
+        """
+        self.files = sorted({path.resolve() for path in files})
 
+    def is_available(self) -> bool:
+        """The file set searcher is always available."""
+        return True
+
+    def search(self, pattern: str, directory: Path) -> list[TextMatch]:
+        """Search the candidate files located under the directory."""
+        directory = directory.resolve()
+        matches = []
+        for py_file in self.files:
+            if py_file.is_file() and py_file.is_relative_to(directory):
+                matches.extend(_search_file(py_file, pattern))
+        return matches
+
+
+def _search_file(py_file: Path, pattern: str) -> list[TextMatch]:
+    """Find all occurrences of a pattern in one file, skipping unreadable files."""
+    matches: list[TextMatch] = []
+    try:
+        content = py_file.read_text()
+    except (UnicodeDecodeError, PermissionError):
         return matches
 
+    for line_num, line in enumerate(content.splitlines(), start=1):
+        # Find all occurrences of pattern in this line
+        column = 0
+        while True:
+            index = line.find(pattern, column)
+            if index == -1:
+                break
+
+            matches.append(
+                TextMatch(
+                    file_path=py_file,
+                    line_number=line_num,
+                    column=index,
+                    text=pattern,
+                    line=line,
+                )
+            )
+
+            # Move past this match to find additional matches on same line
+            column = index + 1
+
+    return matches
+
 
 def get_best_searcher() -> ReferenceSearcher:
     """Auto-detect and return the fastest available search backend.
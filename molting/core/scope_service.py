@@ -0,0 +1,613 @@
+"""Shared scope analysis for a module, computed once and queried by analyzers.
+
+ScopeService runs libcst's ScopeProvider over a module once and answers the
+scope questions analyzers otherwise re-derive with their own class/function
+stacks and hard-coded builtin lists:
+
+- the scope of a function and the accesses of a name in a scope
+- which names a line range reads, assigns, or reads from outside itself
+- which class an attribute access such as ``self.total`` belongs to, including
+  classes imported with ``from module import Class``
+
+Builtins are recognized from libcst's scope resolution, so no builtin list is
+needed, and names read inside nested functions, lambdas and comprehensions are
+attributed to the scope that defines them.
+
+Usage:
+    scopes = ScopeService.for_module(module)
+    scope = scopes.function_scope(function)
+    scopes.free_names(scope, 5, 7)  # ["total", "rate"]
+"""
+
+from typing import Iterator
+
+import libcst as cst
+from libcst.metadata import (
+    Access,
+    Assignment,
+    BaseAssignment,
+    BuiltinAssignment,
+    ClassScope,
+    FunctionScope,
+    GlobalScope,
+    MetadataWrapper,
+    PositionProvider,
+    Scope,
+    ScopeProvider,
+)
+
+from molting.core.caches import IdentityCache
+from molting.core.profiling import phase
+
+# Literal and display nodes -> the builtin type they evaluate to
+_LITERAL_TYPES: tuple[tuple[tuple[type[cst.CSTNode], ...], str], ...] = (
+    ((cst.Dict, cst.DictComp), "dict"),
+    ((cst.List, cst.ListComp), "list"),
+    ((cst.Set, cst.SetComp), "set"),
+    ((cst.Tuple,), "tuple"),
+    ((cst.SimpleString, cst.ConcatenatedString, cst.FormattedString), "str"),
+    ((cst.Integer,), "int"),
+    ((cst.Float,), "float"),
+    ((cst.Imaginary,), "complex"),
+    ((cst.GeneratorExp,), "generator"),
+)
+
+# Recently analyzed modules, reused by ScopeService.for_module()
+_cache: "IdentityCache[cst.Module, ScopeService]" = IdentityCache()
+
+
+class ScopeService:
+    """Scope and name-resolution queries over one module.
+
+    Nodes passed to and returned from the service belong to the analyzed
+    module itself (it is wrapped without copying).
+    """
+
+    def __init__(self, module: cst.Module) -> None:
+        """Resolve scopes and positions for a module.
+
+        Args:
+            module: The module to analyze
+        """
+        self.module = module
+        with phase("metadata"):
+            wrapper = MetadataWrapper(module, unsafe_skip_copy=True)
+            self._scopes = wrapper.resolve(ScopeProvider)
+            self._positions = wrapper.resolve(PositionProvider)
+
+        self._children: dict[Scope, list[Scope]] = {}
+        self._function_scopes: list[FunctionScope] = []
+        for scope in {scope for scope in self._scopes.values() if scope is not None}:
+            if scope.parent is not scope:
+                self._children.setdefault(scope.parent, []).append(scope)
+            if isinstance(scope, FunctionScope):
+                self._function_scopes.append(scope)
+
+        facts = _ModuleFacts()
+        module.visit(facts)
+        self._augmented_targets = facts.augmented_targets
+        self._constructed_from = facts.constructed_from
+        self._assigned_values = facts.assigned_values
+        self._annotations = facts.annotations
+        self._access_by_node: dict[cst.CSTNode, Access] | None = None
+
+    @classmethod
+    def for_module(cls, module: cst.Module) -> "ScopeService":
+        """Return the service for a module, reusing it if the same module was seen recently.
+
+        Args:
+            module: The module to analyze
+
+        Returns:
+            The scope service for the module
+        """
+        cached = _cache.get(module)
+        if cached is not None:
+            return cached
+
+        service = cls(module)
+        _cache.put(module, service)
+        return service
+
+    def scope_of(self, node: cst.CSTNode) -> Scope | None:
+        """Return the scope a node is in."""
+        return self._scopes.get(node)
+
+    def function_scope(self, function: cst.FunctionDef) -> Scope:
+        """Return the scope a function's parameters and body are in."""
+        scope = self._scopes[function.params]
+        assert scope is not None
+        return scope
+
+    def find_function(self, class_name: str, function_name: str) -> cst.FunctionDef | None:
+        """Find a method of a top-level class, or a module-level function.
+
+        Args:
+            class_name: Name of the class (empty string for module-level functions)
+            function_name: Name of the function
+
+        Returns:
+            The first matching function in source order, or None
+        """
+        matches = []
+        for scope in self._function_scopes:
+            function = scope.node
+            if not isinstance(function, cst.FunctionDef) or function.name.value != function_name:
+                continue
+            parent = scope.parent
+            if class_name:
+                is_match = (
+                    isinstance(parent, ClassScope)
+                    and isinstance(parent.node, cst.ClassDef)
+                    and parent.node.name.value == class_name
+                    and isinstance(parent.parent, GlobalScope)
+                )
+            else:
+                is_match = isinstance(parent, GlobalScope)
+            if is_match:
+                matches.append(function)
+        return min(matches, key=self._start, default=None)
+
+    def line(self, node: cst.CSTNode) -> int:
+        """Return the line a node starts on."""
+        return int(self._positions[node].start.line)
+
+    def lines(self, node: cst.CSTNode) -> tuple[int, int]:
+        """Return the (start_line, end_line) interval of a node."""
+        position = self._positions[node]
+        return (position.start.line, position.end.line)
+
+    def accesses(self, name: str, scope: Scope, include_nested: bool = True) -> list[Access]:
+        """Return the reads of a name in a scope, in source order.
+
+        Args:
+            name: The name to look up
+            scope: The scope to search
+            include_nested: Also return reads in nested scopes (nested functions,
+                lambdas, comprehensions) that resolve to this scope's definitions
+
+        Returns:
+            The accesses, ordered by position
+        """
+        found = list(scope.accesses[name])
+        if include_nested:
+            for nested in self._descendants(scope):
+                found.extend(
+                    access
+                    for access in nested.accesses[name]
+                    if any(referent.scope is scope for referent in access.referents)
+                )
+        return sorted(found, key=self._position_key)
+
+    def reads_in_region(self, scope: Scope, start_line: int, end_line: int) -> list[str]:
+        """Return the non-builtin names read in a line range of a scope.
+
+        Reads in nested scopes count, and so do augmented assignment targets
+        (``total += x`` reads ``total``).
+
+        Args:
+            scope: The scope the region belongs to
+            start_line: First line of the region (1-indexed)
+            end_line: Last line of the region (1-indexed, inclusive)
+
+        Returns:
+            Names in order of first read
+        """
+        return _unique_names(
+            [
+                (self._start(node), name)
+                for node, name, _ in self._region_reads(scope)
+                if start_line <= self.line(node) <= end_line
+            ]
+        )
+
+    def assignments_in_region(self, scope: Scope, start_line: int, end_line: int) -> list[str]:
+        """Return the names a line range binds in a scope.
+
+        Args:
+            scope: The scope the region belongs to
+            start_line: First line of the region (1-indexed)
+            end_line: Last line of the region (1-indexed, inclusive)
+
+        Returns:
+            Names in order of first binding
+        """
+        return _unique_names(
+            [
+                (self._start(assignment.node), assignment.name)
+                for assignment in scope.assignments
+                if isinstance(assignment, Assignment)
+                and start_line <= self.line(assignment.node) <= end_line
+            ]
+        )
+
+    def free_names(self, scope: Scope, start_line: int, end_line: int) -> list[str]:
+        """Return the names read in a line range that are bound outside it.
+
+        Args:
+            scope: The scope the region belongs to
+            start_line: First line of the region (1-indexed)
+            end_line: Last line of the region (1-indexed, inclusive)
+
+        Returns:
+            Names in order of first read; builtins are never free
+        """
+        pairs: list[tuple[tuple[int, int], str]] = []
+        for node, name, referents in self._region_reads(scope):
+            line = self.line(node)
+            if not start_line <= line <= end_line:
+                continue
+            # Unresolved names (globals defined elsewhere) are free as well
+            if not referents or any(
+                not isinstance(referent, BuiltinAssignment)
+                and not start_line <= self._binding_line(referent) <= end_line
+                for referent in referents
+            ):
+                pairs.append((self._start(node), name))
+        return _unique_names(pairs)
+
+    def is_free_in_region(self, name: str, scope: Scope, start_line: int, end_line: int) -> bool:
+        """Check whether a region reads a name that is bound outside it."""
+        return name in self.free_names(scope, start_line, end_line)
+
+    def module_bindings(self, name: str) -> list[Assignment]:
+        """Return the module-level bindings of a name (imports, classes, functions, assignments).
+
+        Args:
+            name: The name to look up
+
+        Returns:
+            The bindings, in no particular order
+        """
+        scope = self._scopes.get(self.module)
+        if scope is None:
+            return []
+        return [
+            assignment
+            for assignment in scope.assignments[name]
+            if isinstance(assignment, Assignment)
+        ]
+
+    def global_reads(self, function: cst.FunctionDef) -> dict[str, list[Assignment]]:
+        """Return the module-level names a function's body reads, with their bindings.
+
+        Reads in nested functions, lambdas and comprehensions count. Builtins
+        and names bound inside the function are not included. Names bound by
+        ``import a.b`` are reported as ``a.b``.
+
+        Args:
+            function: A function of the analyzed module
+
+        Returns:
+            Name -> module-level bindings, ordered by first read
+        """
+        scope = self.function_scope(function)
+        pairs = []
+        bindings: dict[str, list[Assignment]] = {}
+        for current in [scope, *self._descendants(scope)]:
+            for access in current.accesses:
+                for referent in access.referents:
+                    if isinstance(referent, Assignment) and isinstance(referent.scope, GlobalScope):
+                        pairs.append((self._start(access.node), referent.name))
+                        found = bindings.setdefault(referent.name, [])
+                        if referent not in found:
+                            found.append(referent)
+        return {name: bindings[name] for name in _unique_names(pairs)}
+
+    def attribute_class(self, attribute: cst.Attribute) -> str | None:
+        """Return the class an attribute access belongs to, when it can be resolved.
+
+        Resolves ``self.x``/``cls.x`` inside methods, ``Class.x`` and
+        ``obj.x`` where ``obj`` was assigned ``Class(...)`` in the same scope.
+
+        Args:
+            attribute: An attribute node of the analyzed module
+
+        Returns:
+            Name of the class, or None if the receiver's class is unknown
+        """
+        if not isinstance(attribute.value, cst.Name):
+            return None
+        access = self._access_for(attribute.value)
+        if access is None:
+            return None
+        for referent in access.referents:
+            class_name = self._class_of_binding(referent)
+            if class_name is not None:
+                return class_name
+        return None
+
+    def receiver_type(self, attribute: cst.Attribute) -> str | None:
+        """Return the name of the type of an attribute access's receiver, when it can be inferred.
+
+        Extends attribute_class with receivers that are not project classes:
+        literals (``{}.get`` is ``dict``), constructor calls (``Order().total``),
+        calls of functions with a return annotation (``make().total``),
+        names annotated with a type (``settings: dict``), names assigned a
+        literal or the result of calling a builtin (``items = list()``),
+        builtins themselves (``str.join``) and modules bound by ``import``.
+
+        Args:
+            attribute: An attribute node of the analyzed module
+
+        Returns:
+            The type's unqualified name, or None if the receiver's type is unknown
+        """
+        class_name = self.attribute_class(attribute)
+        if class_name is not None:
+            return class_name
+        receiver = attribute.value
+        if isinstance(receiver, cst.Call):
+            return self._constructed_type(receiver)
+        literal = _literal_type(receiver)
+        if literal is not None or not isinstance(receiver, cst.Name):
+            return literal
+        access = self._access_for(receiver)
+        if access is None:
+            return None
+        for referent in access.referents:
+            type_name = self._type_of_binding(referent)
+            if type_name is not None:
+                return type_name
+        return None
+
+    def binding_nodes(self, name: cst.Name | cst.Attribute) -> list[cst.CSTNode]:
+        """Return the nodes binding the value a name reads (imports, definitions, assignments).
+
+        Args:
+            name: A name node of the analyzed module that is read, or the
+                dotted reference to a module bound by ``import a.b``
+
+        Returns:
+            The binding nodes; empty for builtins, unbound names and names that are not reads
+        """
+        access = self._access_for(name)
+        if access is None:
+            return []
+        return [referent.node for referent in access.referents if isinstance(referent, Assignment)]
+
+    def _region_reads(
+        self, scope: Scope
+    ) -> Iterator[tuple[cst.CSTNode, str, "set[BaseAssignment]"]]:
+        """Yield (node, name, referents) for the non-builtin reads of a scope.
+
+        Reads in nested scopes are included unless they resolve to a binding of
+        the nested scope itself (a comprehension variable, a lambda parameter).
+        """
+        nested = self._descendants(scope)
+        nested_set = set(nested)
+        for current in [scope, *nested]:
+            for access in current.accesses:
+                if not isinstance(access.node, cst.Name):
+                    continue
+                referents = set(access.referents)
+                if referents and all(
+                    isinstance(referent, BuiltinAssignment) or referent.scope in nested_set
+                    for referent in referents
+                ):
+                    continue
+                yield access.node, access.node.value, referents
+        for assignment in scope.assignments:
+            if isinstance(assignment, Assignment) and assignment.node in self._augmented_targets:
+                others = {
+                    other for other in scope.assignments[assignment.name] if other is not assignment
+                }
+                yield assignment.node, assignment.name, others
+
+    def _binding_line(self, referent: BaseAssignment) -> int:
+        """Return the line of a binding; bindings without a node count as line 0."""
+        if isinstance(referent, Assignment):
+            return self.line(referent.node)
+        return 0
+
+    def _class_of_binding(self, referent: BaseAssignment) -> str | None:
+        """Return the class a binding refers to or holds an instance of."""
+        if not isinstance(referent, Assignment):
+            return None
+        node = referent.node
+        if isinstance(node, cst.ClassDef):
+            return node.name.value
+        if isinstance(node, cst.ImportFrom):
+            return _imported_name(node, referent.name)
+        if isinstance(node, cst.Param):
+            return self._receiver_class(node, referent.scope)
+        constructor = self._constructed_from.get(node)
+        if constructor is not None:
+            access = self._access_for(constructor)
+            if access is not None:
+                for target in access.referents:
+                    if isinstance(target, Assignment) and isinstance(target.node, cst.ClassDef):
+                        return target.node.name.value
+                    if isinstance(target, Assignment) and isinstance(target.node, cst.ImportFrom):
+                        return _imported_name(target.node, target.name)
+        return None
+
+    def _type_of_binding(self, referent: BaseAssignment) -> str | None:
+        """Return the type of what a binding holds, for bindings attribute_class leaves unknown."""
+        if isinstance(referent, BuiltinAssignment):
+            return referent.name
+        if not isinstance(referent, Assignment):
+            return None
+        node = referent.node
+        if isinstance(node, cst.Import):
+            return referent.name
+        if isinstance(node, cst.Param):
+            return _annotation_type(node.annotation)
+        annotation = self._annotations.get(node)
+        if annotation is not None:
+            return _annotation_type(annotation)
+        value = self._assigned_values.get(node)
+        if value is None:
+            return None
+        if isinstance(value, cst.Call):
+            return self._constructed_type(value)
+        return _literal_type(value)
+
+    def _constructed_type(self, call: cst.Call) -> str | None:
+        """Return the type a call like ``Order()``, ``list()`` or ``make()`` returns.
+
+        A call of a function of the module has the type its return annotation
+        names. A call of an imported name has that name, since it is usually a
+        class; callers that know the project's functions can map it further.
+        """
+        if not isinstance(call.func, cst.Name):
+            return None
+        access = self._access_for(call.func)
+        if access is None:
+            return None
+        for target in access.referents:
+            if isinstance(target, BuiltinAssignment):
+                return target.name
+            if isinstance(target, Assignment) and isinstance(target.node, cst.ClassDef):
+                return target.node.name.value
+            if isinstance(target, Assignment) and isinstance(target.node, cst.FunctionDef):
+                return _annotation_type(target.node.returns)
+            if isinstance(target, Assignment) and isinstance(target.node, cst.ImportFrom):
+                return _imported_name(target.node, target.name)
+        return None
+
+    def _receiver_class(self, param: cst.Param, scope: Scope) -> str | None:
+        """Return the class of a method's first parameter (``self`` or ``cls``)."""
+        if not isinstance(scope, FunctionScope) or not isinstance(scope.parent, ClassScope):
+            return None
+        function = scope.node
+        class_def = scope.parent.node
+        if not isinstance(function, cst.FunctionDef) or not isinstance(class_def, cst.ClassDef):
+            return None
+        params = [*function.params.posonly_params, *function.params.params]
+        is_static = any(
+            isinstance(decorator.decorator, cst.Name)
+            and decorator.decorator.value == "staticmethod"
+            for decorator in function.decorators
+        )
+        if is_static or not params or params[0] is not param:
+            return None
+        return class_def.name.value
+
+    def _access_for(self, name: cst.Name | cst.Attribute) -> Access | None:
+        """Return the access recorded for a name node."""
+        if self._access_by_node is None:
+            self._access_by_node = {}
+            for scope in {scope for scope in self._scopes.values() if scope is not None}:
+                for access in scope.accesses:
+                    self._access_by_node[access.node] = access
+        return self._access_by_node.get(name)
+
+    def _descendants(self, scope: Scope) -> list[Scope]:
+        """Return every scope nested (directly or indirectly) in a scope."""
+        result = []
+        pending = list(self._children.get(scope, ()))
+        while pending:
+            nested = pending.pop()
+            result.append(nested)
+            pending.extend(self._children.get(nested, ()))
+        return result
+
+    def _position_key(self, access: Access) -> tuple[int, int]:
+        """Sort key placing accesses in source order."""
+        return self._start(access.node)
+
+    def _start(self, node: cst.CSTNode) -> tuple[int, int]:
+        """Return the (line, column) a node starts at."""
+        start = self._positions[node].start
+        return (start.line, start.column)
+
+
+def _imported_name(node: cst.ImportFrom, bound_name: str) -> str | None:
+    """Return the original name of what ``from x import Name [as alias]`` binds to a name."""
+    if isinstance(node.names, cst.ImportStar):
+        return None
+    for alias in node.names:
+        if alias.evaluated_alias == bound_name or (
+            alias.asname is None and alias.evaluated_name == bound_name
+        ):
+            return alias.evaluated_name.rsplit(".", 1)[-1]
+    return None
+
+
+def _literal_type(node: cst.BaseExpression) -> str | None:
+    """Return the builtin type a literal or display evaluates to."""
+    for node_types, type_name in _LITERAL_TYPES:
+        if isinstance(node, node_types):
+            return type_name
+    return None
+
+
+def _annotation_type(annotation: cst.Annotation | None) -> str | None:
+    """Return the type an annotation names, e.g. ``dict`` for ``dict[str, int]``.
+
+    ``Optional[X]`` and ``X | None`` name ``X``; other unions name no single type.
+    """
+    if annotation is None:
+        return None
+    return _type_expression_name(annotation.annotation)
+
+
+def _type_expression_name(node: cst.BaseExpression) -> str | None:
+    """Return the unqualified type name of a type expression."""
+    if isinstance(node, cst.SimpleString):
+        text = node.evaluated_value
+        try:
+            return (
+                _type_expression_name(cst.parse_expression(text)) if isinstance(text, str) else None
+            )
+        except cst.ParserSyntaxError:
+            return None
+    if isinstance(node, cst.Name):
+        return node.value
+    if isinstance(node, cst.Attribute):
+        return node.attr.value
+    if isinstance(node, cst.BinaryOperation) and isinstance(node.operator, cst.BitOr):
+        names = {_type_expression_name(node.left), _type_expression_name(node.right)} - {"None"}
+        return names.pop() if len(names) == 1 else None
+    if isinstance(node, cst.Subscript):
+        name = _type_expression_name(node.value)
+        if name == "Optional" and len(node.slice) == 1:
+            element = node.slice[0].slice
+            return _type_expression_name(element.value) if isinstance(element, cst.Index) else None
+        return name if name != "Union" else None
+    return None
+
+
+def _unique_names(pairs: list[tuple[tuple[int, int], str]]) -> list[str]:
+    """Return names ordered by position, each once."""
+    result: list[str] = []
+    for _, name in sorted(pairs, key=lambda pair: pair[0]):
+        if name not in result:
+            result.append(name)
+    return result
+
+
+class _ModuleFacts(cst.CSTVisitor):
+    """Collects the syntactic facts scope analysis does not record."""
+
+    def __init__(self) -> None:
+        """Initialize the collector."""
+        # Names that are targets of augmented assignments (also reads)
+        self.augmented_targets: set[cst.CSTNode] = set()
+        # Assignment target name -> the called name, for ``x = Name(...)``
+        self.constructed_from: dict[cst.CSTNode, cst.Name] = {}
+        # Assignment target name -> the assigned value
+        self.assigned_values: dict[cst.CSTNode, cst.BaseExpression] = {}
+        # Annotated target name -> its annotation
+        self.annotations: dict[cst.CSTNode, cst.Annotation] = {}
+
+    def visit_AugAssign(self, node: cst.AugAssign) -> None:  # noqa: N802
+        """Record the target of an augmented assignment."""
+        if isinstance(node.target, cst.Name):
+            self.augmented_targets.add(node.target)
+
+    def visit_Assign(self, node: cst.Assign) -> None:  # noqa: N802
+        """Record names assigned the result of calling a plain name."""
+        for target in node.targets:
+            if isinstance(target.target, cst.Name):
+                self.assigned_values[target.target] = node.value
+                if isinstance(node.value, cst.Call) and isinstance(node.value.func, cst.Name):
+                    self.constructed_from[target.target] = node.value.func
+
+    def visit_AnnAssign(self, node: cst.AnnAssign) -> None:  # noqa: N802
+        """Record annotated names and their values."""
+        if isinstance(node.target, cst.Name):
+            self.annotations[node.target] = node.annotation
+            if node.value is not None:
+                self.assigned_values[node.target] = node.value
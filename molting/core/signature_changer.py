@@ -0,0 +1,475 @@
+"""Adding and removing method parameters together with their call sites.
+
+SignatureChanger applies one signature change (any number of removed and
+added parameters) to a method and the overrides it shares a slot with, and
+rewrites the calls:
+
+- a removed parameter's argument is dropped, whether it is passed by
+  position or by keyword
+- an added parameter without a default is passed by keyword, with the value
+  given for call sites; parameters with a default need no call-site change.
+  A ``super()`` call from an override forwards the override's own parameter
+
+Calls are matched like MethodRenamer matches accesses: the receiver's type
+(ScopeService.receiver_type, with calls of the project's annotated factory
+functions resolved through the ProjectIndex) must be a class of the method's
+family, so calls on builtins (``settings.get(...)`` with ``settings: dict``),
+library classes and unrelated classes are never changed. Receivers of unknown
+type are matched only with include_unresolved, when no class outside the
+family defines a method of that name.
+
+Calls that may be calls of the method but are left unchanged are recorded in
+``skipped``, and check_skipped() raises for them:
+- calls on a receiver of unknown type whose arguments the change affects,
+  without include_unresolved, when no class outside the family defines the
+  method
+- calls whose positional arguments cannot be matched to parameters (a
+  ``*args`` before a removed parameter's position)
+
+Each module is parsed once and transformed in one pass for all parameters.
+
+Usage:
+    change = SignatureChange("Order", "total", removed=("legacy", "unused"))
+    index, callers = signature_scope(file_path, "total", updater)
+    changer = SignatureChanger(index, change, definition)
+    new_module = changer.update_module(module, file_path)  # the defining module
+    new_code = changer.rewrite_files(callers)  # {path: code} for the changed files
+    changer.check_skipped()  # before writing anything
+"""
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Sequence, TypeVar
+
+import libcst as cst
+
+from molting.core.call_site_updater import CallSiteUpdater
+from molting.core.profiling import phase
+from molting.core.project_index import ProjectIndex
+from molting.core.scope_service import ScopeService
+
+_Node = TypeVar("_Node", cst.Param, cst.Arg)
+
+
+@dataclass(frozen=True)
+class AddedParameter:
+    """A parameter added to a method.
+
+    Attributes:
+        name: Parameter name
+        default: Source code of the default value, if any
+        value: Source code of the argument passed by call sites when there is
+            no default; call sites are not changed if None
+    """
+
+    name: str
+    default: str | None = None
+    value: str | None = None
+
+
+@dataclass(frozen=True)
+class SignatureChange:
+    """Parameters removed from and added to a method.
+
+    Attributes:
+        class_name: Class defining the method
+        method_name: Method name
+        removed: Names of the parameters to remove
+        added: Parameters to append after the existing positional parameters
+    """
+
+    class_name: str
+    method_name: str
+    removed: tuple[str, ...] = ()
+    added: tuple[AddedParameter, ...] = ()
+
+
+def parse_added_parameters(text: str) -> list[AddedParameter]:
+    """Parse parameter declarations such as ``include_email`` or ``limit=10, verbose=False``.
+
+    Args:
+        text: Comma-separated parameter names, each with an optional default
+
+    Returns:
+        The parameters, in order
+
+    Raises:
+        ValueError: If the text is not a plain parameter list
+    """
+    try:
+        expression = cst.parse_expression(f"lambda {text}: None")
+    except cst.ParserSyntaxError as e:
+        raise ValueError(f"Invalid parameter list: '{text}'") from e
+    assert isinstance(expression, cst.Lambda)
+    params = expression.params
+    if (
+        params.posonly_params
+        or params.kwonly_params
+        or not isinstance(params.star_arg, cst.MaybeSentinel)
+        or params.star_kwarg is not None
+    ):
+        raise ValueError(f"Invalid parameter list: '{text}' (expected names with defaults)")
+    return [
+        AddedParameter(
+            param.name.value,
+            cst.Module([]).code_for_node(param.default) if param.default is not None else None,
+        )
+        for param in params.params
+    ]
+
+
+def signature_scope(
+    file_path: Path, method_name: str, updater: CallSiteUpdater | None
+) -> tuple[ProjectIndex, list[Path]]:
+    """Return the class index and the other files a signature change must visit.
+
+    Args:
+        file_path: File defining the method
+        method_name: Name of the method
+        updater: Call site updater over the project, or None to change the
+            defining file only
+
+    Returns:
+        The index of the classes in scope, and the files other than
+        file_path that may call the method
+    """
+    file_path = file_path.resolve()
+    if updater is None:
+        return ProjectIndex.from_files([file_path]), []
+    files = {path.resolve() for path in updater.find_candidate_lines([method_name])}
+    files.discard(file_path)
+    return ProjectIndex.build(updater.directory), sorted(files)
+
+
+class SignatureChanger:
+    """Applies a signature change to a method family and its calls."""
+
+    def __init__(
+        self,
+        index: ProjectIndex,
+        change: SignatureChange,
+        definition: cst.FunctionDef,
+        include_unresolved: bool = False,
+    ) -> None:
+        """Resolve the method family and the positions of the removed parameters.
+
+        Args:
+            index: Index of the project's classes
+            change: The change to apply
+            definition: The method's definition in change.class_name
+            include_unresolved: Also change calls on receivers of unknown type
+                when the method name is unambiguous in the project
+
+        Raises:
+            ValueError: If a removed parameter does not exist, or an added one already does
+        """
+        self.change = change
+        self.index = index
+        self.family = index.method_family(change.class_name, change.method_name)
+        self.ambiguous = bool(index.classes_defining(change.method_name) - self.family)
+        self.include_unresolved = include_unresolved
+        # ``file:line`` of the calls that could not be updated
+        self.skipped: list[str] = []
+        # The skipped calls whose receiver's type is unknown
+        self.unresolved: list[str] = []
+
+        params = definition.params
+        positional = [param.name.value for param in [*params.posonly_params, *params.params]]
+        names = {*positional, *(param.name.value for param in params.kwonly_params)}
+        for name in change.removed:
+            if name not in names:
+                raise ValueError(f"Parameter '{name}' not found in method '{change.method_name}'")
+        for added in change.added:
+            if added.name in names:
+                raise ValueError(
+                    f"Parameter '{added.name}' already exists in method '{change.method_name}'"
+                )
+
+        self.is_static = _is_static(definition)
+        offset = 0 if self.is_static else 1
+        # Removed parameter -> index of its positional argument in a call on an instance
+        self.positions = {
+            name: positional.index(name) - offset for name in change.removed if name in positional
+        }
+
+    def update_module(self, module: cst.Module, file_path: Path | None = None) -> cst.Module:
+        """Change the method's definitions and calls in a module.
+
+        Args:
+            module: The module to transform
+            file_path: File of the module, to report skipped calls
+
+        Returns:
+            The transformed module
+        """
+        if self.change.method_name not in module.code:
+            return module
+        location = str(file_path) if file_path is not None else "<module>"
+        return module.visit(_SignatureTransformer(self, ScopeService.for_module(module), location))
+
+    def rewrite_files(self, files: Iterable[Path]) -> dict[Path, str]:
+        """Change the method's definitions and calls in several files.
+
+        Files are read but not written.
+
+        Args:
+            files: Files to transform
+
+        Returns:
+            File -> new code, for the files that changed
+        """
+        result = {}
+        for file_path in files:
+            with phase("parse"):
+                source = file_path.read_text()
+                module = cst.parse_module(source)
+            with phase("transform"):
+                new_code = self.update_module(module, file_path).code
+            if new_code != source:
+                result[file_path] = new_code
+        return result
+
+    def update_params(self, params: cst.Parameters) -> cst.Parameters:
+        """Return a definition's parameters with the change applied.
+
+        Raises:
+            ValueError: If a parameter without default would follow one with a default
+        """
+        removed = set(self.change.removed)
+        posonly = [p for p in params.posonly_params if p.name.value not in removed]
+        regular = [p for p in params.params if p.name.value not in removed]
+        kwonly = [p for p in params.kwonly_params if p.name.value not in removed]
+
+        for added in self.change.added:
+            if added.default is None and any(p.default is not None for p in [*posonly, *regular]):
+                raise ValueError(
+                    f"Cannot add parameter '{added.name}' without a default after "
+                    "parameters with defaults"
+                )
+            regular.append(
+                cst.Param(
+                    name=cst.Name(added.name),
+                    default=cst.parse_expression(added.default) if added.default else None,
+                    equal=_tight_equal() if added.default else cst.MaybeSentinel.DEFAULT,
+                )
+            )
+
+        return params.with_changes(
+            posonly_params=_close(posonly, params.posonly_params),
+            params=_close(regular, params.params),
+            kwonly_params=_close(kwonly, params.kwonly_params),
+        )
+
+    def update_args(
+        self, args: Sequence[cst.Arg], unbound: bool = False, forward: bool = False
+    ) -> Sequence[cst.Arg] | None:
+        """Return a call's arguments with the change applied.
+
+        Args:
+            args: The call's arguments
+            unbound: Whether the call passes the instance explicitly (``Class.method(obj)``)
+            forward: Whether added parameters are passed as the caller's own
+                parameters of the same name (a ``super()`` call from an override)
+
+        Returns:
+            The new arguments, or None if the call cannot be updated
+        """
+        shift = 1 if unbound and not self.is_static else 0
+        drop_positions = {position + shift for position in self.positions.values()}
+        removed = set(self.change.removed)
+
+        new_args: list[cst.Arg] = []
+        position = 0
+        for arg in args:
+            if arg.star == "*" and drop_positions and position <= max(drop_positions):
+                return None
+            if arg.keyword is None and not arg.star:
+                position += 1
+                if position - 1 in drop_positions:
+                    continue
+            elif arg.keyword is not None and arg.keyword.value in removed:
+                continue
+            new_args.append(arg)
+
+        passed = {arg.keyword.value for arg in new_args if arg.keyword is not None}
+        for added in self.change.added:
+            if added.default is not None or added.name in passed:
+                continue
+            if forward or added.value is not None:
+                new_args.append(
+                    cst.Arg(
+                        value=(
+                            cst.Name(added.name)
+                            if forward
+                            else cst.parse_expression(added.value or "")
+                        ),
+                        keyword=cst.Name(added.name),
+                        equal=_tight_equal(),
+                    )
+                )
+        return _close(new_args, args)
+
+    def is_target(self, class_name: str | None) -> bool:
+        """Return whether a call on a receiver of a type calls the changed method."""
+        if class_name is None:
+            return self.include_unresolved and not self.ambiguous
+        return class_name in self.family
+
+    def check_skipped(self) -> None:
+        """Raise if some calls of the method could not be updated.
+
+        Raises:
+            ValueError: If a call's receiver has an unknown type (without
+                include_unresolved), or its arguments could not be matched to
+                the parameters
+        """
+        if not self.skipped:
+            return
+        reasons = []
+        if self.unresolved:
+            reasons.append(
+                f"on receivers of unknown type (pass include_unresolved=True to update them): "
+                f"{', '.join(self.unresolved)}"
+            )
+        unmatched = [location for location in self.skipped if location not in self.unresolved]
+        if unmatched:
+            reasons.append(
+                f"whose arguments cannot be matched to its parameters: {', '.join(unmatched)}"
+            )
+        raise ValueError(
+            f"Cannot update {len(self.skipped)} call(s) of '{self.change.method_name}' "
+            + "; ".join(reasons)
+        )
+
+
+class _SignatureTransformer(cst.CSTTransformer):
+    """Changes the definitions and calls of a method family in one module."""
+
+    def __init__(self, changer: SignatureChanger, scopes: ScopeService, location: str) -> None:
+        """Initialize the transformer.
+
+        Args:
+            changer: The signature change
+            scopes: Scope analysis of the module being transformed
+            location: Path of the module's file, for skipped calls
+        """
+        self.changer = changer
+        self.scopes = scopes
+        self.location = location
+        self.method_name = changer.change.method_name
+        # Enclosing class name, or None for a function, innermost last
+        self.enclosing: list[str | None] = []
+        # Enclosing function names, innermost last
+        self.functions: list[str] = []
+
+    def visit_ClassDef(self, node: cst.ClassDef) -> None:  # noqa: N802
+        """Enter a class."""
+        self.enclosing.append(node.name.value)
+
+    def leave_ClassDef(  # noqa: N802
+        self, original_node: cst.ClassDef, updated_node: cst.ClassDef
+    ) -> cst.ClassDef:
+        """Leave a class."""
+        self.enclosing.pop()
+        return updated_node
+
+    def visit_FunctionDef(self, node: cst.FunctionDef) -> None:  # noqa: N802
+        """Enter a function."""
+        self.enclosing.append(None)
+        self.functions.append(node.name.value)
+
+    def leave_FunctionDef(  # noqa: N802
+        self, original_node: cst.FunctionDef, updated_node: cst.FunctionDef
+    ) -> cst.FunctionDef:
+        """Change the signature of a method of the family."""
+        self.enclosing.pop()
+        self.functions.pop()
+        class_name = self.enclosing[-1] if self.enclosing else None
+        if (
+            class_name is None
+            or original_node.name.value != self.method_name
+            or class_name not in self.changer.family
+        ):
+            return updated_node
+        return updated_node.with_changes(params=self.changer.update_params(updated_node.params))
+
+    def leave_Call(self, original_node: cst.Call, updated_node: cst.Call) -> cst.Call:  # noqa: N802
+        """Change the arguments of a call of the method."""
+        callee = original_node.func
+        if not isinstance(callee, cst.Attribute) or callee.attr.value != self.method_name:
+            return updated_node
+        class_name = self._receiver_class(callee)
+        location = f"{self.location}:{self.scopes.line(original_node)}"
+        # A call that may be a call of the method, left unchanged unless its
+        # arguments need no change
+        unresolved = (
+            class_name is None
+            and not self.changer.ambiguous
+            and not self.changer.include_unresolved
+        )
+        if not unresolved and not self.changer.is_target(class_name):
+            return updated_node
+        unbound = isinstance(callee.value, cst.Name) and callee.value.value in self.changer.family
+        forward = _is_super_call(callee.value) and self.functions[-1:] == [self.method_name]
+        new_args = self.changer.update_args(updated_node.args, unbound, forward)
+        if unresolved:
+            if _changes_args(new_args, updated_node.args):
+                self.changer.skipped.append(location)
+                self.changer.unresolved.append(location)
+            return updated_node
+        if new_args is None:
+            self.changer.skipped.append(location)
+            return updated_node
+        return updated_node.with_changes(args=new_args)
+
+    def _receiver_class(self, callee: cst.Attribute) -> str | None:
+        """Return the type of a call's receiver; ``super()`` counts as the enclosing class."""
+        if _is_super_call(callee.value):
+            classes = [name for name in self.enclosing if name is not None]
+            return classes[-1] if classes else None
+        type_name = self.scopes.receiver_type(callee)
+        index = self.changer.index
+        if type_name in index.functions and type_name not in index.classes:
+            # An imported factory function: its call has its return type
+            return index.functions[type_name]
+        return type_name
+
+
+def _is_super_call(node: cst.BaseExpression) -> bool:
+    """Return whether an expression is a ``super()`` call."""
+    return (
+        isinstance(node, cst.Call)
+        and isinstance(node.func, cst.Name)
+        and node.func.value == "super"
+    )
+
+
+def _changes_args(new_args: Sequence[cst.Arg] | None, args: Sequence[cst.Arg]) -> bool:
+    """Return whether update_args() changed a call's arguments (or could not update them)."""
+    return (
+        new_args is None
+        or len(new_args) != len(args)
+        or any(new is not old for new, old in zip(new_args, args))
+    )
+
+
+def _is_static(function: cst.FunctionDef) -> bool:
+    """Return whether a method is decorated with ``@staticmethod``."""
+    return any(
+        isinstance(decorator.decorator, cst.Name) and decorator.decorator.value == "staticmethod"
+        for decorator in function.decorators
+    )
+
+
+def _tight_equal() -> cst.AssignEqual:
+    """Return ``=`` without surrounding spaces, as in ``name=value``."""
+    return cst.AssignEqual(
+        whitespace_before=cst.SimpleWhitespace(""), whitespace_after=cst.SimpleWhitespace("")
+    )
+
+
+def _close(items: list[_Node], original: Sequence[_Node]) -> list[_Node]:
+    """Drop a trailing comma left on the last item when items were removed from a list."""
+    if items and (not original or items[-1] is not original[-1]):
+        items[-1] = items[-1].with_changes(comma=cst.MaybeSentinel.DEFAULT)
+    return items
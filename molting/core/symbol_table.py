@@ -0,0 +1,240 @@
+"""Module-wide symbol table backing the name conflict checkers.
+
+ModuleSymbolTable collects, in a single traversal, every name a refactoring
+might collide with: module-level classes, functions and assignments, the
+methods and ``__init__`` fields of each class, and the local variables of each
+function. Conflict checks then become dictionary lookups, and a command that
+validates several new names pays for one traversal.
+
+Usage:
+    table = ModuleSymbolTable.for_module(module)
+    if table.has_method("Order", "base_price"):
+        raise ValueError("Method 'base_price' already exists in class 'Order'")
+"""
+
+from typing import Iterable
+
+import libcst as cst
+
+from molting.core.caches import IdentityCache
+
+# Recently built tables, reused by ModuleSymbolTable.for_module()
+_cache: "IdentityCache[cst.CSTNode, ModuleSymbolTable]" = IdentityCache()
+
+
+class ModuleSymbolTable:
+    """Names defined in a module, grouped by the scope they live in.
+
+    Attributes:
+        module_classes: Classes defined at module level
+        module_functions: Functions defined at module level
+        module_assignments: Names assigned (``NAME = ...``) at module level
+        class_methods: Class name -> functions defined anywhere in that class
+        class_fields: Class name -> ``self.<field>`` names assigned in ``__init__``
+        function_locals: Function name -> names assigned inside that function
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty table; use build() or for_module() to populate it."""
+        self.module_classes: set[str] = set()
+        self.module_functions: set[str] = set()
+        self.module_assignments: set[str] = set()
+        self.class_methods: dict[str, set[str]] = {}
+        self.class_fields: dict[str, set[str]] = {}
+        self.function_locals: dict[str, set[str]] = {}
+
+    @classmethod
+    def build(cls, node: cst.CSTNode) -> "ModuleSymbolTable":
+        """Build a table with one traversal of a module (or any subtree).
+
+        Args:
+            node: The module or node to collect names from
+
+        Returns:
+            The populated symbol table
+        """
+        table = cls()
+        node.visit(_SymbolTableBuilder(table))
+        return table
+
+    @classmethod
+    def for_module(cls, node: cst.CSTNode) -> "ModuleSymbolTable":
+        """Return the table for a node, reusing it if the same node was seen recently.
+
+        Args:
+            node: The module or node to collect names from
+
+        Returns:
+            The symbol table for the node
+        """
+        cached = _cache.get(node)
+        if cached is not None:
+            return cached
+
+        table = cls.build(node)
+        cls.remember(node, table)
+        return table
+
+    @classmethod
+    def remember(cls, node: cst.CSTNode, table: "ModuleSymbolTable") -> None:
+        """Store a table built elsewhere so for_module() returns it for a node.
+
+        Args:
+            node: The module or node the table describes
+            table: The symbol table for the node
+        """
+        _cache.put(node, table)
+
+    @classmethod
+    def merge(cls, tables: Iterable["ModuleSymbolTable"]) -> "ModuleSymbolTable":
+        """Combine the tables of a module's top-level statements into one module table.
+
+        Every scope is keyed by name, so the table of a module is the union of
+        the tables built from each of its top-level statements.
+
+        Args:
+            tables: Tables built from the top-level statements of one module
+
+        Returns:
+            A new table holding all their names
+        """
+        merged = cls()
+        for table in tables:
+            merged.module_classes |= table.module_classes
+            merged.module_functions |= table.module_functions
+            merged.module_assignments |= table.module_assignments
+            for target, source in (
+                (merged.class_methods, table.class_methods),
+                (merged.class_fields, table.class_fields),
+                (merged.function_locals, table.function_locals),
+            ):
+                for name, names in source.items():
+                    target.setdefault(name, set()).update(names)
+        return merged
+
+    def has_class(self, class_name: str) -> bool:
+        """Check if a class is defined at module level."""
+        return class_name in self.module_classes
+
+    def has_function(self, function_name: str) -> bool:
+        """Check if a function is defined at module level."""
+        return function_name in self.module_functions
+
+    def has_constant(self, constant_name: str) -> bool:
+        """Check if a name is assigned at module level."""
+        return constant_name in self.module_assignments
+
+    def has_method(self, class_name: str, method_name: str) -> bool:
+        """Check if a method exists in a class, or a module-level function if no class.
+
+        Args:
+            class_name: Name of the class, or empty string for module-level functions
+            method_name: Method/function name to look up
+        """
+        if not class_name:
+            return self.has_function(method_name)
+        return method_name in self.class_methods.get(class_name, ())
+
+    def has_field(self, class_name: str, field_name: str) -> bool:
+        """Check if ``self.<field_name>`` is assigned in the class's ``__init__``."""
+        return field_name in self.class_fields.get(class_name, ())
+
+    def has_local(self, function_name: str, variable_name: str) -> bool:
+        """Check if a variable is assigned inside a function."""
+        return variable_name in self.function_locals.get(function_name, ())
+
+    def first_local_conflict(self, function_name: str, variable_names: list[str]) -> str | None:
+        """Return the first of several names already assigned inside a function."""
+        local_names = self.function_locals.get(function_name, set())
+        for name in variable_names:
+            if name in local_names:
+                return name
+        return None
+
+
+class _SymbolTableBuilder(cst.CSTVisitor):
+    """Populates a ModuleSymbolTable in a single traversal."""
+
+    def __init__(self, table: ModuleSymbolTable) -> None:
+        """Initialize the builder.
+
+        Args:
+            table: The table to populate
+        """
+        self.table = table
+        self.class_stack: list[str] = []
+        self.function_stack: list[str] = []
+        # Class names whose __init__ we are currently inside
+        self.init_classes: list[str] = []
+
+    def _at_module_level(self) -> bool:
+        """Check if the traversal is outside every class and function."""
+        return not self.class_stack and not self.function_stack
+
+    def visit_ClassDef(self, node: cst.ClassDef) -> None:  # noqa: N802
+        """Record module-level classes and enter the class scope."""
+        name = node.name.value
+        if self._at_module_level():
+            self.table.module_classes.add(name)
+        self.table.class_methods.setdefault(name, set())
+        self.class_stack.append(name)
+
+    def leave_ClassDef(self, original_node: cst.ClassDef) -> None:  # noqa: N802
+        """Leave the class scope."""
+        self.class_stack.pop()
+
+    def visit_FunctionDef(self, node: cst.FunctionDef) -> None:  # noqa: N802
+        """Record the function as a module-level function or a method of its classes."""
+        name = node.name.value
+        if self._at_module_level():
+            self.table.module_functions.add(name)
+        for class_name in self.class_stack:
+            self.table.class_methods[class_name].add(name)
+        if name == "__init__" and self.class_stack:
+            self.init_classes.append(self.class_stack[-1])
+        else:
+            self.init_classes.append("")
+        self.table.function_locals.setdefault(name, set())
+        self.function_stack.append(name)
+
+    def leave_FunctionDef(self, original_node: cst.FunctionDef) -> None:  # noqa: N802
+        """Leave the function scope."""
+        self.function_stack.pop()
+        self.init_classes.pop()
+
+    def visit_Assign(self, node: cst.Assign) -> None:  # noqa: N802
+        """Record assigned names and ``self`` fields."""
+        for target in node.targets:
+            self._record_target(target.target)
+
+    def visit_AnnAssign(self, node: cst.AnnAssign) -> None:  # noqa: N802
+        """Record annotated local variables."""
+        if isinstance(node.target, cst.Name) and self.function_stack:
+            self._record_local(node.target.value)
+
+    def _record_target(self, target: cst.BaseExpression) -> None:
+        """Record a single assignment target."""
+        if isinstance(target, cst.Name):
+            if self._at_module_level():
+                self.table.module_assignments.add(target.value)
+            self._record_local(target.value)
+        elif (
+            isinstance(target, cst.Attribute)
+            and isinstance(target.value, cst.Name)
+            and target.value.value == "self"
+        ):
+            init_class = self._current_init_class()
+            if init_class:
+                self.table.class_fields.setdefault(init_class, set()).add(target.attr.value)
+
+    def _record_local(self, name: str) -> None:
+        """Record a local in every enclosing function, as nested scopes are searched too."""
+        for function_name in self.function_stack:
+            self.table.function_locals[function_name].add(name)
+
+    def _current_init_class(self) -> str:
+        """Return the class of the innermost enclosing ``__init__``, if any."""
+        for init_class in reversed(self.init_classes):
+            if init_class:
+                return init_class
+        return ""
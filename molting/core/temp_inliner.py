@@ -0,0 +1,540 @@
+"""Finding and inlining every single-assignment temp of a module at once.
+
+TempTable resolves the module's scopes once, with ScopeService, and reads the
+def-use chain of each temp from them: the one assignment of the name in its
+function and every read it reaches. Deciding eligibility for all temps of a
+function, or of a whole file, then costs no further analysis. A temp is
+eligible when:
+
+- it is assigned exactly once, by a plain ``name = value`` statement directly in
+  the function body (not in a branch or loop), and is neither a parameter nor
+  declared ``global``/``nonlocal`` nor deleted
+- it is read at least once, only after its assignment, and not from a nested
+  function, lambda or class, whose code may run later
+- its value has no calls, awaits, yields or ``:=``, and no name the value reads
+  is assigned again after the temp, so evaluating the value at each use gives
+  the same result; a value reading attributes or subscripts additionally needs
+  no call or attribute/subscript store between the assignment and the end of
+  the statement holding the last use
+- a value that builds a new object (a list, dict, set or comprehension) is read
+  only once, so identity is preserved
+
+inline_temps substitutes the values in one transform of the module. Temps
+assigned from other temps get the earlier values substituted first, and
+values are parenthesized where the precedence of the use requires it.
+
+Usage:
+    table = TempTable(module)
+    temps = [temp for function in functions for temp in table.temps(function)]
+    module = inline_temps(module, temps)
+"""
+
+from dataclasses import dataclass
+from typing import Callable, Iterable, Mapping, Sequence
+
+import libcst as cst
+from libcst.metadata import Access, Assignment, ComprehensionScope, Scope
+
+from molting.core.scope_service import ScopeService
+
+# Precedence of an expression that never needs parentheses (names, calls, literals, ...)
+_ATOM = 16
+
+_BINARY_PRECEDENCE: dict[type[cst.BaseBinaryOp], int] = {
+    cst.BitOr: 6,
+    cst.BitXor: 7,
+    cst.BitAnd: 8,
+    cst.LeftShift: 9,
+    cst.RightShift: 9,
+    cst.Add: 10,
+    cst.Subtract: 10,
+    cst.Multiply: 11,
+    cst.MatrixMultiply: 11,
+    cst.Divide: 11,
+    cst.FloorDivide: 11,
+    cst.Modulo: 11,
+    cst.Power: 13,
+}
+
+# Values that evaluate to a new object each time
+_CONSTRUCTORS = (
+    cst.List,
+    cst.Dict,
+    cst.Set,
+    cst.ListComp,
+    cst.DictComp,
+    cst.SetComp,
+    cst.GeneratorExp,
+)
+
+
+@dataclass(frozen=True, eq=False)
+class Temp:
+    """A temp that can be inlined, with its def-use chain.
+
+    Attributes:
+        name: Name of the temp
+        function: Function the temp is local to
+        statement: The ``name = value`` statement assigning it
+        value: The assigned expression
+        uses: The Name nodes reading the temp, in source order
+        reads: Names the value reads
+    """
+
+    name: str
+    function: cst.FunctionDef
+    statement: cst.SimpleStatementLine
+    value: cst.BaseExpression
+    uses: tuple[cst.Name, ...]
+    reads: frozenset[str]
+
+
+class TempTable:
+    """Def-use table of the temps of a module's functions."""
+
+    def __init__(self, module: cst.Module) -> None:
+        """Resolve the scopes of a module.
+
+        Args:
+            module: The module whose functions are examined
+        """
+        self.scopes = ScopeService.for_module(module)
+
+    def temps(self, function: cst.FunctionDef) -> list[Temp]:
+        """Return the eligible temps of a function, in definition order.
+
+        Args:
+            function: A function of the module
+
+        Returns:
+            The temps that can be inlined
+        """
+        if not isinstance(function.body, cst.IndentedBlock):
+            return []
+        scope = self.scopes.function_scope(function)
+        facts = _FunctionFacts(self.scopes)
+        function.body.visit(facts)
+
+        temps = []
+        chains: dict[str, _Chain] = {}
+        for statement in function.body.body:
+            assignment = self._single_assignment(statement, scope, facts.deleted)
+            if assignment is None:
+                continue
+            assert isinstance(statement, cst.SimpleStatementLine)
+            assign = statement.body[0]
+            assert isinstance(assign, cst.Assign)
+            value_facts = _ValueFacts()
+            assign.value.visit(value_facts)
+            if value_facts.has_effects:
+                continue
+            # The values of earlier temps the value reads are evaluated at its uses too
+            chain = _Chain(
+                reads=set(value_facts.reads),
+                reads_state=value_facts.reads_state,
+                builds_object=isinstance(assign.value, _CONSTRUCTORS)
+                or (
+                    isinstance(assign.value, cst.Name)
+                    and assign.value.value in chains
+                    and chains[assign.value.value].builds_object
+                ),
+            )
+            for name in value_facts.reads & chains.keys():
+                chain.reads |= chains[name].reads
+                chain.reads_state |= chains[name].reads_state
+            uses = self._uses(statement, assignment, scope, chain, facts)
+            if uses is None:
+                continue
+            chains[assignment.name] = chain
+            temps.append(
+                Temp(
+                    name=assignment.name,
+                    function=function,
+                    statement=statement,
+                    value=assign.value,
+                    uses=uses,
+                    reads=frozenset(value_facts.reads),
+                )
+            )
+        return temps
+
+    def _single_assignment(
+        self, statement: cst.BaseStatement, scope: Scope, deleted: set[str]
+    ) -> Assignment | None:
+        """Return the binding of a ``name = value`` statement if it is the name's only one."""
+        if not (
+            isinstance(statement, cst.SimpleStatementLine)
+            and len(statement.body) == 1
+            and isinstance(statement.body[0], cst.Assign)
+            and len(statement.body[0].targets) == 1
+        ):
+            return None
+        target = statement.body[0].targets[0].target
+        if not isinstance(target, cst.Name) or target.value in deleted:
+            return None
+        assignments = list(scope.assignments[target.value])
+        if len(assignments) != 1:
+            return None
+        assignment = assignments[0]
+        if not isinstance(assignment, Assignment) or assignment.node is not target:
+            return None
+        return assignment
+
+    def _uses(
+        self,
+        statement: cst.SimpleStatementLine,
+        assignment: Assignment,
+        scope: Scope,
+        chain: "_Chain",
+        facts: "_FunctionFacts",
+    ) -> tuple[cst.Name, ...] | None:
+        """Return the reads of a temp, or None if its value cannot be evaluated at them."""
+        end_line = self.scopes.lines(statement)[1]
+        accesses = sorted(assignment.references, key=lambda access: self.scopes.line(access.node))
+        if not accesses or (chain.builds_object and len(accesses) > 1):
+            return None
+        uses = []
+        for access in accesses:
+            node = access.node
+            if not isinstance(node, cst.Name) or self.scopes.line(node) <= end_line:
+                return None
+            if not _is_evaluated_in(access, scope, chain.reads):
+                return None
+            uses.append(node)
+
+        for name in chain.reads:
+            if any(
+                isinstance(other, Assignment) and self.scopes.line(other.node) > end_line
+                for other in scope.assignments[name]
+            ):
+                return None
+        if chain.reads_state:
+            last_use = facts.statement_end(self.scopes.line(uses[-1]))
+            if any(end_line < line <= last_use for line in facts.effect_lines):
+                return None
+        return tuple(uses)
+
+
+def inline_temps(module: cst.Module, temps: Sequence[Temp]) -> cst.Module:
+    """Replace the uses of temps with their values and remove their assignments.
+
+    Args:
+        module: The module the temps belong to
+        temps: Temps from the module's TempTable, in definition order per function
+
+    Returns:
+        The rewritten module
+    """
+    if not temps:
+        return module
+    values = resolve_values(temps, lambda temp, value: value)
+    replacements = {use: values[temp] for temp in temps for use in temp.uses}
+    return module.visit(NameReplacer(replacements, {temp.statement for temp in temps}))
+
+
+def resolve_values(
+    temps: Sequence[Temp],
+    replacement_for: Callable[[Temp, cst.BaseExpression], cst.BaseExpression],
+) -> dict[Temp, cst.BaseExpression]:
+    """Substitute the temps read by other temps' values, in definition order.
+
+    Args:
+        temps: Temps in definition order per function
+        replacement_for: Returns the expression that replaces the uses of a
+            temp, given the temp and its resolved value
+
+    Returns:
+        Temp -> its value with the uses of earlier temps replaced
+    """
+    values: dict[Temp, cst.BaseExpression] = {}
+    replacements: dict[cst.Name, cst.BaseExpression] = {}
+    for temp in temps:
+        resolved = temp.value.visit(NameReplacer(replacements))
+        assert isinstance(resolved, cst.BaseExpression)
+        values[temp] = resolved
+        replacement = replacement_for(temp, resolved)
+        for use in temp.uses:
+            replacements[use] = replacement
+    return values
+
+
+class NameReplacer(cst.CSTTransformer):
+    """Replaces Name nodes with expressions, parenthesizing them where needed.
+
+    Names are matched by identity against the original tree. Statements can
+    be removed in the same pass.
+    """
+
+    def __init__(
+        self,
+        replacements: Mapping[cst.Name, cst.BaseExpression],
+        removed: Iterable[cst.SimpleStatementLine] = (),
+    ) -> None:
+        """Initialize the replacer.
+
+        Args:
+            replacements: Name node -> expression replacing it
+            removed: Statements to remove
+        """
+        self.replacements = replacements
+        self.removed = set(removed)
+        # Expressions put in place of names, which may need parentheses
+        self._inserted: set[int] = set()
+
+    def leave_Name(  # noqa: N802
+        self, original_node: cst.Name, updated_node: cst.Name
+    ) -> cst.BaseExpression:
+        """Replace a name with its expression."""
+        replacement = self.replacements.get(original_node)
+        if replacement is None:
+            return updated_node
+        if isinstance(replacement, cst.Tuple) and not replacement.lpar:
+            replacement = _parenthesized(replacement)
+        self._inserted.add(id(replacement))
+        return replacement
+
+    def leave_SimpleStatementLine(  # noqa: N802
+        self, original_node: cst.SimpleStatementLine, updated_node: cst.SimpleStatementLine
+    ) -> cst.SimpleStatementLine | cst.RemovalSentinel:
+        """Remove the statements assigning inlined temps."""
+        if original_node in self.removed:
+            return cst.RemoveFromParent()
+        return updated_node
+
+    def leave_BinaryOperation(  # noqa: N802
+        self, original_node: cst.BinaryOperation, updated_node: cst.BinaryOperation
+    ) -> cst.BinaryOperation:
+        """Parenthesize operands that bind less tightly than the operator."""
+        precedence = _precedence(updated_node)
+        # ** is right-associative, the other operators left-associative
+        power = isinstance(updated_node.operator, cst.Power)
+        return updated_node.with_changes(
+            left=self._wrap(updated_node.left, precedence + power),
+            right=self._wrap(updated_node.right, precedence + (not power)),
+        )
+
+    def leave_BooleanOperation(  # noqa: N802
+        self, original_node: cst.BooleanOperation, updated_node: cst.BooleanOperation
+    ) -> cst.BooleanOperation:
+        """Parenthesize operands that bind less tightly than ``and``/``or``."""
+        precedence = _precedence(updated_node)
+        return updated_node.with_changes(
+            left=self._wrap(updated_node.left, precedence),
+            right=self._wrap(updated_node.right, precedence + 1),
+        )
+
+    def leave_UnaryOperation(  # noqa: N802
+        self, original_node: cst.UnaryOperation, updated_node: cst.UnaryOperation
+    ) -> cst.UnaryOperation:
+        """Parenthesize an operand that binds less tightly than the operator."""
+        return updated_node.with_changes(
+            expression=self._wrap(updated_node.expression, _precedence(updated_node))
+        )
+
+    def leave_Comparison(  # noqa: N802
+        self, original_node: cst.Comparison, updated_node: cst.Comparison
+    ) -> cst.Comparison:
+        """Parenthesize operands that are comparisons or bind less tightly."""
+        precedence = _precedence(updated_node) + 1
+        return updated_node.with_changes(
+            left=self._wrap(updated_node.left, precedence),
+            comparisons=[
+                target.with_changes(comparator=self._wrap(target.comparator, precedence))
+                for target in updated_node.comparisons
+            ],
+        )
+
+    def leave_IfExp(  # noqa: N802
+        self, original_node: cst.IfExp, updated_node: cst.IfExp
+    ) -> cst.IfExp:
+        """Parenthesize parts that are conditional expressions or lambdas."""
+        precedence = _precedence(updated_node) + 1
+        return updated_node.with_changes(
+            test=self._wrap(updated_node.test, precedence),
+            body=self._wrap(updated_node.body, precedence),
+            orelse=self._wrap(updated_node.orelse, precedence),
+        )
+
+    def leave_Attribute(  # noqa: N802
+        self, original_node: cst.Attribute, updated_node: cst.Attribute
+    ) -> cst.Attribute:
+        """Parenthesize an object that is not an atom, or is a number (``(1).real``)."""
+        value = updated_node.value
+        if id(value) in self._inserted and isinstance(value, (cst.Integer, cst.Float)):
+            return updated_node.with_changes(value=_parenthesized(value))
+        return updated_node.with_changes(value=self._wrap(value, _ATOM))
+
+    def leave_Subscript(  # noqa: N802
+        self, original_node: cst.Subscript, updated_node: cst.Subscript
+    ) -> cst.Subscript:
+        """Parenthesize a subscripted object that is not an atom."""
+        return updated_node.with_changes(value=self._wrap(updated_node.value, _ATOM))
+
+    def leave_Call(self, original_node: cst.Call, updated_node: cst.Call) -> cst.Call:  # noqa: N802
+        """Parenthesize a callee that is not an atom."""
+        return updated_node.with_changes(func=self._wrap(updated_node.func, _ATOM))
+
+    def _wrap(self, node: cst.BaseExpression, minimum: int) -> cst.BaseExpression:
+        """Parenthesize an inserted expression whose precedence is below a minimum."""
+        if id(node) in self._inserted and _precedence(node) < minimum:
+            return _parenthesized(node)
+        return node
+
+
+@dataclass
+class _Chain:
+    """What a temp's value depends on, including the earlier temps it reads.
+
+    Attributes:
+        reads: Names read
+        reads_state: Whether attributes or subscripts are read
+        builds_object: Whether the value is a new object each time
+    """
+
+    reads: set[str]
+    reads_state: bool
+    builds_object: bool
+
+
+def _precedence(node: cst.BaseExpression) -> int:
+    """Return how tightly an expression binds, from -1 (bare tuple) to _ATOM."""
+    if node.lpar:
+        return _ATOM
+    if isinstance(node, cst.Tuple):
+        return -1
+    if isinstance(node, cst.Lambda):
+        return 0
+    if isinstance(node, cst.IfExp):
+        return 1
+    if isinstance(node, cst.BooleanOperation):
+        return 2 if isinstance(node.operator, cst.Or) else 3
+    if isinstance(node, cst.UnaryOperation):
+        return 4 if isinstance(node.operator, cst.Not) else 12
+    if isinstance(node, cst.Comparison):
+        return 5
+    if isinstance(node, cst.BinaryOperation):
+        return _BINARY_PRECEDENCE[type(node.operator)]
+    if isinstance(node, cst.Await):
+        return 14
+    return _ATOM
+
+
+def _parenthesized(node: cst.BaseExpression) -> cst.BaseExpression:
+    """Wrap an expression in parentheses."""
+    return node.with_changes(lpar=[cst.LeftParen()], rpar=[cst.RightParen()])
+
+
+def _is_evaluated_in(access: Access, scope: Scope, reads: set[str]) -> bool:
+    """Return whether a read runs immediately in a scope and sees the same names there.
+
+    Reads inside comprehensions qualify unless the comprehension binds a name the
+    value reads; reads inside nested functions, lambdas and classes do not.
+    """
+    current: Scope = access.scope
+    while current is not scope:
+        if not isinstance(current, ComprehensionScope):
+            return False
+        if any(current.assignments[name] for name in reads):
+            return False
+        current = current.parent
+    return True
+
+
+class _ValueFacts(cst.CSTVisitor):
+    """Collects what evaluating a temp's value depends on."""
+
+    def __init__(self) -> None:
+        """Initialize the collector."""
+        self.reads: set[str] = set()
+        self.reads_state = False
+        self.has_effects = False
+
+    def visit_Name(self, node: cst.Name) -> None:  # noqa: N802
+        """Record a name read."""
+        self.reads.add(node.value)
+
+    def visit_Attribute(self, node: cst.Attribute) -> bool:  # noqa: N802
+        """Record an attribute read, but not the attribute name."""
+        self.reads_state = True
+        node.value.visit(self)
+        return False
+
+    def visit_Subscript(self, node: cst.Subscript) -> None:  # noqa: N802
+        """Record a subscript read."""
+        self.reads_state = True
+
+    def visit_Call(self, node: cst.Call) -> None:  # noqa: N802
+        """Calls may have side effects or return a new value each time."""
+        self.has_effects = True
+
+    def visit_Await(self, node: cst.Await) -> None:  # noqa: N802
+        """Awaiting cannot be repeated."""
+        self.has_effects = True
+
+    def visit_Yield(self, node: cst.Yield) -> None:  # noqa: N802
+        """Yielding cannot be repeated."""
+        self.has_effects = True
+
+    def visit_NamedExpr(self, node: cst.NamedExpr) -> None:  # noqa: N802
+        """An assignment expression binds a name."""
+        self.has_effects = True
+
+
+class _FunctionFacts(cst.CSTVisitor):
+    """Collects the deleted names and the lines with possible side effects of a function."""
+
+    def __init__(self, scopes: ScopeService) -> None:
+        """Initialize the collector.
+
+        Args:
+            scopes: Scope analysis of the module, for line numbers
+        """
+        self.scopes = scopes
+        self.deleted: set[str] = set()
+        # Lines with a call or a store to an attribute or subscript
+        self.effect_lines: set[int] = set()
+        # (start_line, end_line) of the simple statements
+        self.statement_lines: list[tuple[int, int]] = []
+
+    def statement_end(self, line: int) -> int:
+        """Return the last line of the innermost simple statement containing a line."""
+        ends = [end for start, end in self.statement_lines if start <= line <= end]
+        return min(ends, default=line)
+
+    def visit_SimpleStatementLine(self, node: cst.SimpleStatementLine) -> None:  # noqa: N802
+        """Record the lines of a statement."""
+        self.statement_lines.append(self.scopes.lines(node))
+
+    def visit_Del(self, node: cst.Del) -> None:  # noqa: N802
+        """Record deleted names and mutations."""
+        if isinstance(node.target, cst.Name):
+            self.deleted.add(node.target.value)
+        elif isinstance(node.target, (cst.Tuple, cst.List)):
+            for element in node.target.elements:
+                if isinstance(element.value, cst.Name):
+                    self.deleted.add(element.value.value)
+        self._store(node.target)
+
+    def visit_Call(self, node: cst.Call) -> None:  # noqa: N802
+        """Record a call."""
+        self.effect_lines.add(self.scopes.line(node))
+
+    def visit_AssignTarget(self, node: cst.AssignTarget) -> None:  # noqa: N802
+        """Record a store to an attribute or subscript."""
+        self._store(node.target)
+
+    def visit_AugAssign(self, node: cst.AugAssign) -> None:  # noqa: N802
+        """Record an in-place update of an attribute or subscript."""
+        self._store(node.target)
+
+    def visit_AnnAssign(self, node: cst.AnnAssign) -> None:  # noqa: N802
+        """Record an annotated store to an attribute or subscript."""
+        self._store(node.target)
+
+    def _store(self, target: cst.BaseExpression) -> None:
+        """Record the line of a target if it stores into an object."""
+        if isinstance(target, (cst.Attribute, cst.Subscript)):
+            self.effect_lines.add(self.scopes.line(target))
+        elif isinstance(target, (cst.Tuple, cst.List)):
+            for element in target.elements:
+                self._store(element.value)
@@ -19,8 +19,12 @@ Note on Mutable State Pattern:
     after calling visit().
 """
 
+from abc import ABC, abstractmethod
+
 import libcst as cst
 
+from molting.core.symbol_table import ModuleSymbolTable
+
 
 class SelfFieldCollector(cst.CSTVisitor):
     """Collects all self.field references in a node.
@@ -84,7 +88,25 @@ class SelfFieldChecker(cst.CSTVisitor):
         return True
 
 
-class VariableConflictChecker(cst.CSTVisitor):
+class _SymbolTableChecker(cst.CSTVisitor, ABC):
+    """Base class for conflict checkers answered from a ModuleSymbolTable.
+
+    Visiting a node looks up (or builds, in one pass) the symbol table for that
+    node and stops immediately, so each check is a dictionary lookup and several
+    checks against the same module share one traversal.
+    """
+
+    def on_visit(self, node: cst.CSTNode) -> bool:
+        """Run the check against the node's symbol table and skip traversal."""
+        self._check(ModuleSymbolTable.for_module(node))
+        return False
+
+    @abstractmethod
+    def _check(self, table: ModuleSymbolTable) -> None:
+        """Perform the lookup and record the result."""
+
+
+class VariableConflictChecker(_SymbolTableChecker):
     """Check if a variable name already exists in a function scope.
 
     Use this to detect name conflicts before introducing new variables.
@@ -106,40 +128,13 @@ class VariableConflictChecker(cst.CSTVisitor):
         self.function_name = function_name
         self.variable_name = variable_name
         self.has_conflict = False
-        self._in_target_function = False
-
-    def visit_FunctionDef(self, node: cst.FunctionDef) -> bool:  # noqa: N802
-        """Track entry into target function."""
-        if node.name.value == self.function_name:
-            self._in_target_function = True
-        return True
-
-    def leave_FunctionDef(self, node: cst.FunctionDef) -> None:  # noqa: N802
-        """Track exit from target function."""
-        if node.name.value == self.function_name:
-            self._in_target_function = False
-
-    def visit_Assign(self, node: cst.Assign) -> bool:  # noqa: N802
-        """Check assignments for the conflicting variable name."""
-        if not self._in_target_function:
-            return True
-
-        for target in node.targets:
-            if isinstance(target.target, cst.Name) and target.target.value == self.variable_name:
-                self.has_conflict = True
-        return True
-
-    def visit_AnnAssign(self, node: cst.AnnAssign) -> bool:  # noqa: N802
-        """Check annotated assignments for conflicts."""
-        if not self._in_target_function:
-            return True
 
-        if isinstance(node.target, cst.Name) and node.target.value == self.variable_name:
-            self.has_conflict = True
-        return True
+    def _check(self, table: ModuleSymbolTable) -> None:
+        """Check assignments in the function for the variable name."""
+        self.has_conflict = table.has_local(self.function_name, self.variable_name)
 
 
-class MultiVariableConflictChecker(cst.CSTVisitor):
+class MultiVariableConflictChecker(_SymbolTableChecker):
     """Check if any of multiple variable names exist in a function scope.
 
     Use this when a refactoring generates multiple variable names that could conflict.
@@ -162,33 +157,15 @@ class MultiVariableConflictChecker(cst.CSTVisitor):
             variable_names: List of variable names to check for conflicts
         """
         self.function_name = function_name
-        self.variable_names = set(variable_names)
+        self.variable_names = list(variable_names)
         self.conflicting_name: str | None = None
-        self._in_target_function = False
 
-    def visit_FunctionDef(self, node: cst.FunctionDef) -> bool:  # noqa: N802
-        """Track entry into target function."""
-        if node.name.value == self.function_name:
-            self._in_target_function = True
-        return True
-
-    def leave_FunctionDef(self, node: cst.FunctionDef) -> None:  # noqa: N802
-        """Track exit from target function."""
-        if node.name.value == self.function_name:
-            self._in_target_function = False
-
-    def visit_Assign(self, node: cst.Assign) -> bool:  # noqa: N802
-        """Check assignments for conflicting variable names."""
-        if not self._in_target_function:
-            return True
-
-        for target in node.targets:
-            if isinstance(target.target, cst.Name) and target.target.value in self.variable_names:
-                self.conflicting_name = target.target.value
-        return True
+    def _check(self, table: ModuleSymbolTable) -> None:
+        """Find the first variable name already assigned in the function."""
+        self.conflicting_name = table.first_local_conflict(self.function_name, self.variable_names)
 
 
-class MethodConflictChecker(cst.CSTVisitor):
+class MethodConflictChecker(_SymbolTableChecker):
     """Check if a method name already exists in a class or module.
 
     Use this before creating new methods via refactoring.
@@ -216,34 +193,13 @@ class MethodConflictChecker(cst.CSTVisitor):
         self.class_name = class_name
         self.method_name = method_name
         self.has_conflict = False
-        self._in_target_class = False
-        self._in_any_class = False
-
-    def visit_ClassDef(self, node: cst.ClassDef) -> bool:  # noqa: N802
-        """Track entry into target class."""
-        self._in_any_class = True
-        if node.name.value == self.class_name:
-            self._in_target_class = True
-        return True
-
-    def leave_ClassDef(self, node: cst.ClassDef) -> None:  # noqa: N802
-        """Track exit from target class."""
-        if node.name.value == self.class_name:
-            self._in_target_class = False
-        self._in_any_class = False
 
-    def visit_FunctionDef(self, node: cst.FunctionDef) -> bool:  # noqa: N802
-        """Check if this method/function has the conflicting name."""
-        # For class methods, check if we're in the target class
-        if self.class_name and self._in_target_class and node.name.value == self.method_name:
-            self.has_conflict = True
-        # For module-level functions, check if we're NOT in any class
-        elif not self.class_name and not self._in_any_class and node.name.value == self.method_name:
-            self.has_conflict = True
-        return True
+    def _check(self, table: ModuleSymbolTable) -> None:
+        """Check if the class (or module) already defines the method."""
+        self.has_conflict = table.has_method(self.class_name, self.method_name)
 
 
-class FieldConflictChecker(cst.CSTVisitor):
+class FieldConflictChecker(_SymbolTableChecker):
     """Check if a field name already exists in a class.
 
     Use this before moving or creating fields via refactoring.
@@ -266,49 +222,13 @@ class FieldConflictChecker(cst.CSTVisitor):
         self.class_name = class_name
         self.field_name = field_name
         self.has_conflict = False
-        self._in_target_class = False
-        self._in_init = False
-
-    def visit_ClassDef(self, node: cst.ClassDef) -> bool:  # noqa: N802
-        """Track entry into target class."""
-        if node.name.value == self.class_name:
-            self._in_target_class = True
-        return True
-
-    def leave_ClassDef(self, node: cst.ClassDef) -> None:  # noqa: N802
-        """Track exit from target class."""
-        if node.name.value == self.class_name:
-            self._in_target_class = False
-
-    def visit_FunctionDef(self, node: cst.FunctionDef) -> bool:  # noqa: N802
-        """Track entry into __init__ method."""
-        if self._in_target_class and node.name.value == "__init__":
-            self._in_init = True
-        return True
 
-    def leave_FunctionDef(self, node: cst.FunctionDef) -> None:  # noqa: N802
-        """Track exit from __init__ method."""
-        if self._in_target_class and node.name.value == "__init__":
-            self._in_init = False
-
-    def visit_Assign(self, node: cst.Assign) -> bool:  # noqa: N802
-        """Check for self.field_name assignments."""
-        if not self._in_init:
-            return True
-
-        for target in node.targets:
-            if isinstance(target.target, cst.Attribute):
-                attr = target.target
-                if (
-                    isinstance(attr.value, cst.Name)
-                    and attr.value.value == "self"
-                    and attr.attr.value == self.field_name
-                ):
-                    self.has_conflict = True
-        return True
+    def _check(self, table: ModuleSymbolTable) -> None:
+        """Check for a self.field_name assignment in the class's __init__."""
+        self.has_conflict = table.has_field(self.class_name, self.field_name)
 
 
-class ClassConflictChecker(cst.CSTVisitor):
+class ClassConflictChecker(_SymbolTableChecker):
     """Check if a class name already exists at module level.
 
     Use this before creating new classes via refactoring.
@@ -328,35 +248,13 @@ class ClassConflictChecker(cst.CSTVisitor):
         """
         self.class_name = class_name
         self.has_conflict = False
-        self._class_depth = 0  # Track class nesting depth
-        self._function_depth = 0  # Track function nesting depth
-
-    def visit_ClassDef(self, node: cst.ClassDef) -> bool:  # noqa: N802
-        """Check if this is a module-level class with the conflicting name."""
-        if (
-            self._class_depth == 0
-            and self._function_depth == 0
-            and node.name.value == self.class_name
-        ):
-            self.has_conflict = True
-        self._class_depth += 1
-        return True
-
-    def leave_ClassDef(self, node: cst.ClassDef) -> None:  # noqa: N802
-        """Track exit from class."""
-        self._class_depth -= 1
-
-    def visit_FunctionDef(self, node: cst.FunctionDef) -> bool:  # noqa: N802
-        """Track entry into function (increases depth)."""
-        self._function_depth += 1
-        return True
 
-    def leave_FunctionDef(self, node: cst.FunctionDef) -> None:  # noqa: N802
-        """Track exit from function."""
-        self._function_depth -= 1
+    def _check(self, table: ModuleSymbolTable) -> None:
+        """Check for a module-level class with the conflicting name."""
+        self.has_conflict = table.has_class(self.class_name)
 
 
-class ConstantConflictChecker(cst.CSTVisitor):
+class ConstantConflictChecker(_SymbolTableChecker):
     """Check if a module-level constant name already exists.
 
     Use this before creating new module-level constants via refactoring.
@@ -376,39 +274,13 @@ class ConstantConflictChecker(cst.CSTVisitor):
         """
         self.constant_name = constant_name
         self.has_conflict = False
-        self._depth = 0  # Track nesting depth to only check module-level
-
-    def visit_ClassDef(self, node: cst.ClassDef) -> bool:  # noqa: N802
-        """Track entry into class (increases depth)."""
-        self._depth += 1
-        return True
-
-    def leave_ClassDef(self, node: cst.ClassDef) -> None:  # noqa: N802
-        """Track exit from class."""
-        self._depth -= 1
 
-    def visit_FunctionDef(self, node: cst.FunctionDef) -> bool:  # noqa: N802
-        """Track entry into function (increases depth)."""
-        self._depth += 1
-        return True
-
-    def leave_FunctionDef(self, node: cst.FunctionDef) -> None:  # noqa: N802
-        """Track exit from function."""
-        self._depth -= 1
-
-    def visit_Assign(self, node: cst.Assign) -> bool:  # noqa: N802
-        """Check for module-level constant assignment."""
-        if self._depth == 0:
-            for target in node.targets:
-                if (
-                    isinstance(target.target, cst.Name)
-                    and target.target.value == self.constant_name
-                ):
-                    self.has_conflict = True
-        return True
+    def _check(self, table: ModuleSymbolTable) -> None:
+        """Check for a module-level assignment of the constant name."""
+        self.has_conflict = table.has_constant(self.constant_name)
 
 
-class FunctionConflictChecker(cst.CSTVisitor):
+class FunctionConflictChecker(_SymbolTableChecker):
     """Check if a function name already exists at module level.
 
     Use this before creating new module-level functions via refactoring.
@@ -428,27 +300,10 @@ class FunctionConflictChecker(cst.CSTVisitor):
         """
         self.function_name = function_name
         self.has_conflict = False
-        self._depth = 0  # Track nesting depth to only check module-level
-
-    def visit_ClassDef(self, node: cst.ClassDef) -> bool:  # noqa: N802
-        """Track entry into class (increases depth)."""
-        self._depth += 1
-        return True
-
-    def leave_ClassDef(self, node: cst.ClassDef) -> None:  # noqa: N802
-        """Track exit from class."""
-        self._depth -= 1
 
-    def visit_FunctionDef(self, node: cst.FunctionDef) -> bool:  # noqa: N802
-        """Check if this is a module-level function with the conflicting name."""
-        if self._depth == 0 and node.name.value == self.function_name:
-            self.has_conflict = True
-        self._depth += 1
-        return True
-
-    def leave_FunctionDef(self, node: cst.FunctionDef) -> None:  # noqa: N802
-        """Track exit from function."""
-        self._depth -= 1
+    def _check(self, table: ModuleSymbolTable) -> None:
+        """Check for a module-level function with the conflicting name."""
+        self.has_conflict = table.has_function(self.function_name)
 
 
 class DelegatingMethodChecker(cst.CSTVisitor):
@@ -4,6 +4,8 @@ Tests for the Extract Method refactoring, which extracts a code fragment
 into its own new method with a clear, intention-revealing name.
 """
 
+import pytest
+
 from tests.conftest import RefactoringTestBase
 
 
@@ -20,3 +22,60 @@ class TestExtractMethod(RefactoringTestBase):
         or return values.
         """
         self.refactor("extract-method", target="Order::print_owing#L9-L12", name="print_banner")
+
+    def test_with_inputs(self) -> None:
+        """Test extracting code that reads a parameter and an earlier local.
+
+        Both are inputs of the extracted loop, so they become parameters of the new
+        method and arguments of the call. The loop variable is local to the extracted
+        code and the list is only mutated, so nothing is returned.
+        """
+        self.refactor("extract-method", target="Report::render#L11-L12", name="pad_lines")
+
+    def test_conditional_assignment(self) -> None:
+        """Test extracting a branch that assigns a variable on some paths only.
+
+        When the branch is not taken the earlier value must survive, so the variable
+        is passed in as well as returned.
+        """
+        self.refactor("extract-method", target="Order::price#L7-L8", name="adjust")
+
+    def test_multiple_ranges(self) -> None:
+        """Test extracting several line ranges of one method, each into its own method.
+
+        All ranges refer to the lines of the original file.
+        """
+        self.refactor(
+            "extract-method",
+            target="Order::print_owing#L9-L12,L14-L16,L18-L20",
+            name="print_banner,calculate_outstanding,print_details",
+        )
+
+    @pytest.mark.parametrize(
+        "target, name, message",
+        [
+            ("Order::total#L3-L4,L4-L5", "a,b", "overlap the statements extracted into 'a'"),
+            ("Order::total#L3-L3,L4-L4", "a", "Expected 2 method name"),
+            ("Order::total#L3-L3,L4-L4", "a,a", "given more than once"),
+            ("Order::total#L3-L5,L6-L6", "x,y", "Lines 6-6 select no statement of 'Order::total'"),
+            ("Order::total#L1-L1", "x", "Lines 1-1 select no statement"),
+        ],
+    )
+    def test_invalid_ranges(self, target: str, name: str, message: str) -> None:
+        """Test that ranges are validated together before anything is written."""
+        self.test_file = self.tmp_path / "input.py"
+        original = (
+            "class Order:\n"
+            "    def total(self):\n"
+            "        a = 1\n"
+            "        b = 2\n"
+            "        return a + b\n"
+        )
+        self.test_file.write_text(original)
+
+        from molting.cli import refactor_file
+
+        with pytest.raises(ValueError, match=message):
+            refactor_file("extract-method", self.test_file, target=target, name=name)
+
+        assert self.test_file.read_text() == original
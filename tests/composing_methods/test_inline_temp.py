@@ -4,6 +4,8 @@ Tests for the Inline Temp refactoring, which replaces a temp variable
 with its expression.
 """
 
+import pytest
+
 from tests.conftest import RefactoringTestBase
 
 
@@ -31,3 +33,28 @@ class TestInlineTemp(RefactoringTestBase):
         handle the case where inlining is not beneficial.
         """
         self.refactor("inline-temp", target="calculate_price::base_price")
+
+    def test_all_temps(self) -> None:
+        """Test inlining every eligible temp of a function in one pass.
+
+        Temps read by other temps are substituted first and parenthesized where
+        needed. Reassigned temps, temps whose value calls something, and temps
+        reading attributes with a call before their last use are kept.
+        """
+        self.refactor("inline-temp", target="calculate_total")
+
+    def test_whole_file(self) -> None:
+        """Test inlining every eligible temp of every function of a file."""
+        self.refactor("inline-temp")
+
+    def test_function_not_found(self) -> None:
+        """Test that a missing function is reported in batch mode."""
+        from molting.cli import refactor_file
+
+        self.test_file = self.tmp_path / "input.py"
+        source = "def area(width, height):\n    product = width * height\n    return product\n"
+        self.test_file.write_text(source)
+
+        with pytest.raises(ValueError, match="Function 'volume' not found"):
+            refactor_file("inline-temp", self.test_file, target="volume")
+        assert self.test_file.read_text() == source
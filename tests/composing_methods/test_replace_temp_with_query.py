@@ -75,3 +75,27 @@ class TestReplaceTempWithQuery(RefactoringTestBase):
         """
         # Replace perimeter temp in @property decorated area method
         self.refactor("replace-temp-with-query", target="Rectangle::area::perimeter")
+
+    def test_all_temps(self) -> None:
+        """Test replacing every eligible temp of a method with a query in one pass.
+
+        Temps reading parameters or other locals stay, as do temps whose name is
+        already a field of the class. A query may call an earlier query.
+        """
+        self.refactor("replace-temp-with-query", target="Order::get_price")
+
+    def test_whole_class(self) -> None:
+        """Test replacing the temps of every instance method of a class."""
+        self.refactor("replace-temp-with-query", target="Rectangle")
+
+    def test_class_not_found(self) -> None:
+        """Test that a missing class is reported in batch mode."""
+        from molting.cli import refactor_file
+
+        self.test_file = self.tmp_path / "input.py"
+        source = "class Order:\n    def total(self):\n        return 1\n"
+        self.test_file.write_text(source)
+
+        with pytest.raises(ValueError, match="Class 'Invoice' not found"):
+            refactor_file("replace-temp-with-query", self.test_file, target="Invoice")
+        assert self.test_file.read_text() == source
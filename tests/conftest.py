@@ -100,6 +100,35 @@ class RefactoringTestBase:
         # Validate result
         self.assert_matches_expected()
 
+    def copy_fixture_module(self, name: str) -> Path:
+        """Copy an extra module of the fixture next to the input file.
+
+        Multi-module fixtures keep each extra module as ``<name>_input.py``
+        with its expected result in ``<name>_expected.py``.
+
+        Args:
+            name: Module name (e.g., "account_type")
+
+        Returns:
+            Path of the copied module
+        """
+        if self.expected_file is None:
+            raise RuntimeError("No fixture loaded")
+        module_file = self.tmp_path / f"{name}.py"
+        shutil.copy(self.expected_file.parent / f"{name}_input.py", module_file)
+        return module_file
+
+    def assert_module_matches_expected(self, name: str) -> None:
+        """Assert that an extra module copied by copy_fixture_module matches its expected file.
+
+        Args:
+            name: Module name (e.g., "account_type")
+        """
+        if self.expected_file is None:
+            raise RuntimeError("No fixture loaded")
+        expected = (self.expected_file.parent / f"{name}_expected.py").read_text()
+        self._assert_ast_equal((self.tmp_path / f"{name}.py").read_text(), expected)
+
     def assert_matches_expected(self, normalize: bool = True) -> None:
         """Assert that test_file matches expected_file.
 
@@ -0,0 +1,88 @@
+"""Tests for the per-function analysis cache."""
+
+from pathlib import Path
+
+import libcst as cst
+
+from molting.core.analysis_cache import AnalysisCache, function_fingerprint
+from molting.core.local_variable_analyzer import get_local_variables
+
+
+def _function(code: str) -> cst.FunctionDef:
+    """Parse a module and return its first statement, which must be a function."""
+    function = cst.parse_module(code).body[0]
+    assert isinstance(function, cst.FunctionDef)
+    return function
+
+
+class TestFunctionFingerprint:
+    """Tests for function_fingerprint."""
+
+    def test_same_source_same_fingerprint(self) -> None:
+        """Separately parsed copies of a function hash equally."""
+        code = "def f(a):\n    return a + 1\n"
+        assert function_fingerprint(_function(code)) == function_fingerprint(_function(code))
+
+    def test_edit_changes_fingerprint(self) -> None:
+        """Any edit to the function body changes the hash."""
+        before = _function("def f(a):\n    return a + 1\n")
+        after = _function("def f(a):\n    return a + 2\n")
+        assert function_fingerprint(before) != function_fingerprint(after)
+
+
+class TestAnalysisCache:
+    """Tests for AnalysisCache."""
+
+    def test_unchanged_function_is_computed_once(self) -> None:
+        """A second request for the same unchanged function is a hit."""
+        cache = AnalysisCache()
+        calls = []
+
+        def compute() -> int:
+            calls.append(1)
+            return 42
+
+        code = "def f(a):\n    return a\n"
+        first = cache.get_or_compute("facts", Path("m.py"), "f", _function(code), compute)
+        second = cache.get_or_compute("facts", Path("m.py"), "f", _function(code), compute)
+
+        assert first == second == 42
+        assert len(calls) == 1
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_key_includes_kind_file_and_start_line(self) -> None:
+        """Different analyses, files or start lines never share a result."""
+        cache = AnalysisCache()
+        function = _function("def f(a):\n    return a\n")
+
+        cache.get_or_compute("facts", Path("a.py"), "f", function, lambda: 1)
+        cache.get_or_compute("other", Path("a.py"), "f", function, lambda: 2)
+        cache.get_or_compute("facts", Path("b.py"), "f", function, lambda: 3)
+        result = cache.get_or_compute("facts", Path("a.py"), "f", function, lambda: 4, 10)
+
+        assert result == 4
+        assert cache.misses == 4
+
+    def test_least_recently_used_is_evicted(self) -> None:
+        """The cache keeps at most max_entries results."""
+        cache = AnalysisCache(max_entries=2)
+        functions = [_function(f"def f{i}():\n    return {i}\n") for i in range(3)]
+
+        cache.get_or_compute("facts", None, "f0", functions[0], lambda: 0)
+        cache.get_or_compute("facts", None, "f1", functions[1], lambda: 1)
+        cache.get_or_compute("facts", None, "f0", functions[0], lambda: 0)
+        cache.get_or_compute("facts", None, "f2", functions[2], lambda: 2)
+
+        assert len(cache) == 2
+        assert cache.get_or_compute("facts", None, "f0", functions[0], lambda: -1) == 0
+        assert cache.get_or_compute("facts", None, "f1", functions[1], lambda: -1) == -1
+
+
+def test_get_local_variables_returns_independent_lists() -> None:
+    """Cached local variables are returned as fresh lists callers may modify."""
+    function = _function("def f(a):\n    x = a\n    y, z = x, a\n    return y\n")
+
+    first = get_local_variables(function)
+    first.append("mutated")
+
+    assert get_local_variables(function) == ["x", "y", "z"]
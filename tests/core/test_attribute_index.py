@@ -0,0 +1,60 @@
+"""Tests for the project-wide attribute access index."""
+
+from pathlib import Path
+
+from molting.core.attribute_index import AttributeAccessIndex
+
+SOURCE = """\
+class Account:
+    def __init__(this, rate):
+        this.rate = rate
+
+    def yearly(self):
+        def helper():
+            return self.rate
+        return helper()
+
+    @staticmethod
+    def parse(data):
+        return data.rate
+
+
+class Loan:
+    def __init__(self):
+        self.rate = 3
+
+
+def report(account):
+    return account.rate
+"""
+
+
+class TestAttributeAccessIndex:
+    """Tests for AttributeAccessIndex."""
+
+    def test_receiver_class_of_method_receivers(self) -> None:
+        """A method's first parameter, under any name, is an instance of its class."""
+        index = AttributeAccessIndex()
+        index.add_file(Path("bank.py"), SOURCE)
+
+        by_line = {access.line: access.receiver_class for access in index.accesses("rate")}
+
+        assert by_line == {3: "Account", 7: "Account", 12: None, 17: "Loan", 21: None}
+
+    def test_classes_storing(self) -> None:
+        """Only assignments on a method's receiver count as storing the attribute."""
+        index = AttributeAccessIndex()
+        index.add_file(Path("bank.py"), SOURCE)
+
+        assert index.classes_storing("rate") == {"Account", "Loan"}
+        assert index.classes_storing("missing") == set()
+
+    def test_candidate_lines_exclude_other_classes(self, tmp_path: Path) -> None:
+        """Accesses known to be on other classes are not candidates."""
+        (tmp_path / "bank.py").write_text(SOURCE)
+        (tmp_path / "broken.py").write_text("def (:\n")
+        index = AttributeAccessIndex.build(tmp_path)
+
+        candidates = index.candidate_lines(["rate"], {"Account"})
+
+        assert candidates == {(tmp_path / "bank.py").resolve(): {3, 7, 12, 21}}
@@ -0,0 +1,65 @@
+"""Tests for the shared LRU caches."""
+
+import libcst as cst
+
+from molting.core import caches
+from molting.core.caches import IdentityCache, LRUCache, clear_caches
+from molting.core.symbol_table import ModuleSymbolTable
+
+
+class TestLRUCache:
+    """Tests for LRUCache."""
+
+    def test_evicts_least_recently_used(self) -> None:
+        """Past CACHE_SIZE entries, the entry used least recently is dropped."""
+        cache: LRUCache[int, str] = LRUCache()
+        for key in range(caches.CACHE_SIZE):
+            cache.put(key, str(key))
+        cache.get(0)
+
+        cache.put(caches.CACHE_SIZE, "new")
+
+        assert len(cache) == caches.CACHE_SIZE
+        assert cache.get(0) == "0"
+        assert cache.get(1) is None
+
+    def test_clear(self) -> None:
+        """clear() drops every entry."""
+        cache: LRUCache[str, int] = LRUCache()
+        cache.put("a", 1)
+
+        cache.clear()
+
+        assert cache.get("a") is None
+
+
+class TestIdentityCache:
+    """Tests for IdentityCache."""
+
+    def test_keyed_by_identity(self) -> None:
+        """An equal but distinct object misses."""
+        cache: IdentityCache[list[int], str] = IdentityCache()
+        key = [1]
+        cache.put(key, "one")
+
+        assert cache.get(key) == "one"
+        assert cache.get([1]) is None
+
+    def test_keeps_object_alive(self) -> None:
+        """The cached object is held, so its id is not reused while cached."""
+        cache: IdentityCache[object, str] = IdentityCache()
+        cache.put(object(), "value")
+
+        assert len(cache) == 1
+        assert cache.get(object()) is None
+
+
+def test_clear_caches() -> None:
+    """clear_caches() empties the caches used by the analyses."""
+    module = cst.parse_module("x = 1\n")
+    table = ModuleSymbolTable.for_module(module)
+    assert ModuleSymbolTable.for_module(module) is table
+
+    clear_caches()
+
+    assert ModuleSymbolTable.for_module(module) is not table
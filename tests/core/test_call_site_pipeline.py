@@ -0,0 +1,143 @@
+"""Tests for CallSitePipeline."""
+
+import asyncio
+from pathlib import Path
+
+import libcst as cst
+import pytest
+
+from molting.core.call_site_pipeline import CallSitePipeline, PipelineProgress
+from molting.core.call_site_updater import CallSiteUpdater, Reference
+from molting.core.profiling import CpuProfiler, MemoryProfiler
+from molting.core.reference_searcher import GrepSearcher, PythonSearcher
+from molting.core.symbol_context import SymbolContext
+
+
+def _to_getter(node: cst.CSTNode, ref: Reference) -> cst.CSTNode:
+    """Transform x.department.manager to x.get_manager()."""
+    if isinstance(node, cst.Attribute) and isinstance(node.value, cst.Attribute):
+        base = node.value.value
+        return cst.Call(func=cst.Attribute(value=base, attr=cst.Name("get_manager")), args=[])
+    return node
+
+
+class TestCallSitePipeline:
+    """Tests for the CallSitePipeline class."""
+
+    def test_run_updates_all_files(self, tmp_path: Path) -> None:
+        """Test that the pipeline transforms and writes every matching file."""
+        for index in range(5):
+            (tmp_path / f"file{index}.py").write_text(f"x{index} = person.department.manager\n")
+        (tmp_path / "other.py").write_text("manager = 1\n")
+
+        pipeline = CallSitePipeline(CallSiteUpdater(tmp_path, searcher=PythonSearcher()))
+        result = asyncio.run(pipeline.run("manager", SymbolContext.ATTRIBUTE_ACCESS, _to_getter))
+
+        assert result.references_updated == 5
+        assert len(result.files_modified) == 5
+        for index in range(5):
+            content = (tmp_path / f"file{index}.py").read_text()
+            assert content == f"x{index} = person.get_manager()\n"
+        assert (tmp_path / "other.py").read_text() == "manager = 1\n"
+
+    def test_run_streams_from_subprocess_searcher(self, tmp_path: Path) -> None:
+        """Test that command-line backends are streamed through the pipeline."""
+        searcher = GrepSearcher()
+        if not searcher.is_available():
+            pytest.skip("grep is not available")
+        test_file = tmp_path / "test.py"
+        test_file.write_text("a = p.department.manager\nb = q.department.manager\n")
+
+        pipeline = CallSitePipeline(CallSiteUpdater(tmp_path, searcher=searcher), queue_size=1)
+        result = asyncio.run(pipeline.run("manager", SymbolContext.ATTRIBUTE_ACCESS, _to_getter))
+
+        assert result.references_updated == 2
+        assert test_file.read_text() == "a = p.get_manager()\nb = q.get_manager()\n"
+
+    def test_progress_callback_reports_each_stage(self, tmp_path: Path) -> None:
+        """Test that progress is reported for every stage of every file."""
+        (tmp_path / "a.py").write_text("x = p.department.manager\n")
+        (tmp_path / "b.py").write_text("y = q.department.manager\n")
+        events: list[PipelineProgress] = []
+
+        pipeline = CallSitePipeline(
+            CallSiteUpdater(tmp_path, searcher=PythonSearcher()), progress=events.append
+        )
+        asyncio.run(pipeline.run("manager", SymbolContext.ATTRIBUTE_ACCESS, _to_getter))
+
+        stages = [event.stage for event in events]
+        for stage in ("search", "validate", "transform", "write"):
+            assert stages.count(stage) == 2
+        assert events[-1].files_written == 2
+        assert events[-1].references_updated == 2
+
+    def test_run_no_matches(self, tmp_path: Path) -> None:
+        """Test running the pipeline when nothing matches."""
+        (tmp_path / "test.py").write_text("def foo():\n    return None\n")
+
+        pipeline = CallSitePipeline(CallSiteUpdater(tmp_path, searcher=PythonSearcher()))
+        result = asyncio.run(
+            pipeline.run("nonexistent", SymbolContext.ATTRIBUTE_ACCESS, _to_getter)
+        )
+
+        assert result.references_updated == 0
+        assert result.files_modified == []
+
+    def test_invalid_queue_size(self, tmp_path: Path) -> None:
+        """Test that a non-positive queue size is rejected."""
+        with pytest.raises(ValueError, match="queue_size"):
+            CallSitePipeline(CallSiteUpdater(tmp_path), queue_size=0)
+
+    def test_update_all_runs_the_pipeline(self, tmp_path: Path) -> None:
+        """Test that CallSiteUpdater.update_all streams through the pipeline."""
+        (tmp_path / "a.py").write_text("x = p.department.manager\n")
+        (tmp_path / "b.py").write_text("y = q.department.manager\n")
+        events: list[PipelineProgress] = []
+
+        updater = CallSiteUpdater(tmp_path, searcher=PythonSearcher())
+        result = updater.update_all(
+            "manager", SymbolContext.ATTRIBUTE_ACCESS, _to_getter, progress=events.append
+        )
+
+        assert result.references_updated == 2
+        assert events[-1].stage == "write"
+        assert events[-1].files_written == 2
+        assert (tmp_path / "a.py").read_text() == "x = p.get_manager()\n"
+
+    def test_update_all_from_running_loop(self, tmp_path: Path) -> None:
+        """Test that update_all works when called from a running event loop."""
+        (tmp_path / "a.py").write_text("x = p.department.manager\n")
+        updater = CallSiteUpdater(tmp_path, searcher=PythonSearcher())
+
+        async def update() -> int:
+            result = updater.update_all("manager", SymbolContext.ATTRIBUTE_ACCESS, _to_getter)
+            return result.references_updated
+
+        assert asyncio.run(update()) == 1
+        assert (tmp_path / "a.py").read_text() == "x = p.get_manager()\n"
+
+    def test_failed_run_writes_nothing(self, tmp_path: Path) -> None:
+        """Test that no file is changed when any file fails."""
+        for name in ("a", "b", "c"):
+            (tmp_path / f"{name}.py").write_text(f"{name} = p.department.manager\n")
+        (tmp_path / "b.py").write_text("b = p.department.manager\ndef broken(:\n")
+
+        updater = CallSiteUpdater(tmp_path, searcher=PythonSearcher())
+        with pytest.raises(RuntimeError, match="b.py"):
+            updater.update_all("manager", SymbolContext.ATTRIBUTE_ACCESS, _to_getter)
+
+        assert (tmp_path / "a.py").read_text() == "a = p.department.manager\n"
+        assert (tmp_path / "c.py").read_text() == "c = p.department.manager\n"
+
+    def test_update_all_is_profiled(self, tmp_path: Path) -> None:
+        """Test that every stage is recorded while a profiler is active."""
+        (tmp_path / "a.py").write_text("x = p.department.manager\n")
+        updater = CallSiteUpdater(tmp_path, searcher=PythonSearcher())
+
+        with MemoryProfiler() as memory, CpuProfiler() as cpu:
+            updater.update_all("manager", SymbolContext.ATTRIBUTE_ACCESS, _to_getter)
+
+        phases = [phase.name for phase in memory.report.phases]
+        assert phases == ["search", "parse", "metadata", "transform", "write"]
+        functions = [timing.name for timing in cpu.top_functions(limit=100)]
+        assert any("find_references_in_file" in name for name in functions)
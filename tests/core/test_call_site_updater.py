@@ -4,7 +4,12 @@ from pathlib import Path
 
 import libcst as cst
 
-from molting.core.call_site_updater import CallSiteUpdater, Reference, UpdateResult
+from molting.core.call_site_updater import (
+    CallSiteUpdater,
+    Reference,
+    SourceFileTable,
+    UpdateResult,
+)
 from molting.core.reference_searcher import PythonSearcher
 from molting.core.symbol_context import SymbolContext
 
@@ -95,6 +100,18 @@ def process(person):
 
         assert len(refs) == 0
 
+    def test_find_candidate_lines_groups_symbols_by_file(self, tmp_path: Path) -> None:
+        """Test that lines matching any of several symbols are grouped per file."""
+        (tmp_path / "a.py").write_text("x.alpha()\ny = 1\nx.beta()\n")
+        (tmp_path / "b.py").write_text("x.beta()\n")
+        (tmp_path / "c.py").write_text("x.gamma()\n")
+
+        updater = CallSiteUpdater(tmp_path, searcher=PythonSearcher())
+        lines = updater.find_candidate_lines(["alpha", "beta", "beta"])
+
+        by_name = {path.name: line_numbers for path, line_numbers in lines.items()}
+        assert by_name == {"a.py": {1, 3}, "b.py": {1}}
+
     def test_update_all_transforms_references(self, tmp_path: Path) -> None:
         """Test updating all references with a transformer."""
         test_file = tmp_path / "test.py"
@@ -180,23 +197,21 @@ class TestReference:
     def test_reference_creation(self, tmp_path: Path) -> None:
         """Test creating a Reference instance."""
         test_file = tmp_path / "test.py"
-        module = cst.parse_module("x = person.department")
-        node = module.body[0].body[0].value
+        source = "x = person.department"
+        module = cst.parse_module(source)
+        files = SourceFileTable()
+        file_id = files.add(test_file, module, source)
 
         ref = Reference(
-            file_path=test_file,
+            files=files,
+            file_id=file_id,
             line_number=1,
             column=4,
-            node=node,
-            parent=module.body[0],
-            module=module,
+            node_path=(0, 0, 1),
             context=SymbolContext.ATTRIBUTE_ACCESS,
             symbol="department",
-            containing_class=None,
             containing_function="foo",
             attribute_chain=["person", "department"],
-            source_line="x = person.department",
-            metadata={},
         )
 
         assert ref.file_path == test_file
@@ -204,6 +219,40 @@ class TestReference:
         assert ref.symbol == "department"
         assert ref.context == SymbolContext.ATTRIBUTE_ACCESS
         assert ref.containing_function == "foo"
+        assert ref.module is module
+        assert ref.source_line == source
+
+    def test_reference_has_no_instance_dict(self, tmp_path: Path) -> None:
+        """Test that references use slots instead of a per-instance dict."""
+        files = SourceFileTable()
+        file_id = files.add(tmp_path / "test.py", cst.parse_module(""), "")
+        ref = Reference(
+            files=files,
+            file_id=file_id,
+            line_number=1,
+            column=0,
+            node_path=(),
+            context=SymbolContext.ATTRIBUTE_ACCESS,
+            symbol="x",
+        )
+
+        assert not hasattr(ref, "__dict__")
+
+    def test_references_share_module_and_rehydrate_nodes(self, tmp_path: Path) -> None:
+        """Test that references in one file share a module and resolve their nodes."""
+        test_file = tmp_path / "test.py"
+        test_file.write_text("a = obj.manager\nb = other.manager\n")
+
+        updater = CallSiteUpdater(tmp_path)
+        refs = updater.find_references("manager", SymbolContext.ATTRIBUTE_ACCESS)
+
+        assert len(refs) == 2
+        assert refs[0].module is refs[1].module
+        for ref in refs:
+            assert isinstance(ref.node, cst.Attribute)
+            assert ref.node.attr.value == "manager"
+            assert isinstance(ref.parent, cst.Assign)
+        assert refs[1].source_line == "b = other.manager"
 
 
 class TestUpdateResult:
@@ -0,0 +1,88 @@
+"""Tests for git-aware changed file detection."""
+
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from molting.core.changed_files import direct_importers, git_changed_files
+from molting.core.reference_searcher import FileSetSearcher, PythonSearcher
+
+
+def _git(repo: Path, *args: str) -> None:
+    """Run a git command in the test repository."""
+    subprocess.run(
+        ["git", "-c", "user.name=test", "-c", "user.email=test@example.com", *args],
+        cwd=repo,
+        check=True,
+        capture_output=True,
+    )
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    """Create a git repository with three committed modules."""
+    _git(tmp_path, "init", "-q")
+    (tmp_path / "models.py").write_text("class Person:\n    pass\n")
+    (tmp_path / "service.py").write_text("from models import Person\n")
+    (tmp_path / "other.py").write_text("x = 1\n")
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "commit", "-q", "-m", "initial")
+    return tmp_path
+
+
+class TestGitChangedFiles:
+    """Tests for git_changed_files()."""
+
+    def test_clean_tree_has_no_changes(self, repo: Path) -> None:
+        """Test that an unmodified work tree yields no files."""
+        assert git_changed_files(repo) == set()
+
+    def test_working_tree_and_untracked_changes(self, repo: Path) -> None:
+        """Test that modified and untracked Python files are reported."""
+        (repo / "models.py").write_text("class Person:\n    name = ''\n")
+        (repo / "new.py").write_text("y = 2\n")
+        (repo / "notes.txt").write_text("not python\n")
+
+        assert git_changed_files(repo) == {
+            (repo / "models.py").resolve(),
+            (repo / "new.py").resolve(),
+        }
+
+    def test_changes_since_revision(self, repo: Path) -> None:
+        """Test that committed changes since a revision are reported."""
+        (repo / "other.py").write_text("x = 2\n")
+        _git(repo, "commit", "-q", "-am", "change other")
+
+        assert git_changed_files(repo) == set()
+        assert git_changed_files(repo, since="HEAD~1") == {(repo / "other.py").resolve()}
+
+    def test_not_a_repository(self, tmp_path: Path) -> None:
+        """Test that a directory outside git raises ValueError."""
+        outside = tmp_path / "outside"
+        outside.mkdir()
+        with pytest.raises(ValueError, match="git"):
+            git_changed_files(outside, since="does-not-exist")
+
+
+class TestDirectImporters:
+    """Tests for direct_importers()."""
+
+    def test_finds_importing_modules(self, repo: Path) -> None:
+        """Test that only modules importing a changed file are returned."""
+        importers = direct_importers({repo / "models.py"}, repo, searcher=PythonSearcher())
+
+        assert importers == {(repo / "service.py").resolve()}
+
+
+class TestFileSetSearcher:
+    """Tests for FileSetSearcher."""
+
+    def test_searches_only_given_files(self, tmp_path: Path) -> None:
+        """Test that files outside the candidate set are ignored."""
+        (tmp_path / "a.py").write_text("person.manager\n")
+        (tmp_path / "b.py").write_text("person.manager\n")
+
+        matches = FileSetSearcher({tmp_path / "a.py"}).search("manager", tmp_path)
+
+        assert [match.file_path for match in matches] == [(tmp_path / "a.py").resolve()]
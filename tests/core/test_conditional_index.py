@@ -0,0 +1,84 @@
+"""Tests for the project-wide conditional pattern index."""
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import libcst as cst
+
+from molting.core.conditional_index import ConditionalPatternIndex
+from molting.core.conditional_pattern import extract_pattern
+
+ELIGIBILITY = """\
+def disability_amount(employee):
+    if employee.seniority < 2:
+        return 0
+    if employee.is_part_time:
+        return 0
+    return 100
+"""
+
+SIBLING = """\
+def amount(person):
+    if person.is_part_time:
+        return 0
+    if person.seniority < 2:
+        return 0
+    return 1
+
+
+class Claims:
+    def amount(self, person):
+        if person.is_part_time:
+            return 0
+        return 1
+
+
+def bonus(person):
+    if person.seniority < 3:
+        return 0
+    return 1
+"""
+
+
+def _write_tree(tmp_path: Path) -> None:
+    """Write two modules sharing one conditional pattern and a broken file."""
+    (tmp_path / "benefits.py").write_text(ELIGIBILITY)
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "claims.py").write_text(SIBLING)
+    (tmp_path / "broken.py").write_text("def oops(:\n")
+
+
+class TestConditionalPatternIndex:
+    """Tests for ConditionalPatternIndex."""
+
+    def test_matches_across_files(self, tmp_path: Path) -> None:
+        """Test that functions in other modules with the same pattern are found."""
+        _write_tree(tmp_path)
+        signature = extract_pattern(cst.parse_module(ELIGIBILITY), "disability_amount", "", 2, 5)
+        assert signature is not None
+
+        matches = ConditionalPatternIndex.build(tmp_path).matches(signature)
+
+        assert [(m.file_path.name, m.class_name, m.function_name) for m in matches] == [
+            ("benefits.py", "", "disability_amount"),
+            ("claims.py", "", "amount"),
+        ]
+        assert (matches[1].start_line, matches[1].end_line) == (2, 4)
+
+    def test_duplicates_groups_shared_patterns(self, tmp_path: Path) -> None:
+        """Test that only patterns shared by several functions are grouped."""
+        _write_tree(tmp_path)
+
+        groups = ConditionalPatternIndex.build(tmp_path).duplicates()
+
+        assert len(groups) == 1
+        assert {entry.function_name for entry in groups[0]} == {"disability_amount", "amount"}
+
+    def test_build_with_executor(self, tmp_path: Path) -> None:
+        """Test that a supplied executor produces the same index."""
+        _write_tree(tmp_path)
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            groups = ConditionalPatternIndex.build(tmp_path, executor=executor).duplicates()
+
+        assert [len(group) for group in groups] == [2]
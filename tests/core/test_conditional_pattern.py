@@ -0,0 +1,115 @@
+"""Tests for conditional pattern fingerprints."""
+
+import libcst as cst
+
+from molting.core.conditional_pattern import (
+    ConditionalCatalog,
+    ConditionalPatternSignature,
+    fingerprint_condition,
+)
+
+SOURCE = """\
+def disability_amount(employee):
+    if employee.seniority < 2:
+        return 0
+    if employee.is_part_time:
+        return 0
+    return 100
+
+
+class Benefits:
+    def disability_amount(self):
+        if self.seniority < 2:
+            return 0
+        return 100
+
+
+def claim_amount(person):
+    if person.is_part_time:
+        return 0.0
+    if person.seniority < 2:
+        return 0
+    return 1
+"""
+
+
+def _fingerprint(code: str, param_map: dict[str, str]) -> int:
+    """Fingerprint an expression given as source code."""
+    return fingerprint_condition(cst.parse_expression(code), param_map)
+
+
+class TestFingerprintCondition:
+    """Tests for fingerprint_condition()."""
+
+    def test_parameters_match_by_position(self) -> None:
+        """Test that differently named parameters in the same slot match."""
+        first = _fingerprint("employee.seniority < 2", {"employee": "$0"})
+        second = _fingerprint("person.seniority < 2", {"person": "$0"})
+        other_slot = _fingerprint("person.seniority < 2", {"self": "$0", "person": "$1"})
+
+        assert first == second
+        assert first != other_slot
+
+    def test_ignores_whitespace_and_parentheses(self) -> None:
+        """Test that formatting differences do not change the fingerprint."""
+        assert _fingerprint("(a.x  <  2)", {"a": "$0"}) == _fingerprint("a.x<2", {"a": "$0"})
+
+    def test_distinguishes_structure_and_values(self) -> None:
+        """Test that operators, literals and attribute names are significant."""
+        base = _fingerprint("a.x < 2", {"a": "$0"})
+
+        assert base != _fingerprint("a.x <= 2", {"a": "$0"})
+        assert base != _fingerprint("a.x < 3", {"a": "$0"})
+        assert base != _fingerprint("a.y < 2", {"a": "$0"})
+
+    def test_attribute_named_like_parameter_is_not_replaced(self) -> None:
+        """Test that only name references, not attribute names, map to slots."""
+        assert _fingerprint("a.b > 0", {"a": "$0", "b": "$1"}) != _fingerprint(
+            "a.c > 0", {"a": "$0", "c": "$1"}
+        )
+
+
+class TestConditionalPatternSignature:
+    """Tests for ConditionalPatternSignature."""
+
+    def test_equality_and_hash_follow_fingerprint(self) -> None:
+        """Test that equal conditions give equal, hashable signatures."""
+        first = ConditionalPatternSignature(conditions=(1, 2), num_statements=2)
+        second = ConditionalPatternSignature(conditions=(1, 2), num_statements=2)
+
+        assert first == second
+        assert hash(first) == hash(second) == first.fingerprint
+        assert first != ConditionalPatternSignature(conditions=(1, 3), num_statements=2)
+
+
+class TestConditionalCatalog:
+    """Tests for ConditionalCatalog."""
+
+    def test_records_top_level_ifs_per_function(self) -> None:
+        """Test that each function's if statements are cataloged with their lines."""
+        catalog = ConditionalCatalog.for_module(cst.parse_module(SOURCE))
+
+        method = catalog.find_function("disability_amount", "Benefits")
+        function = catalog.find_function("disability_amount", "")
+
+        assert method is not None and [cataloged.line for cataloged in method.ifs] == [11]
+        assert function is not None and [cataloged.line for cataloged in function.ifs] == [2, 4]
+
+    def test_extract_and_scan_are_lookups(self) -> None:
+        """Test extracting a pattern and finding a reordered match elsewhere."""
+        catalog = ConditionalCatalog.for_module(cst.parse_module(SOURCE))
+
+        pattern = catalog.extract_pattern("disability_amount", "", 2, 5)
+        assert pattern is not None
+        matches = catalog.scan_for_pattern(pattern, "disability_amount", "")
+
+        assert [(match.function_name, match.start_line, match.end_line) for match in matches] == [
+            ("claim_amount", 17, 19)
+        ]
+
+    def test_catalog_is_reused_for_same_module(self) -> None:
+        """Test that the same module object gets the same catalog."""
+        module = cst.parse_module(SOURCE)
+
+        assert ConditionalCatalog.for_module(module) is ConditionalCatalog.for_module(module)
+        assert ConditionalCatalog.for_module(module).module is module
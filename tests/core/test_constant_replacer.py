@@ -0,0 +1,136 @@
+"""Tests for replacing a number with a constant across modules."""
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import libcst as cst
+import pytest
+
+from molting.core.constant_replacer import (
+    ConstantReplacement,
+    parse_number,
+    rewrite_constant,
+    rewrite_constant_in_files,
+)
+from molting.core.import_graph import ImportGraph
+
+SPEC = ConstantReplacement(86400, "SECONDS_PER_DAY", "units")
+
+
+def _rewrite(tmp_path: Path, source: str, module_name: str = "client") -> str:
+    """Rewrite a module of a project whose constants live in units.py."""
+    (tmp_path / "units.py").write_text("")
+    graph = ImportGraph.build(tmp_path)
+    return rewrite_constant(cst.parse_module(source), SPEC, module_name, graph).code
+
+
+class TestParseNumber:
+    """Tests for parse_number."""
+
+    def test_forms(self) -> None:
+        """Integers and floats are parsed in any literal form."""
+        assert parse_number("86_400") == 86400
+        assert parse_number("0x10") == 16
+        assert parse_number(" 9.81 ") == 9.81
+
+    @pytest.mark.parametrize("text", ["True", "1j", "'1'", "x"])
+    def test_invalid(self, text: str) -> None:
+        """Anything but an integer or float literal is rejected."""
+        with pytest.raises(ValueError, match="Invalid number"):
+            parse_number(text)
+
+
+class TestRewriteConstant:
+    """Tests for rewrite_constant."""
+
+    def test_literal_forms(self, tmp_path: Path) -> None:
+        """Literals of the same type and value match, whatever their spelling."""
+        source = "a = 86_400\nb = 0x15180\nc = 86400.0\nd = (86400)\n"
+
+        assert _rewrite(tmp_path, source) == (
+            "from units import SECONDS_PER_DAY\n\n"
+            "a = SECONDS_PER_DAY\nb = SECONDS_PER_DAY\nc = 86400.0\nd = (SECONDS_PER_DAY)\n"
+        )
+
+    def test_existing_relative_import(self, tmp_path: Path) -> None:
+        """An existing import of the constant, relative or not, is reused."""
+        package = tmp_path / "pkg"
+        package.mkdir()
+        (package / "__init__.py").write_text("")
+        (package / "units.py").write_text("SECONDS_PER_DAY = 86400\n")
+        graph = ImportGraph.build(tmp_path)
+        spec = ConstantReplacement(86400, "SECONDS_PER_DAY", "pkg.units")
+        source = "from .units import SECONDS_PER_DAY\n\nx = 86400\n"
+
+        code = rewrite_constant(cst.parse_module(source), spec, "pkg.client", graph).code
+
+        assert code == "from .units import SECONDS_PER_DAY\n\nx = SECONDS_PER_DAY\n"
+
+    def test_literal_annotations_are_kept(self, tmp_path: Path) -> None:
+        """Numbers in ``Literal[...]`` are types and are not replaced."""
+        source = (
+            "import typing\n"
+            "from typing import Literal\n\n"
+            "def wait(a: Literal[86400], b: typing.Literal[1, 86400] = 86400):\n"
+            "    pass\n"
+        )
+
+        assert _rewrite(tmp_path, source) == source.replace(
+            "import Literal\n", "import Literal\n\nfrom units import SECONDS_PER_DAY\n"
+        ).replace("= 86400)", "= SECONDS_PER_DAY)")
+
+    @pytest.mark.parametrize(
+        "imports, separator",
+        [
+            ("import math\n", "\n"),
+            ("import math\n\nfrom units import HOUR\n", ""),
+            ("import math\n\nimport units\n", ""),
+        ],
+    )
+    def test_import_group(self, tmp_path: Path, imports: str, separator: str) -> None:
+        """The constant's import joins the project's imports, or starts their group."""
+        source = f"{imports}\nx = math.floor(86400)\n"
+
+        assert _rewrite(tmp_path, source) == (
+            f"{imports}{separator}from units import SECONDS_PER_DAY\n\n"
+            "x = math.floor(SECONDS_PER_DAY)\n"
+        )
+
+    def test_name_taken(self, tmp_path: Path) -> None:
+        """A module that uses the constant's name for something else is rejected."""
+        with pytest.raises(ValueError, match="already used"):
+            _rewrite(tmp_path, "SECONDS_PER_DAY = 1\nx = 86400\n")
+
+    def test_shadowed_by_local(self, tmp_path: Path) -> None:
+        """A literal where a local name would shadow the constant is rejected."""
+        source = "def f(SECONDS_PER_DAY):\n    return 86400\n"
+
+        with pytest.raises(ValueError, match="client:2: a local name shadows it"):
+            _rewrite(tmp_path, source)
+
+    def test_defining_module_with_other_value(self, tmp_path: Path) -> None:
+        """The defining module cannot already assign the name another value."""
+        with pytest.raises(ValueError, match="Constant 'SECONDS_PER_DAY' already exists"):
+            _rewrite(tmp_path, "SECONDS_PER_DAY = 3600\n", module_name="units")
+
+
+class TestRewriteConstantInFiles:
+    """Tests for rewrite_constant_in_files."""
+
+    def test_files_in_executor(self, tmp_path: Path) -> None:
+        """Files transformed on an executor give the same result as in-process."""
+        (tmp_path / "a.py").write_text("x = 86400\n")
+        (tmp_path / "b.py").write_text("y = 3600\n")
+        graph = ImportGraph.build(tmp_path)
+        files = [tmp_path / "a.py", tmp_path / "b.py", tmp_path / "units.py"]
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            parallel = rewrite_constant_in_files(files, SPEC, graph, executor=executor)
+
+        assert parallel == rewrite_constant_in_files(files, SPEC, graph)
+        assert parallel[tmp_path / "a.py"] == (
+            "from units import SECONDS_PER_DAY\n\nx = SECONDS_PER_DAY\n"
+        )
+        assert parallel[tmp_path / "b.py"] is None
+        # The defining module did not exist and is created
+        assert parallel[tmp_path / "units.py"] == "SECONDS_PER_DAY = 86400\n"
@@ -0,0 +1,144 @@
+"""Tests for the statement-level dataflow engine."""
+
+import libcst as cst
+from libcst.metadata import MetadataWrapper
+
+from molting.core.dataflow import FunctionDataflow
+from molting.core.line_index import LineIndex
+
+
+def _dataflow(code: str, function_name: str) -> FunctionDataflow:
+    """Build the dataflow of a module-level function."""
+    index = LineIndex(MetadataWrapper(cst.parse_module(code)))
+    function = index.find_function(function_name)
+    assert function is not None
+    return FunctionDataflow(function, index.lines)
+
+
+class TestRegionFlow:
+    """Tests for FunctionDataflow.region_flow."""
+
+    def test_straight_line(self) -> None:
+        """Inputs are read-before-written; outputs are written and read later."""
+        code = """
+def process(param):
+    x = 10
+    y = x + param
+    z = y * 2
+    return z
+"""
+        region = _dataflow(code, "process").region_flow(4, 5)
+        assert region.inputs == ["param", "x"]
+        assert region.outputs == ["z"]
+
+    def test_loop_carried_variable_is_output(self) -> None:
+        """A variable read by the loop header on the next iteration is live after the body."""
+        code = """
+def drain(queue):
+    item = queue.pop()
+    while item:
+        handle(item)
+        item = queue.pop()
+    return None
+"""
+        region = _dataflow(code, "drain").region_flow(6, 6)
+        assert region.inputs == ["queue"]
+        assert region.outputs == ["item"]
+
+    def test_loop_carried_variable_is_input(self) -> None:
+        """A definition later in the loop body reaches the region through the back edge."""
+        code = """
+def running(values):
+    total = 0
+    for value in values:
+        print(total)
+        total = total + value
+    return total
+"""
+        region = _dataflow(code, "running").region_flow(5, 5)
+        assert region.inputs == ["total"]
+        assert region.outputs == []
+
+    def test_early_return_is_not_a_later_use(self) -> None:
+        """A read after an unconditional return in the region does not make an output."""
+        code = """
+def first(items):
+    result = None
+    if items:
+        result = items[0]
+        return result
+    print(result)
+    return None
+"""
+        region = _dataflow(code, "first").region_flow(5, 6)
+        assert region.outputs == []
+
+    def test_branch_keeps_variable_live(self) -> None:
+        """A variable defined in one branch and read after the if is an output.
+
+        The earlier value survives the other branch, so it is an input as well.
+        """
+        code = """
+def label(flag):
+    name = "no"
+    if flag:
+        name = "yes"
+    return name
+"""
+        region = _dataflow(code, "label").region_flow(4, 5)
+        assert region.inputs == ["flag", "name"]
+        assert region.outputs == ["name"]
+
+    def test_defined_on_every_path_is_not_input(self) -> None:
+        """An output assigned on both branches does not need its earlier value."""
+        code = """
+def label(flag):
+    name = "no"
+    if flag:
+        name = "yes"
+    else:
+        name = "maybe"
+    return name
+"""
+        region = _dataflow(code, "label").region_flow(4, 7)
+        assert region.inputs == ["flag"]
+        assert region.outputs == ["name"]
+
+    def test_redefined_before_use_is_not_output(self) -> None:
+        """A value overwritten on every path before it is read is dead on exit."""
+        code = """
+def process():
+    x = 1
+    x = 2
+    return x
+"""
+        region = _dataflow(code, "process").region_flow(3, 3)
+        assert region.outputs == []
+
+    def test_globals_and_comprehension_targets_are_not_inputs(self) -> None:
+        """Names without a local definition and comprehension variables are ignored."""
+        code = """
+def squares(limit):
+    values = [n * n for n in range(limit)]
+    return values
+"""
+        region = _dataflow(code, "squares").region_flow(3, 3)
+        assert region.inputs == ["limit"]
+        assert region.outputs == ["values"]
+
+    def test_exception_handler_reads_try_body_definitions(self) -> None:
+        """Statements in a try body may jump to the handler, keeping their definitions live."""
+        code = """
+def load(path):
+    stage = "open"
+    try:
+        handle = open(path)
+        stage = "read"
+        data = handle.read()
+    except OSError:
+        log(stage)
+        data = ""
+    return data
+"""
+        region = _dataflow(code, "load").region_flow(6, 6)
+        assert region.outputs == ["stage"]
@@ -0,0 +1,154 @@
+"""Tests for near-duplicate method detection."""
+
+import shlex
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from molting.cli import main, refactor_file
+from molting.core.duplicate_finder import DuplicateFinder
+
+SITES = """\
+class Site:
+    pass
+
+
+class ResidentialSite(Site):
+    def get_bill_amount(self):
+        base = self.units * self.rate
+        tax = base * Site.TAX_RATE
+        total = base + tax
+        if total > self.limit:
+            total = self.limit
+        return round(total, 2)
+
+
+class LifelineSite(Site):
+    def get_bill_amount(self):
+        base = self.units * self.rate * 0.5
+        tax = base * Site.TAX_RATE * 0.2
+        total = base + tax
+        if total > self.limit:
+            total = self.limit
+        return round(total, 2)
+"""
+
+OTHER = """\
+class Report:
+    def render(self, rows):
+        lines = []
+        for row in rows:
+            lines.append(", ".join(str(cell) for cell in row))
+        return "\\n".join(lines)
+
+    def short(self):
+        return 1
+"""
+
+
+def _write_tree(tmp_path: Path) -> None:
+    """Write a module with two sibling classes and an unrelated module."""
+    (tmp_path / "sites.py").write_text(SITES)
+    (tmp_path / "report.py").write_text(OTHER)
+
+
+class TestDuplicateFinder:
+    """Tests for the DuplicateFinder class."""
+
+    def test_finds_sibling_methods(self, tmp_path: Path) -> None:
+        """Test that near-identical methods of sibling classes are paired."""
+        _write_tree(tmp_path)
+        finder = DuplicateFinder(threshold=0.7)
+        finder.add_directory(tmp_path)
+
+        class_pairs = finder.find_class_pairs()
+
+        assert len(class_pairs) == 1
+        class_pair = class_pairs[0]
+        assert (class_pair.class_a, class_pair.class_b) == ("ResidentialSite", "LifelineSite")
+        assert class_pair.shared_bases == ("Site",)
+        assert class_pair.methods[0].similarity >= 0.7
+        # total is computed the same way in both methods, so it is not a step
+        assert class_pair.suggestion() == (
+            "form-template-method",
+            tmp_path / "sites.py",
+            {
+                "targets": "ResidentialSite::get_bill_amount,LifelineSite::get_bill_amount",
+                "name": "get_bill_amount",
+                "steps": "base:get_base,tax:get_tax",
+            },
+        )
+
+    def test_extract_superclass_suggestion_applies(self, tmp_path: Path) -> None:
+        """Test that classes without a shared base get a complete extract-superclass call."""
+        sites = SITES.replace("class Site:\n    pass\n\n\n", "").replace("(Site)", "")
+        (tmp_path / "sites.py").write_text(sites)
+        finder = DuplicateFinder(threshold=0.7)
+        finder.add_directory(tmp_path)
+
+        refactoring, file_path, params = finder.find_class_pairs()[0].suggestion()
+
+        assert (refactoring, params) == (
+            "extract-superclass",
+            {"targets": "ResidentialSite,LifelineSite", "name": "Site"},
+        )
+        refactor_file(refactoring, file_path, **params)
+        assert "class ResidentialSite(Site):" in file_path.read_text()
+
+    def test_suggested_command_runs_with_apply(self, tmp_path: Path) -> None:
+        """Test that the printed suggestion is a valid apply command line."""
+        sites = SITES.replace("class Site:\n    pass\n\n\n", "").replace("(Site)", "")
+        (tmp_path / "sites.py").write_text(sites)
+        finder = DuplicateFinder(threshold=0.7)
+        finder.add_directory(tmp_path)
+        command = shlex.split(finder.find_class_pairs()[0].suggested_command())
+
+        result = CliRunner().invoke(main, ["apply", *command])
+
+        assert result.exit_code == 0, result.output
+        assert "class ResidentialSite(Site):" in (tmp_path / "sites.py").read_text()
+
+    def test_apply_rejects_invalid_parameters(self, tmp_path: Path) -> None:
+        """Test that apply reports malformed parameters and refactoring errors."""
+        (tmp_path / "sites.py").write_text(SITES)
+        path = str(tmp_path / "sites.py")
+
+        malformed = CliRunner().invoke(main, ["apply", "extract-superclass", path, "Site"])
+        unknown = CliRunner().invoke(main, ["apply", "no-such-refactoring", path])
+
+        assert malformed.exit_code == 2
+        assert "Expected key=value, got 'Site'" in malformed.output
+        assert unknown.exit_code == 1
+        assert "no-such-refactoring" in unknown.output
+        assert (tmp_path / "sites.py").read_text() == SITES
+
+    def test_short_methods_are_ignored(self, tmp_path: Path) -> None:
+        """Test that methods below the token minimum are not fingerprinted."""
+        _write_tree(tmp_path)
+        finder = DuplicateFinder()
+        finder.add_directory(tmp_path)
+
+        assert "short" not in {method.method_name for method in finder.methods}
+
+    def test_identical_shingles_have_full_similarity(self) -> None:
+        """Test that equal token sequences give equal signatures."""
+        finder = DuplicateFinder()
+        tokens = "def f ( self ) : return self . a + self . b".split()
+
+        assert finder.signature(finder.shingles(tokens)) == finder.signature(
+            finder.shingles(list(tokens))
+        )
+
+    def test_find_duplicates_command(self, tmp_path: Path) -> None:
+        """Test the find-duplicates CLI report."""
+        _write_tree(tmp_path)
+
+        result = CliRunner().invoke(main, ["find-duplicates", str(tmp_path), "--threshold", "0.7"])
+
+        assert result.exit_code == 0, result.output
+        assert "ResidentialSite::get_bill_amount" in result.output
+        assert (
+            f"suggested: form-template-method {tmp_path / 'sites.py'} "
+            "targets=ResidentialSite::get_bill_amount,LifelineSite::get_bill_amount "
+            "name=get_bill_amount steps=base:get_base,tax:get_tax"
+        ) in result.output
@@ -0,0 +1,41 @@
+"""Tests for FileTransaction."""
+
+from pathlib import Path
+
+import pytest
+
+from molting.core.file_transaction import FileTransaction
+
+
+class TestFileTransaction:
+    """Tests for the FileTransaction class."""
+
+    def test_nothing_written_before_commit(self, tmp_path: Path) -> None:
+        """Test that staged content only reaches disk on commit."""
+        target = tmp_path / "a.py"
+        target.write_text("old\n")
+        transaction = FileTransaction()
+
+        transaction.stage(target, "new\n")
+
+        assert target.read_text() == "old\n"
+        assert transaction.staged(target) == "new\n"
+        assert transaction.commit() == [target.resolve()]
+        assert target.read_text() == "new\n"
+
+    def test_failed_write_rolls_back(self, tmp_path: Path) -> None:
+        """Test that files written before a failure are restored."""
+        first = tmp_path / "a.py"
+        first.write_text("old\n")
+        created = tmp_path / "b.py"
+        unwritable = tmp_path / "missing" / "c.py"
+        transaction = FileTransaction()
+        transaction.stage(first, "new\n")
+        transaction.stage(created, "created\n")
+        transaction.stage(unwritable, "never\n")
+
+        with pytest.raises(RuntimeError, match="no files were changed"):
+            transaction.commit()
+
+        assert first.read_text() == "old\n"
+        assert not created.exists()
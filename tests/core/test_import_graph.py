@@ -0,0 +1,97 @@
+"""Tests for the project import graph."""
+
+from pathlib import Path
+
+import pytest
+
+from molting.core.import_graph import ImportGraph, find_import_root
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    """A small package with absolute, relative and external imports."""
+    package = tmp_path / "billing"
+    package.mkdir()
+    (package / "__init__.py").write_text("from .account import Account\n")
+    (package / "account.py").write_text("import os\n\nfrom billing.types import AccountType\n")
+    (package / "types.py").write_text("from . import rates\n")
+    (package / "rates.py").write_text("RATE = 2\n")
+    (tmp_path / "main.py").write_text("import billing.account\n")
+    return tmp_path
+
+
+class TestImportGraph:
+    """Tests for ImportGraph."""
+
+    def test_module_names(self, project: Path) -> None:
+        """Files are named by their dotted path; packages by their directory."""
+        graph = ImportGraph.build(project)
+
+        assert graph.module_name(project / "billing" / "account.py") == "billing.account"
+        assert graph.module_name(project / "billing" / "__init__.py") == "billing"
+        assert graph.module_name(project / "main.py") == "main"
+
+    def test_module_names_of_a_package_directory(self, project: Path) -> None:
+        """A graph of a package's directory names its modules from the import root."""
+        graph = ImportGraph.build(project / "billing")
+
+        assert graph.import_root == project.resolve()
+        assert graph.module_name(project / "billing" / "account.py") == "billing.account"
+        assert graph.imports("billing.types") == {"billing", "billing.rates"}
+
+    def test_imports_resolve_relative_and_skip_external(self, project: Path) -> None:
+        """Relative imports are resolved and only project modules are kept."""
+        graph = ImportGraph.build(project)
+
+        assert graph.imports("billing") == {"billing.account"}
+        assert graph.imports("billing.account") == {"billing", "billing.types"}
+        assert graph.imports("billing.types") == {"billing", "billing.rates"}
+        assert graph.imports("main") == {"billing", "billing.account"}
+        assert graph.importers("billing.types") == {"billing.account"}
+
+    def test_reaches(self, project: Path) -> None:
+        """Import chains are followed transitively."""
+        graph = ImportGraph.build(project)
+
+        assert graph.reaches("main", "billing.rates")
+        assert not graph.reaches("billing.rates", "billing.account")
+
+    def test_resolve_relative(self, project: Path) -> None:
+        """Relative names resolve against the module's package."""
+        graph = ImportGraph.build(project)
+
+        assert graph.resolve_relative("billing.types", 1, "rates") == "billing.rates"
+        assert graph.resolve_relative("billing", 1, "account") == "billing.account"
+        assert graph.resolve_relative("billing.types", 0, "os") == "os"
+
+    def test_relative_name(self, project: Path) -> None:
+        """Modules of the same top-level package are named with leading dots."""
+        (project / "billing" / "core").mkdir()
+        (project / "billing" / "core" / "__init__.py").write_text("")
+        (project / "billing" / "core" / "ledger.py").write_text("")
+        graph = ImportGraph.build(project)
+
+        assert graph.relative_name("billing.account", "billing.types") == ".types"
+        assert graph.relative_name("billing.account", "billing") == "."
+        assert graph.relative_name("billing", "billing.rates") == ".rates"
+        assert graph.relative_name("billing.core.ledger", "billing.rates") == "..rates"
+        assert graph.relative_name("billing.account", "billing.core.ledger") == ".core.ledger"
+        assert graph.relative_name("main", "billing.rates") == "billing.rates"
+
+    def test_for_directory_is_cached_until_a_file_changes(self, project: Path) -> None:
+        """The cached graph is reused until a Python file is added or modified."""
+        first = ImportGraph.for_directory(project)
+        assert ImportGraph.for_directory(project) is first
+
+        (project / "billing" / "rates.py").write_text("from billing.account import Account\n")
+        second = ImportGraph.for_directory(project)
+
+        assert second is not first
+        assert second.reaches("billing.rates", "billing.types")
+
+
+def test_find_import_root(project: Path) -> None:
+    """The import root is the parent of the outermost package."""
+    assert find_import_root(project / "billing") == project.resolve()
+    assert find_import_root(project / "billing" / "rates.py") == project.resolve()
+    assert find_import_root(project) == project.resolve()
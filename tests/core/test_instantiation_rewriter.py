@@ -0,0 +1,119 @@
+"""Tests for rewriting instantiations into factory calls."""
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import libcst as cst
+import pytest
+
+from molting.core.import_graph import ImportGraph
+from molting.core.instantiation_rewriter import (
+    FactoryReplacement,
+    rewrite_instantiations,
+    rewrite_instantiations_in_files,
+)
+
+SPEC = FactoryReplacement("Employee", "staff.models", "create_employee")
+
+
+def _project(tmp_path: Path, files: dict[str, str]) -> ImportGraph:
+    """Write a project with a staff.models module and build its import graph."""
+    package = tmp_path / "staff"
+    package.mkdir()
+    (package / "__init__.py").write_text("")
+    (package / "models.py").write_text("class Employee:\n    pass\n")
+    for name, source in files.items():
+        (tmp_path / name).write_text(source)
+    return ImportGraph.build(tmp_path)
+
+
+def _rewrite(tmp_path: Path, source: str, module_name: str = "client") -> str:
+    """Rewrite a module of the project."""
+    graph = _project(tmp_path, {})
+    return rewrite_instantiations(cst.parse_module(source), SPEC, module_name, graph).code
+
+
+class TestRewriteInstantiations:
+    """Tests for rewrite_instantiations."""
+
+    def test_dotted_module_import(self, tmp_path: Path) -> None:
+        """Calls through ``import staff.models`` keep the module prefix."""
+        source = "import staff.models\n\nstaff.models.Employee()\n"
+
+        assert _rewrite(tmp_path, source) == (
+            "import staff.models\n\nstaff.models.create_employee()\n"
+        )
+
+    @pytest.mark.parametrize(
+        "module_import, module_name",
+        [
+            ("from staff import models", "client"),
+            ("from staff import models as m", "client"),
+            ("from . import models", "staff.views"),
+        ],
+    )
+    def test_module_from_import(self, tmp_path: Path, module_import: str, module_name: str) -> None:
+        """Calls through a module bound by a ``from`` import keep the module prefix."""
+        reference = module_import.split()[-1]
+        source = f"{module_import}\n\n{reference}.Employee(3)\n{reference}.helper()\n"
+
+        code = _rewrite(tmp_path, source, module_name=module_name)
+
+        assert code == source.replace(".Employee(", ".create_employee(")
+
+    def test_relative_import(self, tmp_path: Path) -> None:
+        """A relative import of the class's module is recognized."""
+        source = "from .models import Employee\n\nEmployee()\n"
+
+        code = _rewrite(tmp_path, source, module_name="staff.views")
+
+        assert code == "from .models import create_employee\n\ncreate_employee()\n"
+
+    def test_other_modules_class_is_kept(self, tmp_path: Path) -> None:
+        """A class of the same name from another module is not rewritten."""
+        source = "from billing import Employee\n\nEmployee()\n"
+
+        assert _rewrite(tmp_path, source) == source
+
+    def test_factory_already_imported(self, tmp_path: Path) -> None:
+        """An existing import of the factory is reused."""
+        source = (
+            "from staff.models import Employee\n"
+            "from staff.models import create_employee\n\n"
+            "Employee()\n"
+        )
+
+        assert _rewrite(tmp_path, source) == (
+            "from staff.models import create_employee\n\ncreate_employee()\n"
+        )
+
+    def test_factory_name_taken(self, tmp_path: Path) -> None:
+        """A module that uses the factory's name for something else is rejected."""
+        source = "from staff.models import Employee\n\ncreate_employee = 1\nEmployee()\n"
+
+        with pytest.raises(ValueError, match="already used"):
+            _rewrite(tmp_path, source)
+
+
+class TestRewriteInstantiationsInFiles:
+    """Tests for rewrite_instantiations_in_files."""
+
+    def test_files_in_executor(self, tmp_path: Path) -> None:
+        """Files transformed on an executor give the same result as in-process."""
+        graph = _project(
+            tmp_path,
+            {
+                "a.py": "from staff.models import Employee\n\nEmployee()\n",
+                "b.py": "def Employee():\n    return 1\n\nEmployee()\n",
+            },
+        )
+        files = [tmp_path / "a.py", tmp_path / "b.py"]
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            parallel = rewrite_instantiations_in_files(files, SPEC, graph, executor=executor)
+
+        assert parallel == rewrite_instantiations_in_files(files, SPEC, graph)
+        assert parallel[tmp_path / "a.py"] == (
+            "from staff.models import create_employee\n\ncreate_employee()\n"
+        )
+        assert parallel[tmp_path / "b.py"] is None
@@ -0,0 +1,69 @@
+"""Tests for LineIndex."""
+
+import libcst as cst
+
+from molting.core.line_index import get_line_index
+
+SOURCE = """\
+class Order:
+    def print_owing(self, amount):
+        total = amount * 2
+        if total > 10:
+            print("big")
+            print(total)
+        return total
+
+
+def helper(x):
+    return compute(x) * 3
+"""
+
+
+class TestLineIndex:
+    """Tests for the LineIndex class."""
+
+    def test_find_function_by_target_spec(self) -> None:
+        """Test looking up methods and module-level functions."""
+        index = get_line_index(SOURCE)
+
+        method = index.find_function("Order", "print_owing")
+        function = index.find_function("helper")
+
+        assert isinstance(method, cst.FunctionDef)
+        assert method.name.value == "print_owing"
+        assert isinstance(function, cst.FunctionDef)
+        assert function.name.value == "helper"
+        assert index.find_function("Order", "missing") is None
+
+    def test_statement_at_returns_innermost(self) -> None:
+        """Test that the innermost statement covering a line is returned."""
+        index = get_line_index(SOURCE)
+
+        statement = index.statement_at(5)
+
+        assert isinstance(statement, cst.SimpleStatementLine)
+        assert index.lines(statement) == (5, 5)
+
+    def test_enclosing_statement_spans_range(self) -> None:
+        """Test finding the smallest statement covering a line range."""
+        index = get_line_index(SOURCE)
+
+        statement = index.enclosing_statement(5, 6)
+
+        assert isinstance(statement, cst.If)
+        assert index.lines(statement) == (4, 6)
+
+    def test_expressions_starting_on_inner_first(self) -> None:
+        """Test that expressions on a line are listed inner-first."""
+        index = get_line_index(SOURCE)
+        function = index.find_function("helper")
+
+        expressions = index.expressions_starting_on(11, within=function)
+
+        assert isinstance(expressions[-1], cst.BinaryOperation)
+        assert any(isinstance(expr, cst.Call) for expr in expressions[:-1])
+
+    def test_index_is_reused_for_identical_source(self) -> None:
+        """Test that indexing the same source twice reuses the index."""
+        assert get_line_index(SOURCE) is get_line_index(SOURCE)
+        assert get_line_index(SOURCE) is not get_line_index(SOURCE + "\n")
@@ -0,0 +1,170 @@
+"""Tests for moving methods across modules."""
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import libcst as cst
+import pytest
+
+from molting.core.import_graph import ImportGraph
+from molting.core.method_mover import (
+    MovedMethod,
+    carry_imports,
+    rewrite_callers,
+    rewrite_callers_in_files,
+)
+from molting.core.scope_service import ScopeService
+
+SPEC = MovedMethod("charge", frozenset({"Account"}), "account_type", ("days",))
+
+
+def _rewrite(source: str, spec: MovedMethod = SPEC) -> tuple[str, int]:
+    """Rewrite callers in source code."""
+    module, skipped = rewrite_callers(cst.parse_module(source), spec)
+    return module.code, skipped
+
+
+class TestRewriteCallers:
+    """Tests for rewrite_callers."""
+
+    def test_calls_pass_fields_then_arguments(self) -> None:
+        """Calls are redirected to the field and receive the fields first."""
+        code, skipped = _rewrite("def f(account):\n    return account.charge(2)\n")
+
+        assert "account.account_type.charge(account.days, 2)" in code
+        assert skipped == 0
+
+    def test_receivers_of_other_classes_are_kept(self) -> None:
+        """Calls on a resolved receiver of another class are not touched."""
+        source = "class Loan:\n    def f(self):\n        return self.charge()\n"
+
+        assert _rewrite(source) == (source, 0)
+
+    def test_unresolved_receivers_follow_spec(self) -> None:
+        """Unknown receivers are left alone when another class defines the method."""
+        source = "def f(item):\n    return item.charge()\n"
+        spec = MovedMethod("charge", frozenset({"Account"}), "account_type", (), False)
+
+        assert _rewrite(source, spec) == (source, 0)
+
+    def test_untranslatable_accesses_are_counted(self) -> None:
+        """References, super() calls and complex receivers with fields are skipped."""
+        source = (
+            "class Savings(Account):\n"
+            "    def f(self):\n"
+            "        handler = self.charge\n"
+            "        return super().charge() + make().charge()\n"
+        )
+        spec = MovedMethod("charge", frozenset({"Account", "Savings"}), "account_type", ("days",))
+
+        code, skipped = _rewrite(source, spec)
+
+        assert code == source
+        assert skipped == 3
+
+    def test_files_in_executor(self, tmp_path: Path) -> None:
+        """Files transformed on an executor give the same result as in-process."""
+        files = []
+        for number in range(3):
+            file_path = tmp_path / f"caller{number}.py"
+            file_path.write_text(f"def f{number}(account):\n    return account.charge()\n")
+            files.append(file_path)
+        (tmp_path / "other.py").write_text("def g():\n    return 1\n")
+        files.append(tmp_path / "other.py")
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            parallel = rewrite_callers_in_files(files, SPEC, executor=executor)
+        sequential = rewrite_callers_in_files(files, SPEC)
+
+        assert parallel == sequential
+        assert parallel[tmp_path / "other.py"] == (None, 0)
+        assert "account.account_type.charge(account.days)" in str(parallel[files[0]][0])
+
+
+class TestCarryImports:
+    """Tests for carry_imports."""
+
+    def _carry(
+        self, tmp_path: Path, source: str, destination: str, graph_root: str = ""
+    ) -> tuple[str, list[str]]:
+        """Carry the imports of Account.charge from source.py to destination.py."""
+        package = tmp_path / "pkg"
+        package.mkdir()
+        (package / "__init__.py").write_text("")
+        (package / "source.py").write_text(source)
+        (package / "destination.py").write_text(destination)
+        module = cst.parse_module(source)
+        scopes = ScopeService.for_module(module)
+        function = scopes.find_function("Account", "charge")
+        assert function is not None
+
+        new_destination, local = carry_imports(
+            scopes.global_reads(function),
+            package / "source.py",
+            cst.parse_module(destination),
+            package / "destination.py",
+            ImportGraph.build(tmp_path / graph_root),
+        )
+        return new_destination.code, [cst.Module([stmt]).code.strip() for stmt in local]
+
+    @pytest.mark.parametrize("graph_root", ["", "pkg"])
+    def test_imports_are_replicated(self, tmp_path: Path, graph_root: str) -> None:
+        """Imports are copied with their aliases, relative imports stay relative.
+
+        Module names come from the import root, whether the graph covers the
+        package's directory or its parent.
+        """
+        source = (
+            "import os.path\n"
+            "import numpy as np\n"
+            "from .rates import RATE as R\n"
+            "from decimal import Decimal\n\n"
+            "class Account:\n"
+            "    def charge(self):\n"
+            "        return os.path.sep, np.zeros(R), Decimal(1)\n"
+        )
+
+        code, local = self._carry(tmp_path, source, "class Type:\n    pass\n", graph_root)
+
+        assert local == []
+        assert code.startswith(
+            "import os.path\n"
+            "import numpy as np\n"
+            "from .rates import RATE as R\n"
+            "from decimal import Decimal\n"
+        )
+
+    def test_source_names_use_local_import_on_cycle(self, tmp_path: Path) -> None:
+        """A name from a module importing the destination is imported in the method.
+
+        The import is relative, as both modules are in the package.
+        """
+        source = (
+            "from pkg.destination import Type\n\n"
+            "LIMIT = 3\n\n"
+            "class Account:\n"
+            "    def charge(self):\n"
+            "        return Type(LIMIT)\n"
+        )
+        destination = "class Type:\n    pass\n"
+
+        code, local = self._carry(tmp_path, source, destination, "pkg")
+
+        assert code == destination
+        assert local == ["from .source import LIMIT"]
+
+    def test_new_import_is_separated_from_code(self, tmp_path: Path) -> None:
+        """An import added before the destination's code is followed by a blank line."""
+        source = "import math\n\nclass Account:\n    def charge(self):\n        return math.pi\n"
+
+        code, local = self._carry(tmp_path, source, "class Type:\n    pass\n")
+
+        assert local == []
+        assert code == "import math\n\nclass Type:\n    pass\n"
+
+    def test_conflicting_name_is_rejected(self, tmp_path: Path) -> None:
+        """A name the destination binds to something else cannot be carried over."""
+        source = "LIMIT = 3\n\nclass Account:\n    def charge(self):\n        return LIMIT\n"
+
+        with pytest.raises(ValueError, match="'LIMIT' is used by the moved method"):
+            self._carry(tmp_path, source, "LIMIT = 4\n")
@@ -0,0 +1,140 @@
+"""Tests for hierarchy-aware method renaming."""
+
+from pathlib import Path
+
+import libcst as cst
+import pytest
+
+from molting.core.method_renamer import MethodRename, MethodRenamer, parse_rename_map
+from molting.core.project_index import ProjectIndex
+
+SOURCE = """\
+class Shape:
+    def area(self):
+        return 0
+
+
+class Square(Shape):
+    def area(self):
+        return self.side**2
+
+
+class Room:
+    def area(self):
+        return self.width * self.depth
+
+
+def total(shapes):
+    square = Square()
+    room = Room()
+    return square.area() + room.area() + shapes[0].area()
+"""
+
+
+CACHE = """\
+import requests
+from requests import Session
+
+
+class Cache:
+    def get(self, key, default=None):
+        return default
+
+    def append(self, value):
+        pass
+
+
+def lookup(cache: Cache, settings: dict, url, key):
+    names = []
+    names.append(cache.get(key))
+    session = Session()
+    return settings.get("x"), {"y": 1}.get("y"), session.get(url), requests.get(url), names
+"""
+
+
+def _index(source: str) -> ProjectIndex:
+    """Index a single module."""
+    index = ProjectIndex()
+    index.add_file(Path("shapes.py"), source)
+    return index
+
+
+class TestParseRenameMap:
+    """Tests for parse_rename_map."""
+
+    def test_comments_and_blank_lines_are_skipped(self) -> None:
+        """Each non-empty line is one rename; comments are ignored."""
+        renames = parse_rename_map("# header\n\nShape::area surface  # why\nRoom::size dims\n")
+        assert renames == [
+            MethodRename("Shape", "area", "surface"),
+            MethodRename("Room", "size", "dims"),
+        ]
+
+    @pytest.mark.parametrize("line", ["area surface", "Shape::area", "Shape::area 1st"])
+    def test_malformed_line(self, line: str) -> None:
+        """Lines without a Class::method target and a valid new name are rejected."""
+        with pytest.raises(ValueError, match="line 2"):
+            parse_rename_map(f"Shape::perimeter edge\n{line}\n")
+
+
+class TestMethodRenamer:
+    """Tests for MethodRenamer."""
+
+    def test_renames_family_and_resolved_receivers(self) -> None:
+        """Overrides and resolved calls are renamed; unrelated and unknown receivers are not."""
+        renamer = MethodRenamer(_index(SOURCE), [MethodRename("Square", "area", "surface")])
+
+        code = renamer.rename_module(cst.parse_module(SOURCE)).code
+
+        assert code.count("def surface") == 2
+        assert "def area(self):\n        return self.width" in code
+        assert "square.surface() + room.area() + shapes[0].area()" in code
+
+    def test_unknown_receiver_renamed_only_when_opted_in(self) -> None:
+        """Receivers of unknown type are renamed only with include_unresolved, if unambiguous."""
+        source = "def read(store):\n    return store.get('x')\n"
+        renames = [MethodRename("Cache", "get", "fetch")]
+
+        kept = MethodRenamer(_index(CACHE), renames).rename_module(cst.parse_module(source))
+        opted_in = MethodRenamer(_index(CACHE), renames, include_unresolved=True)
+        ambiguous = MethodRenamer(
+            _index(SOURCE), [MethodRename("Room", "area", "floor")], include_unresolved=True
+        )
+
+        assert kept.code == source
+        assert "store.fetch('x')" in opted_in.rename_module(cst.parse_module(source)).code
+        # Shape also defines area
+        assert ambiguous.new_name_for(None, "area") is None
+        assert ambiguous.new_name_for("Room", "area") == "floor"
+
+    def test_builtin_receivers_are_not_renamed(self) -> None:
+        """Same-named methods of dict, list and library classes are left alone."""
+        renamer = MethodRenamer(
+            _index(CACHE),
+            [MethodRename("Cache", "get", "fetch"), MethodRename("Cache", "append", "push")],
+            include_unresolved=True,
+        )
+
+        code = renamer.rename_module(cst.parse_module(CACHE)).code
+
+        assert "def fetch(self, key, default=None)" in code
+        assert "def push(self, value)" in code
+        assert 'settings.get("x")' in code
+        assert '{"y": 1}.get("y")' in code
+        assert "names.append(cache.fetch(key))" in code
+        assert "session.get(url)" in code
+        assert "requests.get(url)" in code
+
+    def test_conflicting_renames(self) -> None:
+        """Two new names for one method family are rejected."""
+        with pytest.raises(ValueError, match="Conflicting renames"):
+            MethodRenamer(
+                _index(SOURCE),
+                [MethodRename("Shape", "area", "surface"), MethodRename("Square", "area", "size")],
+            )
+
+    def test_module_without_old_names_is_returned_unchanged(self) -> None:
+        """Modules that never mention a renamed method are not traversed."""
+        renamer = MethodRenamer(_index(SOURCE), [MethodRename("Room", "area", "floor")])
+        module = cst.parse_module("def unrelated():\n    return 1\n")
+        assert renamer.rename_module(module) is module
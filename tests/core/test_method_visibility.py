@@ -0,0 +1,98 @@
+"""Tests for finding methods that can be hidden."""
+
+from pathlib import Path
+
+from molting.core.attribute_index import AttributeAccessIndex
+from molting.core.method_visibility import find_hideable_methods, format_report
+from molting.core.project_index import ProjectIndex
+
+SOURCE = """\
+class Account:
+    def balance(self):
+        return self.total() - self._fees()
+
+    def total(self):
+        return 0
+
+    def _fees(self):
+        return 1
+
+    def statement(self):
+        return self.balance()
+
+    def close(self):
+        return None
+
+
+class Savings(Account):
+    def close(self):
+        return self.statement()
+
+
+class Loan:
+    def total(self):
+        return self.total
+
+
+class Broker:
+    def _balance(self):
+        return 0
+
+    def balance(self):
+        return self._balance()
+"""
+
+
+def _decisions(class_names: list[str] | None = None) -> dict[str, tuple[bool, str]]:
+    """Decide for the methods of SOURCE, keyed by ``Class.method``."""
+    path = Path("bank.py")
+    project = ProjectIndex()
+    project.add_file(path, SOURCE)
+    accesses = AttributeAccessIndex()
+    accesses.add_file(path, SOURCE)
+    return {
+        f"{decision.class_name}.{decision.method_name}": (decision.hidden, decision.reason)
+        for decision in find_hideable_methods(project, accesses, class_names)
+    }
+
+
+class TestFindHideableMethods:
+    """Tests for find_hideable_methods."""
+
+    def test_decisions(self) -> None:
+        """Only methods whose every access is on their own class's instance are hidden."""
+        decisions = _decisions(["Account"])
+
+        assert decisions == {
+            "Account.balance": (True, "only used inside the class"),
+            # Loan's own total does not count as a caller
+            "Account.total": (True, "only used inside the class"),
+            # Called on a Savings instance, outside Account
+            "Account.statement": (False, "used at bank.py:20"),
+            "Account.close": (False, "shares its slot with Savings"),
+        }
+
+    def test_private_name_taken(self) -> None:
+        """A method whose private name already exists stays public."""
+        assert _decisions(["Broker"])["Broker.balance"] == (
+            False,
+            "'_balance' is already defined in Broker",
+        )
+
+    def test_every_class_by_default(self) -> None:
+        """Without class names every class of the project is examined."""
+        assert {name.split(".")[0] for name in _decisions()} == {
+            "Account",
+            "Savings",
+            "Loan",
+            "Broker",
+        }
+
+    def test_format_report(self) -> None:
+        """Each decision is one line, with paths relative to the root."""
+        project = ProjectIndex()
+        project.add_file(Path("/src/bank.py"), "class A:\n    def run(self):\n        pass\n")
+        accesses = AttributeAccessIndex()
+        report = format_report(find_hideable_methods(project, accesses), Path("/src"))
+
+        assert report == "hidden  bank.py:1  A.run -> _run  (never referenced)\n"
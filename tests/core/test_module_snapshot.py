@@ -0,0 +1,47 @@
+"""Tests for ModuleSnapshot change detection."""
+
+import libcst as cst
+
+from molting.core.module_snapshot import MODULE_CODE, ModuleSnapshot
+
+SOURCE = """import os
+
+LIMIT = 10
+
+
+def first():
+    return 1
+
+
+class Shape:
+    def area(self):
+        return 0
+"""
+
+
+class TestModuleSnapshot:
+    """Tests for ModuleSnapshot."""
+
+    def test_names(self) -> None:
+        """Each top-level statement is named after what it defines."""
+        snapshot = ModuleSnapshot(cst.parse_module(SOURCE))
+        assert snapshot.names == {MODULE_CODE, "LIMIT", "first", "Shape"}
+
+    def test_unchanged_module(self) -> None:
+        """Re-parsing identical source reports no changes."""
+        before = ModuleSnapshot(cst.parse_module(SOURCE))
+        after = ModuleSnapshot(cst.parse_module(SOURCE))
+        assert after.changed_since(before) == set()
+
+    def test_changed_method_reports_its_class(self) -> None:
+        """Editing a method body marks only its top-level class as changed."""
+        before = ModuleSnapshot(cst.parse_module(SOURCE))
+        after = ModuleSnapshot(cst.parse_module(SOURCE.replace("return 0", "return 1")))
+        assert after.changed_since(before) == {"Shape"}
+
+    def test_added_and_removed_definitions(self) -> None:
+        """Added and removed top-level definitions are both reported."""
+        before = ModuleSnapshot(cst.parse_module(SOURCE))
+        edited = SOURCE.replace("def first", "def second") + "\n\ndef third():\n    pass\n"
+        after = ModuleSnapshot(cst.parse_module(edited))
+        assert after.changed_since(before) == {"first", "second", "third"}
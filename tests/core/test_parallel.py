@@ -0,0 +1,34 @@
+"""Tests for running a function over many files."""
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from molting.core.parallel import map_files
+
+
+def _size_plus(file_path: Path, offset: int) -> int:
+    """Return a file's size plus an offset (module-level, so worker processes can run it)."""
+    return file_path.stat().st_size + offset
+
+
+class TestMapFiles:
+    """Tests for map_files."""
+
+    def _files(self, tmp_path: Path, count: int) -> list[Path]:
+        """Write files of sizes 0 to count - 1."""
+        files = []
+        for size in range(count):
+            file_path = tmp_path / f"m{size}.py"
+            file_path.write_text("x" * size)
+            files.append(file_path)
+        return files
+
+    def test_results_in_file_order(self, tmp_path: Path) -> None:
+        """In-process, on an executor and in a process pool, results follow the files."""
+        few = self._files(tmp_path, 3)
+        many = self._files(tmp_path, 20)
+
+        assert map_files(_size_plus, few, 10) == [10, 11, 12]
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            assert map_files(_size_plus, few, 10, executor=executor) == [10, 11, 12]
+        assert map_files(_size_plus, many, 1, max_workers=2) == list(range(1, 21))
@@ -0,0 +1,215 @@
+"""Tests for memory profiling of refactoring phases."""
+
+import pstats
+import re
+import threading
+import time
+import tracemalloc
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from molting.cli import main
+from molting.commands.registry import apply_refactoring
+from molting.core.profiling import CpuProfiler, MemoryProfiler, format_bytes, phase
+
+SOURCE = """\
+class Order:
+    def total(self):
+        return self.price * self.quantity * self.rate()
+
+    def rate(self):
+        return 1.2
+"""
+
+
+class TestMemoryProfiler:
+    """Tests for MemoryProfiler."""
+
+    def test_phase_records_peak_above_start(self) -> None:
+        """A phase's peak covers a temporary allocation freed before the phase ends."""
+        with MemoryProfiler() as profiler:
+            with phase("parse"):
+                buffer = bytearray(1_000_000)
+                del buffer
+
+        parse = profiler.report.phase("parse")
+        assert parse is not None
+        assert parse.calls == 1
+        assert parse.peak >= 1_000_000
+        assert parse.retained < 1_000_000
+        assert profiler.report.peak >= 1_000_000
+
+    def test_nested_phase_peak_counts_for_outer_phase(self) -> None:
+        """The peak of an inner phase is also the peak of the phase around it."""
+        with MemoryProfiler() as profiler:
+            with phase("transform"):
+                with phase("metadata"):
+                    buffer = bytearray(1_000_000)
+                    del buffer
+
+        transform = profiler.report.phase("transform")
+        metadata = profiler.report.phase("metadata")
+        assert transform is not None and metadata is not None
+        assert transform.peak >= metadata.peak >= 1_000_000
+
+    def test_phases_reported_in_pipeline_order(self) -> None:
+        """Standard phases come first in pipeline order, others after them."""
+        with MemoryProfiler() as profiler:
+            for name in ("write", "custom", "search"):
+                with phase(name):
+                    pass
+
+        assert [p.name for p in profiler.report.phases] == ["search", "write", "custom"]
+
+    def test_top_sites_point_at_allocating_line(self) -> None:
+        """Memory still held when profiling stops is reported by allocation site."""
+        with MemoryProfiler(top=3) as profiler:
+            kept = [bytearray(100_000) for _ in range(5)]
+
+        assert len(kept) == 5
+        assert profiler.report.top_sites[0].file_name.endswith("test_profiling.py")
+        assert profiler.report.top_sites[0].size >= 500_000
+        assert not tracemalloc.is_tracing()
+
+    def test_phase_on_other_thread_is_not_attributed(self) -> None:
+        """Phases run on worker threads record nothing."""
+
+        def work() -> None:
+            with phase("parse"):
+                pass
+
+        with MemoryProfiler() as profiler:
+            worker = threading.Thread(target=work)
+            worker.start()
+            worker.join()
+
+        assert profiler.report.phase("parse") is None
+
+    def test_phase_without_profiler_is_noop(self) -> None:
+        """Phases outside a profiling run record nothing."""
+        with phase("parse"):
+            pass
+        assert not tracemalloc.is_tracing()
+
+    def test_refactoring_phases(self, tmp_path: Path) -> None:
+        """A refactoring through apply_libcst_transform reports parse, transform and write."""
+        file_path = tmp_path / "order.py"
+        file_path.write_text(SOURCE)
+
+        with MemoryProfiler() as profiler:
+            apply_refactoring("hide-method", file_path, target="Order::rate")
+
+        names = [p.name for p in profiler.report.phases]
+        assert {"parse", "transform", "write"} <= set(names)
+        assert "Peak traced memory" in profiler.report.format()
+
+
+def _busy(seconds: float) -> None:
+    """Keep the CPU busy so the stack sampler sees this frame."""
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+class TestCpuProfiler:
+    """Tests for CpuProfiler."""
+
+    def test_pstats_file_is_loadable(self, tmp_path: Path) -> None:
+        """The saved statistics can be read back with pstats."""
+        file_path = tmp_path / "order.py"
+        file_path.write_text(SOURCE)
+        pstats_path = tmp_path / "out.pstats"
+
+        with CpuProfiler(pstats_path=pstats_path):
+            apply_refactoring("hide-method", file_path, target="Order::rate")
+
+        functions = pstats.Stats(str(pstats_path)).stats  # type: ignore[attr-defined]
+        assert any(name == "execute" for _, _, name in functions)
+
+    def test_top_functions_are_molting_functions(self, tmp_path: Path) -> None:
+        """Only functions of the molting package are listed, slowest first."""
+        file_path = tmp_path / "order.py"
+        file_path.write_text(SOURCE)
+
+        with CpuProfiler() as profiler:
+            apply_refactoring("hide-method", file_path, target="Order::rate")
+
+        top = profiler.top_functions(limit=5)
+        assert 0 < len(top) <= 5
+        assert all(timing.name.startswith("molting") for timing in top)
+        assert [t.cumulative_time for t in top] == sorted(
+            (t.cumulative_time for t in top), reverse=True
+        )
+
+    def test_folded_stacks(self, tmp_path: Path) -> None:
+        """Sampled stacks are written outermost first, one stack and count per line."""
+        folded_path = tmp_path / "out.folded"
+
+        with CpuProfiler(folded_path=folded_path, interval=0.001):
+            _busy(0.05)
+
+        lines = folded_path.read_text().splitlines()
+        assert lines
+        assert all(re.fullmatch(r".+ \d+", line) for line in lines)
+        busy_frame = f"_busy ({__file__}:{_busy.__code__.co_firstlineno})"
+        assert any(busy_frame in line for line in lines)
+
+
+def test_format_bytes() -> None:
+    """Byte counts are rendered with binary units."""
+    assert format_bytes(512) == "512 B"
+    assert format_bytes(1536) == "1.5 KiB"
+    assert format_bytes(3 * 1024 * 1024) == "3.0 MiB"
+
+
+def test_memprofile_option(tmp_path: Path) -> None:
+    """The --memprofile flag prints a memory report after the command."""
+    (tmp_path / "order.py").write_text(SOURCE)
+
+    result = CliRunner().invoke(main, ["--memprofile", "find-duplicates", str(tmp_path)])
+
+    assert result.exit_code == 0, result.output
+    assert "Peak traced memory" in result.stderr
+    assert "Top allocation sites" in result.stderr
+
+
+def test_cprofile_and_flamegraph_options(tmp_path: Path) -> None:
+    """The profiling options save their files and print the slowest molting functions."""
+    (tmp_path / "order.py").write_text(SOURCE)
+    pstats_path = tmp_path / "out.pstats"
+    folded_path = tmp_path / "out.folded"
+
+    result = CliRunner().invoke(
+        main,
+        [
+            "--cprofile",
+            str(pstats_path),
+            "--flamegraph",
+            str(folded_path),
+            "find-duplicates",
+            str(tmp_path),
+        ],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert pstats_path.exists()
+    assert folded_path.exists()
+    assert "cumtime" in result.stderr
+    assert "duplicate_finder.py" in result.stderr
+
+
+def test_profiling_options_reach_refactorings(tmp_path: Path) -> None:
+    """Refactorings run with apply are profiled like any other command."""
+    path = tmp_path / "order.py"
+    path.write_text(SOURCE)
+
+    result = CliRunner().invoke(
+        main,
+        ["--memprofile", "apply", "rename-method", str(path), "target=Order::rate", "new_name=tax"],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "def tax(self)" in path.read_text()
+    assert "transform" in result.stderr
+    assert "Top allocation sites" in result.stderr
@@ -0,0 +1,97 @@
+"""Tests for the project-wide class index."""
+
+from pathlib import Path
+
+import pytest
+
+from molting.core.project_index import ProjectIndex
+
+MODELS = """\
+class Employee:
+    def pay(self):
+        return 0
+
+
+class Manager(Employee):
+    def pay(self):
+        return 1
+
+
+class Director(Manager):
+    def approve(self):
+        return True
+"""
+
+STAFF = """\
+import models
+
+
+def hire(name) -> "models.Employee":
+    return models.Employee()
+
+
+def fire(name):
+    return None
+
+
+class Engineer(models.Employee):
+    def build(self):
+        return None
+
+
+class Invoice:
+    def pay(self):
+        return 2
+"""
+
+
+@pytest.fixture
+def index(tmp_path: Path) -> ProjectIndex:
+    """Index of a two-file project."""
+    (tmp_path / "models.py").write_text(MODELS)
+    (tmp_path / "staff.py").write_text(STAFF)
+    (tmp_path / "broken.py").write_text("class (:\n")
+    return ProjectIndex.build(tmp_path)
+
+
+class TestProjectIndex:
+    """Tests for ProjectIndex."""
+
+    def test_classes_and_methods(self, index: ProjectIndex) -> None:
+        """Classes are recorded with their dotted bases reduced to the last name."""
+        engineer = index.get_class("Engineer")
+        assert engineer.bases == ("Employee",)
+        assert engineer.methods == frozenset({"build"})
+        assert engineer.file_path.name == "staff.py"
+        assert len(index.files) == 2
+
+    def test_function_return_types(self, index: ProjectIndex) -> None:
+        """Module-level functions are recorded with the class they are annotated to return."""
+        assert index.functions == {"hire": "Employee", "fire": None}
+
+    def test_missing_class(self, index: ProjectIndex) -> None:
+        """Looking up an unknown class is an error."""
+        with pytest.raises(ValueError, match="Class 'Missing' not found"):
+            index.get_class("Missing")
+
+    def test_hierarchy(self, index: ProjectIndex) -> None:
+        """Ancestors are nearest first; subclasses are transitive."""
+        assert index.ancestors("Director") == ["Manager", "Employee"]
+        assert index.subclasses("Employee") == {"Manager", "Director", "Engineer"}
+        assert index.subclasses("Director") == set()
+
+    def test_method_family_starts_at_topmost_definition(self, index: ProjectIndex) -> None:
+        """An override's family includes the base definition and all its subclasses."""
+        family = index.method_family("Manager", "pay")
+        assert family == {"Employee", "Manager", "Director", "Engineer"}
+        assert index.method_family("Director", "pay") == family
+
+    def test_method_family_excludes_unrelated_classes(self, index: ProjectIndex) -> None:
+        """Same-named methods of unrelated classes form their own family."""
+        assert index.method_family("Invoice", "pay") == {"Invoice"}
+        assert index.classes_defining("pay") == {"Employee", "Manager", "Invoice"}
+
+    def test_method_family_of_undefined_method(self, index: ProjectIndex) -> None:
+        """A method no class in the lineage defines has no family."""
+        with pytest.raises(ValueError, match="Method 'fire' not found in class 'Manager'"):
+            index.method_family("Manager", "fire")
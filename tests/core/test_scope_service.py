@@ -0,0 +1,197 @@
+"""Tests for the shared ScopeService."""
+
+import libcst as cst
+import pytest
+from libcst.metadata import Scope
+
+from molting.core.scope_service import ScopeService
+
+SOURCE = """
+RATE = 2
+
+
+class Invoice:
+    def total(self, items):
+        subtotal = 0
+        for item in items:
+            subtotal += item.price
+        scaled = [x * RATE for x in range(len(items))]
+        bonus = (lambda y: y + subtotal)(1)
+        return subtotal + bonus + self.fee
+
+    @staticmethod
+    def build(data):
+        return data
+
+
+def report(data):
+    invoice = Invoice()
+    return invoice.total(data)
+"""
+
+
+@pytest.fixture
+def scopes() -> ScopeService:
+    """Scope service for the sample module."""
+    return ScopeService(cst.parse_module(SOURCE))
+
+
+def _total_scope(scopes: ScopeService) -> Scope:
+    """Scope of Invoice.total."""
+    function = scopes.find_function("Invoice", "total")
+    assert function is not None
+    return scopes.function_scope(function)
+
+
+class TestScopeService:
+    """Tests for ScopeService."""
+
+    def test_find_function(self, scopes: ScopeService) -> None:
+        """Methods are found by class, functions at module level only."""
+        method = scopes.find_function("Invoice", "total")
+        function = scopes.find_function("", "report")
+
+        assert method is not None and scopes.line(method) == 6
+        assert function is not None and scopes.line(function) == 19
+        assert scopes.find_function("", "total") is None
+
+    def test_reads_skip_builtins_and_comprehension_variables(self, scopes: ScopeService) -> None:
+        """Builtins and names bound by nested scopes are not reads of the function."""
+        reads = scopes.reads_in_region(_total_scope(scopes), 10, 10)
+        assert reads == ["RATE", "items"]
+
+    def test_augmented_assignment_is_a_read(self, scopes: ScopeService) -> None:
+        """``subtotal += ...`` reads ``subtotal``."""
+        reads = scopes.reads_in_region(_total_scope(scopes), 9, 9)
+        assert reads == ["subtotal", "item"]
+
+    def test_free_names(self, scopes: ScopeService) -> None:
+        """Names read in a region and bound outside it are free; local ones are not."""
+        scope = _total_scope(scopes)
+
+        assert scopes.free_names(scope, 8, 9) == ["items", "subtotal"]
+        assert scopes.free_names(scope, 11, 11) == ["subtotal"]
+        assert scopes.is_free_in_region("RATE", scope, 10, 10)
+        assert not scopes.is_free_in_region("x", scope, 10, 10)
+
+    def test_assignments_in_region(self, scopes: ScopeService) -> None:
+        """Bindings in a region are reported in order, once each."""
+        assert scopes.assignments_in_region(_total_scope(scopes), 7, 10) == [
+            "subtotal",
+            "item",
+            "scaled",
+        ]
+
+    def test_accesses_include_nested_scopes(self, scopes: ScopeService) -> None:
+        """Reads from a lambda resolve to the function that binds the name."""
+        lines = [
+            scopes.line(access.node) for access in scopes.accesses("subtotal", _total_scope(scopes))
+        ]
+        assert lines == [11, 12]
+
+    def test_global_reads(self, scopes: ScopeService) -> None:
+        """Module-level names read by a function are returned with their bindings."""
+        function = scopes.find_function("Invoice", "total")
+        assert function is not None
+
+        reads = scopes.global_reads(function)
+
+        assert list(reads) == ["RATE"]
+        assert reads["RATE"] == scopes.module_bindings("RATE")
+        assert scopes.module_bindings("subtotal") == []
+
+    def test_attribute_class(self) -> None:
+        """Receivers resolve through self, the class name and constructor assignments."""
+        module = cst.parse_module(SOURCE)
+        scopes = ScopeService(module)
+        attributes: list[cst.Attribute] = []
+
+        class Collector(cst.CSTVisitor):
+            def visit_Attribute(self, node: cst.Attribute) -> None:  # noqa: N802
+                attributes.append(node)
+
+        module.visit(Collector())
+        by_code = {module.code_for_node(node): scopes.attribute_class(node) for node in attributes}
+
+        assert by_code["self.fee"] == "Invoice"
+        assert by_code["invoice.total"] == "Invoice"
+        assert by_code["item.price"] is None
+
+    def test_attribute_class_through_import(self) -> None:
+        """Receivers resolve to classes imported with ``from module import``."""
+        module = cst.parse_module(
+            "from models import Customer, Order as Purchase\n"
+            "import helpers\n\n"
+            "def report():\n"
+            "    customer = Customer()\n"
+            "    customer.limit()\n"
+            "    Purchase.create()\n"
+            "    helpers.format()\n"
+        )
+        scopes = ScopeService(module)
+        attributes: list[cst.Attribute] = []
+
+        class Collector(cst.CSTVisitor):
+            def visit_Attribute(self, node: cst.Attribute) -> None:  # noqa: N802
+                attributes.append(node)
+
+        module.visit(Collector())
+        by_code = {module.code_for_node(node): scopes.attribute_class(node) for node in attributes}
+
+        assert by_code["customer.limit"] == "Customer"
+        assert by_code["Purchase.create"] == "Order"
+        assert by_code["helpers.format"] is None
+
+    def test_receiver_type(self) -> None:
+        """Receiver types come from annotations, literals, builtins, imports and factories."""
+        module = cst.parse_module(
+            "import os\n"
+            "from typing import Optional\n"
+            "from models import Customer\n\n"
+            "def make() -> Customer:\n"
+            "    return Customer()\n\n"
+            "def report(settings: dict, customer: Optional[Customer], tags: 'list[str]', raw):\n"
+            "    names = list()\n"
+            "    counts = {}\n"
+            "    label: str = raw\n"
+            "    settings.get\n"
+            "    customer.limit\n"
+            "    tags.append\n"
+            "    names.append\n"
+            "    counts.get\n"
+            "    label.strip\n"
+            "    os.path\n"
+            "    str.join\n"
+            "    [].append\n"
+            "    raw.get\n"
+            "    made = make()\n"
+            "    made.limit\n"
+            "    make().limit\n"
+        )
+        scopes = ScopeService(module)
+        attributes: list[cst.Attribute] = []
+
+        class Collector(cst.CSTVisitor):
+            def visit_Attribute(self, node: cst.Attribute) -> None:  # noqa: N802
+                attributes.append(node)
+
+        module.visit(Collector())
+        by_code = {module.code_for_node(node): scopes.receiver_type(node) for node in attributes}
+
+        assert by_code["settings.get"] == "dict"
+        assert by_code["customer.limit"] == "Customer"
+        assert by_code["tags.append"] == "list"
+        assert by_code["names.append"] == "list"
+        assert by_code["counts.get"] == "dict"
+        assert by_code["label.strip"] == "str"
+        assert by_code["os.path"] == "os"
+        assert by_code["str.join"] == "str"
+        assert by_code["[].append"] == "list"
+        assert by_code["raw.get"] is None
+        assert by_code["made.limit"] == "Customer"
+        assert by_code["make().limit"] == "Customer"
+
+    def test_for_module_reuses_service(self) -> None:
+        """The same module object is analyzed once."""
+        module = cst.parse_module(SOURCE)
+        assert ScopeService.for_module(module) is ScopeService.for_module(module)
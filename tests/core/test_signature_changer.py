@@ -0,0 +1,171 @@
+"""Tests for project-wide method signature changes."""
+
+from pathlib import Path
+
+import libcst as cst
+import pytest
+
+from molting.core.project_index import ProjectIndex
+from molting.core.scope_service import ScopeService
+from molting.core.signature_changer import (
+    AddedParameter,
+    SignatureChange,
+    SignatureChanger,
+    parse_added_parameters,
+)
+
+SOURCE = """\
+class Order:
+    def total(self, legacy, rate, rush=False):
+        return rate
+
+
+class Quote:
+    def total(self, legacy):
+        return 0
+
+
+def run(order, args):
+    mine = Order()
+    quote = Quote()
+    mine.total(1, 2)
+    Order.total(mine, 1, 2)
+    mine.total(*args)
+    quote.total(1)
+    order.total(1, 2)
+"""
+
+
+def _changer(
+    change: SignatureChange, source: str = SOURCE, include_unresolved: bool = False
+) -> tuple[SignatureChanger, cst.Module]:
+    """Build a changer for a single-module project."""
+    index = ProjectIndex()
+    index.add_file(Path("orders.py"), source)
+    module = cst.parse_module(source)
+    definition = ScopeService.for_module(module).find_function(
+        change.class_name, change.method_name
+    )
+    assert definition is not None
+    return SignatureChanger(index, change, definition, include_unresolved), module
+
+
+class TestParseAddedParameters:
+    """Tests for parse_added_parameters."""
+
+    def test_names_and_defaults(self) -> None:
+        """Each parameter keeps its default as source code."""
+        assert parse_added_parameters("currency, limit=None, tags=[]") == [
+            AddedParameter("currency"),
+            AddedParameter("limit", "None"),
+            AddedParameter("tags", "[]"),
+        ]
+
+    @pytest.mark.parametrize("text", ["a=1, b", "*args", "a, *, b", "1st"])
+    def test_invalid(self, text: str) -> None:
+        """Only plain names with optional defaults, in a valid order, are accepted."""
+        with pytest.raises(ValueError, match="Invalid parameter list"):
+            parse_added_parameters(text)
+
+
+class TestSignatureChanger:
+    """Tests for SignatureChanger."""
+
+    def test_remove_updates_resolved_calls(self) -> None:
+        """Bound and unbound calls are updated; star arguments and other classes are not."""
+        changer, module = _changer(SignatureChange("Order", "total", removed=("legacy",)))
+
+        code = changer.update_module(module, Path("orders.py")).code
+
+        assert "def total(self, rate, rush=False):" in code
+        assert "def total(self, legacy):" in code
+        assert "mine.total(2)" in code
+        assert "Order.total(mine, 2)" in code
+        assert "mine.total(*args)" in code
+        assert "quote.total(1)" in code
+        # Quote defines total too, so a receiver of unknown class is left alone
+        assert "order.total(1, 2)" in code
+        assert changer.skipped == ["orders.py:16"]
+        with pytest.raises(ValueError, match=r"1 call\(s\) of 'total'.*orders.py:16"):
+            changer.check_skipped()
+
+    def test_foreign_receivers_left_alone(self) -> None:
+        """Calls on builtins and unknown receivers keep their arguments by default.
+
+        The call on an unknown receiver may be a call of the method, so it is reported.
+        """
+        source = (
+            "class Cache:\n"
+            "    def get(self, key, default=None):\n"
+            "        return default\n\n"
+            "def load(settings: dict, cache: Cache, other):\n"
+            '    settings.get("x", 1)\n'
+            '    {}.get("x", 1)\n'
+            '    cache.get("x", 1)\n'
+            '    other.get("x", 1)\n'
+        )
+        change = SignatureChange("Cache", "get", removed=("default",))
+
+        changer, module = _changer(change, source)
+        code = changer.update_module(module).code
+
+        assert 'settings.get("x", 1)' in code
+        assert '{}.get("x", 1)' in code
+        assert 'cache.get("x")' in code
+        assert 'other.get("x", 1)' in code
+        assert changer.skipped == changer.unresolved == ["<module>:9"]
+        with pytest.raises(ValueError, match=r"unknown type \(pass include_unresolved"):
+            changer.check_skipped()
+
+        changer, module = _changer(change, source, include_unresolved=True)
+        code = changer.update_module(module).code
+
+        assert 'settings.get("x", 1)' in code
+        assert 'other.get("x")' in code
+
+    def test_remove_by_keyword(self) -> None:
+        """Arguments passed by keyword are removed as well."""
+        source = (
+            "class Order:\n    def total(self, a, b):\n        return a\n\nOrder().total(1, b=2)\n"
+        )
+        changer, module = _changer(SignatureChange("Order", "total", removed=("b",)), source)
+
+        assert "Order().total(1)" in changer.update_module(module).code
+
+    def test_added_parameter_passed_by_keyword(self) -> None:
+        """A parameter without default is passed by the calls; one with a default is not."""
+        change = SignatureChange(
+            "Order",
+            "total",
+            added=(AddedParameter("currency", value='"EUR"'), AddedParameter("audit", "False")),
+        )
+        source = (
+            "class Order:\n    def total(self, rate):\n        return rate\n\nOrder().total(2)\n"
+        )
+        changer, module = _changer(change, source)
+
+        code = changer.update_module(module).code
+
+        assert "def total(self, rate, currency, audit=False):" in code
+        assert 'Order().total(2, currency="EUR")' in code
+
+    def test_required_parameter_after_default(self) -> None:
+        """A parameter without default cannot follow one with a default."""
+        changer, module = _changer(
+            SignatureChange("Order", "total", added=(AddedParameter("currency", value="1"),))
+        )
+
+        with pytest.raises(ValueError, match="without a default after"):
+            changer.update_module(module)
+
+    @pytest.mark.parametrize(
+        "change, message",
+        [
+            (SignatureChange("Order", "total", removed=("missing",)), "not found"),
+            (SignatureChange("Order", "total", added=(AddedParameter("rate"),)), "already exists"),
+        ],
+    )
+    def test_invalid_change(self, change: SignatureChange, message: str) -> None:
+        """Removing an unknown parameter or adding an existing one is rejected."""
+        with pytest.raises(ValueError, match=message):
+            _changer(change)
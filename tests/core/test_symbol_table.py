@@ -0,0 +1,89 @@
+"""Tests for ModuleSymbolTable."""
+
+import libcst as cst
+
+from molting.core.symbol_table import ModuleSymbolTable
+from molting.core.visitors import ClassConflictChecker, MethodConflictChecker
+
+SOURCE = """\
+MAX_RETRIES = 3
+
+
+class Order:
+    def __init__(self, amount):
+        self.amount = amount
+
+    def total(self):
+        base: int = self.amount
+        discount = 0
+        return base - discount
+
+    class Line:
+        pass
+
+
+def helper(x):
+    def inner():
+        nested = 1
+        return nested
+
+    return inner()
+"""
+
+
+class TestModuleSymbolTable:
+    """Tests for the ModuleSymbolTable class."""
+
+    def test_module_level_names(self) -> None:
+        """Test that module-level classes, functions and constants are recorded."""
+        table = ModuleSymbolTable.build(cst.parse_module(SOURCE))
+
+        assert table.has_class("Order")
+        assert not table.has_class("Line")
+        assert table.has_function("helper")
+        assert not table.has_function("inner")
+        assert table.has_constant("MAX_RETRIES")
+        assert not table.has_constant("discount")
+
+    def test_class_methods_and_fields(self) -> None:
+        """Test that methods and __init__ fields are recorded per class."""
+        table = ModuleSymbolTable.build(cst.parse_module(SOURCE))
+
+        assert table.has_method("Order", "total")
+        assert table.has_method("", "helper")
+        assert not table.has_method("Order", "helper")
+        assert table.has_field("Order", "amount")
+        assert not table.has_field("Order", "total")
+
+    def test_function_locals(self) -> None:
+        """Test that locals, including annotated and nested ones, are recorded."""
+        table = ModuleSymbolTable.build(cst.parse_module(SOURCE))
+
+        assert table.has_local("total", "base")
+        assert table.has_local("total", "discount")
+        assert table.has_local("helper", "nested")
+        assert table.first_local_conflict("total", ["x", "discount", "base"]) == "discount"
+        assert table.first_local_conflict("total", ["x"]) is None
+
+    def test_checkers_share_one_table_per_module(self) -> None:
+        """Test that several checkers on one module reuse the same table."""
+        module = cst.parse_module(SOURCE)
+        class_checker = ClassConflictChecker("Order")
+        method_checker = MethodConflictChecker("Order", "refund")
+
+        module.visit(class_checker)
+        module.visit(method_checker)
+
+        assert class_checker.has_conflict
+        assert not method_checker.has_conflict
+        assert ModuleSymbolTable.for_module(module) is ModuleSymbolTable.for_module(module)
+
+    def test_merge_of_statement_tables_equals_module_table(self) -> None:
+        """Test that merging per-statement tables gives the module's table."""
+        module = cst.parse_module(SOURCE)
+
+        merged = ModuleSymbolTable.merge(
+            ModuleSymbolTable.build(statement) for statement in module.body
+        )
+
+        assert vars(merged) == vars(ModuleSymbolTable.build(module))
@@ -0,0 +1,114 @@
+"""Tests for finding and inlining single-assignment temps."""
+
+import libcst as cst
+import pytest
+
+from molting.core.temp_inliner import TempTable, inline_temps
+
+
+def _function(module: cst.Module) -> cst.FunctionDef:
+    """Return the first statement of a module, which must be a function."""
+    function = module.body[0]
+    assert isinstance(function, cst.FunctionDef)
+    return function
+
+
+def _temp_names(source: str) -> list[str]:
+    """Return the names of the eligible temps of a module's first function."""
+    module = cst.parse_module(source)
+    return [temp.name for temp in TempTable(module).temps(_function(module))]
+
+
+def _inline(source: str) -> str:
+    """Inline every eligible temp of a module's first function."""
+    module = cst.parse_module(source)
+    temps = TempTable(module).temps(_function(module))
+    return inline_temps(module, temps).code
+
+
+class TestTempTable:
+    """Tests for TempTable."""
+
+    @pytest.mark.parametrize(
+        "body",
+        [
+            # Reassigned
+            "t = a\n    t = t + 1\n    return t\n",
+            # Assigned in a branch
+            "if a:\n        t = a\n    else:\n        t = 0\n    return t\n",
+            # The value calls something
+            "t = f(a)\n    return t\n",
+            # A name the value reads is reassigned after it
+            "t = a + 1\n    a = 0\n    return t\n",
+            # Read from a nested function
+            "t = a + 1\n    return lambda: t\n",
+            # Deleted
+            "t = a + 1\n    print(t)\n    del t\n",
+            # A new list read twice
+            "t = [a]\n    return t, t\n",
+            # An attribute read, with a call before the use
+            "t = a.total\n    g()\n    return t\n",
+            # A comprehension binds a name the value reads
+            "t = a + 1\n    return [t for a in range(3)]\n",
+            # Never read
+            "t = a + 1\n",
+        ],
+    )
+    def test_ineligible(self, body: str) -> None:
+        """Temps whose value could differ at their uses are not eligible."""
+        assert _temp_names(f"def f(a):\n    {body}") == []
+
+    def test_parameter(self) -> None:
+        """A parameter is never a temp, even if assigned once in the body."""
+        assert _temp_names("def f(a):\n    a = 1\n    return a\n") == []
+
+    def test_chained(self) -> None:
+        """A temp assigned from another temp is eligible too."""
+        source = "def f(a):\n    s = a + 1\n    t = s * 2\n    u = [x for x in t]\n    return u\n"
+
+        assert _temp_names(source) == ["s", "t", "u"]
+
+    def test_chained_attribute_read_after_call(self) -> None:
+        """A temp inherits the attribute reads of the temps it reads."""
+        source = "def f(a):\n    s = a.total\n    t = s * 2\n    g()\n    return t\n"
+
+        assert _temp_names(source) == ["s"]
+
+
+class TestInlineTemps:
+    """Tests for inline_temps."""
+
+    def test_precedence(self) -> None:
+        """Inlined values are parenthesized only where the use requires it."""
+        source = (
+            "def f(a, b):\n"
+            "    s = a + b\n"
+            "    n = -a\n"
+            "    p = a, b\n"
+            "    c = a if b else 0\n"
+            "    return s * 2, s + 1, n ** 2, p, c.real, not s, 2 - s\n"
+        )
+
+        assert _inline(source) == (
+            "def f(a, b):\n"
+            "    return (a + b) * 2, a + b + 1, (-a) ** 2, (a, b), (a if b else 0).real, "
+            "not a + b, 2 - (a + b)\n"
+        )
+
+    def test_chained_values(self) -> None:
+        """Values of earlier temps are substituted into later ones."""
+        source = "def f(a):\n    s = a + 1\n    t = s * 2\n    return t\n"
+
+        assert _inline(source) == "def f(a):\n    return (a + 1) * 2\n"
+
+    def test_comprehension_use(self) -> None:
+        """A use inside a comprehension is inlined."""
+        source = "def f(a, items):\n    t = a * 2\n    return [t + i for i in items]\n"
+
+        assert _inline(source) == "def f(a, items):\n    return [a * 2 + i for i in items]\n"
+
+    def test_no_temps(self) -> None:
+        """A module without eligible temps is returned as is."""
+        module = cst.parse_module("def f(a):\n    return a\n")
+
+        assert inline_temps(module, []) is module
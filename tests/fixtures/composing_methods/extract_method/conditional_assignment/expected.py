@@ -0,0 +1,13 @@
+"""Example code for extract method with a conditionally assigned output."""
+
+
+class Order:
+    def price(self, cond):
+        x = 0
+        x = self.adjust(cond, x)
+        return x
+
+    def adjust(self, cond, x):
+        if cond:
+            x = 1
+        return x
@@ -0,0 +1,9 @@
+"""Example code for extract method with a conditionally assigned output."""
+
+
+class Order:
+    def price(self, cond):
+        x = 0
+        if cond:
+            x = 1
+        return x
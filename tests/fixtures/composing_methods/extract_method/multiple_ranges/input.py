@@ -0,0 +1,20 @@
+class Order:
+    def __init__(self, name, orders):
+        self.name = name
+        self.orders = orders
+
+    def print_owing(self):
+        outstanding = 0
+
+        # print banner
+        print("**************************")
+        print("***** Customer Owes ******")
+        print("**************************")
+
+        # calculate outstanding
+        for order in self.orders:
+            outstanding += order.amount
+
+        # print details
+        print(f"name: {self.name}")
+        print(f"amount: {outstanding}")
@@ -0,0 +1,15 @@
+"""Example code for extract method whose code reads earlier locals and parameters."""
+
+
+class Report:
+    def __init__(self, lines):
+        self.lines = lines
+
+    def render(self, width):
+        border = "-" * width
+        output = []
+        for line in self.lines:
+            output.append(line.ljust(width))
+        output.insert(0, border)
+        output.append(border)
+        return "\n".join(output)
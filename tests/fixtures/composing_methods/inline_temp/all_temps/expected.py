@@ -0,0 +1,18 @@
+"""Example code for inlining every temp of a function."""
+
+
+def calculate_total(order, rates):
+    total = order.quantity * order.item_price + order.quantity * order.item_price * rates.shipping
+    total = total - (
+        order.quantity * order.item_price - order.budget
+        if order.quantity * order.item_price > order.budget
+        else 0
+    )
+    lines = [item.total for item in order.items]
+    count = len(lines)
+    return total * (1 - rates.tax), count
+
+
+def describe(order):
+    label = order.name
+    return label.upper()
@@ -0,0 +1,17 @@
+"""Example code for inlining every temp of a function."""
+
+
+def calculate_total(order, rates):
+    subtotal = order.quantity * order.item_price
+    shipping = subtotal * rates.shipping
+    discount = subtotal - order.budget if subtotal > order.budget else 0
+    total = subtotal + shipping
+    total = total - discount
+    lines = [item.total for item in order.items]
+    count = len(lines)
+    return total * (1 - rates.tax), count
+
+
+def describe(order):
+    label = order.name
+    return label.upper()
@@ -0,0 +1,23 @@
+"""Example code for inlining every temp of a file."""
+
+
+def area(width, height):
+    return width * height
+
+
+def scaled_area(width, height, factor):
+    return ((width + height) * factor) ** 2
+
+
+class Invoice:
+    def total(self):
+        net = self.amount - self.discount
+        self.history.append(net)
+        return net
+
+
+def unchanged(items):
+    total = 0
+    for item in items:
+        total += item
+    return total
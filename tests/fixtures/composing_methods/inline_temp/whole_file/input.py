@@ -0,0 +1,26 @@
+"""Example code for inlining every temp of a file."""
+
+
+def area(width, height):
+    product = width * height
+    return product
+
+
+def scaled_area(width, height, factor):
+    side = width + height
+    scaled = side * factor
+    return scaled ** 2
+
+
+class Invoice:
+    def total(self):
+        net = self.amount - self.discount
+        self.history.append(net)
+        return net
+
+
+def unchanged(items):
+    total = 0
+    for item in items:
+        total += item
+    return total
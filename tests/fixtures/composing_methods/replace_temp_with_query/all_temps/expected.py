@@ -0,0 +1,23 @@
+"""Example code for replacing every temp of a method with a query."""
+
+
+class Order:
+    def __init__(self, quantity, item_price, discount):
+        self.quantity = quantity
+        self.item_price = item_price
+        self.discount = discount
+
+    def get_price(self, rate):
+        surcharge = self.base_price() * rate
+        discount = self.base_price() * self.discount
+        return self.base_price() * self.discount_factor() + surcharge - discount
+
+    def base_price(self):
+        return self.quantity * self.item_price
+
+    def discount_factor(self):
+        return 0.98 if self.base_price() > 1000 else 0.95
+
+    def describe(self):
+        label = str(self.quantity)
+        return label
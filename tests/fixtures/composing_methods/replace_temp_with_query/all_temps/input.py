@@ -0,0 +1,19 @@
+"""Example code for replacing every temp of a method with a query."""
+
+
+class Order:
+    def __init__(self, quantity, item_price, discount):
+        self.quantity = quantity
+        self.item_price = item_price
+        self.discount = discount
+
+    def get_price(self, rate):
+        base_price = self.quantity * self.item_price
+        discount_factor = 0.98 if base_price > 1000 else 0.95
+        surcharge = base_price * rate
+        discount = base_price * self.discount
+        return base_price * discount_factor + surcharge - discount
+
+    def describe(self):
+        label = str(self.quantity)
+        return label
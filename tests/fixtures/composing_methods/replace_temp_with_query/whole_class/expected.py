@@ -0,0 +1,24 @@
+"""Example code for replacing the temps of every method of a class."""
+
+
+class Rectangle:
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+
+    def area(self):
+        return self.product()
+
+    def product(self):
+        return self.width * self.height
+
+    def perimeter(self):
+        return 2 * self.sides()
+
+    def sides(self):
+        return self.width + self.height
+
+    @staticmethod
+    def unit(size):
+        square = size * size
+        return square
@@ -0,0 +1,20 @@
+"""Example code for replacing the temps of every method of a class."""
+
+
+class Rectangle:
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+
+    def area(self):
+        product = self.width * self.height
+        return product
+
+    def perimeter(self):
+        sides = self.width + self.height
+        return 2 * sides
+
+    @staticmethod
+    def unit(size):
+        square = size * size
+        return square
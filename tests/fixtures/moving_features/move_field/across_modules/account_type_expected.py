@@ -0,0 +1,7 @@
+"""Account types."""
+
+
+class AccountType:
+    def __init__(self, name):
+        self.name = name
+        self.interest_rate = 0.05
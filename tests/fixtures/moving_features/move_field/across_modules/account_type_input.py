@@ -0,0 +1,6 @@
+"""Account types."""
+
+
+class AccountType:
+    def __init__(self, name):
+        self.name = name
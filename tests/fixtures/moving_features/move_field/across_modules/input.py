@@ -0,0 +1,10 @@
+"""Example code for move-field to a class in another module."""
+
+
+class Account:
+    def __init__(self, number):
+        self.number = number
+        self.interest_rate = 0.05
+
+    def interest_for(self, amount):
+        return amount * self.interest_rate
@@ -0,0 +1,20 @@
+"""Savings accounts."""
+
+from input import Account
+
+
+class SavingsAccount(Account):
+    def bonus_rate(self):
+        return self.account_type.interest_rate * 1.5
+
+
+class Statement:
+    def __init__(self, account):
+        self.account = account
+
+    def rate_line(self):
+        return f"Rate: {self.account.account_type.interest_rate}"
+
+
+def best_rate(accounts):
+    return max(account.account_type.interest_rate for account in accounts)
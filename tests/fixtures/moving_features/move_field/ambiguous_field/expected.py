@@ -0,0 +1,10 @@
+"""Example code for move-field when another class has a field of the same name."""
+
+
+class Account:
+    def __init__(self, number, account_type):
+        self.number = number
+        self.account_type = account_type
+
+    def interest_for(self, amount):
+        return amount * self.account_type.interest_rate
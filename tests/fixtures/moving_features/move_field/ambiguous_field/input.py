@@ -0,0 +1,10 @@
+"""Example code for move-field when another class has a field of the same name."""
+
+
+class Account:
+    def __init__(self, number):
+        self.number = number
+        self.interest_rate = 0.05
+
+    def interest_for(self, amount):
+        return amount * self.interest_rate
@@ -0,0 +1,21 @@
+"""Loans."""
+
+from account_type import AccountType
+from input import Account
+
+
+class Loan:
+    def __init__(self, interest_rate):
+        self.interest_rate = interest_rate
+
+    def monthly_rate(self):
+        return self.interest_rate / 12
+
+
+def default_rate():
+    account = Account(1, AccountType("Standard"))
+    return account.account_type.interest_rate
+
+
+def spread(loan, deposit):
+    return loan.interest_rate - deposit.interest_rate
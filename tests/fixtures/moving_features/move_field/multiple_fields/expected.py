@@ -0,0 +1,31 @@
+"""Example code for moving several fields at once."""
+
+
+class Account:
+    def __init__(self, account_type):
+        self.balance = 1000
+        self.account_type = account_type
+
+    def available(self):
+        return self.balance + self.account_type.overdraft_limit
+
+    def yearly_interest(self):
+        return self.balance * self.account_type.interest_rate
+
+
+class AccountType:
+    def __init__(self, name):
+        self.name = name
+        self.interest_rate = 0.05
+        self.overdraft_limit = 500
+
+
+class Report:
+    def __init__(self, account):
+        self.account = account
+
+    def summary(self):
+        return (
+            self.account.account_type.interest_rate,
+            self.account.account_type.overdraft_limit,
+        )
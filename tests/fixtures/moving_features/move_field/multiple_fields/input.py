@@ -0,0 +1,27 @@
+"""Example code for moving several fields at once."""
+
+
+class Account:
+    def __init__(self):
+        self.balance = 1000
+        self.interest_rate = 0.05
+        self.overdraft_limit = 500
+
+    def available(self):
+        return self.balance + self.overdraft_limit
+
+    def yearly_interest(self):
+        return self.balance * self.interest_rate
+
+
+class AccountType:
+    def __init__(self, name):
+        self.name = name
+
+
+class Report:
+    def __init__(self, account):
+        self.account = account
+
+    def summary(self):
+        return (self.account.interest_rate, self.account.overdraft_limit)
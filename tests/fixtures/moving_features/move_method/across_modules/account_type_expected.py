@@ -0,0 +1,19 @@
+"""Account types."""
+
+import math
+
+
+class AccountType:
+    def __init__(self, name):
+        self.name = name
+
+    def is_premium(self):
+        return self.name == "Premium"
+
+    def overdraft_charge(self, days_overdrawn, rate):
+        from input import OVERDRAFT_GRACE_DAYS
+
+        if self.is_premium():
+            extra_days = max(days_overdrawn - OVERDRAFT_GRACE_DAYS, 0)
+            return 10 + math.ceil(extra_days * rate)
+        return days_overdrawn * 1.75
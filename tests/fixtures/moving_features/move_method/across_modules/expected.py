@@ -0,0 +1,20 @@
+"""Example code for move-method to a class in another module."""
+
+import math
+
+from account_type import AccountType
+
+OVERDRAFT_GRACE_DAYS = 7
+
+
+class Account:
+    def __init__(self, account_type, days_overdrawn=0):
+        self.account_type = account_type
+        self.days_overdrawn = days_overdrawn
+
+    def overdraft_charge(self, rate):
+        return self.account_type.overdraft_charge(self.days_overdrawn, rate)
+
+
+def open_premium_account():
+    return Account(AccountType("Premium"))
@@ -0,0 +1,23 @@
+"""Example code for move-method to a class in another module."""
+
+import math
+
+from account_type import AccountType
+
+OVERDRAFT_GRACE_DAYS = 7
+
+
+class Account:
+    def __init__(self, account_type, days_overdrawn=0):
+        self.account_type = account_type
+        self.days_overdrawn = days_overdrawn
+
+    def overdraft_charge(self, rate):
+        if self.account_type.is_premium():
+            extra_days = max(self.days_overdrawn - OVERDRAFT_GRACE_DAYS, 0)
+            return 10 + math.ceil(extra_days * rate)
+        return self.days_overdrawn * 1.75
+
+
+def open_premium_account():
+    return Account(AccountType("Premium"))
@@ -0,0 +1,9 @@
+"""Account types."""
+
+
+class AccountType:
+    def __init__(self, name):
+        self.name = name
+
+    def is_premium(self):
+        return self.name == "Premium"
@@ -0,0 +1,19 @@
+"""Example code for move-method to a class in another module of a package."""
+
+import math
+
+from .account_type import AccountType
+from .helpers import grace
+
+
+class Account:
+    def __init__(self, account_type, days_overdrawn=0):
+        self.account_type = account_type
+        self.days_overdrawn = days_overdrawn
+
+    def overdraft_charge(self, rate):
+        return self.account_type.overdraft_charge(self.days_overdrawn, rate)
+
+
+def open_premium_account():
+    return Account(AccountType("Premium"))
@@ -0,0 +1,5 @@
+"""Overdraft helpers."""
+
+
+def grace():
+    return 7
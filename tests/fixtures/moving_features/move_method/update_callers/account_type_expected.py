@@ -0,0 +1,14 @@
+"""Account types."""
+
+
+class AccountType:
+    def __init__(self, name):
+        self.name = name
+
+    def is_premium(self):
+        return self.name == "Premium"
+
+    def overdraft_charge(self, days_overdrawn, rate):
+        if self.is_premium():
+            return 10 + days_overdrawn * rate
+        return days_overdrawn * 1.75
@@ -0,0 +1,19 @@
+"""Banks."""
+
+from input import Account
+
+
+class Bank:
+    def __init__(self, accounts):
+        self.accounts = accounts
+
+    def total_charges(self):
+        return sum(
+            account.account_type.overdraft_charge(account.days_overdrawn, 0.85)
+            for account in self.accounts
+        )
+
+    def open_account(self, account_type):
+        account = Account(account_type)
+        self.accounts.append(account)
+        return account.account_type.overdraft_charge(account.days_overdrawn, rate=1.0)
@@ -0,0 +1,16 @@
+"""Banks."""
+
+from input import Account
+
+
+class Bank:
+    def __init__(self, accounts):
+        self.accounts = accounts
+
+    def total_charges(self):
+        return sum(account.overdraft_charge(0.85) for account in self.accounts)
+
+    def open_account(self, account_type):
+        account = Account(account_type)
+        self.accounts.append(account)
+        return account.overdraft_charge(rate=1.0)
@@ -0,0 +1,16 @@
+"""Example code for move-method updating the callers."""
+
+from account_type import AccountType
+
+
+class Account:
+    def __init__(self, account_type, days_overdrawn=0):
+        self.account_type = account_type
+        self.days_overdrawn = days_overdrawn
+
+    def monthly_fees(self):
+        return self.account_type.overdraft_charge(self.days_overdrawn, 0.85) + 5
+
+
+def open_premium_account():
+    return Account(AccountType("Premium"))
@@ -0,0 +1,21 @@
+"""Example code for move-method updating the callers."""
+
+from account_type import AccountType
+
+
+class Account:
+    def __init__(self, account_type, days_overdrawn=0):
+        self.account_type = account_type
+        self.days_overdrawn = days_overdrawn
+
+    def overdraft_charge(self, rate):
+        if self.account_type.is_premium():
+            return 10 + self.days_overdrawn * rate
+        return self.days_overdrawn * 1.75
+
+    def monthly_fees(self):
+        return self.overdraft_charge(0.85) + 5
+
+
+def open_premium_account():
+    return Account(AccountType("Premium"))
@@ -0,0 +1,41 @@
+class Person:
+    def __init__(self, name, email, age):
+        self._name = name
+        self._email = email
+        self.age = age
+
+    @property
+    def name(self):
+        return self._name
+
+    @name.setter
+    def name(self, value):
+        self._name = value
+
+    @property
+    def email(self):
+        return self._email
+
+    @email.setter
+    def email(self, value):
+        self._email = value
+
+
+class Team:
+    def __init__(self, members):
+        self._members = members
+
+    def size(self):
+        return len(self.members)
+
+    @property
+    def members(self):
+        return self._members
+
+    @members.setter
+    def members(self, value):
+        self._members = value
+
+
+person = Person("Alice", "alice@example.com", 30)
+person.email = "alice@example.org"
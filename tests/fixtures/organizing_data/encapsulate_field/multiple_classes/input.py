@@ -0,0 +1,17 @@
+class Person:
+    def __init__(self, name, email, age):
+        self.name = name
+        self.email = email
+        self.age = age
+
+
+class Team:
+    def __init__(self, members):
+        self.members = members
+
+    def size(self):
+        return len(self.members)
+
+
+person = Person("Alice", "alice@example.com", 30)
+person.email = "alice@example.org"
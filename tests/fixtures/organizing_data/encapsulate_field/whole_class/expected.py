@@ -0,0 +1,30 @@
+class Account:
+    def __init__(self, owner, balance):
+        self._owner = owner
+        self._balance = balance
+        self._history = []
+
+    @property
+    def summary(self):
+        return f"{self.owner}: {self.balance}"
+
+    @property
+    def owner(self):
+        return self._owner
+
+    @owner.setter
+    def owner(self, value):
+        self._owner = value
+
+    @property
+    def balance(self):
+        return self._balance
+
+    @balance.setter
+    def balance(self, value):
+        self._balance = value
+
+
+class Bank:
+    def __init__(self, name):
+        self.name = name
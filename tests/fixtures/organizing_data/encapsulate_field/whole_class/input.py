@@ -0,0 +1,14 @@
+class Account:
+    def __init__(self, owner, balance):
+        self.owner = owner
+        self.balance = balance
+        self._history = []
+
+    @property
+    def summary(self):
+        return f"{self.owner}: {self.balance}"
+
+
+class Bank:
+    def __init__(self, name):
+        self.name = name
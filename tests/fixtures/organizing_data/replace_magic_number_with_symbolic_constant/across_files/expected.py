@@ -0,0 +1,12 @@
+"""Energy calculations."""
+
+from math import sqrt
+from constants import GRAVITY
+
+
+def potential_energy(mass, height):
+    return mass * GRAVITY * height
+
+
+def impact_speed(height):
+    return sqrt(2 * GRAVITY * height)
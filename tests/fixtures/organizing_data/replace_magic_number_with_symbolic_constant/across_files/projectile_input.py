@@ -0,0 +1,6 @@
+def flight_time(speed):
+    return 2 * speed / 9.810
+
+
+def rough_flight_time(speed):
+    return 2 * speed / 9.8
@@ -0,0 +1,5 @@
+"""Physical constants."""
+
+GRAVITY = 9.81
+
+SPEED_OF_LIGHT = 299_792_458
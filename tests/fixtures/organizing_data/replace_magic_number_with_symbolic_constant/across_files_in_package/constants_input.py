@@ -0,0 +1,3 @@
+"""Physical constants."""
+
+SPEED_OF_LIGHT = 299_792_458
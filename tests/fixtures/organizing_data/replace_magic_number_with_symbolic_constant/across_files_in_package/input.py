@@ -0,0 +1,11 @@
+"""Energy calculations."""
+
+from math import sqrt
+
+
+def potential_energy(mass, height):
+    return mass * 9.81 * height
+
+
+def impact_speed(height):
+    return sqrt(2 * 9.81 * height)
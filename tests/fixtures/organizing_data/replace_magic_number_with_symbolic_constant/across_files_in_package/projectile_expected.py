@@ -0,0 +1,9 @@
+from ..constants import GRAVITY
+
+
+def flight_time(speed):
+    return 2 * speed / GRAVITY
+
+
+def rough_flight_time(speed):
+    return 2 * speed / 9.8
@@ -0,0 +1,9 @@
+SECONDS_PER_DAY = 86400
+
+
+def days_to_seconds(days):
+    return days * 86_400
+
+
+def seconds_to_days(seconds):
+    return seconds / 86400.0
@@ -0,0 +1,24 @@
+class Account:
+    def __init__(self, balance, interest_rate):
+        self._balance = balance
+        self._interest_rate = interest_rate
+        self._log = []
+
+    @property
+    def balance(self):
+        return self._balance
+
+    @balance.setter
+    def balance(self, value):
+        self._balance = value
+
+    @property
+    def interest_rate(self):
+        return self._interest_rate
+
+    @interest_rate.setter
+    def interest_rate(self, value):
+        self._interest_rate = value
+
+    def apply_interest(self):
+        self.balance += self.balance * self.interest_rate
@@ -0,0 +1,8 @@
+class Account:
+    def __init__(self, balance, interest_rate):
+        self.balance = balance
+        self.interest_rate = interest_rate
+        self._log = []
+
+    def apply_interest(self):
+        self.balance += self.balance * self.interest_rate
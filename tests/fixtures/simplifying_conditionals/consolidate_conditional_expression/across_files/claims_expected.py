@@ -0,0 +1,14 @@
+"""Claims processing."""
+from input import is_not_eligible_for_disability
+
+
+def claim_amount(person):
+    if is_not_eligible_for_disability(person):
+        return 0
+    return person.salary * 0.6
+
+
+def unrelated(person):
+    if person.seniority < 5:
+        return 0
+    return 1
@@ -0,0 +1,17 @@
+"""Claims processing."""
+
+
+def claim_amount(person):
+    if person.is_part_time:
+        return 0
+    if person.seniority < 2:
+        return 0
+    if person.months_disabled > 12:
+        return 0
+    return person.salary * 0.6
+
+
+def unrelated(person):
+    if person.seniority < 5:
+        return 0
+    return 1
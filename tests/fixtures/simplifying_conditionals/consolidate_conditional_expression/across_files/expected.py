@@ -0,0 +1,9 @@
+def disability_amount(employee):
+    if is_not_eligible_for_disability(employee):
+        return 0
+    # calculate disability amount
+    return 100
+
+
+def is_not_eligible_for_disability(employee):
+    return employee.seniority < 2 or employee.months_disabled > 12 or employee.is_part_time
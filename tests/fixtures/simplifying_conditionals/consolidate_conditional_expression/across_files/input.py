@@ -0,0 +1,9 @@
+def disability_amount(employee):
+    if employee.seniority < 2:
+        return 0
+    if employee.months_disabled > 12:
+        return 0
+    if employee.is_part_time:
+        return 0
+    # calculate disability amount
+    return 100
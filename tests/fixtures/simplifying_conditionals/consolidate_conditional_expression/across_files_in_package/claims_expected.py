@@ -0,0 +1,20 @@
+"""Claims processing."""
+from ..input import is_not_eligible_for_disability
+
+
+def claim_amount(person):
+    if is_not_eligible_for_disability(person):
+        return 0
+    return person.salary * 0.6
+
+
+class Appeal:
+    @staticmethod
+    def amount(person):
+        if person.seniority < 2:
+            return 0
+        if person.months_disabled > 12:
+            return 0
+        if person.is_part_time:
+            return 0
+        return person.salary * 0.5
@@ -0,0 +1,10 @@
+from input import Shipment
+
+
+def invoice(shipments):
+    return sum(shipment.cost(2.0) for shipment in shipments)
+
+
+def express():
+    shipment = Shipment(3)
+    return shipment.cost(rate=4.0)
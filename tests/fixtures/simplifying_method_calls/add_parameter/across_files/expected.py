@@ -0,0 +1,9 @@
+class Shipment:
+    def __init__(self, weight):
+        self.weight = weight
+
+    def cost(self, rate, currency, insured=False):
+        return self.weight * rate
+
+    def quote(self):
+        return self.cost(1.5, currency="EUR")
@@ -0,0 +1,18 @@
+"""Example code for add-parameter adding several parameters."""
+
+
+class Report:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def render(self, title, locale, limit=None, verbose=False):
+        return f"{title}: {len(self.rows)} rows"
+
+
+class CsvReport(Report):
+    def render(self, title, locale, limit=None, verbose=False):
+        return super().render(title, locale=locale).upper()
+
+
+def publish(report: Report):
+    return report.render("Monthly", locale="en")
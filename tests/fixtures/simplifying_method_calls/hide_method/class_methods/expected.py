@@ -0,0 +1,35 @@
+class Invoice:
+    def __init__(self, lines):
+        self.lines = lines
+
+    def total(self):
+        return sum(self._subtotals())
+
+    def _subtotals(self):
+        return [self._line_amount(line) for line in self.lines]
+
+    def _line_amount(self, line):
+        return line.price * line.quantity
+
+    def _render(self):
+        return f"Total: {self.total()}"
+
+
+class TaxedInvoice(Invoice):
+    def total(self):
+        return super().total() * 1.2
+
+
+class Ledger:
+    def __init__(self):
+        self.entries = []
+
+    def record(self, entry):
+        if self.check(entry):
+            self.entries.append(entry)
+
+    def check(self, entry):
+        return entry is not None
+
+    def describe(self):
+        return f"{len(self.entries)} entries"
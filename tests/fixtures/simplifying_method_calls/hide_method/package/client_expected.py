@@ -0,0 +1,11 @@
+from input import Invoice
+
+
+def print_invoice(lines):
+    invoice = Invoice(lines)
+    print(invoice.render())
+
+
+def archive(ledger, entry):
+    ledger.record(entry)
+    return ledger.describe()
@@ -0,0 +1,20 @@
+from input import Order
+
+
+class Quote:
+    def calculate_total(self, discount_code):
+        return 0
+
+
+def cart_total(orders):
+    return sum(order.calculate_total(None) for order in orders)
+
+
+def order_total():
+    order = Order(10, 2)
+    return order.calculate_total(discount_code="SPRING")
+
+
+def quote_total():
+    quote = Quote()
+    return quote.calculate_total("SPRING")
@@ -0,0 +1,7 @@
+class Order:
+    def __init__(self, base_price, quantity):
+        self.base_price = base_price
+        self.quantity = quantity
+
+    def calculate_total(self, discount_code):
+        return self.base_price * self.quantity
@@ -0,0 +1,21 @@
+"""Example code for remove-parameter removing several parameters."""
+
+
+class Order:
+    def __init__(self, base_price, quantity):
+        self.base_price = base_price
+        self.quantity = quantity
+
+    def calculate_total(self, customer, rush=False):
+        return self.base_price * self.quantity
+
+
+class BulkOrder(Order):
+    def calculate_total(self, customer, rush=False):
+        return super().calculate_total(customer, rush) * 0.9
+
+
+def checkout(order: Order, customer):
+    first = order.calculate_total(customer)
+    second = order.calculate_total(customer, rush=True)
+    return first + second
@@ -0,0 +1,10 @@
+from input import Customer
+
+
+def credit_report(name):
+    customer = Customer()
+    return f"{name}: {customer.get_invoice_credit_limit()}"
+
+
+def can_buy(customer: Customer, amount):
+    return amount <= customer.get_invoice_credit_limit()
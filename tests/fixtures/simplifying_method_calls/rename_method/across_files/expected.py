@@ -0,0 +1,6 @@
+class Customer:
+    def __init__(self):
+        self.invoice_credit_limit = 1000
+
+    def get_invoice_credit_limit(self):
+        return self.invoice_credit_limit
@@ -0,0 +1,38 @@
+class Employee:
+    def __init__(self, salary):
+        self.salary = salary
+
+    def pay_amount(self):
+        return self.salary
+
+
+class Manager(Employee):
+    def __init__(self, salary, bonus):
+        super().__init__(salary)
+        self.bonus = bonus
+
+    def pay_amount(self):
+        return super().pay_amount() + self.bonus
+
+
+class Engineer(Employee):
+    def summary(self):
+        return f"Engineer paid {self.pay_amount()}"
+
+
+class Invoice:
+    def __init__(self, amount):
+        self.amount = amount
+
+    def pay_amt(self):
+        return self.amount
+
+
+def monthly_cost(salary, bonus):
+    manager = Manager(salary, bonus)
+    invoice = Invoice(salary)
+    return manager.pay_amount() + invoice.pay_amt()
+
+
+def pay(payee):
+    return payee.pay_amt()
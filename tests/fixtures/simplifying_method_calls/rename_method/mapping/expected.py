@@ -0,0 +1,22 @@
+class Customer:
+    def __init__(self, orders):
+        self.orders = orders
+
+    def get_invoice_credit_limit(self):
+        return 1000
+
+    def order_count(self):
+        return len(self.orders)
+
+
+class Order:
+    def __init__(self, items):
+        self.items = items
+
+    def calculate_total(self):
+        return sum(item.price for item in self.items)
+
+
+def describe(customer: Customer, order: Order):
+    limit = customer.get_invoice_credit_limit()
+    return f"{customer.order_count()} orders, limit {limit}, total {order.calculate_total()}"
@@ -0,0 +1,22 @@
+class Customer:
+    def __init__(self, orders):
+        self.orders = orders
+
+    def get_inv_cdtlmt(self):
+        return 1000
+
+    def ord_cnt(self):
+        return len(self.orders)
+
+
+class Order:
+    def __init__(self, items):
+        self.items = items
+
+    def calc(self):
+        return sum(item.price for item in self.items)
+
+
+def describe(customer: Customer, order: Order):
+    limit = customer.get_inv_cdtlmt()
+    return f"{customer.ord_cnt()} orders, limit {limit}, total {order.calc()}"
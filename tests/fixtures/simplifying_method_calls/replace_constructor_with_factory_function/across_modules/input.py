@@ -0,0 +1,4 @@
+class Employee:
+    def __init__(self, name, salary):
+        self.name = name
+        self.salary = salary
@@ -0,0 +1,7 @@
+from input import Employee, create_employee
+
+
+def promote(person):
+    if isinstance(person, Employee):
+        return create_employee(person.name, person.salary * 1.1)
+    return person
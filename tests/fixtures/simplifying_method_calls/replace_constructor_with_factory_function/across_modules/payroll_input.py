@@ -0,0 +1,7 @@
+from input import Employee
+
+
+def promote(person):
+    if isinstance(person, Employee):
+        return Employee(person.name, person.salary * 1.1)
+    return person
@@ -0,0 +1,9 @@
+import input as models
+
+
+def sample():
+    return models.create_employee("Sample", 0)
+
+
+def build(Employee):
+    return Employee("Other", 1)
@@ -0,0 +1,5 @@
+from input import create_employee
+
+
+def hire(name):
+    return create_employee(name, 1000)
@@ -0,0 +1,5 @@
+from input import Employee as Emp
+
+
+def hire(name):
+    return Emp(name, 1000)
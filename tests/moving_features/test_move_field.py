@@ -50,3 +50,67 @@ class TestMoveField(RefactoringTestBase):
         """
         with pytest.raises(ValueError, match="already has a field"):
             self.refactor("move-field", source="Account::interest_rate", to="AccountType")
+
+    def test_multiple_fields(self) -> None:
+        """Test moving several fields between the same two classes in one pass."""
+        self.refactor(
+            "move-field", source="Account::interest_rate,overdraft_limit", to="AccountType"
+        )
+
+    def test_across_modules(self) -> None:
+        """Test moving a field to a class in another module.
+
+        Accesses in other modules are updated: on a subclass's self, on an
+        attribute holding an account, and on receivers of unknown class, since
+        no other class has a field of that name.
+        """
+        self.copy_fixture_module("account_type")
+        self.copy_fixture_module("savings")
+
+        self.refactor("move-field", source="Account::interest_rate", to="AccountType")
+
+        self.assert_module_matches_expected("account_type")
+        self.assert_module_matches_expected("savings")
+
+    def test_ambiguous_field(self) -> None:
+        """Test that accesses that may belong to another class's field are kept.
+
+        Loan has its own interest_rate, so only the access on a receiver known
+        to be an Account is updated.
+        """
+        self.copy_fixture_module("account_type")
+        self.copy_fixture_module("loans")
+
+        self.refactor("move-field", source="Account::interest_rate", to="AccountType")
+
+        self.assert_module_matches_expected("account_type")
+        self.assert_module_matches_expected("loans")
+
+    def test_field_without_init_value(self) -> None:
+        """Test that a field the source __init__ does not assign is rejected.
+
+        No value is invented for the target class, and nothing is written.
+        """
+        self.test_file = self.tmp_path / "input.py"
+        original = (
+            "class AccountType:\n"
+            "    pass\n\n\n"
+            "class Account:\n"
+            "    def __init__(self, rate):\n"
+            "        self.interest_rate = rate\n\n"
+            "    def set_limit(self, limit):\n"
+            "        self.overdraft_limit = limit\n"
+        )
+        self.test_file.write_text(original)
+
+        from molting.cli import refactor_file
+
+        with pytest.raises(ValueError, match="Field 'overdraft_limit' is not assigned"):
+            refactor_file(
+                "move-field",
+                self.test_file,
+                source="Account::interest_rate,overdraft_limit",
+                to="AccountType",
+            )
+
+        assert self.test_file.read_text() == original
@@ -69,3 +69,84 @@ class TestMoveMethod(RefactoringTestBase):
         """
         with pytest.raises(ValueError, match="already has a method"):
             self.refactor("move-method", source="Account::overdraft_charge", to="AccountType")
+
+    def test_across_modules(self) -> None:
+        """Test moving a method to a class defined in another module.
+
+        The target class is found in the directory's other modules. The
+        module it lives in gains the import the method needs; the constant
+        from the source module is imported inside the method, because a
+        module-level import would close an import cycle.
+        """
+        self.copy_fixture_module("account_type")
+
+        self.refactor("move-method", source="Account::overdraft_charge", to="AccountType")
+
+        self.assert_module_matches_expected("account_type")
+
+    def test_across_modules_in_package(self) -> None:
+        """Test moving a method between modules of a package.
+
+        The relative import the method needs stays relative in the
+        destination module, rather than being made absolute from the
+        package's own directory.
+        """
+        (self.tmp_path / "__init__.py").write_text("")
+        self.copy_fixture_module("account_type")
+        self.copy_fixture_module("helpers")
+
+        self.refactor("move-method", source="Account::overdraft_charge", to="AccountType")
+
+        self.assert_module_matches_expected("account_type")
+        self.assert_module_matches_expected("helpers")
+
+    def test_update_callers(self) -> None:
+        """Test that calls across the directory are redirected to the target instance.
+
+        Every call could be rewritten, so no delegating method is left behind.
+        """
+        self.copy_fixture_module("account_type")
+        self.copy_fixture_module("bank")
+
+        self.refactor(
+            "move-method",
+            source="Account::overdraft_charge",
+            to="AccountType",
+            update_callers=True,
+        )
+
+        self.assert_module_matches_expected("account_type")
+        self.assert_module_matches_expected("bank")
+
+    def test_update_callers_keeps_delegate_for_references(self) -> None:
+        """Test that the delegating method stays when a reference is not a call."""
+        self.test_file = self.tmp_path / "input.py"
+        self.test_file.write_text(
+            "class Account:\n"
+            "    def __init__(self, account_type):\n"
+            "        self.account_type = account_type\n"
+            "\n"
+            "    def charge(self):\n"
+            "        return self.account_type.rate\n"
+            "\n"
+            "    def handlers(self):\n"
+            "        return [self.charge]\n"
+            "\n"
+            "\n"
+            "class AccountType:\n"
+            "    rate = 3\n"
+        )
+
+        from molting.cli import refactor_file
+
+        refactor_file(
+            "move-method",
+            self.test_file,
+            source="Account::charge",
+            to="AccountType",
+            update_callers=True,
+        )
+
+        result = self.test_file.read_text()
+        assert "return self.account_type.charge()" in result
+        assert "return [self.charge]" in result
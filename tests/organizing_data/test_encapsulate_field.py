@@ -5,6 +5,8 @@ This test module verifies the encapsulate-field refactoring,
 which makes fields private and provides accessor methods.
 """
 
+import pytest
+
 from tests.conftest import RefactoringTestBase
 
 
@@ -39,3 +41,24 @@ class TestEncapsulateField(RefactoringTestBase):
         across all call sites that access the field.
         """
         self.refactor("encapsulate-field", target="Person::name")
+
+    def test_multiple_classes(self) -> None:
+        """Test encapsulating several fields of several classes in one run."""
+        self.refactor("encapsulate-field", target="Person::name,email,Team::members")
+
+    def test_whole_class(self) -> None:
+        """Test encapsulating every public field a class assigns in __init__."""
+        self.refactor("encapsulate-field", target="Account")
+
+    def test_class_without_public_fields(self) -> None:
+        """Test that a whole-class target with nothing to encapsulate is rejected."""
+        self.test_file = self.tmp_path / "input.py"
+        original = "class Ledger:\n    def __init__(self):\n        self._rows = []\n"
+        self.test_file.write_text(original)
+
+        from molting.cli import refactor_file
+
+        with pytest.raises(ValueError, match="no public fields"):
+            refactor_file("encapsulate-field", self.test_file, target="Ledger")
+
+        assert self.test_file.read_text() == original
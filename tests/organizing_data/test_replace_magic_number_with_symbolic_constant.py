@@ -55,3 +55,54 @@ class TestReplaceMagicNumberWithSymbolicConstant(RefactoringTestBase):
                 target="potential_energy#L2",
                 name="GRAVITATIONAL_CONSTANT",
             )
+
+    def test_across_files(self) -> None:
+        """Test replacing the number in every module, with the constant in a chosen module."""
+        self.copy_fixture_module("constants")
+        self.copy_fixture_module("projectile")
+
+        self.refactor(
+            "replace-magic-number-with-symbolic-constant",
+            target="potential_energy#L7",
+            name="GRAVITY",
+            module="constants.py",
+            across_files=True,
+        )
+
+        self.assert_module_matches_expected("constants")
+        self.assert_module_matches_expected("projectile")
+
+    def test_across_files_in_package(self) -> None:
+        """Test that modules of a package import the constant relatively.
+
+        The package has a subpackage, so one module imports it from ``.``
+        and another from ``..``.
+        """
+        assert self.expected_file is not None
+        fixture_dir = self.expected_file.parent
+        (self.tmp_path / "__init__.py").write_text("")
+        self.copy_fixture_module("constants")
+        subpackage = self.tmp_path / "physics"
+        subpackage.mkdir()
+        (subpackage / "__init__.py").write_text("")
+        projectile = subpackage / "projectile.py"
+        projectile.write_text((fixture_dir / "projectile_input.py").read_text())
+
+        self.refactor(
+            "replace-magic-number-with-symbolic-constant",
+            target="potential_energy#L7",
+            name="GRAVITY",
+            module="constants.py",
+            across_files=True,
+        )
+
+        self.assert_module_matches_expected("constants")
+        assert projectile.read_text() == (fixture_dir / "projectile_expected.py").read_text()
+
+    def test_reuse_constant(self) -> None:
+        """Test that a constant already holding the number is reused, by value alone."""
+        self.refactor(
+            "replace-magic-number-with-symbolic-constant",
+            value="86400",
+            name="SECONDS_PER_DAY",
+        )
@@ -54,3 +54,11 @@ class TestSelfEncapsulateField(RefactoringTestBase):
         refactor_file("self-encapsulate-field", self.test_file, target="Range::low")
         refactor_file("self-encapsulate-field", self.test_file, target="Range::high")
         self.assert_matches_expected()
+
+    def test_multiple_fields(self) -> None:
+        """Test self-encapsulating several fields of a class in one run."""
+        self.refactor("self-encapsulate-field", target="Range::low,high")
+
+    def test_whole_class(self) -> None:
+        """Test self-encapsulating every public field a class assigns in __init__."""
+        self.refactor("self-encapsulate-field", target="Account")
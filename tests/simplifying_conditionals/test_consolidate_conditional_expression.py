@@ -4,6 +4,9 @@ Tests for Consolidate Conditional Expression refactoring.
 This refactoring combines conditionals with the same result into a single condition.
 """
 
+import shutil
+from pathlib import Path
+
 import pytest
 
 from tests.conftest import RefactoringTestBase
@@ -94,3 +97,130 @@ class TestConsolidateConditionalExpression(RefactoringTestBase):
             target="EmployeeBenefits::disability_amount#L10-L15",
             name="is_not_eligible_for_disability",
         )
+
+    def test_across_files(self) -> None:
+        """Test consolidating the same conditional chain in a sibling module.
+
+        With across_files, functions in other modules whose conditions match the
+        target (up to parameter names and order) call the new helper, which is
+        imported from the target module. Unmatched functions are left alone.
+        """
+        fixture_dir = Path(__file__).parent.parent / "fixtures" / self.fixture_category
+        claims_file = self.tmp_path / "claims.py"
+        shutil.copy(fixture_dir / "across_files" / "claims_input.py", claims_file)
+
+        self.refactor(
+            "consolidate-conditional-expression",
+            target="disability_amount#L2-L7",
+            name="is_not_eligible_for_disability",
+            across_files=True,
+        )
+
+        expected = (fixture_dir / "across_files" / "claims_expected.py").read_text()
+        assert claims_file.read_text() == expected
+
+    def test_across_files_in_package(self) -> None:
+        """Test that a module in a subpackage imports the helper relatively.
+
+        The method with the same pattern is kept, and the report says which
+        functions were rewritten.
+        """
+        fixture_dir = Path(__file__).parent.parent / "fixtures" / self.fixture_category
+        (self.tmp_path / "__init__.py").write_text("")
+        subpackage = self.tmp_path / "benefits"
+        subpackage.mkdir()
+        (subpackage / "__init__.py").write_text("")
+        claims_file = subpackage / "claims.py"
+        shutil.copy(fixture_dir / "across_files_in_package" / "claims_input.py", claims_file)
+        report = self.tmp_path / "report.txt"
+
+        self.refactor(
+            "consolidate-conditional-expression",
+            target="disability_amount#L2-L7",
+            name="is_not_eligible_for_disability",
+            across_files=True,
+            report=str(report),
+        )
+
+        expected = (fixture_dir / "across_files_in_package" / "claims_expected.py").read_text()
+        assert claims_file.read_text() == expected
+        assert report.read_text() == (
+            "rewritten     benefits/claims.py:5  claim_amount\n"
+            "kept          benefits/claims.py:17  Appeal.amount  (method in another module)\n"
+            "consolidated  input.py:2  disability_amount\n"
+        )
+
+    def test_across_files_changed_only(self) -> None:
+        """Test that with changed_only only the files git reports as changed are indexed."""
+        import subprocess
+
+        self.test_file = self.tmp_path / "input.py"
+        self.test_file.write_text(
+            "def disability_amount(employee):\n"
+            "    if employee.seniority < 2:\n"
+            "        return 0\n"
+            "    return 100\n"
+        )
+        claims = (
+            "def claim_amount(person):\n"
+            "    if person.seniority < 2:\n"
+            "        return 0\n"
+            "    return 1\n"
+        )
+        committed = self.tmp_path / "committed.py"
+        committed.write_text(claims)
+        git = ["git", "-c", "user.name=test", "-c", "user.email=test@example.com"]
+        subprocess.run([*git, "init", "-q"], cwd=self.tmp_path, check=True)
+        subprocess.run([*git, "add", "."], cwd=self.tmp_path, check=True)
+        subprocess.run([*git, "commit", "-q", "-m", "initial"], cwd=self.tmp_path, check=True)
+        changed = self.tmp_path / "changed.py"
+        changed.write_text(claims)
+
+        from molting.cli import refactor_file
+
+        refactor_file(
+            "consolidate-conditional-expression",
+            self.test_file,
+            target="disability_amount#L2-L3",
+            name="is_not_eligible",
+            across_files=True,
+            changed_only=True,
+        )
+
+        assert committed.read_text() == claims
+        assert "if is_not_eligible(person):" in changed.read_text()
+
+    def test_across_files_helper_conflict(self) -> None:
+        """Test that no file is written when the helper name exists in a matched module."""
+        self.test_file = self.tmp_path / "input.py"
+        original = (
+            "def disability_amount(employee):\n"
+            "    if employee.seniority < 2:\n"
+            "        return 0\n"
+            "    return 100\n"
+        )
+        self.test_file.write_text(original)
+        claims_file = self.tmp_path / "claims.py"
+        claims = (
+            "def claim_amount(person):\n"
+            "    if person.seniority < 2:\n"
+            "        return 0\n"
+            "    return 1\n\n\n"
+            "def is_not_eligible(person):\n"
+            "    return False\n"
+        )
+        claims_file.write_text(claims)
+
+        from molting.cli import refactor_file
+
+        with pytest.raises(ValueError, match="is_not_eligible.*already exists"):
+            refactor_file(
+                "consolidate-conditional-expression",
+                self.test_file,
+                target="disability_amount#L2-L3",
+                name="is_not_eligible",
+                across_files=True,
+            )
+
+        assert self.test_file.read_text() == original
+        assert claims_file.read_text() == claims
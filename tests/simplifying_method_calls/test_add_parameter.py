@@ -1,5 +1,7 @@
 """Tests for Add Parameter refactoring."""
 
+import pytest
+
 from tests.conftest import RefactoringTestBase
 
 
@@ -64,3 +66,48 @@ class TestAddParameter(RefactoringTestBase):
             name="include_overdraft",
             default="False",
         )
+
+    def test_multiple_params(self) -> None:
+        """Test adding several parameters in one run.
+
+        The parameter without a default is passed by the existing calls, and
+        the override's super() call forwards its own parameter.
+        """
+        self.refactor(
+            "add-parameter",
+            target="Report::render",
+            name="locale, limit=None, verbose=False",
+            value='"en"',
+        )
+
+    def test_across_files(self) -> None:
+        """Test adding a parameter and passing it from callers in other modules.
+
+        The shipments of invoice() are of unknown type, so their calls are
+        only updated with include_unresolved.
+        """
+        self.copy_fixture_module("billing")
+
+        self.refactor(
+            "add-parameter",
+            target="Shipment::cost",
+            name="currency, insured=False",
+            value='"EUR"',
+            across_files=True,
+            include_unresolved=True,
+        )
+
+        self.assert_module_matches_expected("billing")
+
+    def test_missing_value(self) -> None:
+        """Test that a parameter without default or value for the calls is rejected."""
+        self.test_file = self.tmp_path / "input.py"
+        original = "class Order:\n    def total(self):\n        return 1\n"
+        self.test_file.write_text(original)
+
+        from molting.cli import refactor_file
+
+        with pytest.raises(ValueError, match="Expected 1 value"):
+            refactor_file("add-parameter", self.test_file, target="Order::total", name="currency")
+
+        assert self.test_file.read_text() == original
@@ -34,3 +34,32 @@ class TestHideMethod(RefactoringTestBase):
         that instance references remain valid after the visibility change.
         """
         self.refactor("hide-method", target="PriceCalculator::apply_discount")
+
+    def test_class_methods(self) -> None:
+        """Test hiding every public method of a class that only the class uses.
+
+        total is kept public because TaxedInvoice overrides it; the methods of
+        other classes are left alone.
+        """
+        self.refactor("hide-method", target="Invoice")
+
+    def test_package(self) -> None:
+        """Test hiding unused public methods of every class in the package.
+
+        Methods called from another module are kept, and the report lists each
+        decision with its reason.
+        """
+        self.copy_fixture_module("client")
+        report = self.tmp_path / "report.txt"
+
+        self.refactor("hide-method", package=True, report=str(report))
+
+        self.assert_module_matches_expected("client")
+        lines = report.read_text().splitlines()
+        assert (
+            "hidden  input.py:1  Invoice.line_amount -> _line_amount  (only used inside the class)"
+            in lines
+        )
+        assert "kept    input.py:1  Invoice.render  (used at client.py:6)" in lines
+        assert "kept    input.py:18  TaxedInvoice.total  (shares its slot with Invoice)" in lines
+        assert "kept    input.py:23  Ledger.record  (used at client.py:10)" in lines
@@ -1,5 +1,7 @@
 """Tests for Remove Parameter refactoring."""
 
+import pytest
+
 from tests.conftest import RefactoringTestBase
 
 
@@ -31,9 +33,14 @@ class TestRemoveParameter(RefactoringTestBase):
 
         Unlike test_simple, this verifies that all call sites are updated to remove
         the parameter from their method calls. Missing even one call site would break
-        the code, making this test critical for completeness.
+        the code, making this test critical for completeness. The orders are
+        of unknown type, so their calls are only updated with include_unresolved.
         """
-        self.refactor("remove-parameter", target="Order::calculate_total::discount_code")
+        self.refactor(
+            "remove-parameter",
+            target="Order::calculate_total::discount_code",
+            include_unresolved=True,
+        )
 
     def test_with_instance_vars(self) -> None:
         """Test removing a parameter from a method that uses instance variables.
@@ -43,3 +50,100 @@ class TestRemoveParameter(RefactoringTestBase):
         instance variable references remain valid after parameter removal.
         """
         self.refactor("remove-parameter", target="EmailService::send_email::priority")
+
+    def test_multiple_params(self) -> None:
+        """Test removing several parameters in one run.
+
+        The parameters are removed from the override too, and their arguments
+        are dropped whether passed by position or by keyword.
+        """
+        self.refactor("remove-parameter", target="Order::calculate_total::discount_code,region")
+
+    def test_across_files(self) -> None:
+        """Test removing a parameter and updating the callers in other modules.
+
+        Quote defines a method of the same name, so calls on receivers of
+        unknown class are left alone.
+        """
+        self.copy_fixture_module("cart")
+
+        self.refactor(
+            "remove-parameter", target="Order::calculate_total::discount_code", across_files=True
+        )
+
+        self.assert_module_matches_expected("cart")
+
+    def test_parameter_not_found(self) -> None:
+        """Test that removing an unknown parameter is rejected and nothing is written."""
+        self.test_file = self.tmp_path / "input.py"
+        original = "class Order:\n    def total(self, a):\n        return a\n"
+        self.test_file.write_text(original)
+
+        from molting.cli import refactor_file
+
+        with pytest.raises(ValueError, match="Parameter 'b' not found"):
+            refactor_file("remove-parameter", self.test_file, target="Order::total::a,b")
+
+        assert self.test_file.read_text() == original
+
+    def test_star_args_call(self) -> None:
+        """Test that a call whose arguments cannot be updated is reported and nothing is written."""
+        self.test_file = self.tmp_path / "input.py"
+        original = (
+            "class Order:\n"
+            "    def total(self, a, b):\n"
+            "        return a\n\n\n"
+            "def run(args):\n"
+            "    Order().total(1, 2)\n"
+            "    Order().total(*args)\n"
+        )
+        self.test_file.write_text(original)
+
+        from molting.cli import refactor_file
+
+        with pytest.raises(ValueError, match=r"Cannot update 1 call\(s\) of 'total'.*input.py:8"):
+            refactor_file("remove-parameter", self.test_file, target="Order::total::b")
+
+        assert self.test_file.read_text() == original
+
+    @pytest.mark.parametrize("annotated", [True, False])
+    def test_factory_receiver_in_other_file(self, annotated: bool) -> None:
+        """Test calls on a factory's result: updated if its return type is annotated.
+
+        Without the annotation the receiver's type is unknown, so the call is
+        reported and nothing is written.
+        """
+        self.test_file = self.tmp_path / "billing.py"
+        returns = " -> Billing" if annotated else ""
+        self.test_file.write_text(
+            "class Billing:\n"
+            "    def charge(self, amount, currency):\n"
+            "        return amount\n\n\n"
+            f"def make(){returns}:\n"
+            "    return Billing()\n"
+        )
+        client = self.tmp_path / "client.py"
+        original = 'from billing import make\n\nmake().charge(2, "JPY")\n'
+        client.write_text(original)
+
+        from molting.cli import refactor_file
+
+        if annotated:
+            refactor_file(
+                "remove-parameter",
+                self.test_file,
+                target="Billing::charge::currency",
+                across_files=True,
+            )
+            assert client.read_text() == "from billing import make\n\nmake().charge(2)\n"
+            return
+
+        with pytest.raises(ValueError, match=r"unknown type.*client.py:3"):
+            refactor_file(
+                "remove-parameter",
+                self.test_file,
+                target="Billing::charge::currency",
+                across_files=True,
+            )
+        assert client.read_text() == original
+        assert "currency" in self.test_file.read_text()
@@ -1,5 +1,10 @@
 """Tests for Rename Method refactoring."""
 
+import shutil
+from pathlib import Path
+
+import pytest
+
 from tests.conftest import RefactoringTestBase
 
 
@@ -47,9 +52,13 @@ class TestRenameMethod(RefactoringTestBase):
         Unlike test_simple which may only have one call site, this verifies
         that ALL call sites are updated when renaming a method. Missing even
         one call site would break the code, so this is critical for correctness.
+        The callers' receivers are untyped, so include_unresolved opts them in.
         """
         self.refactor(
-            "rename-method", target="Customer::get_inv_cdtlmt", new_name="get_invoice_credit_limit"
+            "rename-method",
+            target="Customer::get_inv_cdtlmt",
+            new_name="get_invoice_credit_limit",
+            include_unresolved=True,
         )
 
     def test_name_conflict(self) -> None:
@@ -62,3 +71,46 @@ class TestRenameMethod(RefactoringTestBase):
         self.refactor(
             "rename-method", target="Customer::get_inv_cdtlmt", new_name="get_invoice_credit_limit"
         )
+
+    def test_hierarchy(self) -> None:
+        """Test renaming a method together with its overrides.
+
+        Renaming Manager::pay_amt also renames the Employee method it
+        overrides and the calls on Employee subclasses, including super()
+        calls. Invoice defines an unrelated pay_amt: its definition, calls on
+        Invoice instances and calls on receivers of unknown type are kept.
+        """
+        self.refactor("rename-method", target="Manager::pay_amt", new_name="pay_amount")
+
+    def test_across_files(self) -> None:
+        """Test that callers in other modules of the directory are updated."""
+        fixture_dir = Path(__file__).parent.parent / "fixtures" / self.fixture_category
+        billing_file = self.tmp_path / "billing.py"
+        shutil.copy(fixture_dir / "across_files" / "billing_input.py", billing_file)
+
+        self.refactor(
+            "rename-method", target="Customer::get_inv_cdtlmt", new_name="get_invoice_credit_limit"
+        )
+
+        expected = (fixture_dir / "across_files" / "billing_expected.py").read_text()
+        assert billing_file.read_text() == expected
+
+    def test_mapping(self) -> None:
+        """Test applying every rename of a mapping file in one pass."""
+        fixture_dir = Path(__file__).parent.parent / "fixtures" / self.fixture_category
+        self.refactor("rename-method", mapping=str(fixture_dir / "mapping" / "renames.txt"))
+
+    def test_conflicting_mapping(self) -> None:
+        """Test that renaming one method to two different names is rejected."""
+        self.test_file = self.tmp_path / "input.py"
+        original = "class Order:\n    def calc(self):\n        return 1\n"
+        self.test_file.write_text(original)
+        mapping = self.tmp_path / "renames.txt"
+        mapping.write_text("Order::calc total\nOrder::calc sum_total\n")
+
+        from molting.cli import refactor_file
+
+        with pytest.raises(ValueError, match="Conflicting renames"):
+            refactor_file("rename-method", self.test_file, mapping=str(mapping))
+
+        assert self.test_file.read_text() == original
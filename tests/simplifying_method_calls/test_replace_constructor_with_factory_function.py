@@ -34,3 +34,18 @@ class TestReplaceConstructorWithFactoryFunction(RefactoringTestBase):
         gracefully, either by detecting it or preventing it.
         """
         self.refactor("replace-constructor-with-factory-function", target="Employee::__init__")
+
+    def test_across_modules(self) -> None:
+        """Test replacing instantiations in the modules that import the class.
+
+        Aliased imports are followed, the factory replaces the class in an
+        import once nothing else uses the class, calls through a module import
+        are rewritten, and a parameter shadowing the class name is left alone.
+        """
+        for name in ("staffing", "payroll", "reports"):
+            self.copy_fixture_module(name)
+
+        self.refactor("replace-constructor-with-factory-function", target="Employee::__init__")
+
+        for name in ("staffing", "payroll", "reports"):
+            self.assert_module_matches_expected(name)
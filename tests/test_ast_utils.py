@@ -8,6 +8,7 @@ including field extraction from __init__ methods.
 from typing import cast
 
 import libcst as cst
+import pytest
 
 from molting.core.ast_utils import (
     camel_to_snake_case,
@@ -25,10 +26,13 @@ from molting.core.ast_utils import (
     is_self_attribute,
     is_self_field_assignment,
     parse_comma_separated_list,
+    parse_field_targets,
     parse_line_number,
     parse_line_range,
     parse_target_with_line,
     parse_target_with_range,
+    parse_target_with_ranges,
+    resolve_field_targets,
     statements_contain_only_pass,
 )
 
@@ -686,6 +690,68 @@ class TestParseCommaSeparatedList:
         assert result == ["first", "second", "third", "fourth"]
 
 
+class TestParseFieldTargets:
+    """Tests for parse_field_targets() function."""
+
+    def test_fields_of_one_class(self) -> None:
+        """Should read names after a Class::field item as fields of that class."""
+        assert parse_field_targets("Range::low, high") == {"Range": ["low", "high"]}
+
+    def test_several_classes(self) -> None:
+        """Should group fields by class and keep bare classes as whole-class targets."""
+        assert parse_field_targets("Account,Person::name,email,Team::members") == {
+            "Account": [],
+            "Person": ["name", "email"],
+            "Team": ["members"],
+        }
+
+    def test_invalid_format(self) -> None:
+        """Should reject items that are not names or Class::field pairs."""
+        with pytest.raises(ValueError, match="Invalid target format"):
+            parse_field_targets("Person::name::first")
+
+
+class TestResolveFieldTargets:
+    """Tests for resolve_field_targets() function."""
+
+    def test_whole_class(self) -> None:
+        """Should expand a class into public __init__ fields that are not members yet."""
+        module = cst.parse_module("""
+class Person:
+    def __init__(self, name, age):
+        self.name = name
+        self.age = age
+        self._id = 0
+
+    def age(self):
+        return 1
+""")
+
+        assert resolve_field_targets(module, {"Person": []}) == {"Person": ["name"]}
+
+    def test_class_not_found(self) -> None:
+        """Should reject a class the module does not define."""
+        with pytest.raises(ValueError, match="Class 'Person' not found"):
+            resolve_field_targets(cst.parse_module("x = 1\n"), {"Person": ["name"]})
+
+
+class TestParseTargetWithRanges:
+    """Tests for parse_target_with_ranges() function."""
+
+    def test_several_ranges(self) -> None:
+        """Should parse every comma-separated range of the target."""
+        assert parse_target_with_ranges("Order::print_owing#L9-L12, L14-L16") == (
+            "Order",
+            "print_owing",
+            [(9, 12), (14, 16)],
+        )
+
+    def test_invalid_range(self) -> None:
+        """Should reject a malformed range among valid ones."""
+        with pytest.raises(ValueError, match="Invalid line range format"):
+            parse_target_with_ranges("Order::print_owing#L9-L12,14-16")
+
+
 class TestParseLineNumber:
     """Tests for parse_line_number() function."""
 
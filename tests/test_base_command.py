@@ -388,3 +388,74 @@ class TestApplyAstTransform:
         compile(result, str(test_file), "exec")
         # Verify the modification was applied
         assert "def method(self, x, y):" in result
+
+
+class TestCreateCallSiteUpdater:
+    """Tests for BaseCommand.create_call_site_updater() method."""
+
+    def test_default_searches_whole_directory(self, tmp_path: Path) -> None:
+        """Should use the auto-detected searcher when no incremental params are given."""
+        from molting.core.reference_searcher import FileSetSearcher
+
+        cmd = ConcreteCommand(tmp_path / "test.py")
+        updater = cmd.create_call_site_updater(tmp_path)
+
+        assert updater.directory == tmp_path
+        assert not isinstance(updater.searcher, FileSetSearcher)
+
+    def test_changed_only_restricts_to_changed_files(self, tmp_path: Path) -> None:
+        """Should restrict the search to git-changed files plus the target file."""
+        import subprocess
+
+        from molting.core.reference_searcher import FileSetSearcher
+
+        target = tmp_path / "target.py"
+        target.write_text("x = 1\n")
+        (tmp_path / "unchanged.py").write_text("z = 3\n")
+        git = ["git", "-c", "user.name=test", "-c", "user.email=test@example.com"]
+        subprocess.run([*git, "init", "-q"], cwd=tmp_path, check=True)
+        subprocess.run([*git, "add", "."], cwd=tmp_path, check=True)
+        subprocess.run([*git, "commit", "-q", "-m", "initial"], cwd=tmp_path, check=True)
+        changed = tmp_path / "changed.py"
+        changed.write_text("y = 2\n")
+
+        cmd = ConcreteCommand(target, changed_only=True)
+        updater = cmd.create_call_site_updater(tmp_path)
+
+        assert isinstance(updater.searcher, FileSetSearcher)
+        assert set(updater.searcher.files) == {target.resolve(), changed.resolve()}
+
+
+class TestProjectFiles:
+    """Tests for BaseCommand.project_files() method."""
+
+    def test_default_lists_every_python_file(self, tmp_path: Path) -> None:
+        """Should list every Python file under the directory when not incremental."""
+        (tmp_path / "a.py").write_text("")
+        (tmp_path / "pkg").mkdir()
+        (tmp_path / "pkg" / "b.py").write_text("")
+        (tmp_path / "notes.txt").write_text("")
+
+        cmd = ConcreteCommand(tmp_path / "a.py")
+
+        assert cmd.project_files(tmp_path) == sorted(
+            [(tmp_path / "a.py").resolve(), (tmp_path / "pkg" / "b.py").resolve()]
+        )
+
+    def test_changed_only_lists_changed_files(self, tmp_path: Path) -> None:
+        """Should list the target and the git-changed files, as the call-site search does."""
+        import subprocess
+
+        target = tmp_path / "target.py"
+        target.write_text("x = 1\n")
+        (tmp_path / "unchanged.py").write_text("z = 3\n")
+        git = ["git", "-c", "user.name=test", "-c", "user.email=test@example.com"]
+        subprocess.run([*git, "init", "-q"], cwd=tmp_path, check=True)
+        subprocess.run([*git, "add", "."], cwd=tmp_path, check=True)
+        subprocess.run([*git, "commit", "-q", "-m", "initial"], cwd=tmp_path, check=True)
+        changed = tmp_path / "changed.py"
+        changed.write_text("y = 2\n")
+
+        cmd = ConcreteCommand(target, changed_only=True)
+
+        assert cmd.project_files(tmp_path) == sorted([target.resolve(), changed.resolve()])
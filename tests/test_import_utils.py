@@ -194,3 +194,24 @@ class Foo:
 
         # Verify the import was added
         assert has_import(modified, "typing", "Protocol")
+
+    def test_adds_dotted_module_import(self) -> None:
+        """Test importing from a dotted module path."""
+        module = cst.parse_module("x = 1\n")
+        result = ensure_import(module, "pkg.helpers", ["check"])
+
+        assert result.code.startswith("from pkg.helpers import check\n")
+        assert has_import(result, "pkg.helpers", "check")
+
+    def test_keeps_docstring_and_future_imports_first(self) -> None:
+        """Test that the import goes after the module docstring and __future__ imports.
+
+        A blank line separates it from the code that follows.
+        """
+        code = '"""Module docstring."""\nfrom __future__ import annotations\nx = 1\n'
+        result = ensure_import(cst.parse_module(code), "typing", ["Any"])
+
+        assert result.code == (
+            '"""Module docstring."""\nfrom __future__ import annotations\n'
+            "from typing import Any\n\nx = 1\n"
+        )
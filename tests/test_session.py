@@ -0,0 +1,102 @@
+"""Tests for multi-step refactoring sessions."""
+
+from pathlib import Path
+
+from molting.commands.session import ModuleSession
+from molting.core.analysis_cache import get_analysis_cache
+from molting.core.symbol_table import ModuleSymbolTable
+
+SOURCE = '''\
+"""Orders."""
+
+TAX_RATE = 0.2
+
+
+def helper():
+    return 1
+
+
+class Order:
+    def __init__(self, name, orders):
+        self.name = name
+        self.orders = orders
+
+    def print_owing(self):
+        outstanding = 0
+
+        print("**************************")
+        print("***** Customer Owes ******")
+        print("**************************")
+
+        for order in self.orders:
+            outstanding += order.amount
+
+        print(f"name: {self.name}")
+        print(f"amount: {outstanding}")
+'''
+
+
+def test_first_refresh_reports_every_definition(tmp_path: Path) -> None:
+    """Opening a session analyzes every top-level definition."""
+    file_path = tmp_path / "orders.py"
+    file_path.write_text(SOURCE)
+
+    session = ModuleSession(file_path)
+
+    assert session.symbols.has_constant("TAX_RATE")
+    assert session.symbols.has_method("Order", "print_owing")
+    assert session.symbols.has_field("Order", "orders")
+
+
+def test_steps_report_only_changed_definitions(tmp_path: Path) -> None:
+    """Each step reports the definitions it changed and updates the symbol table."""
+    file_path = tmp_path / "orders.py"
+    file_path.write_text(SOURCE)
+    session = ModuleSession(file_path)
+
+    changed = session.run(
+        "extract-method", target="Order::print_owing#L18-L20", name="print_banner"
+    )
+    session.run("extract-method", target="Order::print_owing#L20-L21", name="calculate")
+
+    assert changed == {"Order"}
+    assert session.history == [{"Order"}, {"Order"}]
+    assert session.symbols.has_method("Order", "print_banner")
+    assert session.symbols.has_method("Order", "calculate")
+    assert session.symbols.has_function("helper")
+
+
+def test_merged_table_matches_full_build(tmp_path: Path) -> None:
+    """The incrementally merged table equals one built from scratch and is shared."""
+    file_path = tmp_path / "orders.py"
+    file_path.write_text(SOURCE)
+    session = ModuleSession(file_path)
+    session.run("extract-method", target="Order::print_owing#L18-L20", name="print_banner")
+
+    full = ModuleSymbolTable.build(session.line_index.module)
+
+    assert vars(session.symbols) == vars(full)
+    assert ModuleSymbolTable.for_module(session.line_index.module) is session.symbols
+
+
+def test_changed_definitions_drop_cached_facts(tmp_path: Path) -> None:
+    """Facts of changed definitions are evicted; facts of unchanged ones are kept."""
+    file_path = tmp_path / "orders.py"
+    file_path.write_text(SOURCE)
+    session = ModuleSession(file_path)
+    cache = get_analysis_cache()
+    index = session.line_index
+    helper = index.find_function("helper")
+    method = index.find_function("Order", "print_owing")
+    assert helper is not None and method is not None
+    cache.get_or_compute("facts", file_path, "helper", helper, lambda: "helper facts")
+    cache.get_or_compute("facts", file_path, "Order.print_owing", method, lambda: "old")
+
+    session.run("extract-method", target="Order::print_owing#L18-L20", name="print_banner")
+
+    assert cache.get_or_compute("facts", file_path, "helper", helper, lambda: "recomputed") == (
+        "helper facts"
+    )
+    assert cache.get_or_compute("facts", file_path, "Order.print_owing", method, lambda: "new") == (
+        "new"
+    )
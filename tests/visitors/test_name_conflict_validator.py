@@ -158,3 +158,28 @@ CUSTOMER = "customer"
         # But they shouldn't interfere with each other
         validator.validate_class_name("ORDER")
         validator.validate_constant_name("NewConstant")
+
+    def test_detects_existing_method_conflict(self) -> None:
+        """Test that validator detects when a method already exists in a class."""
+        source_code = """\
+class Order:
+    def base_price(self):
+        return 1
+"""
+        validator = NameConflictValidator(source_code)
+        with pytest.raises(ValueError, match="Method.*base_price.*already exists"):
+            validator.validate_method_name("Order", "base_price")
+        validator.validate_method_name("Order", "discount")
+        validator.validate_method_name("", "base_price")
+
+    def test_detects_existing_field_conflict(self) -> None:
+        """Test that validator detects fields assigned in __init__."""
+        source_code = """\
+class Account:
+    def __init__(self):
+        self.interest_rate = 0.1
+"""
+        validator = NameConflictValidator(source_code)
+        with pytest.raises(ValueError, match="Field.*interest_rate.*already exists"):
+            validator.validate_field_name("Account", "interest_rate")
+        validator.validate_field_name("Account", "balance")